@@ -5,6 +5,8 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from dominion.boards.loader import BoardConfig, load_board
+from dominion.simulation.rating_tournament import RatingTournament, ratings_to_leaderboard
+from dominion.simulation.result_store import ResultStore, board_fingerprint, play_stored_matchup
 from dominion.simulation.strategy_battle import (
     StrategyBattle,
     StrategyBoardReferences,
@@ -47,9 +49,17 @@ def run_full_battle(
     num_games: int = 10,
     use_shelters: bool = False,
     board_config: Optional[BoardConfig] = None,
+    results_db: Optional[Path] = None,
+    rating: bool = False,
+    max_games: Optional[int] = None,
 ) -> Dict[str, Dict[str, Any]]:
     """Play each strategy against all others.
 
+    With ``results_db``, pairings are read from that result store and only
+    games missing from it are played. With ``rating``, an adaptive rating
+    tournament replaces the round-robin: ``num_games`` is then the batch
+    size per pairing round and ``max_games`` the total budget.
+
     Returns aggregated results keyed by strategy name.
     """
     battle = StrategyBattle(
@@ -94,6 +104,16 @@ def run_full_battle(
     strategy_names = compatible_names
     aggregated = all_meta
 
+    store = ResultStore(results_db) if results_db else None
+    if rating:
+        try:
+            return _run_rating_tournament(
+                battle, strategy_names, aggregated, num_games, max_games, use_shelters, store
+            )
+        finally:
+            if store is not None:
+                store.close()
+
     total_pairings = len(list(combinations(strategy_names, 2)))
     print(f"Running {total_pairings} pairings ({len(strategy_names)} strategies, {num_games} games each)...")
 
@@ -102,7 +122,10 @@ def run_full_battle(
         if i % 10 == 0 or i == total_pairings:
             print(f"  Pairing {i}/{total_pairings}: {strat1} vs {strat2}")
         try:
-            results = battle.run_battle(strat1, strat2, num_games)
+            if store is not None:
+                results = _run_stored_pairing(store, battle, strat1, strat2, num_games, use_shelters)
+            else:
+                results = battle.run_battle(strat1, strat2, num_games)
         except Exception as exc:
             skipped_pairings += 1
             print(f"  Skipping {strat1} vs {strat2}: {exc}")
@@ -125,9 +148,89 @@ def run_full_battle(
 
     if skipped_pairings:
         print(f"Skipped {skipped_pairings} of {total_pairings} pairings due to setup or runtime errors.")
+    if store is not None:
+        store.close()
 
     return aggregated
 
+
+def _run_rating_tournament(
+    battle: StrategyBattle,
+    strategy_names: list[str],
+    metadata: Dict[str, Dict[str, Any]],
+    batch_games: int,
+    max_games: Optional[int],
+    use_shelters: bool,
+    store: Optional[ResultStore],
+) -> Dict[str, Dict[str, Any]]:
+    """Rate ``strategy_names`` with an adaptive Bradley-Terry tournament."""
+
+    def play(name1: str, name2: str, games: int, offset: int) -> Optional[int]:
+        try:
+            if store is not None:
+                results = _run_stored_pairing(store, battle, name1, name2, games, use_shelters, seed=offset)
+            else:
+                results = battle.run_battle(name1, name2, games)
+        except Exception as exc:
+            print(f"  Skipping {name1} vs {name2}: {exc}")
+            return None
+        return results["strategy1_wins"]
+
+    tournament = RatingTournament(strategy_names, play, batch_games=batch_games, max_games=max_games)
+    print(f"Running rating tournament ({len(strategy_names)} strategies, up to {tournament.max_games} games)...")
+    aggregated = ratings_to_leaderboard(tournament.run(), tournament.z)
+    print(
+        f"Played {tournament.games_played} games; ranking "
+        + ("resolved." if tournament.is_resolved() else "not fully resolved (budget spent).")
+    )
+    for name, stats in aggregated.items():
+        stats["games"] = stats["wins"] + stats["losses"]
+        stats["cards"] = metadata[name]["cards"]
+        stats["description"] = metadata[name]["description"]
+    return aggregated
+
+
+def _run_stored_pairing(
+    store: ResultStore,
+    battle: StrategyBattle,
+    name1: str,
+    name2: str,
+    num_games: int,
+    use_shelters: bool,
+    seed: int = 0,
+) -> Dict[str, int]:
+    """Play one pairing through the result store; return the win counts."""
+    strategy1 = battle.strategy_loader.get_strategy(name1)
+    strategy2 = battle.strategy_loader.get_strategy(name2)
+    refs = battle._determine_board_references(strategy1, strategy2)
+    traits = battle.board_config.traits if battle.board_config else {}
+    board_key = board_fingerprint(
+        kingdom_cards=refs.kingdom_cards,
+        events=refs.events,
+        projects=refs.projects,
+        ways=refs.ways,
+        landmarks=refs.landmarks,
+        allies=refs.allies,
+        traits=[f"{card}:{trait}" for card, trait in traits.items()],
+        shelters=["Shelters"] if use_shelters else [],
+    )
+    matchup = play_stored_matchup(
+        store,
+        battle,
+        strategy1,
+        strategy2,
+        num_games,
+        board_key,
+        refs.kingdom_cards,
+        seed=seed,
+        events=refs.events,
+        projects=refs.projects,
+        ways=refs.ways,
+        landmarks=refs.landmarks,
+        allies=refs.allies,
+    )
+    return {"strategy1_wins": matchup.a_wins, "strategy2_wins": matchup.b_wins}
+
 def main() -> None:
     import argparse
 
@@ -151,6 +254,23 @@ def main() -> None:
             "or reports/leaderboard_<board>.html with --board)"
         ),
     )
+    parser.add_argument(
+        "--rating",
+        action="store_true",
+        help="Run an adaptive rating tournament; --games is then the batch size per pairing round",
+    )
+    parser.add_argument(
+        "--max-games",
+        type=int,
+        default=None,
+        help="Total game budget for --rating (default: cost of the round-robin)",
+    )
+    parser.add_argument(
+        "--results-db",
+        type=Path,
+        default=None,
+        help="SQLite result store; games already stored are reused instead of replayed",
+    )
     args = parser.parse_args()
 
     board_config = load_board(args.board) if args.board else None
@@ -159,6 +279,9 @@ def main() -> None:
         num_games=args.games,
         use_shelters=args.use_shelters,
         board_config=board_config,
+        results_db=args.results_db,
+        rating=args.rating,
+        max_games=args.max_games,
     )
 
     if args.output:
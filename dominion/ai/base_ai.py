@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Optional
 
 from dominion.cards.base_card import Card
+from dominion.game import features
 from dominion.game.game_state import GameState
 from dominion.game.player_state import PlayerState
 
@@ -2035,20 +2036,21 @@ class AI(ABC):
         from ..cards.registry import get_card
 
         candidates: list[tuple[int, str]] = []
-        for name, count in state.supply.items():
-            if count <= 0:
-                continue
-            try:
-                card = get_card(name)
-            except ValueError:
-                continue
-            if not card.is_action:
-                continue
-            # Don't replace own existing token on the same pile.
-            if state.has_pile_token(player, name, token_kind):
-                continue
-            score = player.count_in_deck(name) * 10 + card.cost.coins
-            candidates.append((score, name))
+        with state.feature_cache():
+            for name, count in state.supply.items():
+                if count <= 0:
+                    continue
+                try:
+                    card = get_card(name)
+                except ValueError:
+                    continue
+                if not card.is_action:
+                    continue
+                # Don't replace own existing token on the same pile.
+                if state.has_pile_token(player, name, token_kind):
+                    continue
+                score = features.deck_count(state, player, name) * 10 + card.cost.coins
+                candidates.append((score, name))
         if not candidates:
             return None
         candidates.sort(reverse=True)
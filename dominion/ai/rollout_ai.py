@@ -0,0 +1,370 @@
+"""Monte Carlo rollout AI that evaluates buys by simulating games to the end."""
+
+from __future__ import annotations
+
+import copy
+import multiprocessing as mp
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Optional
+
+from dominion.ai.base_ai import AI
+from dominion.cards.base_card import Card
+from dominion.cards.registry import get_card
+
+if TYPE_CHECKING:  # Avoid circular imports at runtime
+    from dominion.game.game_state import GameState
+    from dominion.game.player_state import PlayerState
+
+
+class _PlayoutStrategy:
+    """Strategy metadata used by GameState logging."""
+    name = "Playout"
+
+
+class PlayoutAI(AI):
+    """Fast, board-agnostic default policy used inside rollouts.
+
+    Plays villages before other actions, plays every treasure, buys by a
+    Big Money rule of thumb and never trashes. It holds no per-game state,
+    so one instance can be shared by every seat of a simulated game.
+    """
+
+    def __init__(self):
+        self.strategy = _PlayoutStrategy()
+
+    @property
+    def name(self) -> str:
+        return "PlayoutAI"
+
+    def choose_action(self, state: GameState, choices: list[Optional[Card]]) -> Optional[Card]:
+        actions = [c for c in choices if c is not None]
+        if not actions:
+            return None
+        return max(actions, key=lambda c: (c.stats.actions > 0, c.cost.coins))
+
+    def choose_treasure(self, state: GameState, choices: list[Optional[Card]]) -> Optional[Card]:
+        for choice in choices:
+            if choice is not None:
+                return choice
+        return None
+
+    def choose_buy(self, state: GameState, choices: list[Optional[Card]]) -> Optional[Card]:
+        by_name = {c.name: c for c in choices if c is not None}
+        provinces_left = state.supply.get("Province", 0)
+
+        order = ["Colony", "Province"]
+        if provinces_left <= 4:
+            order.append("Duchy")
+        if provinces_left <= 2:
+            order.append("Estate")
+        order += ["Platinum", "Gold", "Silver"]
+
+        for name in order:
+            if name in by_name:
+                return by_name[name]
+        return None
+
+    def choose_card_to_trash(self, state: GameState, choices: list[Card]) -> Optional[Card]:
+        return None
+
+
+def _discard_log(*_args) -> None:
+    """Picklable stand-in for ``GameState.log_callback`` on rollout roots."""
+
+
+@dataclass
+class RolloutStats:
+    """Accumulated playout results for one buy candidate."""
+
+    rollouts: int = 0
+    total_score: float = 0.0
+    total_margin: float = 0.0
+
+    @property
+    def mean_score(self) -> float:
+        return self.total_score / self.rollouts if self.rollouts else 0.0
+
+    @property
+    def mean_margin(self) -> float:
+        return self.total_margin / self.rollouts if self.rollouts else 0.0
+
+
+def _resolve_candidate(state: GameState, name: str):
+    """Return the object to buy on ``state`` for a candidate name."""
+    for landscape in list(state.events) + list(state.projects):
+        if landscape.name == name:
+            return landscape
+    return get_card(name)
+
+
+def _score_playout(state: GameState, player_index: int, finished: bool) -> tuple[float, int]:
+    """Score a playout from ``player_index``'s seat as (win share, VP margin).
+
+    Finished games use the official tie-break (fewer turns wins on equal
+    VP); truncated playouts are judged on VP alone.
+    """
+    me = state.players[player_index]
+    others = [p for i, p in enumerate(state.players) if i != player_index]
+    my_vp = me.get_victory_points(state)
+    best_vp = max((p.get_victory_points(state) for p in others), default=0)
+    margin = my_vp - best_vp
+
+    if margin != 0 or not others:
+        return (1.0 if margin > 0 else 0.0), margin
+
+    if finished:
+        best_turns = min(p.turns_taken for p in others if p.get_victory_points(state) == best_vp)
+        if me.turns_taken < best_turns:
+            return 1.0, margin
+        if me.turns_taken > best_turns:
+            return 0.0, margin
+    return 0.5, margin
+
+
+def run_playouts(
+    root: GameState,
+    player_index: int,
+    candidate: Optional[str],
+    seeds: list[int],
+    max_turns: Optional[int],
+    policy_factory: Callable[[], AI],
+) -> list[tuple[float, int]]:
+    """Buy ``candidate`` (``None`` passes) on copies of ``root`` and play out.
+
+    ``root`` must be a detached rollout root (see
+    :meth:`RolloutAI._make_root`); every seat is driven by a policy built
+    from ``policy_factory``. Each playout reseeds the global RNG from
+    ``seeds`` so sibling candidates can be compared on common random
+    numbers. Lives at module level so it can be sent to a
+    ProcessPoolExecutor.
+    """
+    policies = [policy_factory() for _ in root.players]
+    results = []
+    for seed in seeds:
+        random.seed(seed)
+        sim = copy.deepcopy(root)
+        for player, policy in zip(sim.players, policies):
+            player.ai = policy
+        player = sim.players[player_index]
+
+        if candidate is None:
+            sim._handle_buy_phase_end(player)
+            sim.phase = "night"
+        else:
+            sim._commit_buy(player, _resolve_candidate(sim, candidate))
+
+        start_turn = sim.turn_number
+        finished = True
+        while not sim.is_game_over():
+            if (
+                max_turns is not None
+                and sim.phase == "start"
+                and sim.turn_number - start_turn >= max_turns
+            ):
+                finished = False
+                break
+            sim.play_turn()
+
+        results.append(_score_playout(sim, player_index, finished))
+    return results
+
+
+class _RolloutStrategy:
+    """Strategy metadata used by GameState logging."""
+    name = "Rollout"
+
+
+class RolloutAI(AI):
+    """AI that picks buys by Monte Carlo playouts from cloned states.
+
+    At each buy-phase decision every offered candidate (including passing)
+    is committed on a copy of the game and played to the end by a fast
+    default policy. The candidate with the best mean win share (VP margin
+    breaks ties) is bought. All other decisions are delegated to a policy
+    built from ``policy_factory``.
+
+    Budget: up to ``rollouts`` playouts per candidate, allocated round-robin
+    so that ``time_budget`` (seconds per decision, optional) cuts every
+    candidate short evenly. ``max_turns`` truncates playouts after that many
+    rounds and judges them on VP. Candidates share seeds, and results are
+    kept while the decision is unchanged, so when the endgame guard vetoes
+    a choice and asks again the surviving siblings reuse their playouts.
+    With ``processes`` > 1 playouts run in a process pool; ``policy_factory``
+    must then be picklable (a module-level callable).
+
+    The global RNG is restored after each decision, so adding rollouts does
+    not perturb the real game's shuffles.
+    """
+
+    def __init__(
+        self,
+        rollouts: int = 16,
+        time_budget: Optional[float] = None,
+        max_turns: Optional[int] = None,
+        policy_factory: Callable[[], AI] = PlayoutAI,
+        processes: int = 0,
+        seed: Optional[int] = None,
+    ):
+        if rollouts < 1:
+            raise ValueError("rollouts must be at least 1")
+        self.rollouts = rollouts
+        self.time_budget = time_budget
+        self.max_turns = max_turns
+        self.policy_factory = policy_factory
+        self.processes = processes
+        self.policy = policy_factory()
+        self.strategy = _RolloutStrategy()
+        self.last_evaluation: dict[Optional[str], RolloutStats] = {}
+        self._name = f"RolloutAI-{id(self)}"
+        self._rng = random.Random(seed)
+        self._decision_key: Optional[tuple] = None
+        self._base_seed = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_rollout = False
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def choose_action(self, state: GameState, choices: list[Optional[Card]]) -> Optional[Card]:
+        return self.policy.choose_action(state, choices)
+
+    def choose_treasure(self, state: GameState, choices: list[Optional[Card]]) -> Optional[Card]:
+        return self.policy.choose_treasure(state, choices)
+
+    def choose_card_to_trash(self, state: GameState, choices: list[Card]) -> Optional[Card]:
+        return self.policy.choose_card_to_trash(state, choices)
+
+    def choose_way(self, state: GameState, card: Card, ways: list) -> Optional[object]:
+        return self.policy.choose_way(state, card, ways)
+
+    def choose_buy(self, state: GameState, choices: list[Optional[Card]]) -> Optional[Card]:
+        if not choices:
+            return None
+        if self._in_rollout or not getattr(state, "_choosing_buy_phase", False):
+            return self.policy.choose_buy(state, choices)
+
+        by_name: dict[Optional[str], Optional[Card]] = {}
+        for choice in choices:
+            key = None if choice is None else choice.name
+            by_name.setdefault(key, choice)
+        if len(by_name) == 1:
+            return next(iter(by_name.values()))
+
+        self._in_rollout = True
+        rng_state = random.getstate()
+        try:
+            stats = self._evaluate(state, list(by_name))
+        finally:
+            random.setstate(rng_state)
+            self._in_rollout = False
+
+        order = list(by_name)
+        best = max(
+            order,
+            key=lambda name: (stats[name].mean_score, stats[name].mean_margin, -order.index(name)),
+        )
+        return by_name[best]
+
+    def close(self) -> None:
+        """Shut down the playout process pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    # ------------------------------------------------------------------
+    # Rollout machinery
+
+    @staticmethod
+    def _key_for(state: GameState, player: PlayerState) -> tuple:
+        """Fingerprint of a buy decision; any buy or payment changes it."""
+        return (
+            state.turn_number,
+            state.current_player_index,
+            player.coins,
+            player.potions,
+            player.buys,
+            player.debt,
+            len(player.turn.bought_this_turn),
+            tuple(sorted(state.supply.items())),
+        )
+
+    @staticmethod
+    def _make_root(state: GameState) -> GameState:
+        """Clone ``state`` with AIs and logging detached so it can be pickled."""
+        root = copy.deepcopy(state)
+        for player in root.players:
+            player.ai = None
+        root.log_callback = _discard_log
+        root._choosing_buy_phase = False
+        return root
+
+    def _evaluate(self, state: GameState, candidates: list[Optional[str]]) -> dict[Optional[str], RolloutStats]:
+        player = state.current_player
+        player_index = state.players.index(player)
+
+        key = self._key_for(state, player)
+        if key != self._decision_key:
+            self._decision_key = key
+            self._base_seed = self._rng.getrandbits(32)
+            self.last_evaluation = {}
+        stats = self.last_evaluation
+        for name in candidates:
+            stats.setdefault(name, RolloutStats())
+
+        root = self._make_root(state)
+        deadline = (
+            time.perf_counter() + self.time_budget if self.time_budget is not None else None
+        )
+        batch = 1 if self.processes <= 1 else max(1, self.rollouts // self.processes)
+
+        while True:
+            jobs = []
+            for name in candidates:
+                done = stats[name].rollouts
+                if done < self.rollouts:
+                    count = min(batch, self.rollouts - done)
+                    seeds = [self._base_seed + i for i in range(done, done + count)]
+                    jobs.append((name, seeds))
+            if not jobs:
+                break
+            if (
+                deadline is not None
+                and time.perf_counter() >= deadline
+                and all(stats[name].rollouts > 0 for name in candidates)
+            ):
+                break
+
+            for name, results in self._run_jobs(root, player_index, jobs):
+                entry = stats[name]
+                for score, margin in results:
+                    entry.rollouts += 1
+                    entry.total_score += score
+                    entry.total_margin += margin
+
+        return {name: stats[name] for name in candidates}
+
+    def _run_jobs(self, root: GameState, player_index: int, jobs: list[tuple[Optional[str], list[int]]]):
+        if self.processes <= 1:
+            return [
+                (name, run_playouts(root, player_index, name, seeds, self.max_turns, self.policy_factory))
+                for name, seeds in jobs
+            ]
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes, mp_context=mp.get_context("spawn")
+            )
+        futures = [
+            (
+                name,
+                self._executor.submit(
+                    run_playouts, root, player_index, name, seeds, self.max_turns, self.policy_factory
+                ),
+            )
+            for name, seeds in jobs
+        ]
+        return [(name, future.result()) for name, future in futures]
@@ -26,8 +26,7 @@ class OrderOfMasons(Ally):
             return
         player.favors -= spend * 2
         # Stash bonus draws to be applied on top of the next turn's hand.
-        existing = getattr(player, "order_of_masons_bonus", 0)
-        player.order_of_masons_bonus = existing + spend
+        player.order_of_masons_bonus += spend
         game_state.log_callback(
             (
                 "action",
@@ -24,8 +24,7 @@ from pathlib import Path
 from typing import Callable, Iterable
 
 from dominion.boards.loader import BoardConfig, load_board
-from dominion.cards.base_card import Card
-from dominion.cards.registry import get_card
+from dominion.cards.metadata import CardMetadata, get_card_metadata
 from dominion.events.registry import get_event
 from dominion.ways.registry import get_way
 
@@ -34,8 +33,8 @@ from dominion.ways.registry import get_way
 #
 # Small, explicit tables of mechanical facts that can't be derived by simple
 # class inspection. Keep these focused — anything that *can* be derived from a
-# class (overridden hooks, `gain_card` calls in source) is detected
-# heuristically below.
+# class (overridden hooks, `gain_card` calls in source) comes from the card
+# metadata table (``dominion.cards.metadata``).
 
 # Ways that return the played card to its supply pile rather than trashing it.
 # These are the Ways that bypass on_trash hooks.
@@ -55,13 +54,13 @@ SELF_EXILE_OR_SET_ASIDE_CARDS = frozenset({"Stockpile", "Island"})
 EMPTY_DECK_DISCARD_EVENTS = frozenset({"Windfall"})
 
 
-# Per-Command-card target filters. Each entry takes a candidate Card and
+# Per-Command-card target filters. Each entry takes a candidate card's metadata and
 # returns True iff this Command card can legally play / replay / copy it.
 # Commands whose only filter is "non-Command Action" use the default below.
-_DEFAULT_COMMAND_FILTER: Callable[["Card"], bool] = (
+_DEFAULT_COMMAND_FILTER: Callable[[CardMetadata], bool] = (
     lambda c: c.is_action and not c.is_command
 )
-COMMAND_TARGET_FILTERS: dict[str, Callable[["Card"], bool]] = {
+COMMAND_TARGET_FILTERS: dict[str, Callable[[CardMetadata], bool]] = {
     # Captain (promo): plays a non-Command non-Duration Action from supply
     # costing up to $4, with no potion / debt cost.
     "Captain": lambda c: (
@@ -121,8 +120,10 @@ class Interaction:
 
 
 def _source_ref(cls_or_obj) -> str:
-    """Return a ``path:line`` source reference for a class or instance."""
+    """Return a ``path:line`` source reference for a card, class or instance."""
 
+    if isinstance(cls_or_obj, CardMetadata):
+        return cls_or_obj.source_ref
     cls = cls_or_obj if inspect.isclass(cls_or_obj) else type(cls_or_obj)
     try:
         path = inspect.getsourcefile(cls) or ""
@@ -132,31 +133,16 @@ def _source_ref(cls_or_obj) -> str:
     return f"{path}:{line}"
 
 
-def _has_method_override(card: Card, name: str) -> bool:
-    """True iff ``card``'s class (or an intermediate base) overrides ``Card.<name>``."""
-
-    base = getattr(Card, name)
-    method = getattr(type(card), name, None)
-    return method is not None and method is not base
-
-
-def _kingdom_card_objects(board: BoardConfig) -> list[Card]:
-    cards: list[Card] = []
+def _kingdom_card_objects(board: BoardConfig) -> list[CardMetadata]:
+    cards: list[CardMetadata] = []
     for name in board.kingdom_cards:
         try:
-            cards.append(get_card(name))
+            cards.append(get_card_metadata(name))
         except (KeyError, ValueError):
             continue
     return cards
 
 
-def _class_source(card: Card) -> str:
-    try:
-        return inspect.getsource(type(card))
-    except (TypeError, OSError):
-        return ""
-
-
 # --- Predicates ----------------------------------------------------------
 
 
@@ -178,7 +164,7 @@ def predicate_trash_hook_via_return_to_supply(board: BoardConfig) -> list[Intera
         # cards can be routed through a Way at all.
         if not card.is_action:
             continue
-        if not _has_method_override(card, "on_trash"):
+        if not card.overrides("on_trash"):
             continue
         for way_name in return_ways:
             try:
@@ -213,11 +199,7 @@ def predicate_gain_hook_retriggerable(board: BoardConfig) -> list[Interaction]:
     Butterfly, etc.). Each fresh gain re-fires the on_gain hook.
     """
 
-    gainer_names: list[str] = []
-    for card in _kingdom_card_objects(board):
-        src = _class_source(card)
-        if "gain_card(" in src:
-            gainer_names.append(card.name)
+    gainer_names = [card.name for card in _kingdom_card_objects(board) if "gainer" in card.roles]
     if "Way of the Butterfly" in board.ways:
         gainer_names.append("Way of the Butterfly")
     if not gainer_names:
@@ -225,7 +207,7 @@ def predicate_gain_hook_retriggerable(board: BoardConfig) -> list[Interaction]:
 
     interactions: list[Interaction] = []
     for card in _kingdom_card_objects(board):
-        if not _has_method_override(card, "on_gain"):
+        if not card.overrides("on_gain"):
             continue
         sources_for_card = [g for g in gainer_names if g != card.name]
         if not sources_for_card:
@@ -273,7 +255,7 @@ def predicate_empty_deck_discard_triggers(board: BoardConfig) -> list[Interactio
             continue
         for card_name in self_exile:
             try:
-                card = get_card(card_name)
+                card = get_card_metadata(card_name)
             except (KeyError, ValueError):
                 continue
             interactions.append(
@@ -311,7 +293,7 @@ def predicate_command_targets(board: BoardConfig) -> list[Interaction]:
     if not commands:
         return []
 
-    def _payload(c: Card) -> tuple[int, int, str]:
+    def _payload(c: CardMetadata) -> tuple[int, int, str]:
         # Rough heuristic: rank by cost first, then by a weighted stat sum.
         stat_sum = (
             c.stats.cards * 2
@@ -353,16 +335,12 @@ def predicate_cost_mod_gateways(board: BoardConfig) -> list[Interaction]:
     """Predicate 5 — Cost-mod gateways.
 
     For every cost-modifying card in the kingdom (detected by an assignment to
-    ``player.cost_reduction`` in the card's source), summarise which kingdom and
+    ``player.turn.cost_reduction`` in the card's source), summarise which kingdom and
     Province-tier piles drop into reach with each play.
     """
 
     cards = _kingdom_card_objects(board)
-    mods: list[Card] = []
-    for card in cards:
-        src = _class_source(card)
-        if "cost_reduction" in src and "+=" in src:
-            mods.append(card)
+    mods = [card for card in cards if "cost_reducer" in card.roles]
     if not mods:
         return []
 
@@ -0,0 +1,197 @@
+"""Seeded random kingdoms drawn from the card and landscape registries.
+
+:func:`random_board` turns a seed into a legal board:
+
+* ten kingdom piles from :func:`kingdom_pile_names` -- every registered
+  card that heads a Supply pile. Basic cards, Shelters, Loot, Heirlooms,
+  Spirits, Zombies, Ruins and the piles other cards bring along (Prizes,
+  Horse, Spoils, Traveller upgrades...) are left out. Split piles, Castles
+  and Knights are drawn once, by their top card or pile name;
+* up to ``max_landscapes`` Events, Projects, Ways, Landmarks and Traits,
+  drawn from one shared pool. Obelisk gets an Action pile of the kingdom,
+  Way of the Mouse a $2-$3 Action from outside it, and a Trait a kingdom
+  Action or Treasure pile;
+* an Ally when a Liaison is in the kingdom;
+* an eleventh $2-$3 pile when Young Witch is in the kingdom, for its Bane;
+* Colony and Platinum with probability equal to the share of Prosperity
+  kingdom piles, and Shelters likewise for Dark Ages.
+
+Ferryman's pile, Druid's Boons and Rising Sun's Prophecy are chosen by
+``GameState`` at setup from the game's own RNG. :func:`format_board`
+writes a board back in the ``boards/*.txt`` format, so a board that
+misbehaves in a sweep can be saved and replayed with ``load_board``.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import NamedTuple, Optional
+
+from dominion.boards.loader import BoardConfig
+from dominion.cards.metadata import CardMetadata, card_metadata, get_card_metadata
+from dominion.cards.registry import CARD_ALIASES, CARD_TYPES, registry_version
+
+# Cards that never head a kingdom pile, besides those found by type or
+# through another card's extra piles.
+NON_KINGDOM_NAMES = frozenset({
+    "Copper", "Silver", "Gold", "Platinum", "Potion",
+    "Estate", "Duchy", "Province", "Colony", "Curse",
+    "Hovel", "Necropolis", "Overgrown Estate",
+})
+
+
+class RandomBoard(NamedTuple):
+    """A sampled board and the setup choices a ``BoardConfig`` cannot hold."""
+
+    seed: int
+    config: BoardConfig
+    use_shelters: bool
+
+
+def _expansion(name: str) -> str:
+    # Card modules live in dominion.cards.<expansion>[.<module>].
+    parts = CARD_TYPES[CARD_ALIASES.get(name, name)].__module__.split(".")
+    return parts[2] if len(parts) > 2 else ""
+
+
+def _extra_pile_names() -> set[str]:
+    from dominion.cards.plunder import LOOT_CARD_NAMES
+
+    names = set(LOOT_CARD_NAMES)
+    for cls in CARD_TYPES.values():
+        try:
+            card = cls()
+        except ValueError:
+            continue
+        names.update(card.get_additional_piles())
+        names.update(card.get_additional_non_supply_piles())
+        names.update(getattr(card, "nocturne_piles", {}))
+        names.update(getattr(card, "nocturne_trash_piles", {}))
+    return names
+
+
+def _pile_name(key: str, meta: CardMetadata) -> Optional[str]:
+    """The name a board lists for the pile ``key`` heads, or None."""
+    if meta.is_castle:
+        return "Castles" if meta.name == meta.pile[0] else None
+    if meta.is_knight:
+        return key if key == "Knights" else None
+    if meta.pile and key != meta.pile[0]:
+        return None
+    return key
+
+
+_kingdom: tuple[Optional[int], tuple[str, ...]] = (None, ())
+
+
+def kingdom_pile_names() -> tuple[str, ...]:
+    """Names of every pile a kingdom may contain, in registry order."""
+    global _kingdom
+    version = registry_version()
+    cached_version, names = _kingdom
+    if cached_version != version:
+        extras = _extra_pile_names()
+        found = []
+        for key, meta in card_metadata().items():
+            if key in NON_KINGDOM_NAMES or key in extras or meta.name in extras:
+                continue
+            if meta.is_heirloom or meta.is_spirit or meta.is_zombie or meta.is_ruins:
+                continue
+            name = _pile_name(key, meta)
+            if name is not None:
+                found.append(name)
+        names = tuple(found)
+        _kingdom = (version, names)
+    return names
+
+
+def _costs_two_or_three(meta: CardMetadata) -> bool:
+    return meta.cost.coins in (2, 3) and meta.cost.potions == 0 and meta.cost.debt == 0
+
+
+def _landscape_pool() -> list[tuple[str, str]]:
+    from dominion.events.registry import EVENT_TYPES
+    from dominion.landmarks.registry import LANDMARK_TYPES
+    from dominion.projects.registry import PROJECT_TYPES
+    from dominion.traits.registry import TRAITS
+    from dominion.ways.registry import WAY_TYPES
+
+    pool = [("event", name) for name in EVENT_TYPES]
+    pool += [("project", name) for name in PROJECT_TYPES]
+    pool += [("way", name) for name in WAY_TYPES]
+    pool += [("landmark", name) for name in LANDMARK_TYPES]
+    pool += [("trait", name) for name in TRAITS]
+    return pool
+
+
+def random_board(seed: int, *, kingdom_size: int = 10, max_landscapes: int = 2) -> RandomBoard:
+    """Sample a board from ``seed``; the same seed always gives the same board."""
+    from dominion.allies.registry import ALLY_TYPES
+
+    rng = random.Random(seed)
+    piles = kingdom_pile_names()
+    kingdom = rng.sample(piles, kingdom_size)
+    expansions = [_expansion(name) for name in kingdom]
+
+    if "Young Witch" in kingdom:
+        banes = [
+            name for name in piles
+            if name not in kingdom and _costs_two_or_three(get_card_metadata(name))
+        ]
+        if banes:
+            kingdom.append(rng.choice(banes))
+    metas = [get_card_metadata(name) for name in kingdom]
+
+    config = BoardConfig(kingdom)
+    actions = [name for name, meta in zip(kingdom, metas) if meta.is_action and not meta.is_victory]
+    for kind, name in rng.sample(_landscape_pool(), rng.randint(0, max_landscapes)):
+        if kind == "event":
+            config.events.append(name)
+        elif kind == "project":
+            config.projects.append(name)
+        elif kind == "way":
+            if name == "Way of the Mouse":
+                mice = [
+                    pile for pile in piles
+                    if pile not in kingdom
+                    and get_card_metadata(pile).is_action
+                    and _costs_two_or_three(get_card_metadata(pile))
+                ]
+                if not mice:
+                    continue
+                name = f"{name} ({rng.choice(mice)})"
+            config.ways.append(name)
+        elif kind == "landmark":
+            if name == "Obelisk":
+                if not actions:
+                    continue
+                name = f"{name} ({rng.choice(actions)})"
+            config.landmarks.append(name)
+        else:
+            targets = [
+                pile for pile, meta in zip(kingdom, metas)
+                if (meta.is_action or meta.is_treasure) and pile not in config.traits
+            ]
+            if not targets:
+                continue
+            config.traits[rng.choice(targets)] = name
+
+    if any(meta.is_liaison for meta in metas):
+        config.allies.append(rng.choice(sorted(ALLY_TYPES)))
+
+    if rng.random() < expansions.count("prosperity") / kingdom_size:
+        kingdom += ["Colony", "Platinum"]
+    use_shelters = rng.random() < expansions.count("dark_ages") / kingdom_size
+    return RandomBoard(seed, config, use_shelters)
+
+
+def format_board(config: BoardConfig) -> str:
+    """Render ``config`` in the board-file format read by ``load_board``."""
+    lines = list(config.kingdom_cards)
+    lines += [f"Event: {name}" for name in config.events]
+    lines += [f"Project: {name}" for name in config.projects]
+    lines += [f"Way: {name}" for name in config.ways]
+    lines += [f"Landmark: {name}" for name in config.landmarks]
+    lines += [f"Ally: {name}" for name in config.allies]
+    lines += [f"Trait: {trait} ({pile})" for pile, trait in config.traits.items()]
+    return "\n".join(lines) + "\n"
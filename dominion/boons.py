@@ -77,7 +77,7 @@ def the_earths_gift(game_state: "GameState", player: "PlayerState") -> None:
 def the_fields_gift(game_state: "GameState", player: "PlayerState") -> None:
     """+1 Action +$1 (persistent — applied immediately and at start of next turn)."""
 
-    if not player.ignore_action_bonuses:
+    if not player.turn.ignore_action_bonuses:
         player.actions += 1
     player.coins += 1
 
@@ -21,3 +21,6 @@ class Vineyard(Card):
     def get_victory_points(self, player) -> int:
         action_count = sum(1 for c in player.all_cards() if c.is_action)
         return action_count // 3
+
+    def deck_victory_points(self, deck) -> int:
+        return deck.actions // 3
@@ -72,9 +72,9 @@ class Acolyte(_Augurs):
         from ..registry import get_card
 
         # Once per turn: gain an Augurs card.
-        if getattr(player, "acolyte_trashed_this_turn", False):
+        if player.turn.acolyte_trashed_this_turn:
             return
-        player.acolyte_trashed_this_turn = True
+        player.turn.acolyte_trashed_this_turn = True
         candidates = [
             name for name in AUGURS_PILE_ORDER
             if game_state.supply.get(name, 0) > 0
@@ -167,6 +167,9 @@ class Territory(_Clashes):
                 names.add(card.name)
         return len(names)
 
+    def deck_victory_points(self, deck) -> int:
+        return len(deck.victory_counts)
+
     def on_gain(self, game_state, player):
         from ..registry import get_card
 
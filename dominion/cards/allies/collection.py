@@ -11,4 +11,4 @@ class Collection(Card):
         )
 
     def play_effect(self, game_state):
-        game_state.current_player.collection_played += 1
+        game_state.current_player.turn.collection_played += 1
@@ -72,7 +72,7 @@ class Garrison(_Forts):
 
         gain_marker = (
             id(player),
-            getattr(player, "cards_gained_this_turn", 0),
+            player.turn.cards_gained_this_turn,
             id(gained_card),
         )
         if self._garrison_last_gain_marker == gain_marker:
@@ -44,7 +44,7 @@ class Modify(Card):
                 chosen_gain = choice
 
         if chosen_gain is None:
-            if not player.ignore_action_bonuses:
+            if not player.turn.ignore_action_bonuses:
                 player.actions += 1
             game_state.draw_cards(player, 1)
         else:
@@ -61,7 +61,7 @@ class Bauble(Card):
             elif option == "favor":
                 player.favors += 1
             elif option == "topdeck":
-                player.topdeck_gains = True
+                player.turn.topdeck_gains = True
 
 
 class Sycophant(Card):
@@ -402,7 +402,7 @@ class Town(Card):
         action_cards = [c for c in player.hand if c.is_action]
         if action_cards or player.actions == 0:
             # Use as a Village.
-            if not player.ignore_action_bonuses:
+            if not player.turn.ignore_action_bonuses:
                 player.actions += 2
             game_state.draw_cards(player, 1)
         else:
@@ -478,7 +478,7 @@ class Emissary(Card):
         will_shuffle = len(player.deck) < 3 and bool(player.discard)
         chameleon_plus_cards(game_state, player, 3)
         if will_shuffle and not getattr(self, "_chameleon_active", False):
-            if not player.ignore_action_bonuses:
+            if not player.turn.ignore_action_bonuses:
                 player.actions += 1
             player.favors += 2
 
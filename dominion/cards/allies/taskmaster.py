@@ -22,7 +22,7 @@ class Taskmaster(Card):
             self.duration_persistent = False
             return
 
-        if not player.ignore_action_bonuses:
+        if not player.turn.ignore_action_bonuses:
             player.actions += 1
         player.coins += 1
 
@@ -69,7 +69,7 @@ class TownCrier(_Townsfolk):
 
         for mode in modes:
             if mode == "cycle":
-                if not player.ignore_action_bonuses:
+                if not player.turn.ignore_action_bonuses:
                     player.actions += 1
                 game_state.draw_cards(player, 1)
             elif mode == "silver":
@@ -134,7 +134,7 @@ class Blacksmith(_Townsfolk):
             if mode == "to_six":
                 game_state.draw_cards(player, max(0, 6 - len(player.hand)))
             elif mode == "cycle":
-                if not player.ignore_action_bonuses:
+                if not player.turn.ignore_action_bonuses:
                     player.actions += 1
                 game_state.draw_cards(player, 1)
             elif mode == "cards2":
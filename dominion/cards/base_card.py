@@ -2,18 +2,30 @@ from dataclasses import dataclass
 from enum import Enum
 
 
-@dataclass
+# Cost and stats are frozen so instances can be interned and shared. Each
+# defines its own ``__init__`` that writes straight into ``__dict__``: cards
+# are constructed constantly (``get_card``) and the generated frozen
+# ``__init__`` pays one ``object.__setattr__`` call per field.
+
+
+@dataclass(frozen=True)
 class CardCost:
     coins: int = 0
     potions: int = 0
     debt: int = 0
 
+    def __init__(self, coins: int = 0, potions: int = 0, debt: int = 0):
+        fields = self.__dict__
+        fields["coins"] = coins
+        fields["potions"] = potions
+        fields["debt"] = debt
+
     def comparison_tuple(self) -> tuple[int, int, int]:
         """Return a tuple representation for comparing card costs."""
         return (self.coins, self.potions, self.debt)
 
 
-@dataclass
+@dataclass(frozen=True)
 class CardStats:
     actions: int = 0
     cards: int = 0
@@ -22,6 +34,23 @@ class CardStats:
     vp: int = 0
     potions: int = 0
 
+    def __init__(
+        self,
+        actions: int = 0,
+        cards: int = 0,
+        coins: int = 0,
+        buys: int = 0,
+        vp: int = 0,
+        potions: int = 0,
+    ):
+        fields = self.__dict__
+        fields["actions"] = actions
+        fields["cards"] = cards
+        fields["coins"] = coins
+        fields["buys"] = buys
+        fields["vp"] = vp
+        fields["potions"] = potions
+
 
 class CardType(Enum):
     ACTION = "action"
@@ -49,117 +78,132 @@ class CardType(Enum):
     TRAVELLER = "traveller"
 
 
-class Card:
-    def __init__(self, name: str, cost: CardCost, stats: CardStats, types: list[CardType]):
-        self.name = name
-        self.cost = cost
-        self.stats = stats
-        self.types = types
-        self.duration_persistent = False
-        # Nocturne: heirloom name (subclasses set this); when this card is in
-        # the kingdom one starting Copper is replaced with this Heirloom.
-        if not hasattr(self, "heirloom"):
-            self.heirloom: str | None = None
-
-        # Debug validation
-        if not isinstance(types, list):
-            raise ValueError(f"Card {name} initialized with types that's not a list: {types}")
-        for t in types:
-            if not isinstance(t, CardType):
-                raise ValueError(f"Card {name} initialized with invalid type: {t}")
-
-    @property
-    def is_action(self) -> bool:
-        return CardType.ACTION in self.types
-
-    @property
-    def is_treasure(self) -> bool:
-        return CardType.TREASURE in self.types
-
-    @property
-    def is_victory(self) -> bool:
-        return CardType.VICTORY in self.types
+# Cost, stats and type metadata are immutable and interned, so every
+# instance of a card shares one object per distinct value.
+_INTERNED: dict[object, object] = {}
 
-    @property
-    def is_attack(self) -> bool:
-        return CardType.ATTACK in self.types
+_TYPE_BITS = {card_type: 1 << index for index, card_type in enumerate(CardType)}
 
-    @property
-    def is_reaction(self) -> bool:
-        return CardType.REACTION in self.types
+# tuple(types) -> (interned types tuple, type bitmask)
+_TYPE_INFO: dict[tuple, tuple[tuple, int]] = {}
 
-    @property
-    def is_duration(self) -> bool:
-        return CardType.DURATION in self.types
-
-    @property
-    def is_command(self) -> bool:
-        return CardType.COMMAND in self.types
-
-    @property
-    def is_shadow(self) -> bool:
-        return CardType.SHADOW in self.types
+# (card class, name) -> (cost, stats, types tuple, type bitmask). A card
+# class always constructs the same metadata for a given name, so only the
+# first construction validates and interns it.
+_CARD_META: dict[tuple[type, str], tuple] = {}
 
-    @property
-    def is_omen(self) -> bool:
-        return CardType.OMEN in self.types
 
-    @property
-    def is_ruins(self) -> bool:
-        return CardType.RUINS in self.types
+def _intern(value):
+    return _INTERNED.setdefault(value, value)
 
-    @property
-    def is_knight(self) -> bool:
-        return CardType.KNIGHT in self.types
 
-    @property
-    def is_looter(self) -> bool:
-        return CardType.LOOTER in self.types
+def _type_info(types) -> tuple[tuple, int]:
+    key = tuple(types)
+    info = _TYPE_INFO.get(key)
+    if info is None:
+        mask = 0
+        for t in key:
+            if not isinstance(t, CardType):
+                raise ValueError(f"Invalid card type: {t}")
+            mask |= _TYPE_BITS[t]
+        info = _TYPE_INFO[key] = (key, mask)
+    return info
 
-    @property
-    def is_castle(self) -> bool:
-        return CardType.CASTLE in self.types
 
-    @property
-    def is_night(self) -> bool:
-        return CardType.NIGHT in self.types
+def _card_meta(name: str, cost: CardCost, stats: CardStats, types: list[CardType]) -> tuple:
+    # Debug validation
+    if not isinstance(types, list):
+        raise ValueError(f"Card {name} initialized with types that's not a list: {types}")
+    for t in types:
+        if not isinstance(t, CardType):
+            raise ValueError(f"Card {name} initialized with invalid type: {t}")
+    return (_intern(cost), _intern(stats)) + _type_info(types)
 
-    @property
-    def is_spirit(self) -> bool:
-        return CardType.SPIRIT in self.types
 
-    @property
-    def is_fate(self) -> bool:
-        return CardType.FATE in self.types
+def _type_flag(card_type: CardType) -> property:
+    bit = _TYPE_BITS[card_type]
 
-    @property
-    def is_doom(self) -> bool:
-        return CardType.DOOM in self.types
+    def check(self) -> bool:
+        return self._type_mask & bit != 0
 
-    @property
-    def is_zombie(self) -> bool:
-        return CardType.ZOMBIE in self.types
+    check.__name__ = f"is_{card_type.value}"
+    return property(check)
 
-    @property
-    def is_heirloom(self) -> bool:
-        return CardType.HEIRLOOM in self.types
 
-    @property
-    def is_reserve(self) -> bool:
-        return CardType.RESERVE in self.types
+class Card:
+    # ``_frog_topdeck`` and ``_chameleon_active`` are set by Ways on whichever
+    # Action they are played through, so they are declared here rather than
+    # on each card. Card subclasses that keep their own per-instance state
+    # (and the Estates Inheritance rebinds methods on) still get a
+    # ``__dict__`` because they do not declare ``__slots__``.
+    __slots__ = (
+        "name",
+        "cost",
+        "stats",
+        "_types",
+        "_type_mask",
+        "duration_persistent",
+        "_frog_topdeck",
+        "_chameleon_active",
+        "__weakref__",
+    )
+
+    # Nocturne: heirloom name (subclasses override this); when this card is
+    # in the kingdom one starting Copper is replaced with this Heirloom.
+    heirloom: "str | None" = None
 
-    @property
-    def is_traveller(self) -> bool:
-        return CardType.TRAVELLER in self.types
+    def __init__(self, name: str, cost: CardCost, stats: CardStats, types: list[CardType]):
+        key = (type(self), name)
+        meta = _CARD_META.get(key)
+        if meta is None:
+            meta = _CARD_META[key] = _card_meta(name, cost, stats, types)
+        self.name = name
+        self.cost, self.stats, self._types, self._type_mask = meta
+        self.duration_persistent = False
 
     @property
-    def is_liaison(self) -> bool:
-        return CardType.LIAISON in self.types
+    def types(self) -> tuple[CardType, ...]:
+        return self._types
+
+    @types.setter
+    def types(self, value) -> None:
+        self._types, self._type_mask = _type_info(value)
+
+    def has_type(self, card_type: CardType) -> bool:
+        return self._type_mask & _TYPE_BITS[card_type] != 0
+
+    is_action = _type_flag(CardType.ACTION)
+    is_treasure = _type_flag(CardType.TREASURE)
+    is_victory = _type_flag(CardType.VICTORY)
+    is_attack = _type_flag(CardType.ATTACK)
+    is_reaction = _type_flag(CardType.REACTION)
+    is_duration = _type_flag(CardType.DURATION)
+    is_command = _type_flag(CardType.COMMAND)
+    is_shadow = _type_flag(CardType.SHADOW)
+    is_omen = _type_flag(CardType.OMEN)
+    is_ruins = _type_flag(CardType.RUINS)
+    is_knight = _type_flag(CardType.KNIGHT)
+    is_looter = _type_flag(CardType.LOOTER)
+    is_castle = _type_flag(CardType.CASTLE)
+    is_night = _type_flag(CardType.NIGHT)
+    is_spirit = _type_flag(CardType.SPIRIT)
+    is_fate = _type_flag(CardType.FATE)
+    is_doom = _type_flag(CardType.DOOM)
+    is_zombie = _type_flag(CardType.ZOMBIE)
+    is_heirloom = _type_flag(CardType.HEIRLOOM)
+    is_reserve = _type_flag(CardType.RESERVE)
+    is_traveller = _type_flag(CardType.TRAVELLER)
+    is_liaison = _type_flag(CardType.LIAISON)
 
     def get_victory_points(self, player) -> int:
         """Get victory points this card provides for the given player."""
         return self.stats.vp
 
+    # Cards whose VP depends only on what their owner has (Gardens, Duke)
+    # also define ``deck_victory_points(deck)`` over a
+    # ``dominion.game.vp_ledger.DeckSummary`` so the VP ledger can score
+    # them without walking the deck.
+
     def starting_supply(self, game_state) -> int:
         """Get number of copies of this card in the supply at game start."""
         return 10
@@ -182,8 +226,20 @@ class Card:
 
     def on_play(self, game_state):
         """Execute this card's effects when played."""
+        profiler = getattr(game_state, "profiler", None)
+        if profiler is not None:
+            profiler.call("card", self.name, self._resolve_play, game_state)
+        else:
+            self._resolve_play(game_state)
+
+    def _resolve_play(self, game_state):
         player = game_state.current_player
 
+        # Plays can change costs (Quarry, Bridge Troll, Highway, ...).
+        invalidate_costs = getattr(game_state, "invalidate_cost_cache", None)
+        if invalidate_costs is not None:
+            invalidate_costs()
+
         # Rising Sun: "+1 Sun" always appears first on Omens, before any
         # other text. Removing the last Sun token activates the Prophecy in
         # the middle of resolving the Omen (e.g. so Kitsune sees the new
@@ -191,7 +247,7 @@ class Card:
         if self.is_omen:
             game_state.remove_sun_token(1)
 
-        if player.ignore_action_bonuses:
+        if player.turn.ignore_action_bonuses:
             added_actions = 0
         else:
             added_actions = self.stats.actions
@@ -278,10 +334,10 @@ class Card:
 
     def on_gain(self, game_state, player):
         """Effects that happen when card is gained."""
-        if self.is_action and getattr(player, "collection_played", 0) > 0:
-            player.vp_tokens += player.collection_played
+        if self.is_action and player.turn.collection_played > 0:
+            player.vp_tokens += player.turn.collection_played
         if self.cost.coins == 5:
-            player.gained_five_this_turn = True
+            player.turn.gained_five_this_turn = True
 
     def on_trash(self, game_state, player):
         """Effects that happen when card is trashed. Override in subclasses."""
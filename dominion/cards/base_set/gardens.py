@@ -17,3 +17,6 @@ class Gardens(Card):
     def get_victory_points(self, player) -> int:
         total_cards = len(player.all_cards())
         return total_cards // 10
+
+    def deck_victory_points(self, deck) -> int:
+        return deck.size // 10
@@ -22,4 +22,4 @@ class Merchant(Card):
         # When the player plays their first Silver this turn the treasure
         # phase resolution adds the accumulated bonus and resets it.
         player = game_state.current_player
-        player.merchant_silver_bonus = getattr(player, "merchant_silver_bonus", 0) + 1
+        player.turn.merchant_silver_bonus += 1
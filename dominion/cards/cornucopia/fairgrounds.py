@@ -15,3 +15,6 @@ class Fairgrounds(Card):
     def get_victory_points(self, player) -> int:
         unique_names = {card.name for card in player.all_cards()}
         return (len(unique_names) // 5) * 2
+
+    def deck_victory_points(self, deck) -> int:
+        return (deck.distinct_names // 5) * 2
@@ -102,7 +102,7 @@ class Renown(Card):
 
     def play_effect(self, game_state):
         player = game_state.current_player
-        player.cost_reduction += 2
+        player.turn.cost_reduction += 2
 
 
 class Courser(Card):
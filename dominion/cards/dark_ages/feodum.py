@@ -22,6 +22,9 @@ class Feodum(Card):
         silvers = sum(1 for card in player.all_cards() if card.name == "Silver")
         return silvers // 3
 
+    def deck_victory_points(self, deck) -> int:
+        return deck.counts["Silver"] // 3
+
     def on_trash(self, game_state, player):
         from ..registry import get_card
 
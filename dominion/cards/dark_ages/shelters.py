@@ -49,5 +49,8 @@ class OvergrownEstate(Card):
         # Overgrown Estate is worth 0 VP (special card type, not 1).
         return 0
 
+    def deck_victory_points(self, deck) -> int:
+        return 0
+
     def on_trash(self, game_state, player):
         game_state.draw_cards(player, 1)
@@ -65,6 +65,9 @@ class HumbleCastle(_CastleBase):
     def get_victory_points(self, player) -> int:
         return sum(1 for c in player.all_cards() if c.is_castle)
 
+    def deck_victory_points(self, deck) -> int:
+        return deck.castles
+
 
 class CrumblingCastle(_CastleBase):
     """$4 Victory-Castle. 1 VP. On gain or trash: +1 VP token, gain a Silver."""
@@ -264,6 +267,9 @@ class KingsCastle(_CastleBase):
     def get_victory_points(self, player) -> int:
         return 2 * sum(1 for c in player.all_cards() if c.is_castle)
 
+    def deck_victory_points(self, deck) -> int:
+        return 2 * deck.castles
+
 
 __all__ = [
     "HumbleCastle",
@@ -52,6 +52,6 @@ class Charm(Card):
                 game_state.supply[gain_choice.name] -= 1
                 game_state.gain_card(player, gain_choice)
         elif choice == self.COPY_NEXT_BUY_OPTION:
-            player.charm_next_buy_copies = getattr(player, "charm_next_buy_copies", 0) + 1
+            player.turn.charm_next_buy_copies += 1
         else:
             player.coins += 2
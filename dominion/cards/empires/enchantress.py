@@ -44,9 +44,9 @@ class Enchantress(Card):
             if other is player:
                 # Clear our own flag too just in case.
                 other.enchantress_active = False
-                other.enchantress_used_this_turn = False
+                other.turn.enchantress_used_this_turn = False
             else:
                 other.enchantress_active = False
-                other.enchantress_used_this_turn = False
+                other.turn.enchantress_used_this_turn = False
         # Allow this card to leave duration after this trigger.
         self.duration_persistent = False
@@ -18,9 +18,9 @@ class Fortune(BottomSplitPileCard):
 
     def play_effect(self, game_state):
         player = game_state.current_player
-        if not getattr(player, "fortune_doubled_this_turn", False):
+        if not player.turn.fortune_doubled_this_turn:
             player.coins *= 2
-            player.fortune_doubled_this_turn = True
+            player.turn.fortune_doubled_this_turn = True
 
     def on_gain(self, game_state, player):
         from ..registry import get_card
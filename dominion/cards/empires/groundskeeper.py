@@ -12,4 +12,4 @@ class Groundskeeper(Card):
 
     def play_effect(self, game_state):
         player = game_state.current_player
-        player.groundskeeper_bonus = getattr(player, "groundskeeper_bonus", 0) + 1
+        player.turn.groundskeeper_bonus += 1
@@ -13,4 +13,4 @@ class MerchantGuild(Card):
         )
 
     def play_effect(self, game_state):
-        game_state.current_player.merchant_guilds_played += 1
+        game_state.current_player.turn.merchant_guilds_played += 1
@@ -16,6 +16,6 @@ class Crossroads(Card):
         victory_cards = sum(1 for card in player.hand if card.is_victory)
         player.actions += victory_cards
 
-        player.crossroads_played += 1
-        if player.crossroads_played == 1:
+        player.turn.crossroads_played += 1
+        if player.turn.crossroads_played == 1:
             player.buys += 1
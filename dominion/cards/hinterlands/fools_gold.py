@@ -13,9 +13,9 @@ class FoolsGold(Card):
     def play_effect(self, game_state):
         player = game_state.current_player
 
-        if player.fools_gold_played >= 1:
+        if player.turn.fools_gold_played >= 1:
             player.coins += 4
         else:
             player.coins += 1
 
-        player.fools_gold_played += 1
+        player.turn.fools_gold_played += 1
@@ -50,7 +50,7 @@ class IllGottenGains(Card):
                 if count <= 0:
                     continue
                 card = get_card(card_name)
-                if card_name in player.banned_buys:
+                if card_name in player.turn.banned_buys:
                     continue
 
                 cost = game_state.get_card_cost(player, card)
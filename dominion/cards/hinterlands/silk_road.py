@@ -13,3 +13,6 @@ class SilkRoad(Card):
     def get_victory_points(self, player) -> int:
         victory_cards = sum(1 for card in player.all_cards() if card.is_victory)
         return victory_cards // 4
+
+    def deck_victory_points(self, deck) -> int:
+        return deck.victories // 4
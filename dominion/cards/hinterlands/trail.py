@@ -34,7 +34,7 @@ class Trail(Card):
 
         if self.is_action:
             player.actions_played += 1
-            player.actions_this_turn += 1
+            player.turn.actions_this_turn += 1
 
         player.in_play.append(self)
 
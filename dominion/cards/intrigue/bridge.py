@@ -14,4 +14,4 @@ class Bridge(Card):
 
     def play_effect(self, game_state):
         player = game_state.current_player
-        player.cost_reduction += 1
+        player.turn.cost_reduction += 1
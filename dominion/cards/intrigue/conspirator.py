@@ -14,6 +14,6 @@ class Conspirator(Card):
 
     def play_effect(self, game_state):
         player = game_state.current_player
-        if player.actions_this_turn >= 3:
+        if player.turn.actions_this_turn >= 3:
             game_state.draw_cards(player, 1)
             player.actions += 1
@@ -22,4 +22,4 @@ class Coppersmith(Card):
 
     def play_effect(self, game_state):
         player = game_state.current_player
-        player.coppersmiths_played = getattr(player, "coppersmiths_played", 0) + 1
+        player.turn.coppersmiths_played += 1
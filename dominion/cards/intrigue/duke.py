@@ -16,3 +16,6 @@ class Duke(Card):
 
     def get_victory_points(self, player) -> int:
         return sum(1 for card in player.all_cards() if card.name == "Duchy")
+
+    def deck_victory_points(self, deck) -> int:
+        return deck.counts["Duchy"]
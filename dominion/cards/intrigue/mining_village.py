@@ -18,7 +18,9 @@ class MiningVillage(Card):
         player = game_state.current_player
         # The card has been moved from hand into player.in_play before
         # play_effect runs. Decide whether to trash it for +$2.
-        if not self._should_self_trash(game_state, player):
+        # Looked up on the class: an Estate inheriting Mining Village only
+        # has ``play_effect`` bound, not the helpers.
+        if not MiningVillage._should_self_trash(game_state, player):
             return
 
         # Find this exact instance in play and trash it.
@@ -29,7 +31,8 @@ class MiningVillage(Card):
                 player.coins += 2
                 return
 
-    def _should_self_trash(self, game_state, player) -> bool:
+    @staticmethod
+    def _should_self_trash(game_state, player) -> bool:
         """Ask the AI whether to trash this Mining Village for +$2.
 
         The AI hook lives on ``BaseAI.should_trash_mining_village`` so
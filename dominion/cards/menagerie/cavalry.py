@@ -36,6 +36,6 @@ class Cavalry(Card):
         # If we're in the Buy phase, return to Action phase (once per turn).
         # The card text only specifies returning to the Action phase; it does
         # not grant extra Actions, so leave ``player.actions`` untouched.
-        if game_state.phase == "buy" and not getattr(player, "cavalry_returned_this_turn", False):
-            player.cavalry_returned_this_turn = True
+        if game_state.phase == "buy" and not player.turn.cavalry_returned_this_turn:
+            player.turn.cavalry_returned_this_turn = True
             game_state.phase = "action"
@@ -13,4 +13,4 @@ class Destrier(Card):
         )
 
     def cost_modifier(self, game_state, player) -> int:
-        return -getattr(player, "cards_gained_this_turn", 0)
+        return -player.turn.cards_gained_this_turn
@@ -28,8 +28,6 @@ class Gatekeeper(Card):
         # Attack: mark opponents as under gatekeeper attack
         for other in game_state.players:
             if other is not player:
-                if not hasattr(other, "gatekeeper_attacks"):
-                    other.gatekeeper_attacks = 0
                 other.gatekeeper_attacks += 1
 
     def on_duration(self, game_state):
@@ -39,7 +37,6 @@ class Gatekeeper(Card):
         # Remove attack effect from opponents
         for other in game_state.players:
             if other is not player:
-                if hasattr(other, "gatekeeper_attacks"):
-                    other.gatekeeper_attacks = max(0, other.gatekeeper_attacks - 1)
+                other.gatekeeper_attacks = max(0, other.gatekeeper_attacks - 1)
 
         self.duration_persistent = False
@@ -17,4 +17,4 @@ class Kiln(Card):
     def play_effect(self, game_state):
         player = game_state.current_player
         # Mark the next card play to be copied
-        player.kiln_pending = getattr(player, "kiln_pending", 0) + 1
+        player.turn.kiln_pending += 1
@@ -0,0 +1,344 @@
+"""Static facts about every registered card, built once and cached on disk.
+
+Strategy tools, encoders and analysis scripts all need the same per-card
+facts -- cost, types, printed stats, which ``Card`` methods a class
+overrides, heuristic strategic roles and which cards share a pile. Getting
+them used to mean constructing the card, and for roles reading the class
+source with ``inspect``. :func:`card_metadata` builds a
+:class:`CardMetadata` for every registry entry once and saves the table as
+JSON under ``$PY_OVERLORD_CACHE_DIR`` (default ``~/.cache/py-overlord``;
+set it to an empty string to disable). The file name carries
+:func:`registry_fingerprint`, a hash of the registry's names and classes
+and of the source files they come from, so editing or adding a card
+builds a fresh table; saving it deletes the tables of older fingerprints.
+
+Building the table describes every registered card, which takes a couple
+of seconds. A process pays that on its first lookup -- even for a single
+card, as in ``infer_card_roles("Smithy")`` -- whenever no saved table
+matches: on a cold cache, after any card file changes, and always when
+disk caching is disabled.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from dominion.cards.base_card import _TYPE_BITS, Card, CardCost, CardStats, CardType, _type_flag
+from dominion.cards.registry import CARD_ALIASES, CARD_TYPES, registry_version
+
+# Bump when the stored fields or the role heuristics change.
+FORMAT_VERSION = 1
+
+
+class CardMetadata:
+    """What a freshly constructed card of one registry entry looks like.
+
+    Offers the same ``name``, ``cost``, ``stats``, ``types`` and ``is_*``
+    queries as a :class:`Card`, plus:
+
+    * ``methods`` -- names of ``Card`` methods the class overrides, and
+      methods it adds (``on_cargo_ship_gain``, ``deck_victory_points``...),
+    * ``roles`` -- heuristic strategic roles (see :func:`_infer_roles`),
+    * ``pile`` -- every card sharing this card's pile, top to bottom, for
+      split piles, Allies and Wizards piles, Castles, Knights and Ruins;
+      empty when the card has a pile of its own,
+    * ``source_ref`` -- ``path:line`` of the class definition.
+    """
+
+    __slots__ = ("name", "cost", "stats", "types", "_type_mask", "methods", "roles", "pile", "source_ref")
+
+    def __init__(
+        self,
+        name: str,
+        cost: CardCost,
+        stats: CardStats,
+        types: tuple[CardType, ...],
+        methods: frozenset[str],
+        roles: frozenset[str],
+        pile: tuple[str, ...],
+        source_ref: str,
+    ) -> None:
+        self.name = name
+        self.cost = cost
+        self.stats = stats
+        self.types = types
+        self._type_mask = 0
+        for card_type in types:
+            self._type_mask |= _TYPE_BITS[card_type]
+        self.methods = methods
+        self.roles = roles
+        self.pile = pile
+        self.source_ref = source_ref
+
+    def has_type(self, card_type: CardType) -> bool:
+        return self._type_mask & _TYPE_BITS[card_type] != 0
+
+    def overrides(self, method: str) -> bool:
+        """Whether the class overrides (or adds) ``method``."""
+        return method in self.methods
+
+    def __repr__(self) -> str:
+        return f"CardMetadata({self.name!r})"
+
+    def _to_json(self) -> list:
+        return [
+            self.name,
+            list(self.cost.comparison_tuple()),
+            [self.stats.actions, self.stats.cards, self.stats.coins, self.stats.buys, self.stats.vp, self.stats.potions],
+            [card_type.value for card_type in self.types],
+            sorted(self.methods),
+            sorted(self.roles),
+            list(self.pile),
+            self.source_ref,
+        ]
+
+    @classmethod
+    def _from_json(cls, entry: list) -> CardMetadata:
+        name, cost, stats, types, methods, roles, pile, source_ref = entry
+        return cls(
+            name,
+            CardCost(*cost),
+            CardStats(*stats),
+            tuple(CardType(value) for value in types),
+            frozenset(methods),
+            frozenset(roles),
+            tuple(pile),
+            source_ref,
+        )
+
+
+for _card_type in CardType:
+    setattr(CardMetadata, f"is_{_card_type.value}", _type_flag(_card_type))
+
+
+def _methods(cls: type) -> frozenset[str]:
+    names = {
+        name
+        for klass in cls.__mro__
+        if klass is not Card and klass is not object
+        for name, value in vars(klass).items()
+        if callable(value) and not name.startswith("__")
+    }
+    return frozenset(name for name in names if getattr(cls, name) is not getattr(Card, name, None))
+
+
+def _class_source(cls: type) -> tuple[str, str]:
+    """The class body and its ``path:line``, or empty strings if unavailable."""
+    try:
+        path = inspect.getsourcefile(cls) or ""
+        lines, line = inspect.getsourcelines(cls)
+    except (OSError, TypeError):
+        return "", ""
+    return "".join(lines), f"{path}:{line}"
+
+
+def _infer_roles(card: Card, source: str) -> frozenset[str]:
+    """Heuristic strategic roles from printed stats, types and class source."""
+    roles: set[str] = set()
+    if card.is_action:
+        roles.add("action")
+        if card.stats.actions > 0:
+            roles.add("nonterminal")
+            roles.add("village")
+        else:
+            roles.add("terminal")
+        if card.stats.cards >= 1 and card.stats.actions >= 1:
+            roles.add("cantrip")
+        if card.stats.cards >= 2:
+            roles.add("draw")
+        if card.stats.cards >= 2 and card.stats.actions == 0:
+            roles.add("terminal_draw")
+        if card.stats.coins >= 2 or card.stats.buys > 0:
+            roles.add("payload")
+        if card.is_attack:
+            roles.add("attack")
+        if card.is_duration:
+            roles.add("duration")
+        if card.is_command:
+            roles.add("command")
+
+    if card.is_treasure:
+        roles.add("treasure")
+        if card.stats.coins >= 2:
+            roles.add("payload")
+
+    if card.is_victory:
+        roles.add("victory")
+
+    lowered = source.lower()
+    if "trash" in lowered:
+        roles.add("trasher")
+    if "gain_card(" in source:
+        roles.add("gainer")
+    if "discard" in lowered and card.is_action:
+        roles.add("sifter")
+    if "choose_" in source or "should_" in source:
+        roles.add("mode_or_choice")
+    if "cost_reduction" in source and "+=" in source:
+        roles.add("cost_reducer")
+    return frozenset(roles)
+
+
+def _pile(card: Card) -> tuple[str, ...]:
+    from dominion.cards.allies._split_base import AlliesSplitCard
+    from dominion.cards.allies.wizards import WIZARDS_PILE_ORDER, WizardsSplitCard
+    from dominion.cards.dark_ages.knights import KNIGHT_NAMES
+    from dominion.cards.dark_ages.ruins import RUIN_VARIANT_NAMES
+    from dominion.cards.empires.castles import CASTLE_ORDER
+    from dominion.cards.split_pile import SplitPileMixin
+
+    if isinstance(card, SplitPileMixin):
+        if card.bottom:
+            return (card.partner_card_name, card.name)
+        return (card.name, card.partner_card_name)
+    if isinstance(card, AlliesSplitCard):
+        return tuple(card.pile_order)
+    if isinstance(card, WizardsSplitCard):
+        return tuple(WIZARDS_PILE_ORDER)
+    if card.is_castle:
+        return tuple(CASTLE_ORDER)
+    if card.is_knight or card.name == "Knights":
+        return tuple(KNIGHT_NAMES)
+    if card.is_ruins or card.name == "Ruins":
+        return tuple(RUIN_VARIANT_NAMES)
+    return ()
+
+
+def _describe(cls: type) -> Optional[CardMetadata]:
+    try:
+        card = cls()
+    except ValueError:
+        return None
+    source, source_ref = _class_source(cls)
+    return CardMetadata(
+        card.name,
+        card.cost,
+        card.stats,
+        tuple(card.types),
+        _methods(cls),
+        _infer_roles(card, source),
+        _pile(card),
+        source_ref,
+    )
+
+
+# Metadata by card class, so a registry change only describes new classes.
+_by_class: dict[type, Optional[CardMetadata]] = {}
+
+
+def build_card_metadata() -> dict[str, CardMetadata]:
+    """Construct every registered card and record its metadata, by registry name."""
+    table: dict[str, CardMetadata] = {}
+    for key, cls in CARD_TYPES.items():
+        if cls not in _by_class:
+            _by_class[cls] = _describe(cls)
+        meta = _by_class[cls]
+        if meta is not None:
+            table[key] = meta
+    return table
+
+
+def registry_fingerprint() -> str:
+    """Hash of the registry's names, classes and their source files.
+
+    Stable across processes for an unchanged tree, so it can name a cache
+    file. Source files are identified by path, size and modification
+    time rather than read.
+    """
+    digest = hashlib.sha1(f"card-metadata/{FORMAT_VERSION}".encode())
+    modules = {__name__, "dominion.cards.base_card"}
+    for key, cls in CARD_TYPES.items():
+        digest.update(f"{key}={cls.__module__}.{cls.__qualname__};".encode())
+        modules.update(klass.__module__ for klass in cls.__mro__)
+    for name in sorted(modules):
+        path = getattr(sys.modules.get(name), "__file__", None)
+        if path is None:
+            continue
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()
+
+
+def cache_dir() -> Optional[Path]:
+    """Directory for the on-disk table, or None when disk caching is off."""
+    configured = os.environ.get("PY_OVERLORD_CACHE_DIR")
+    if configured is not None:
+        return Path(configured) if configured else None
+    return Path.home() / ".cache" / "py-overlord"
+
+
+def _load(path: Path) -> Optional[dict[str, CardMetadata]]:
+    try:
+        data = json.loads(path.read_text())
+        return {key: CardMetadata._from_json(entry) for key, entry in data["cards"].items()}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save(path: Path, table: dict[str, CardMetadata]) -> None:
+    """Write ``table`` to ``path`` and delete tables saved for other fingerprints."""
+    data = {"format": FORMAT_VERSION, "cards": {key: meta._to_json() for key, meta in table.items()}}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False) as handle:
+            json.dump(data, handle)
+        os.replace(handle.name, path)
+    except OSError:
+        return
+    for stale in path.parent.glob("card-metadata-*.json"):
+        if stale != path:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+
+_table: tuple[Optional[int], dict[str, CardMetadata]] = (None, {})
+
+
+def card_metadata() -> dict[str, CardMetadata]:
+    """Metadata for every registered card, keyed by registry name.
+
+    The first call in a process loads the disk table for the current
+    :func:`registry_fingerprint`, or builds and saves it. Later registry
+    changes (cards registered at runtime, tests swapping classes) are
+    handled in memory, describing only the classes not seen before.
+    """
+    global _table
+    version = registry_version()
+    cached_version, table = _table
+    if cached_version == version:
+        return table
+    directory = cache_dir() if not _by_class else None
+    path = directory / f"card-metadata-{registry_fingerprint()}.json" if directory is not None else None
+    loaded = _load(path) if path is not None and path.exists() else None
+    if loaded is not None:
+        for key, cls in CARD_TYPES.items():
+            _by_class.setdefault(cls, loaded.get(key))
+    else:
+        loaded = build_card_metadata()
+        if path is not None:
+            _save(path, loaded)
+    _table = (version, loaded)
+    return loaded
+
+
+def get_card_metadata(name: str) -> CardMetadata:
+    """Metadata for the card called ``name`` (aliases allowed).
+
+    Raises ``ValueError`` for unknown names, like ``get_card``.
+    """
+    meta = card_metadata().get(CARD_ALIASES.get(name, name))
+    if meta is None:
+        raise ValueError(f"Unknown card: {name}")
+    return meta
@@ -38,5 +38,5 @@ class Conclave(Card):
         played = game_state.play_action_indirectly(
             player, choice, blocked_return_zone=player.hand
         )
-        if played and not player.ignore_action_bonuses:
+        if played and not player.turn.ignore_action_bonuses:
             player.actions += 1
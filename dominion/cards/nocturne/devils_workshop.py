@@ -22,7 +22,7 @@ class DevilsWorkshop(Card):
         from ..registry import get_card
 
         player = game_state.current_player
-        gained = getattr(player, "cards_gained_this_turn_count", 0)
+        gained = player.turn.cards_gained_this_turn_count
 
         if gained >= 2:
             if game_state.supply.get("Imp", 0) > 0:
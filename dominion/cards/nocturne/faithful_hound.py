@@ -27,6 +27,4 @@ class FaithfulHound(Card):
 
         if self in player.discard:
             player.discard.remove(self)
-            if not hasattr(player, "hound_set_aside"):
-                player.hound_set_aside = []
             player.hound_set_aside.append(self)
@@ -36,6 +36,6 @@ class GhostTown(Card):
     def on_duration(self, game_state):
         player = game_state.current_player
         game_state.draw_cards(player, 1)
-        if not player.ignore_action_bonuses:
+        if not player.turn.ignore_action_bonuses:
             player.actions += 1
         self.duration_persistent = False
@@ -19,3 +19,6 @@ class Pasture(Card):
 
     def get_victory_points(self, player) -> int:
         return sum(1 for c in player.all_cards() if c.name == "Estate")
+
+    def deck_victory_points(self, deck) -> int:
+        return deck.counts["Estate"]
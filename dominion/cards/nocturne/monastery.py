@@ -18,7 +18,7 @@ class Monastery(Card):
 
     def play_effect(self, game_state):
         player = game_state.current_player
-        gained = getattr(player, "cards_gained_this_turn_count", 0)
+        gained = player.turn.cards_gained_this_turn_count
         if gained <= 0:
             return
         # Choices: cards in hand + Coppers in play
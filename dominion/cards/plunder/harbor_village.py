@@ -22,6 +22,4 @@ class HarborVillage(Card):
     def play_effect(self, game_state):
         player = game_state.current_player
         # Track that the next action should grant +$1 if it gives +$
-        if not hasattr(player, "harbor_village_pending"):
-            player.harbor_village_pending = 0
-        player.harbor_village_pending += 1
+        player.turn.harbor_village_pending += 1
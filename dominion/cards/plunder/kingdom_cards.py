@@ -391,7 +391,7 @@ class Crucible(Card):
             if choice and choice in player.hand:
                 player.hand.remove(choice)
                 game_state.trash_card(player, choice)
-        player.coins += getattr(player, "cards_trashed_this_turn", 0)
+        player.coins += player.turn.cards_trashed_this_turn
 
 
 class FortuneHunter(Card):
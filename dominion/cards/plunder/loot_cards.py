@@ -6,12 +6,12 @@ from ..base_card import Card, CardCost, CardStats, CardType
 class Loot(Card):
     """Base class for Loot treasures."""
 
-    def __init__(self, name: str, stats: CardStats):
+    def __init__(self, name: str, stats: CardStats, extra_types: tuple[CardType, ...] = ()):
         super().__init__(
             name=name,
             cost=CardCost(coins=7),
             stats=stats,
-            types=[CardType.TREASURE],
+            types=[CardType.TREASURE, *extra_types],
         )
 
     def may_be_bought(self, game_state) -> bool:  # pragma: no cover - not in supply
@@ -20,8 +20,7 @@ class Loot(Card):
 
 class Amphora(Loot):
     def __init__(self):
-        super().__init__("Amphora", CardStats())
-        self.types.append(CardType.DURATION)
+        super().__init__("Amphora", CardStats(), (CardType.DURATION,))
         self.delayed = False
 
     def play_effect(self, game_state):
@@ -59,8 +58,7 @@ class Doubloons(Loot):
 
 class EndlessChalice(Loot):
     def __init__(self):
-        super().__init__("Endless Chalice", CardStats(coins=1, buys=1))
-        self.types.append(CardType.DURATION)
+        super().__init__("Endless Chalice", CardStats(coins=1, buys=1), (CardType.DURATION,))
         self.duration_persistent = True
 
     def play_effect(self, game_state):
@@ -75,8 +73,7 @@ class EndlessChalice(Loot):
 
 class Figurehead(Loot):
     def __init__(self):
-        super().__init__("Figurehead", CardStats(coins=3))
-        self.types.append(CardType.DURATION)
+        super().__init__("Figurehead", CardStats(coins=3), (CardType.DURATION,))
 
     def play_effect(self, game_state):
         game_state.current_player.duration.append(self)
@@ -118,13 +115,12 @@ class Insignia(Loot):
 
     def play_effect(self, game_state):
         player = game_state.current_player
-        player.insignia_active = True
+        player.turn.insignia_active = True
 
 
 class Jewels(Loot):
     def __init__(self):
-        super().__init__("Jewels", CardStats(coins=3, buys=1))
-        self.types.append(CardType.DURATION)
+        super().__init__("Jewels", CardStats(coins=3, buys=1), (CardType.DURATION,))
         self.duration_persistent = True
 
     def play_effect(self, game_state):
@@ -238,14 +234,12 @@ class Sextant(Loot):
 
 class Shield(Loot):
     def __init__(self):
-        super().__init__("Shield", CardStats(coins=3, buys=1))
-        self.types.append(CardType.REACTION)
+        super().__init__("Shield", CardStats(coins=3, buys=1), (CardType.REACTION,))
 
 
 class SpellScroll(Loot):
     def __init__(self):
-        super().__init__("Spell Scroll", CardStats())
-        self.types.append(CardType.ACTION)
+        super().__init__("Spell Scroll", CardStats(), (CardType.ACTION,))
 
     def play_effect(self, game_state):
         player = game_state.current_player
@@ -294,8 +288,7 @@ class Staff(Loot):
 
 class Sword(Loot):
     def __init__(self):
-        super().__init__("Sword", CardStats(coins=3, buys=1))
-        self.types.append(CardType.ATTACK)
+        super().__init__("Sword", CardStats(coins=3, buys=1), (CardType.ATTACK,))
 
     def play_effect(self, game_state):
         player = game_state.current_player
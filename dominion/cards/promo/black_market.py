@@ -94,8 +94,8 @@ class BlackMarket(Card):
             card.on_overpay(game_state, player, overpay_amount, gained_card=gained)
 
         game_state._handle_on_buy_in_play_effects(player, card, gained)
-        if player.goons_played:
-            player.vp_tokens += player.goons_played
-        if getattr(player, "merchant_guilds_played", 0):
-            player.coin_tokens += player.merchant_guilds_played
+        if player.turn.goons_played:
+            player.vp_tokens += player.turn.goons_played
+        if player.turn.merchant_guilds_played:
+            player.coin_tokens += player.turn.merchant_guilds_played
         game_state._trigger_haggler_bonus(player, card)
@@ -11,4 +11,4 @@ class SnowyVillage(Card):
         )
 
     def play_effect(self, game_state):
-        game_state.current_player.ignore_action_bonuses = True
+        game_state.current_player.turn.ignore_action_bonuses = True
@@ -14,4 +14,4 @@ class WalledVillage(Card):
 
     def play_effect(self, game_state):
         player = game_state.current_player
-        player.walled_villages_played += 1
+        player.turn.walled_villages_played += 1
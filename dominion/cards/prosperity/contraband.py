@@ -29,7 +29,7 @@ class Contraband(Card):
         if banned is None:
             banned = choices[0]
 
-        game_state.current_player.banned_buys.append(banned.name)
+        game_state.current_player.turn.banned_buys.append(banned.name)
         game_state.log_callback(
             (
                 "action",
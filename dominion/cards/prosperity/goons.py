@@ -12,7 +12,7 @@ class Goons(Card):
 
     def play_effect(self, game_state):
         player = game_state.current_player
-        player.goons_played += 1
+        player.turn.goons_played += 1
 
         def attack_target(target):
             if len(target.hand) <= 3:
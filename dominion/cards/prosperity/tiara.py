@@ -11,7 +11,7 @@ class Tiara(Card):
     * Topdeck-on-gain — see ``GameState.gain_card`` (checks for Tiara in play
       and asks ``AI.should_topdeck_with_tiara``).
     * Replay-treasure-once — see ``GameState.handle_treasure_phase`` (gated by
-      ``player.tiara_replay_used`` which resets each turn).
+      ``player.turn.tiara_replay_used`` which resets each turn).
     """
 
     def __init__(self):
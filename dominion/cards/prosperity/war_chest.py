@@ -6,7 +6,7 @@ class WarChest(Card):
     costing up to $5 that wasn't named (this turn).
 
     Multi-shot: every War Chest played in a turn names a different card; the
-    list of named cards is tracked on ``player.war_chest_named_this_turn``.
+    list of named cards is tracked on ``player.turn.war_chest_named_this_turn``.
     """
 
     def __init__(self):
@@ -42,15 +42,15 @@ class WarChest(Card):
         else:
             named_name = named.name
 
-        if named_name not in player.war_chest_named_this_turn:
-            player.war_chest_named_this_turn.append(named_name)
+        if named_name not in player.turn.war_chest_named_this_turn:
+            player.turn.war_chest_named_this_turn.append(named_name)
 
         # Gain a card costing up to $5 that wasn't named (this turn).
         gainable = []
         for name, count in game_state.supply.items():
             if count <= 0:
                 continue
-            if name in player.war_chest_named_this_turn:
+            if name in player.turn.war_chest_named_this_turn:
                 continue
             card = get_card(name)
             if card.cost.coins <= 5 and card.cost.potions == 0:
@@ -1315,3 +1315,12 @@ def get_card(name: str) -> Card:
 def get_all_card_names() -> list[str]:
     """Return the names of all registered cards."""
     return list(CARD_TYPES.keys())
+
+
+def registry_version() -> int:
+    """Identify the current registry contents within this process.
+
+    Changes whenever a card class is registered, replaced or removed, so
+    tables derived from the registry can be cached against it.
+    """
+    return hash(tuple(CARD_TYPES.items()))
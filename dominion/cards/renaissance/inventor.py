@@ -43,4 +43,4 @@ class Inventor(Card):
             game_state.supply[gain.name] -= 1
             game_state.gain_card(player, gain)
 
-        player.cost_reduction += 1
+        player.turn.cost_reduction += 1
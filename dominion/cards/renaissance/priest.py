@@ -35,6 +35,4 @@ class Priest(Card):
                 game_state.trash_card(player, choice)
 
         # The "rest of turn" trigger only applies AFTER Priest's own trash.
-        player.priest_played_this_turn = (
-            getattr(player, "priest_played_this_turn", 0) + 1
-        )
+        player.turn.priest_played_this_turn += 1
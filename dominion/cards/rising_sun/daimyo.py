@@ -21,5 +21,5 @@ class Daimyo(Card):
         player = game_state.current_player
         # Each Daimyo registers a pending replay; the action phase loop
         # replays whatever non-Command Action card is played next.
-        pending = getattr(player, "daimyo_pending", 0)
-        player.daimyo_pending = pending + 1
+        pending = player.turn.daimyo_pending
+        player.turn.daimyo_pending = pending + 1
@@ -29,7 +29,7 @@ class Treasury(Card):
         # "If you didn't gain a Victory card this turn" — checks every gain
         # this turn, not just gains during the Buy phase, so Workshop /
         # Charm / Ironworks etc. still block topdecking.
-        if getattr(player, "gained_victory_this_turn", False):
+        if player.turn.gained_victory_this_turn:
             return
 
         # "you may put this onto your deck" — optional, defer to the AI.
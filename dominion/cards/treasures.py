@@ -17,7 +17,7 @@ class Copper(Card):
         # Coppersmith (Intrigue 1E): each Copper played this turn produces
         # an extra +$1 for each Coppersmith already played this turn.
         player = game_state.current_player
-        bonus = getattr(player, "coppersmiths_played", 0)
+        bonus = player.turn.coppersmiths_played
         if bonus:
             player.coins += bonus
 
@@ -38,10 +38,8 @@ class Silver(Card):
         """Apply Merchant's "first Silver this turn = +$1" bonus."""
 
         player = game_state.current_player
-        already_played_silver = getattr(
-            player, "merchant_silver_bonus_used", False
-        )
-        bonus = getattr(player, "merchant_silver_bonus", 0)
+        already_played_silver = player.turn.merchant_silver_bonus_used
+        bonus = player.turn.merchant_silver_bonus
         if bonus and not already_played_silver:
             player.coins += bonus
             game_state.log_callback(
@@ -56,7 +54,7 @@ class Silver(Card):
         # bonus was active. Otherwise a Silver played before any Merchant
         # would let a later Silver (after Merchant) claim the
         # "first Silver this turn" bonus.
-        player.merchant_silver_bonus_used = True
+        player.turn.merchant_silver_bonus_used = True
 
 
 class Gold(Card):
@@ -13,14 +13,14 @@ class Alms(Event):
         super().__init__("Alms", CardCost(coins=0))
 
     def may_be_bought(self, game_state, player) -> bool:
-        if getattr(player, "alms_used_this_turn", False):
+        if player.turn.alms_used_this_turn:
             return False
         if any(c.is_treasure for c in player.in_play):
             return False
         return True
 
     def on_buy(self, game_state, player) -> None:
-        player.alms_used_this_turn = True
+        player.turn.alms_used_this_turn = True
         candidates = []
         for _name, card, _count in game_state._iter_gainable_supply_cards():
             if card.cost.coins <= 4 and card.cost.potions == 0 and card.cost.debt == 0:
@@ -41,10 +41,10 @@ class Borrow(Event):
         super().__init__("Borrow", CardCost(coins=0))
 
     def may_be_bought(self, game_state, player) -> bool:
-        return not getattr(player, "borrow_used_this_turn", False)
+        return not player.turn.borrow_used_this_turn
 
     def on_buy(self, game_state, player) -> None:
-        player.borrow_used_this_turn = True
+        player.turn.borrow_used_this_turn = True
         player.buys += 1
         player.coins += 1
         player.minus_card_tokens += 1
@@ -153,7 +153,7 @@ class TravellingFair(Event):
 
     def on_buy(self, game_state, player) -> None:
         player.buys += 2
-        player.travelling_fair_active = True
+        player.turn.travelling_fair_active = True
 
 
 class Bonfire(Event):
@@ -223,10 +223,10 @@ class Mission(Event):
         super().__init__("Mission", CardCost(coins=4))
 
     def may_be_bought(self, game_state, player) -> bool:
-        return not getattr(player, "mission_used_this_turn", False)
+        return not player.turn.mission_used_this_turn
 
     def on_buy(self, game_state, player) -> None:
-        player.mission_used_this_turn = True
+        player.turn.mission_used_this_turn = True
         # Schedule an extra turn for this player. The "no buys" restriction
         # applies to the GRANTED extra turn, not the current turn — setting it
         # here would immediately shut off any remaining buys on the current
@@ -245,10 +245,10 @@ class Pilgrimage(Event):
         super().__init__("Pilgrimage", CardCost(coins=4))
 
     def may_be_bought(self, game_state, player) -> bool:
-        return not getattr(player, "pilgrimage_used_this_turn", False)
+        return not player.turn.pilgrimage_used_this_turn
 
     def on_buy(self, game_state, player) -> None:
-        player.pilgrimage_used_this_turn = True
+        player.turn.pilgrimage_used_this_turn = True
         player.journey_token_face_up = not player.journey_token_face_up
         if not player.journey_token_face_up:
             return
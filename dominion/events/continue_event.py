@@ -18,10 +18,10 @@ class Continue(Event):
         super().__init__("Continue", CardCost(coins=0, debt=8))
 
     def may_be_bought(self, game_state, player) -> bool:
-        return not getattr(player, "continue_used_this_turn", False)
+        return not player.turn.continue_used_this_turn
 
     def on_buy(self, game_state, player) -> None:
-        player.continue_used_this_turn = True
+        player.turn.continue_used_this_turn = True
         player.actions += 1
         player.buys += 1
 
@@ -82,8 +82,8 @@ class Continue(Event):
         # under Action-phase semantics (Daimyo replays, Prophecy hooks).
         game_state.phase = "action"
 
-        daimyo_replays = getattr(player, "daimyo_pending", 0)
-        player.daimyo_pending = 0
+        daimyo_replays = player.turn.daimyo_pending
+        player.turn.daimyo_pending = 0
         plays = 1 + daimyo_replays
         for _ in range(plays):
             gained.on_play(game_state)
@@ -15,7 +15,7 @@ class Triumph(Event):
     def on_buy(self, game_state, player) -> None:
         if game_state.supply.get("Estate", 0) <= 0:
             return
-        cards_gained_before = player.cards_gained_this_turn
+        cards_gained_before = player.turn.cards_gained_this_turn
         game_state.supply["Estate"] -= 1
         game_state.gain_card(player, get_card("Estate"))
         # Per Empires rule: +1 VP per card gained this turn (Estate counted).
@@ -368,8 +368,6 @@ class Reap(Event):
         game_state.supply["Gold"] -= 1
         gold = get_card("Gold")
         # Track on player so it gets played at start of next turn.
-        if not hasattr(player, "reap_set_aside"):
-            player.reap_set_aside = []
         player.reap_set_aside.append(gold)
 
 
@@ -137,10 +137,10 @@ class Launch(Event):
         super().__init__("Launch", CardCost(coins=3))
 
     def may_be_bought(self, game_state, player) -> bool:
-        return not getattr(player, "launch_used", False)
+        return not player.turn.launch_used
 
     def on_buy(self, game_state, player) -> None:
-        player.launch_used = True
+        player.turn.launch_used = True
         game_state.draw_cards(player, 1)
         player.actions += 1
         player.buys += 1
@@ -328,7 +328,7 @@ class Journey(Event):
         super().__init__("Journey", CardCost(coins=4))
 
     def may_be_bought(self, game_state, player) -> bool:
-        if getattr(player, "journey_used_this_turn", False):
+        if player.turn.journey_used_this_turn:
             return False
         # "Not a 3rd in a row": refuse if the current turn is already an extra
         # turn from any source (Outpost, Journey, Seize the Day, etc.).
@@ -339,7 +339,7 @@ class Journey(Event):
         return True
 
     def on_buy(self, game_state, player) -> None:
-        player.journey_used_this_turn = True
+        player.turn.journey_used_this_turn = True
         player.journey_extra_turn_pending = True
         game_state.extra_turn = True
 
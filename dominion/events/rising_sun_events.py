@@ -66,7 +66,7 @@ class Asceticism(Event):
         if extra <= 0:
             return
         player.coins -= extra
-        player.coins_spent_this_turn += extra
+        player.turn.coins_spent_this_turn += extra
 
         chosen = player.ai.choose_cards_to_trash(
             game_state, list(player.hand), extra
@@ -272,7 +272,7 @@ class ReceiveTribute(Event):
         super().__init__("Receive Tribute", CardCost(coins=5))
 
     def on_buy(self, game_state, player) -> None:
-        if getattr(player, "cards_gained_this_turn", 0) < 3:
+        if player.turn.cards_gained_this_turn < 3:
             return
         in_play_names = {c.name for c in player.in_play + player.duration}
         gained_names: set = set()
@@ -41,6 +41,4 @@ class Training(Event):
                 best_pile = name
 
         if best_pile:
-            if not hasattr(player, "training_pile"):
-                player.training_pile = None
             player.training_pile = best_pile
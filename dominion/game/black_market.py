@@ -0,0 +1,81 @@
+"""Black Market deck construction from a cached eligibility table.
+
+The Black Market deck holds every registered card that is not in the game's
+Supply, minus basic cards and non-Supply piles such as Horse, Spoils and
+Ruins (Events and Projects have registries of their own).
+:func:`black_market_candidates` derives the eligible cards from the card
+metadata table once per :func:`~dominion.cards.registry.registry_version`
+and each game only filters them by its Supply and shuffles the result with
+the game's RNG (:func:`build_black_market_deck`).
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Collection, NamedTuple, Optional
+
+from dominion.cards.metadata import card_metadata, get_card_metadata
+from dominion.cards.registry import CARD_ALIASES, registry_version
+
+# Cards that never go in the Black Market deck.
+EXCLUDED_NAMES = frozenset({
+    "Copper", "Silver", "Gold", "Platinum",
+    "Estate", "Duchy", "Province", "Colony", "Curse",
+    "Horse", "Spoils", "Ruins",
+})
+
+
+class BlackMarketCandidate(NamedTuple):
+    """One card the Black Market deck may contain."""
+
+    # Registry key, compared against the Supply's pile names.
+    key: str
+    # Card name, as it appears in the deck.
+    name: str
+    potion_cost: bool
+
+
+_table: tuple[Optional[int], tuple[BlackMarketCandidate, ...]] = (None, ())
+
+
+def black_market_candidates() -> tuple[BlackMarketCandidate, ...]:
+    """Every card eligible for a Black Market deck, in registry order."""
+    global _table
+    version = registry_version()
+    cached_version, candidates = _table
+    if cached_version != version:
+        candidates = tuple(
+            BlackMarketCandidate(key, meta.name, meta.cost.potions > 0)
+            for key, meta in card_metadata().items()
+            if meta.name not in EXCLUDED_NAMES
+        )
+        _table = (version, candidates)
+    return candidates
+
+
+def build_black_market_deck(supply_names: Collection[str], rng: random.Random = random) -> list[str]:
+    """A shuffled Black Market deck for a game whose Supply is ``supply_names``."""
+    deck = [candidate.name for candidate in black_market_candidates() if candidate.key not in supply_names]
+    rng.shuffle(deck)
+    return deck
+
+
+def black_market_has_potion_cost(supply_names: Collection[str]) -> bool:
+    """Whether a Black Market deck built around ``supply_names`` holds a potion-cost card.
+
+    Every eligible card outside the Supply goes in the deck, so this does
+    not depend on the shuffle.
+    """
+    return any(
+        candidate.potion_cost and candidate.key not in supply_names
+        for candidate in black_market_candidates()
+    )
+
+
+def kingdom_uses_potion(kingdom_names: Collection[str]) -> bool:
+    """Whether ``GameState.setup_supply`` adds a Potion pile for this kingdom."""
+    if any(get_card_metadata(name).cost.potions > 0 for name in kingdom_names):
+        return True
+    if "Black Market" not in kingdom_names:
+        return False
+    return black_market_has_potion_cost({CARD_ALIASES.get(name, name) for name in kingdom_names})
@@ -0,0 +1,153 @@
+"""Per-board switches for the engine's optional event hooks.
+
+Gains, Treasure plays, buys and cleanup each run a long list of expansion
+handlers (Watchtower, Royal Seal, Livery, Cargo Ship, Tiara, Haggler, ...)
+that scan hands or in-play zones for one specific card, and every step of
+the action phase looks through the deck for Shadow cards. On most boards
+those cards cannot exist, so the scans are pure overhead.
+
+:meth:`BoardHooks.for_game` looks at every card that can appear in the
+game -- the supply and its split/ordered piles, the Black Market deck,
+starting decks, the trash, set-aside cards and Loot -- and enables only
+the hooks those cards can trigger. A card from outside that set can only
+enter the game by being gained, so ``gain_card`` admits any gained card
+whose class is in :data:`HOOKED_CLASSES`. Hooks are only ever switched on,
+never off; tests that put a hooked card straight into a zone call
+:meth:`BoardHooks.admit` themselves.
+
+A ``BoardHooks()`` built directly has every hook enabled; that is what a
+``GameState`` uses until ``initialize_game`` runs.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable
+
+from dominion.cards.registry import CARD_ALIASES, CARD_TYPES
+
+if TYPE_CHECKING:
+    from dominion.game.game_state import GameState
+
+# Hooks that only fire while a card with one of these names is around.
+NAMED_HOOKS: dict[str, tuple[str, ...]] = {
+    "watchtower": ("Watchtower",),
+    "royal_seal": ("Royal Seal",),
+    "fools_gold": ("Fool's Gold",),
+    "sleigh_sheepdog": ("Sleigh", "Sheepdog"),
+    "livery": ("Livery",),
+    "mining_road": ("Mining Road",),
+    "trader": ("Trader",),
+    "tiara": ("Tiara",),
+    "corsair": ("Corsair",),
+    "hoard_talisman": ("Hoard", "Talisman"),
+    "hovel": ("Hovel",),
+    "haggler": ("Haggler",),
+}
+
+# Hooks that scan zones for cards implementing a method. (Projects'
+# ``on_opponent_gain`` always runs; only the card scans are gated.)
+ATTRIBUTE_HOOKS: dict[str, str] = {
+    "cargo_ship": "on_cargo_ship_gain",
+    "opponent_gain": "on_opponent_gain",
+    "owner_gain": "on_owner_gain",
+    "cleanup_start": "on_cleanup_start",
+    "discard_from_play": "on_discard_from_play",
+}
+
+# Hooks for cards of a type. Shadow cards can be played from the deck, so
+# the action phase only scans the deck for them when one can exist.
+TYPE_HOOKS: dict[str, str] = {
+    "shadow": "is_shadow",
+}
+
+CARD_HOOKS = tuple(NAMED_HOOKS) + tuple(ATTRIBUTE_HOOKS) + tuple(TYPE_HOOKS)
+HOOKS = CARD_HOOKS + ("invest",)
+
+def _hooks_of(card) -> tuple[str, ...]:
+    cls = type(card)
+    hooks = tuple(hook for hook, names in NAMED_HOOKS.items() if card.name in names)
+    hooks += tuple(hook for hook, attr in ATTRIBUTE_HOOKS.items() if hasattr(cls, attr))
+    hooks += tuple(hook for hook, flag in TYPE_HOOKS.items() if getattr(card, flag, False))
+    return hooks
+
+
+def _hook_table() -> tuple[dict[str, tuple[str, ...]], dict[type, tuple[str, ...]]]:
+    by_name: dict[str, tuple[str, ...]] = {}
+    by_class: dict[type, tuple[str, ...]] = {}
+    for name, cls in CARD_TYPES.items():
+        card = cls()
+        hooks = by_name[name] = by_name[card.name] = _hooks_of(card)
+        if hooks:
+            by_class[cls] = hooks
+    for alias, name in CARD_ALIASES.items():
+        if name in by_name:
+            by_name[alias] = by_name[name]
+    return by_name, by_class
+
+
+_hooks_by_name, _hooks_by_class = _hook_table()
+
+# Card classes that can trigger at least one hook. ``gain_card`` admits a
+# gained card only when its class is in here.
+HOOKED_CLASSES: frozenset[type] = frozenset(_hooks_by_class)
+
+
+def hooks_for_card(name: str) -> tuple[str, ...]:
+    """Hooks a card called ``name`` can trigger (all of them if unknown)."""
+    return _hooks_by_name.get(name, CARD_HOOKS)
+
+
+def _card_names(state: GameState) -> Iterable[str]:
+    from dominion.cards.plunder import LOOT_CARD_NAMES
+
+    yield from state.supply
+    for names in state.pile_order.values():
+        yield from names
+    yield from state.black_market_deck
+    yield from getattr(state, "ferryman_pile_order", ())
+    yield from LOOT_CARD_NAMES
+    for card in state.trash:
+        yield card.name
+    for player in state.players:
+        for card in player.all_cards():
+            yield card.name
+    for landscape in state.ways:
+        card = getattr(landscape, "set_aside_card", None)
+        if card is not None:
+            yield card.name
+    riverboat = getattr(state, "riverboat_set_aside", None)
+    if riverboat is not None:
+        yield riverboat.name
+
+
+class BoardHooks:
+    """Which optional hooks can fire in one game; every flag is a bool."""
+
+    __slots__ = HOOKS + ("names",)
+
+    def __init__(self, enabled: bool = True) -> None:
+        for hook in HOOKS:
+            setattr(self, hook, enabled)
+        # Card names already accounted for.
+        self.names: set[str] = set()
+
+    @classmethod
+    def for_game(cls, state: GameState) -> BoardHooks:
+        """Hooks for an initialized game, from every card it can contain."""
+        hooks = cls(enabled=False)
+        for name in _card_names(state):
+            hooks.admit(name)
+        hooks.invest = any(getattr(event, "name", None) == "Invest" for event in state.events)
+        return hooks
+
+    def admit(self, name: str) -> None:
+        """Enable the hooks of a card called ``name``."""
+        if name in self.names:
+            return
+        self.names.add(name)
+        for hook in hooks_for_card(name):
+            setattr(self, hook, True)
+
+    def enabled(self) -> list[str]:
+        """Names of the enabled hooks."""
+        return [hook for hook in HOOKS if getattr(self, hook)]
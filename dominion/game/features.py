@@ -0,0 +1,116 @@
+"""Decision-scoped memo of derived game facts.
+
+Strategy conditions and AI heuristics evaluated during one decision ask
+the same questions over and over: how many piles are empty, what each
+player's VP total is, how many copies of a card are in my deck. Inside a
+``with game_state.feature_cache():`` block the helpers below compute each
+answer once and share it.
+
+The memo is tagged with ``GameState.state_version``, which gains, trashes
+and buys bump through ``GameState.invalidate_features``, so a value is
+never reused across those mutations even within a block. Blocks are meant
+for read-only decision code; zone moves that do not change deck
+composition (drawing, playing) leave every cached fact valid.
+
+Outside a block, or with a state that has no memo (test doubles), every
+helper falls through to the plain computation.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from dominion.cards.base_card import Card
+    from dominion.game.game_state import GameState
+    from dominion.game.player_state import PlayerState
+
+
+class FeatureCache:
+    """Values computed for one ``state_version``."""
+
+    __slots__ = ("version", "values")
+
+    def __init__(self, version: int) -> None:
+        self.version = version
+        self.values: dict[Any, Any] = {}
+
+
+def _values(state: GameState) -> Optional[dict]:
+    cache = getattr(state, "features", None)
+    if cache is None:
+        return None
+    version = state.state_version
+    if cache.version != version:
+        cache.version = version
+        cache.values.clear()
+    return cache.values
+
+
+def empty_piles(state: GameState) -> int:
+    """``state.empty_piles``, memoized."""
+    values = _values(state)
+    if values is None:
+        return state.empty_piles
+    result = values.get("empty_piles")
+    if result is None:
+        result = values["empty_piles"] = state.empty_piles
+    return result
+
+
+def victory_points(state: GameState, player: PlayerState) -> int:
+    """``player.get_victory_points(state)``, memoized per player."""
+    values = _values(state)
+    if values is None:
+        return player.get_victory_points(state)
+    key = ("vp", id(player))
+    result = values.get(key)
+    if result is None:
+        result = values[key] = player.get_victory_points(state)
+    return result
+
+
+def score_diff(state: GameState, player: PlayerState) -> int:
+    """``player``'s VP minus the best opponent's VP (0 opponents counts as 0)."""
+    opponents = [victory_points(state, p) for p in state.players if p is not player]
+    return victory_points(state, player) - (max(opponents) if opponents else 0)
+
+
+def deck_cards(state: GameState, player: PlayerState) -> list[Card]:
+    """``player.all_cards()``, memoized per player. Do not mutate the result."""
+    values = _values(state)
+    if values is None:
+        return player.all_cards()
+    key = ("deck", id(player))
+    result = values.get(key)
+    if result is None:
+        result = values[key] = player.all_cards()
+    return result
+
+
+def deck_count(state: GameState, player: PlayerState, card_name: str) -> int:
+    """``player.count_in_deck(card_name)``; one pass over the deck per block."""
+    values = _values(state)
+    if values is None:
+        return player.count_in_deck(card_name)
+    key = ("counts", id(player))
+    counts = values.get(key)
+    if counts is None:
+        counts = values[key] = Counter(card.name for card in deck_cards(state, player))
+    return counts[card_name]
+
+
+def action_density(state: GameState, player: PlayerState) -> int:
+    """Percentage (floored) of action cards in ``player``'s deck; 0 when empty."""
+    values = _values(state)
+    key = ("action_density", id(player))
+    if values is not None:
+        result = values.get(key)
+        if result is not None:
+            return result
+    cards = deck_cards(state, player)
+    result = sum(1 for c in cards if c.is_action) * 100 // len(cards) if cards else 0
+    if values is not None:
+        values[key] = result
+    return result
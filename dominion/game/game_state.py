@@ -1,12 +1,18 @@
 import copy
 import random
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from typing import Optional
 
 from dominion.cards.base_card import Card
 from dominion.cards.registry import get_all_card_names, get_card
 from dominion.cards.split_pile import SplitPileMixin
+from dominion.game.black_market import black_market_candidates, build_black_market_deck
+from dominion.game.board_hooks import HOOKED_CLASSES, BoardHooks
+from dominion.game.features import FeatureCache
+from dominion.game.indexed_zone import zone_checks_enabled
 from dominion.game.player_state import PlayerState
+from dominion.game.turn_state import TurnState
 
 
 # Mid-turn safety cap. Real Dominion turns rarely exceed a few hundred plays
@@ -127,6 +133,21 @@ class GameState:
         self.logger = None
         self.log_callback = self._default_log_handler
         self.logs = []
+        # Optional GameProfiler (see dominion.game.profiler); None = off.
+        self.profiler = None
+        # Active ``cost_cache`` block's memo, or None outside of one.
+        self._cost_cache = None
+        # Active ``feature_cache`` block's memo (dominion.game.features),
+        # or None outside of one; ``state_version`` tags its values.
+        self.features = None
+        self.state_version = 0
+        # Optional hooks that can fire on this board (see
+        # dominion.game.board_hooks); everything is on until
+        # ``initialize_game`` narrows it down.
+        self.hooks = BoardHooks()
+        # Supply pile name -> names of every pile counted with it as one
+        # pile for the game end (see ``_pile_group``).
+        self._pile_groups: dict[str, tuple[str, ...]] = {}
         # Provide a back-reference so PlayerState methods (notably
         # ``get_victory_points``) can find Allies / Landmarks even when
         # callers don't pass ``game_state`` explicitly. Some tests construct
@@ -154,6 +175,20 @@ class GameState:
                 new.logger = None
             elif key == "log_callback":
                 new.log_callback = lambda *_: None
+            elif key == "_cost_cache":
+                # Keyed by the original players' ids; clones start cold.
+                new._cost_cache = None
+            elif key == "profiler":
+                new.profiler = None
+            elif key == "features":
+                # Keyed by the original players' ids, like the cost memo.
+                new.features = None
+            elif key == "hooks":
+                # Only ever widened, so clones can share it.
+                new.hooks = value
+            elif key == "_pile_groups":
+                # Derived from card classes only, so clones can share it.
+                new._pile_groups = value
             else:
                 new.__dict__[key] = copy.deepcopy(value, memo)
         return new
@@ -163,6 +198,14 @@ class GameState:
         self.logger = logger
         self.log_callback = self._log_handler
 
+    def set_profiler(self, profiler):
+        """Time phases, card plays, gains and rule conditions with ``profiler``.
+
+        AI decision methods are timed separately via
+        ``profiler.instrument_ai``. Pass ``None`` to turn profiling off.
+        """
+        self.profiler = profiler
+
     def _default_log_handler(self, message: str):
         """Default handler that just prints to console."""
         print(message)
@@ -208,7 +251,7 @@ class GameState:
             and self.prophecy.name == "Enlightenment"
         ):
             return card.name
-        inherited = getattr(player, "inherited_action_name", None)
+        inherited = player.inherited_action_name
         if card.name == "Estate" and inherited:
             return inherited
         return None
@@ -224,7 +267,7 @@ class GameState:
                 seen.add(marker)
                 if card.name == name or (
                     card.name == "Estate"
-                    and getattr(player, "inherited_action_name", None) == name
+                    and player.inherited_action_name == name
                 ):
                     count += 1
         return count
@@ -239,22 +282,22 @@ class GameState:
         action_name = self._warlord_action_name(player, card)
         if action_name is None:
             return False
-        if getattr(player, "warlord_restriction_count", 0) <= 0:
+        if player.warlord_restriction_count <= 0:
             return False
         limit = 3 if card_already_in_play else 2
         return self._cards_in_play_named(player, action_name) >= limit
 
     def _voyage_can_play_from_hand(self, player: PlayerState) -> bool:
-        remaining = getattr(player, "voyage_cards_from_hand_remaining", None)
+        remaining = player.voyage_cards_from_hand_remaining
         return remaining is None or remaining > 0
 
     def _record_voyage_play_from_hand(self, player: PlayerState) -> None:
-        remaining = getattr(player, "voyage_cards_from_hand_remaining", None)
+        remaining = player.voyage_cards_from_hand_remaining
         if remaining is not None:
             player.voyage_cards_from_hand_remaining = max(0, remaining - 1)
 
     def _refund_voyage_play_from_hand(self, player: PlayerState) -> None:
-        remaining = getattr(player, "voyage_cards_from_hand_remaining", None)
+        remaining = player.voyage_cards_from_hand_remaining
         if remaining is not None:
             player.voyage_cards_from_hand_remaining = min(3, remaining + 1)
 
@@ -310,7 +353,7 @@ class GameState:
         Golem, Ghost, Conclave, Necromancer). Each *play* — including each
         replay by a multiplier — must:
 
-        - bump ``player.actions_this_turn`` / ``player.actions_played`` so
+        - bump ``player.turn.actions_this_turn`` / ``player.actions_played`` so
           cards keying off "Actions played this turn" (Conspirator, Peddler)
           see the correct count
         - call ``card.on_play`` or Enchantress's substitute effect
@@ -351,15 +394,15 @@ class GameState:
                 )
             )
             return False
-        player.actions_this_turn += 1
+        player.turn.actions_this_turn += 1
         player.actions_played += 1
         if (
             apply_enchantress
             and card.is_action
-            and getattr(player, "enchantress_active", False)
-            and not getattr(player, "enchantress_used_this_turn", False)
+            and player.enchantress_active
+            and not player.turn.enchantress_used_this_turn
         ):
-            player.enchantress_used_this_turn = True
+            player.turn.enchantress_used_this_turn = True
             self.draw_cards(player, 1)
             player.actions += 1
             self.log_callback(
@@ -373,7 +416,7 @@ class GameState:
             self._fire_urchin_reaction(player, card)
         else:
             card.on_play(self)
-        training_pile = getattr(player, "training_pile", None)
+        training_pile = player.training_pile
         if training_pile and card.name == training_pile:
             player.coins += 1
         self._maybe_kiln_gain(player, card)
@@ -624,6 +667,8 @@ class GameState:
         self.log_callback("Game initialized with players: " + ", ".join(player_descriptions))
         self.log_callback("Kingdom cards: " + ", ".join(c.name for c in kingdom_cards))
 
+        self.hooks = BoardHooks.for_game(self)
+
     def _pick_riverboat_set_aside(self, kingdom_cards: list[Card]) -> "Card | None":
         """Choose a non-Duration Action card costing exactly $5 not in the supply.
 
@@ -773,13 +818,8 @@ class GameState:
         # when no kingdom card requires Potion).
         needs_potion = any(c.cost.potions > 0 for c in kingdom_cards)
         if not needs_potion and self.black_market_deck:
-            for bm_name in self.black_market_deck:
-                try:
-                    if get_card(bm_name).cost.potions > 0:
-                        needs_potion = True
-                        break
-                except ValueError:
-                    continue
+            potion_names = {c.name for c in black_market_candidates() if c.potion_cost}
+            needs_potion = any(name in potion_names for name in self.black_market_deck)
         if needs_potion and "Potion" not in self.supply:
             potion_card = get_card("Potion")
             self.supply["Potion"] = potion_card.starting_supply(self)
@@ -1111,39 +1151,22 @@ class GameState:
     def _prepare_black_market_deck(self, kingdom_cards: list[Card]) -> None:
         """Build and shuffle the Black Market deck for this game."""
 
-        supply_names = set(self.supply.keys())
-        deck: list[str] = []
-        for name in get_all_card_names():
-            if name in supply_names:
-                continue
-            try:
-                card = get_card(name)
-            except ValueError:
-                continue
-            if getattr(card, "is_event", False) or getattr(card, "is_project", False):
-                continue
-            if card.name in {"Copper", "Silver", "Gold", "Estate", "Duchy", "Province", "Curse", "Platinum", "Colony"}:
-                continue
-            if card.name in {"Horse", "Spoils", "Ruins"}:
-                continue
-            deck.append(card.name)
-        random.shuffle(deck)
-        self.black_market_deck = deck
+        self.black_market_deck = build_black_market_deck(self.supply.keys())
 
         self.log_callback(f"Supply initialized: {self.supply}")
 
+    @property
+    def pile_end_count(self) -> int:
+        """Empty supply piles that end the game: four with 5-6 players, else three."""
+        return 4 if len(self.players) >= 5 else 3
+
     @property
     def empty_piles(self) -> int:
         """Return number of empty supply piles, counting split/Wizards/Castles piles once."""
-        from dominion.cards.allies.wizards import WIZARDS_PILE_ORDER, WizardsSplitCard
-        from dominion.cards.allies._split_base import AlliesSplitCard
-        from dominion.cards.empires.castles import CASTLE_ORDER
-
-        castle_names = set(CASTLE_ORDER)
-
+        supply = self.supply
         counted: set[str] = set()
         empties = 0
-        for name in list(self.supply.keys()):
+        for name in supply:
             if name in counted:
                 continue
             # Non-Supply piles (e.g. Tournament Prizes) live in self.supply
@@ -1152,122 +1175,78 @@ class GameState:
             if name in self.non_supply_pile_names:
                 counted.add(name)
                 continue
-            # Empires Castles: all 8 distinct Castle cards form one supply pile
-            # for game-end purposes. Counting them individually would let
-            # emptying three Castle ranks trip the "three piles depleted"
-            # condition even when Castles as a whole still has cards.
-            if name in castle_names:
-                counted.update(castle_names)
-                if all(
-                    self.supply.get(n, 0) == 0
-                    for n in castle_names
-                    if n in self.supply
-                ):
+            group = self._pile_group(name)
+            if len(group) == 1:
+                counted.add(name)
+                if supply[name] == 0:
                     empties += 1
                 continue
+            counted.update(group)
+            if all(supply.get(n, 0) == 0 for n in group):
+                empties += 1
+        return empties
+
+    def _pile_group(self, name: str) -> tuple[str, ...]:
+        """Names of the piles that count as one Supply pile together with ``name``.
+
+        Computed once per name and game: ``empty_piles`` runs on every
+        ``is_game_over`` check, and building a card per pile each time
+        dominated whole games.
+        """
+        group = self._pile_groups.get(name)
+        if group is not None:
+            return group
+
+        from dominion.cards.allies.wizards import WIZARDS_PILE_ORDER, WizardsSplitCard
+        from dominion.cards.allies._split_base import AlliesSplitCard
+        from dominion.cards.empires.castles import CASTLE_ORDER
+
+        # Empires Castles: all 8 distinct Castle cards form one supply pile
+        # for game-end purposes. Counting them individually would let
+        # emptying three Castle ranks trip the "three piles depleted"
+        # condition even when Castles as a whole still has cards.
+        if name in CASTLE_ORDER:
+            group = tuple(CASTLE_ORDER)
+        else:
             card = get_card(name)
             if isinstance(card, WizardsSplitCard):
-                wizard_names = set(WIZARDS_PILE_ORDER)
-                counted.update(wizard_names)
-                if all(self.supply.get(n, 0) == 0 for n in wizard_names if n in self.supply):
-                    empties += 1
+                group = tuple(WIZARDS_PILE_ORDER)
             elif isinstance(card, AlliesSplitCard):
-                pile_names = set(card.pile_order)
-                counted.update(pile_names)
-                if all(self.supply.get(n, 0) == 0 for n in pile_names if n in self.supply):
-                    empties += 1
+                group = tuple(card.pile_order)
             elif isinstance(card, SplitPileMixin):
-                partner = card.partner_card_name
-                counted.add(name)
-                counted.add(partner)
-                if self.supply.get(name, 0) == 0 and self.supply.get(partner, 0) == 0:
-                    empties += 1
+                group = (name, card.partner_card_name)
             else:
-                counted.add(name)
-                if self.supply.get(name, 0) == 0:
-                    empties += 1
-        return empties
+                group = (name,)
+        self._pile_groups[name] = group
+        return group
 
     def handle_start_phase(self):
         """Handle the start of turn phase."""
         player = self.current_player
         player.turns_taken += 1
-        player.gained_five_last_turn = player.gained_five_this_turn
-        player.gained_five_this_turn = False
-
-        # Reset per-turn flags
-        player.ignore_action_bonuses = False
-        player.collection_played = 0
-        player.goons_played = 0
-        player.merchant_guilds_played = 0
-        player.cost_reduction = 0
-        player.innovation_used = False
-        player.citadel_used = False
-        player.groundskeeper_bonus = 0
-        player.crossroads_played = 0
-        player.fools_gold_played = 0
-        player.walled_villages_played = 0
-        player.actions_gained_this_turn = 0
-        player.cauldron_triggered = False
-        player.cards_gained_this_turn = 0
-        player.gained_victory_this_buy_phase = False
-        player.gained_victory_this_turn = False
+        player.gained_five_last_turn = player.turn.gained_five_this_turn
+
+        # Reset per-turn counters and flags (dominion.game.turn_state).
+        player.turn = TurnState()
         player.flagship_pending = [
             card for card in player.flagship_pending if card in player.duration
         ]
-        player.highwayman_blocked_this_turn = False
-        player.actions_this_turn = 0
-        player.bought_this_turn = []
-        player.coins_spent_this_turn = 0
-        player.banned_buys = []
-        player.topdeck_gains = False
-        player.way_of_seal_active = False
-        player.charm_next_buy_copies = 0
-        player.cannot_buy_actions = False
-        player.envious_effect_active = False
-        player.insignia_active = False
-        player.fortune_doubled_this_turn = False
-        player.harbor_village_pending = 0
-        player.continue_used_this_turn = False
-        # Menagerie state resets
-        player.cavalry_returned_this_turn = False
-        player.kiln_pending = 0
-        # Daimyo's "next non-Command Action this turn" replay expires when the
-        # turn ends without a triggering Action being played.
-        player.daimyo_pending = 0
-        # Merchant's "first Silver this turn = +$1" tracking
-        player.merchant_silver_bonus = 0
-        player.merchant_silver_bonus_used = False
-        # Prosperity 2E: Tiara's once-per-turn replay resets each turn
-        player.tiara_replay_used = False
-        # Prosperity 2E: War Chest names tracked per turn
-        player.war_chest_named_this_turn = []
-        # Coppersmith bonus is per-turn.
-        player.coppersmiths_played = 0
-        # Enchantress: re-arm the "first Action this turn" override flag if a
-        # caster's Enchantress is still active over this opponent.
-        player.enchantress_used_this_turn = False
-        # Renaissance Priest's rest-of-turn trigger resets each turn.
-        player.priest_played_this_turn = 0
 
         # Adventures Ball: -$1 tokens queued by Ball buys on previous turns
         # apply at the start of this turn, then clear. Coins were already
         # reset to 0 by the prior turn's cleanup, so this drives them
         # negative; treasures / actions played this turn bring them back up.
-        minus_coin_tokens = getattr(player, "minus_coin_tokens", 0)
+        minus_coin_tokens = player.minus_coin_tokens
         if minus_coin_tokens:
             player.coins -= minus_coin_tokens
             player.minus_coin_tokens = 0
 
-        # Nocturne — reset per-turn counter
-        player.cards_gained_this_turn_count = 0
-
         # Nocturne — persistent Boons given last turn fire their start-of-turn bonus.
-        active_boons = list(getattr(player, "active_boons", []))
+        active_boons = list(player.active_boons)
         player.active_boons = []
         for boon in active_boons:
             if boon == "The Field's Gift":
-                if not player.ignore_action_bonuses:
+                if not player.turn.ignore_action_bonuses:
                     player.actions += 1
                 player.coins += 1
             elif boon == "The Forest's Gift":
@@ -1278,11 +1257,11 @@ class GameState:
         # Nocturne — Druid's set-aside Boons fire their next-turn bonus too,
         # but they are NOT discarded; they remain set aside for the rest of
         # the game so future Druid plays still see all three.
-        druid_boons = list(getattr(player, "druid_active_boons", []))
+        druid_boons = list(player.druid_active_boons)
         player.druid_active_boons = []
         for boon in druid_boons:
             if boon == "The Field's Gift":
-                if not player.ignore_action_bonuses:
+                if not player.turn.ignore_action_bonuses:
                     player.actions += 1
                 player.coins += 1
             elif boon == "The Forest's Gift":
@@ -1292,7 +1271,7 @@ class GameState:
             # turn during cleanup. No discard — Boon stays set aside.
 
         # Nocturne — Lost in the Woods (Fool): may discard a card to receive a Boon
-        if getattr(player, "lost_in_the_woods", False) and player.hand:
+        if player.lost_in_the_woods and player.hand:
             chosen = player.ai.choose_cards_to_discard(
                 self, player, list(player.hand), 1, reason="lost_in_the_woods"
             )
@@ -1304,12 +1283,12 @@ class GameState:
                     self.receive_boon(player)
 
         # Nocturne — Blessed Village pending Boons
-        for _ in range(getattr(player, "pending_blessed_boons", 0)):
+        for _ in range(player.pending_blessed_boons):
             self.receive_boon(player)
         player.pending_blessed_boons = 0
 
         # Nocturne — Ghost: play the set-aside Action twice over two turns
-        if getattr(player, "ghost_pending_actions", None):
+        if player.ghost_pending_actions:
             updated: list = []
             for entry in player.ghost_pending_actions:
                 action_card, plays_left = entry
@@ -1332,7 +1311,7 @@ class GameState:
             self.current_player.delayed_cards = []
 
         # Menagerie Reap event: play any set-aside Golds from previous turn.
-        reap_set_aside = getattr(self.current_player, "reap_set_aside", None)
+        reap_set_aside = self.current_player.reap_set_aside
         if reap_set_aside:
             self.current_player.reap_set_aside = []
             for gold_card in reap_set_aside:
@@ -1340,13 +1319,13 @@ class GameState:
                 gold_card.on_play(self)
 
         # Menagerie Way of the Squirrel: +2 Cards next turn (banked draw).
-        squirrel_pending = getattr(self.current_player, "squirrel_pending", 0)
+        squirrel_pending = self.current_player.squirrel_pending
         if squirrel_pending > 0:
             self.draw_cards(self.current_player, squirrel_pending)
             self.current_player.squirrel_pending = 0
 
         # Menagerie Way of the Turtle: play set-aside cards now.
-        turtle_set_aside = getattr(self.current_player, "turtle_set_aside", None)
+        turtle_set_aside = self.current_player.turtle_set_aside
         if turtle_set_aside:
             self.current_player.turtle_set_aside = []
             for c in turtle_set_aside:
@@ -1377,7 +1356,7 @@ class GameState:
                 player = self.current_player
                 player.in_play.append(card)
                 if card.is_action:
-                    player.actions_this_turn += 1
+                    player.turn.actions_this_turn += 1
                 card.on_play(self)
                 if card.is_action:
                     if self.prophecy is not None and self.prophecy.is_active:
@@ -1391,22 +1370,15 @@ class GameState:
                     # turn, so Citadel marks used and replays it.
                     self._maybe_citadel_replay(player, card)
 
-        # Adventures: reset once-per-turn caps for events.
-        self.current_player.borrow_used_this_turn = False
-        self.current_player.alms_used_this_turn = False
-        self.current_player.pilgrimage_used_this_turn = False
-        self.current_player.travelling_fair_active = False
         # Adventures Mission: if the player bought Mission last turn, the
         # turn that's just starting IS the granted extra turn — apply the
         # "no buys" restriction now. Setting it here (rather than in
         # Mission.on_buy) ensures the player can finish buying on the turn
         # they bought Mission. The flag is cleared at the end of this extra
         # turn during cleanup (see ``handle_cleanup_phase``).
-        mission_pending = getattr(
-            self.current_player, "mission_extra_turn_pending", False
-        )
-        voyage_pending = getattr(self.current_player, "voyage_extra_turn_pending", False)
-        if getattr(self.current_player, "outpost_taken_last_turn", False):
+        mission_pending = self.current_player.mission_extra_turn_pending
+        voyage_pending = self.current_player.voyage_extra_turn_pending
+        if self.current_player.outpost_taken_last_turn:
             self.current_player.mission_extra_turn_pending = False
             self.current_player.voyage_extra_turn_pending = False
         elif voyage_pending:
@@ -1416,7 +1388,6 @@ class GameState:
         elif mission_pending:
             self.current_player.mission_no_buy_turn = True
             self.current_player.mission_extra_turn_pending = False
-        self.current_player.mission_used_this_turn = False
         # NOTE: Haunted Woods / Swamp Hag attack counters are NOT cleared
         # here. The card text says "Until your next turn ..." — the
         # penalty must apply *during* the victim's next turn (including
@@ -1467,24 +1438,20 @@ class GameState:
             )
         )
 
-        # Plunder per-turn flag resets. Performed BEFORE the duration phase
-        # so that any cards trashed by start-of-turn duration effects
+        # Plunder per-turn trigger resets. Repeated here, BEFORE the duration
+        # phase, so only cards trashed by start-of-turn duration effects
         # (e.g. Secluded Shrine) count toward this turn's "cards trashed
         # this turn" total used by Crucible.
-        self.current_player.cards_trashed_this_turn = 0
-        self.current_player.mining_road_triggered = False
-        self.current_player.search_triggered = False
-        # Plunder Launch event: reset the once-per-turn lockout.
-        self.current_player.launch_used = False
-        # Plunder Journey event: reset the once-per-turn lockout.
-        self.current_player.journey_used_this_turn = False
+        self.current_player.turn.cards_trashed_this_turn = 0
+        self.current_player.turn.mining_road_triggered = False
+        self.current_player.turn.search_triggered = False
 
         # Only log duration phase if there are duration cards
         if self.current_player.duration:
             self.do_duration_phase()
 
         # Plunder Deliver event: return any set-aside gains to hand.
-        deliver_set_aside = getattr(self.current_player, "deliver_set_aside", None)
+        deliver_set_aside = self.current_player.deliver_set_aside
         if deliver_set_aside:
             self.current_player.hand.extend(deliver_set_aside)
             self.current_player.deliver_set_aside = []
@@ -1540,7 +1507,7 @@ class GameState:
 
     def _resolve_farmhands_set_aside(self, player: PlayerState) -> None:
         """Play any cards queued by Farmhands' on-gain trigger."""
-        queue = getattr(player, "farmhands_set_aside", None)
+        queue = player.farmhands_set_aside
         if not queue:
             return
         to_play = list(queue)
@@ -1588,15 +1555,15 @@ class GameState:
         # is False.
         inherited_action_play = (
             card.name == "Estate"
-            and getattr(player, "inherited_action_name", None)
+            and player.inherited_action_name
         )
         if not (card.is_action or inherited_action_play):
             return False
-        if player.citadel_used:
+        if player.turn.citadel_used:
             return False
         if not any(p.name == "Citadel" for p in player.projects):
             return False
-        player.citadel_used = True
+        player.turn.citadel_used = True
         # Hold the Inheritance overlay through the post-play hooks so
         # name-gated effects (training token, Kiln, ally play hooks) see
         # the inherited card's identity, matching the action-phase loop.
@@ -1607,7 +1574,7 @@ class GameState:
         )
         try:
             card.on_play(self)
-            training_pile = getattr(player, "training_pile", None)
+            training_pile = player.training_pile
             if training_pile and card.name == training_pile:
                 player.coins += 1
             self._maybe_kiln_gain(player, card)
@@ -1630,7 +1597,7 @@ class GameState:
         for card in cards:
             if card.is_action:
                 player.in_play.append(card)
-                player.actions_this_turn += 1
+                player.turn.actions_this_turn += 1
                 card.on_play(self)
                 self._maybe_citadel_replay(player, card)
             elif card.is_treasure:
@@ -1644,7 +1611,7 @@ class GameState:
         for card in cards:
             if card.is_action:
                 player.in_play.append(card)
-                player.actions_this_turn += 1
+                player.turn.actions_this_turn += 1
                 card.on_play(self)
                 self._maybe_citadel_replay(player, card)
             elif card.is_treasure:
@@ -1760,6 +1727,7 @@ class GameState:
             and self.prophecy.is_active
             and self.prophecy.name == "Enlightenment"
         )
+        check_zones = zone_checks_enabled()
 
         steps = 0
         while True:
@@ -1771,36 +1739,38 @@ class GameState:
                     f"turn={self.turn_number}, hand_size={len(player.hand)}, "
                     f"actions_left={player.actions})"
                 )
-            action_cards = [
-                card for card in player.hand
-                if card.is_action and self._voyage_can_play_from_hand(player)
-            ]
-            # Adventures Inheritance: each Estate in hand can be played as the
-            # inherited Action card.
-            inherited = getattr(player, "inherited_action_name", None)
-            if inherited:
-                action_cards += [
-                    card for card in player.hand
-                    if card.name == "Estate" and self._voyage_can_play_from_hand(player)
-                ]
-            # Rising Sun: Enlightenment turns Treasures into Actions for all
-            # purposes — they can be played from your hand in the Action phase.
-            if enlightened:
-                action_cards += [
-                    card for card in player.hand
-                    if (
-                        card.is_treasure
-                        and not card.is_action
-                        and self._voyage_can_play_from_hand(player)
-                    )
-                ]
+            # Voyage limits plays from hand as a whole, so it is checked
+            # once per step rather than once per card.
+            if check_zones:
+                player.hand.check()
+                player.in_play.check()
+            if self._voyage_can_play_from_hand(player):
+                hand = player.hand
+                action_cards = hand.actions()
+                # Adventures Inheritance: each Estate in hand can be played
+                # as the inherited Action card.
+                if player.inherited_action_name and hand.count_name("Estate"):
+                    action_cards += [card for card in hand if card.name == "Estate"]
+                # Rising Sun: Enlightenment turns Treasures into Actions for
+                # all purposes — they can be played from your hand in the
+                # Action phase.
+                if enlightened:
+                    action_cards += [
+                        card for card in hand.treasures() if not card.is_action
+                    ]
+                if player.warlord_restriction_count > 0:
+                    action_cards = [
+                        card for card in action_cards
+                        if not self._warlord_blocks_action_play(player, card)
+                    ]
+            else:
+                action_cards = []
             # Rising Sun: Shadow cards may be played from the deck whenever
             # you could normally play an Action.
-            shadow_in_deck = [card for card in player.deck if card.is_shadow]
-            playable = [
-                card for card in action_cards
-                if not self._warlord_blocks_action_play(player, card)
-            ] + shadow_in_deck
+            if self.hooks.shadow:
+                playable = action_cards + [card for card in player.deck if card.is_shadow]
+            else:
+                playable = action_cards
 
             if not playable:
                 break
@@ -1854,7 +1824,7 @@ class GameState:
 
             player.actions -= 1
             player.actions_played += 1
-            player.actions_this_turn += 1
+            player.turn.actions_this_turn += 1
             # Shadow cards are played from the deck; everything else from hand.
             if choice in player.hand:
                 self.move_card_from_hand_to_play(player, choice)
@@ -1863,10 +1833,10 @@ class GameState:
                 player.in_play.append(choice)
             # Track coins before play for Harbor Village bonus
             coins_before_action = player.coins
-            harbor_pending = getattr(player, "harbor_village_pending", 0)
+            harbor_pending = player.turn.harbor_village_pending
 
             # Training token: +$1 when playing a card from the trained pile
-            training_pile = getattr(player, "training_pile", None)
+            training_pile = player.training_pile
 
             if way:
                 way.apply(self, choice)
@@ -1884,7 +1854,7 @@ class GameState:
                 self._maybe_citadel_replay(player, choice)
             else:
                 flagships_to_resolve: list[Card] = []
-                pending_flagships = getattr(player, "flagship_pending", [])
+                pending_flagships = player.flagship_pending
                 if pending_flagships and not getattr(choice, "is_command", False):
                     flagships_to_resolve = list(pending_flagships)
                     pending_flagships.clear()
@@ -1896,8 +1866,8 @@ class GameState:
                 # Multiple Daimyos stack and all replay the same card.
                 daimyo_replays = 0
                 if not getattr(choice, "is_command", False):
-                    daimyo_replays = getattr(player, "daimyo_pending", 0)
-                    player.daimyo_pending = 0
+                    daimyo_replays = player.turn.daimyo_pending
+                    player.turn.daimyo_pending = 0
 
                 # Plunder Reckless trait: cards from the Reckless pile play twice.
                 reckless_extra = 1 if self.pile_traits.get(choice.name) == "Reckless" else 0
@@ -1922,7 +1892,7 @@ class GameState:
                 #     still find the actual Estate object in ``in_play``.
                 inheriting = (
                     choice.name == "Estate"
-                    and bool(getattr(player, "inherited_action_name", None))
+                    and bool(player.inherited_action_name)
                 )
 
                 # Renaissance Citadel: first Action played each turn is
@@ -1934,10 +1904,10 @@ class GameState:
                 citadel_extra = 0
                 if (
                     (choice.is_action or inheriting)
-                    and not player.citadel_used
+                    and not player.turn.citadel_used
                     and any(p.name == "Citadel" for p in player.projects)
                 ):
-                    player.citadel_used = True
+                    player.turn.citadel_used = True
                     citadel_extra = 1
 
                 plays = (
@@ -1961,8 +1931,8 @@ class GameState:
                         player.actions += 1
                     elif (
                         choice.is_action
-                        and getattr(player, "enchantress_active", False)
-                        and not getattr(player, "enchantress_used_this_turn", False)
+                        and player.enchantress_active
+                        and not player.turn.enchantress_used_this_turn
                     ):
                         # Empires Enchantress: opponent's first Action this
                         # turn under Enchantress's duration is replaced with
@@ -1971,7 +1941,7 @@ class GameState:
                         # extra turns (e.g. Outpost) before then are still
                         # affected; ``enchantress_used_this_turn`` is reset
                         # at each turn start to re-arm the override.
-                        player.enchantress_used_this_turn = True
+                        player.turn.enchantress_used_this_turn = True
                         self.draw_cards(player, 1)
                         player.actions += 1
                         self.log_callback(
@@ -2048,7 +2018,7 @@ class GameState:
                 coins_gained = player.coins - coins_before_action
                 if coins_gained > 0:
                     player.coins += 1
-                player.harbor_village_pending = max(0, harbor_pending - 1)
+                player.turn.harbor_village_pending = max(0, harbor_pending - 1)
 
             # Plunder Inspiring trait: after playing, may play an Action you
             # don't already have a copy of in play.
@@ -2097,7 +2067,7 @@ class GameState:
             return
         if not self.move_card_from_hand_to_play(player, choice):
             return
-        player.actions_this_turn += 1
+        player.turn.actions_this_turn += 1
         choice.on_play(self)
 
     def charlatan_curse_active(self) -> bool:
@@ -2145,10 +2115,10 @@ class GameState:
         """Apply state effects that trigger at the start of the buy phase."""
 
         player = self.current_player
-        player.cannot_buy_actions = False
-        player.envious_effect_active = False
+        player.turn.cannot_buy_actions = False
+        player.turn.envious_effect_active = False
         player.cards_gained_this_buy_phase = 0
-        player.gained_victory_this_buy_phase = False
+        player.turn.gained_victory_this_buy_phase = False
 
         # Renaissance: Artifact start-of-buy-phase effects (Treasure Chest)
         for artifact in self.artifacts.values():
@@ -2161,11 +2131,11 @@ class GameState:
 
         if player.deluded:
             player.deluded = False
-            player.cannot_buy_actions = True
+            player.turn.cannot_buy_actions = True
 
         if player.envious:
             player.envious = False
-            player.envious_effect_active = True
+            player.turn.envious_effect_active = True
 
         # Empires Landmarks: Arena's start-of-buy discard-for-VP option.
         for landmark in self.landmarks:
@@ -2198,6 +2168,7 @@ class GameState:
         capitalism = any(
             getattr(p, "name", "") == "Capitalism" for p in player.projects
         )
+        check_zones = zone_checks_enabled()
 
         steps = 0
         while True:
@@ -2207,21 +2178,27 @@ class GameState:
                     f"treasure phase exceeded {PHASE_STEP_LIMIT} plays in a single turn "
                     f"(player={getattr(player.ai, 'name', '?')}, turn={self.turn_number})"
                 )
-            # ``is_treasure`` respects game-level type modifiers — notably
-            # Charlatan, which makes Curses Treasures for the whole game.
+            # Curses count as Treasures once Charlatan is in the game (see
+            # ``is_treasure``); Voyage limits plays from hand as a whole.
+            if check_zones:
+                player.hand.check()
+                player.in_play.check()
             if self._voyage_can_play_from_hand(player):
-                treasures = [card for card in player.hand if self.is_treasure(card)]
+                if self.charlatan_curse_active() and player.hand.count_name("Curse"):
+                    treasures = [
+                        card for card in player.hand
+                        if card.is_treasure or card.name == "Curse"
+                    ]
+                else:
+                    treasures = player.hand.treasures()
+                if capitalism:
+                    treasures += [
+                        card
+                        for card in player.hand.actions()
+                        if not card.is_treasure and card.stats.coins > 0
+                    ]
             else:
                 treasures = []
-            if capitalism:
-                treasures += [
-                    card
-                    for card in player.hand
-                    if card.is_action
-                    and not self.is_treasure(card)
-                    and card.stats.coins > 0
-                    and self._voyage_can_play_from_hand(player)
-                ]
             if not treasures:
                 break
 
@@ -2240,12 +2217,12 @@ class GameState:
                 break
 
             blocked = (
-                getattr(player, "highwayman_attacks", 0) > 0
-                and not getattr(player, "highwayman_blocked_this_turn", False)
+                player.highwayman_attacks > 0
+                and not player.turn.highwayman_blocked_this_turn
             )
 
             if blocked:
-                player.highwayman_blocked_this_turn = True
+                player.turn.highwayman_blocked_this_turn = True
                 coins_after = player.coins
             else:
                 # Corsair trashes AFTER on_play: the treasure is fully played
@@ -2259,12 +2236,13 @@ class GameState:
                 if self.pile_traits.get(choice.name) == "Reckless":
                     if choice in player.in_play:
                         choice.on_play(self)
-                self._maybe_corsair_trash(player, choice)
+                if self.hooks.corsair:
+                    self._maybe_corsair_trash(player, choice)
                 # Menagerie: Kiln — gain a copy of the next card played.
                 self._maybe_kiln_gain(player, choice)
                 coins_after = player.coins
                 if (
-                    player.envious_effect_active
+                    player.turn.envious_effect_active
                     and choice.name in {"Silver", "Gold"}
                     and coins_after > coins_before + 1
                 ):
@@ -2290,14 +2268,15 @@ class GameState:
                 # Treasure, you may play it again. Tiara may target itself
                 # (the once-per-turn limit is enforced by ``tiara_replay_used``).
                 if (
-                    not getattr(player, "tiara_replay_used", False)
-                    and any(card.name == "Tiara" for card in player.in_play)
+                    self.hooks.tiara
+                    and not player.turn.tiara_replay_used
+                    and player.in_play.count_name("Tiara")
                     and choice in player.in_play
                 ):
                     if player.ai.should_replay_treasure_with_tiara(
                         self, player, choice
                     ):
-                        player.tiara_replay_used = True
+                        player.turn.tiara_replay_used = True
                         choice.on_play(self)
                         if self.prophecy is not None and self.prophecy.is_active:
                             self.prophecy.on_play_treasure(self, player, choice)
@@ -2311,7 +2290,7 @@ class GameState:
                 # an Action from hand they don't already have in play.
                 self._maybe_inspiring_extra_play(player, choice)
 
-            remaining = [c.name for c in player.hand if c.is_treasure]
+            remaining = [c.name for c in player.hand.treasures()]
             context = {
                 "coins_before": coins_before,
                 "coins_added": coins_after - coins_before,
@@ -2326,45 +2305,48 @@ class GameState:
         """Handle the buy phase of a turn."""
         player = self.current_player
 
-        steps = 0
-        while True:
-            steps += 1
-            if steps > PHASE_STEP_LIMIT:
-                raise PhaseStepLimitExceeded(
-                    f"buy phase exceeded {PHASE_STEP_LIMIT} iterations in a single turn "
-                    f"(player={getattr(player.ai, 'name', '?')}, turn={self.turn_number}, "
-                    f"buys_left={player.buys}, coins={player.coins})"
-                )
-            if player.debt > 0:
-                if player.coins > 0:
-                    paid = min(player.debt, player.coins)
-                    player.coins -= paid
-                    player.coins_spent_this_turn += paid
-                    player.debt -= paid
-                    context = {
-                        "paid_debt": paid,
-                        "remaining_debt": player.debt,
-                        "remaining_coins": player.coins,
-                    }
-                    self.log_callback(
-                        ("action", player.ai.name, f"pays {paid} Debt", context)
+        # Costs only change through plays, gains, trashes, buys and token
+        # moves, each of which invalidates the memo.
+        with self.cost_cache():
+            steps = 0
+            while True:
+                steps += 1
+                if steps > PHASE_STEP_LIMIT:
+                    raise PhaseStepLimitExceeded(
+                        f"buy phase exceeded {PHASE_STEP_LIMIT} iterations in a single turn "
+                        f"(player={getattr(player.ai, 'name', '?')}, turn={self.turn_number}, "
+                        f"buys_left={player.buys}, coins={player.coins})"
                     )
-                    continue
-                break
+                if player.debt > 0:
+                    if player.coins > 0:
+                        paid = min(player.debt, player.coins)
+                        player.coins -= paid
+                        player.turn.coins_spent_this_turn += paid
+                        player.debt -= paid
+                        context = {
+                            "paid_debt": paid,
+                            "remaining_debt": player.debt,
+                            "remaining_coins": player.coins,
+                        }
+                        self.log_callback(
+                            ("action", player.ai.name, f"pays {paid} Debt", context)
+                        )
+                        continue
+                    break
 
-            if player.buys <= 0:
-                break
+                if player.buys <= 0:
+                    break
 
-            affordable = [c for c in self._get_affordable_cards(player) if c is not None]
+                affordable = [c for c in self._get_affordable_cards(player) if c is not None]
 
-            if not affordable:
-                break
+                if not affordable:
+                    break
 
-            choice = self._choose_safe_buy(player, affordable)
-            if choice is None:
-                break
+                choice = self._choose_safe_buy(player, affordable)
+                if choice is None:
+                    break
 
-            self._commit_buy(player, choice)
+                self._commit_buy(player, choice)
 
         self._handle_buy_phase_end(player)
         self.phase = "night"
@@ -2375,6 +2357,8 @@ class GameState:
         This is the shared source of truth for real buy-phase commits and
         the endgame guard's simulated buy on a cloned state.
         """
+        self.invalidate_cost_cache()
+        self.invalidate_features()
         if self.logger:
             self.logger.current_metrics.cards_bought[card.name] = (
                 self.logger.current_metrics.cards_bought.get(card.name, 0) + 1
@@ -2393,9 +2377,9 @@ class GameState:
         }
         self.log_callback(("action", player.ai.name, f"buys {card}", context))
 
-        player.bought_this_turn.append(card.name)
+        player.turn.bought_this_turn.append(card.name)
         player.buys -= 1
-        player.coins_spent_this_turn += cost
+        player.turn.coins_spent_this_turn += cost
 
         player.potions -= card.cost.potions
 
@@ -2405,10 +2389,10 @@ class GameState:
         overpay_amount = self._prompt_overpay(player, card)
 
         if getattr(card, "is_event", False):
-            card.on_buy(self, player)
+            self._call_on_buy(card, player)
         elif getattr(card, "is_project", False):
             player.projects.append(card)
-            card.on_buy(self, player)
+            self._call_on_buy(card, player)
         else:
             pile_name = card.name
             if card.is_knight and "Knights" in self.pile_order:
@@ -2417,15 +2401,17 @@ class GameState:
                     self.pile_order["Knights"].pop()
             self.supply[pile_name] = max(0, self.supply.get(pile_name, 0) - 1)
             self.log_callback(("supply_change", pile_name, -1, self.supply[pile_name]))
-            card.on_buy(self)
+            self._call_on_buy(card)
             gained_card = self.gain_card(player, card)
 
             if overpay_amount > 0:
                 card.on_overpay(self, player, overpay_amount, gained_card=gained_card)
 
-            self._handle_on_buy_in_play_effects(player, card, gained_card)
+            hooks = self.hooks
+            if hooks.hoard_talisman:
+                self._handle_on_buy_in_play_effects(player, card, gained_card)
             self._apply_embargo_tokens(player, pile_name)
-            if card.is_victory:
+            if card.is_victory and hooks.hovel:
                 self._handle_hovel_reaction(player)
             self._apply_tax_tokens(player, pile_name)
 
@@ -2443,25 +2429,29 @@ class GameState:
                     self.trash_card(player, selected)
             self._call_tavern_triggers(player, "buy", card)
 
-            if player.goons_played:
-                player.vp_tokens += player.goons_played
+            if player.turn.goons_played:
+                player.vp_tokens += player.turn.goons_played
 
-            if getattr(player, "merchant_guilds_played", 0):
-                player.coin_tokens += player.merchant_guilds_played
+            if player.turn.merchant_guilds_played:
+                player.coin_tokens += player.turn.merchant_guilds_played
 
-            self._trigger_haggler_bonus(player, card)
+            if hooks.haggler:
+                self._trigger_haggler_bonus(player, card)
 
         if card.cost.debt:
             player.debt += card.cost.debt
 
-        if getattr(player, "charm_next_buy_copies", 0):
+        if player.turn.charm_next_buy_copies:
             copies_to_gain = min(
-                player.charm_next_buy_copies, self.supply.get(card.name, 0)
+                player.turn.charm_next_buy_copies, self.supply.get(card.name, 0)
             )
             for _ in range(copies_to_gain):
                 self.supply[card.name] -= 1
                 self.gain_card(player, get_card(card.name))
-            player.charm_next_buy_copies = 0
+            player.turn.charm_next_buy_copies = 0
+
+        self.invalidate_cost_cache()
+        self.invalidate_features()
 
     def handle_night_phase(self):
         """Play Night cards from hand after Buy, before Cleanup.
@@ -2567,19 +2557,106 @@ class GameState:
         # Draw a fresh hand of 5.
         self.draw_cards(player, 5)
 
+    @contextmanager
+    def cost_cache(self):
+        """Memoize card costs for the duration of the block.
+
+        Zone- and token-derived modifiers (Quarry, Bridge Troll, Ferry) are
+        computed once per player, and final costs of cards without a
+        dynamic ``cost_modifier`` once per card. Plays, gains, trashes,
+        buys and pile-token changes invalidate the memo. Nested blocks
+        share the outermost one.
+        """
+        if self._cost_cache is not None:
+            yield
+            return
+        self._cost_cache = {}
+        try:
+            yield
+        finally:
+            self._cost_cache = None
+
+    @contextmanager
+    def feature_cache(self):
+        """Memoize derived facts (VP, empty piles, deck counts) for the block.
+
+        See :mod:`dominion.game.features`. Meant for read-only decision
+        code; gains, trashes and buys invalidate the memo. Nested blocks
+        share the outermost one.
+        """
+        if self.features is not None:
+            yield
+            return
+        self.features = FeatureCache(self.state_version)
+        try:
+            yield
+        finally:
+            self.features = None
+
+    def invalidate_features(self) -> None:
+        """Mark memoized features stale after a deck, supply or VP change."""
+        self.state_version += 1
+
+    def invalidate_cost_cache(self) -> None:
+        """Drop memoized costs after an event that may change them."""
+        if getattr(self, "_cost_cache", None):
+            self._cost_cache = {}
+
+    def _cost_modifiers(self, player: PlayerState) -> tuple[int, int, set]:
+        """Return (Quarries in play, Bridge Trolls out, -$2 cost token piles)."""
+        quarries = player.in_play.count_name("Quarry")
+
+        # Adventures Bridge Troll: while in play, all cards cost $1 less for
+        # ALL players (the effect is global until the owner's next turn
+        # cleanup). Scan every player's in_play and duration zones.
+        bridge_trolls = 0
+        for tracker in self.players:
+            bridge_trolls += sum(1 for c in tracker.duration if c.name == "Bridge Troll")
+            bridge_trolls += tracker.in_play.count_name("Bridge Troll")
+
+        # Adventures Ferry: -$2 cost token on a pile makes that pile cost $2
+        # less for the token's owner.
+        idx = self.players.index(player)
+        ferry_piles = {
+            pile
+            for (p_idx, pile), tokens in self.pile_tokens.items()
+            if p_idx == idx and "-$2 cost" in tokens
+        }
+        return quarries, bridge_trolls, ferry_piles
+
     def get_card_cost(self, player: PlayerState, card: Card) -> int:
         """Return the coin cost of a card after modifiers."""
+        cache = getattr(self, "_cost_cache", None)
+        if cache is None:
+            return self._compute_card_cost(player, card, self._cost_modifiers(player))
+
+        dynamic = hasattr(card, "cost_modifier")
+        key = (id(player), card.name, card.cost.coins)
+        if not dynamic:
+            cost = cache.get(key)
+            if cost is not None:
+                return cost
+
+        modifiers = cache.get(id(player))
+        if modifiers is None:
+            modifiers = cache[id(player)] = self._cost_modifiers(player)
+        cost = self._compute_card_cost(player, card, modifiers)
+        if not dynamic:
+            cache[key] = cost
+        return cost
+
+    def _compute_card_cost(self, player: PlayerState, card: Card, modifiers: tuple[int, int, set]) -> int:
+        quarries, bridge_trolls, ferry_piles = modifiers
         cost = card.cost.coins
 
         if hasattr(card, "cost_modifier"):
             cost += card.cost_modifier(self, player)
 
-        if getattr(player, "cost_reduction", 0):
-            cost -= player.cost_reduction
+        if player.turn.cost_reduction:
+            cost -= player.turn.cost_reduction
 
-        quarry_discount = sum(1 for c in player.in_play if c.name == "Quarry")
-        if quarry_discount and card.is_action:
-            cost -= 2 * quarry_discount
+        if quarries and card.is_action:
+            cost -= 2 * quarries
 
         # Rising Sun: Flourishing Trade and other cost-modifying Prophecies.
         if self.prophecy is not None and self.prophecy.is_active:
@@ -2593,20 +2670,11 @@ class GameState:
         if tokens:
             cost -= tokens
 
-        # Adventures Ferry: -$2 cost token on a pile makes that pile cost $2
-        # less for the token's owner.
-        if self.has_pile_token(player, card.name, "-$2 cost"):
+        if card.name in ferry_piles:
             cost -= 2
 
-        # Adventures Bridge Troll: while in play, all cards cost $1 less for
-        # ALL players (the effect is global until the owner's next turn
-        # cleanup). Scan every player's in_play and duration zones.
-        bt_count = 0
-        for tracker in self.players:
-            bt_count += sum(1 for c in tracker.duration if c.name == "Bridge Troll")
-            bt_count += sum(1 for c in tracker.in_play if c.name == "Bridge Troll")
-        if bt_count:
-            cost -= bt_count
+        if bridge_trolls:
+            cost -= bridge_trolls
 
         return max(0, cost)
 
@@ -2618,7 +2686,7 @@ class GameState:
 
         # Adventures Mission: on the extra turn granted by Mission, the player
         # cannot buy cards.
-        if getattr(player, "mission_no_buy_turn", False):
+        if player.mission_no_buy_turn:
             return []
 
         affordable = []
@@ -2646,8 +2714,8 @@ class GameState:
                     cost <= available_coins
                     and card.cost.potions <= player.potions
                     and pile_buyable
-                    and card_name not in player.banned_buys
-                    and (not player.cannot_buy_actions or not card.is_action)
+                    and card_name not in player.turn.banned_buys
+                    and (not player.turn.cannot_buy_actions or not card.is_action)
                 ):
                     affordable.append(card)
 
@@ -2696,7 +2764,7 @@ class GameState:
         tokens_spent = amount - coins_spent
         player.coins -= coins_spent
         player.coin_tokens -= tokens_spent
-        player.coins_spent_this_turn += amount
+        player.turn.coins_spent_this_turn += amount
         self.log_callback(
             (
                 "action",
@@ -2711,13 +2779,20 @@ class GameState:
         )
         return amount
 
+    def _call_on_buy(self, card, *args) -> None:
+        """Run ``card.on_buy``, timed as ``on_buy`` when profiling."""
+        if self.profiler is not None:
+            self.profiler.call("on_buy", card.name, card.on_buy, self, *args)
+        else:
+            card.on_buy(self, *args)
+
     def _complete_purchase(self, player, card):
         """Helper to complete a card purchase."""
         cost = self.get_card_cost(player, card)
         coins_spent = min(player.coins, cost)
         tokens_spent = max(0, cost - coins_spent)
         player.buys -= 1
-        player.coins_spent_this_turn += cost
+        player.turn.coins_spent_this_turn += cost
         player.coins -= coins_spent
         player.coin_tokens -= tokens_spent
         player.potions -= card.cost.potions
@@ -2735,13 +2810,14 @@ class GameState:
                 self, player, overpay_amount, gained_card=gained_card
             )
 
-        if player.goons_played:
-            player.vp_tokens += player.goons_played
+        if player.turn.goons_played:
+            player.vp_tokens += player.turn.goons_played
 
-        if getattr(player, "merchant_guilds_played", 0):
-            player.coin_tokens += player.merchant_guilds_played
+        if player.turn.merchant_guilds_played:
+            player.coin_tokens += player.turn.merchant_guilds_played
 
-        self._trigger_haggler_bonus(player, card)
+        if self.hooks.haggler:
+            self._trigger_haggler_bonus(player, card)
 
     def handle_cleanup_phase(self):
         """Handle the cleanup phase of a turn."""
@@ -2752,14 +2828,14 @@ class GameState:
             (
                 "turn_summary",
                 player.ai.name,
-                player.actions_this_turn,
-                list(player.bought_this_turn),
-                player.coins_spent_this_turn + player.coins,
+                player.turn.actions_this_turn,
+                list(player.turn.bought_this_turn),
+                player.turn.coins_spent_this_turn + player.coins,
             )
         )
 
-        player.actions_this_turn = 0
-        player.bought_this_turn = []
+        player.turn.actions_this_turn = 0
+        player.turn.bought_this_turn = []
 
         # Rising Sun: Prophecy cleanup-start hook (Biding Time, Sickness)
         if self.prophecy is not None and self.prophecy.is_active:
@@ -2770,9 +2846,10 @@ class GameState:
         # still part of THIS turn — if the player bought Deliver and had
         # not yet gained, those cleanup-start gains are eligible for the
         # Deliver set-aside trigger.
-        for card in list(player.in_play):
-            if hasattr(card, "on_cleanup_start"):
-                card.on_cleanup_start(self)
+        if self.hooks.cleanup_start:
+            for card in list(player.in_play):
+                if hasattr(card, "on_cleanup_start"):
+                    card.on_cleanup_start(self)
 
         # Plunder Deliver: the "set aside the next gain THIS TURN" trigger
         # only persists until end of turn. Cards already set aside in
@@ -2825,7 +2902,7 @@ class GameState:
         # this turn." Keep every Action card from in_play in the same set so
         # they survive cleanup. They will be discarded normally at the end of
         # the granted extra turn.
-        journey_extra_turn = bool(getattr(player, "journey_extra_turn_pending", False))
+        journey_extra_turn = bool(player.journey_extra_turn_pending)
         if journey_extra_turn:
             for card in player.in_play:
                 if card.is_action:
@@ -2835,7 +2912,7 @@ class GameState:
         # firing discard-from-play hooks, so we don't trigger those hooks on
         # cards that ultimately won't be discarded this cleanup.
         trickster_selected: list[Card] = []
-        trickster_uses = getattr(player, "trickster_uses_remaining", 0)
+        trickster_uses = player.trickster_uses_remaining
         if trickster_uses > 0:
             non_duration_in_play = [
                 card for card in player.in_play if card not in durations_to_keep
@@ -2875,7 +2952,7 @@ class GameState:
                 return False
             if (
                 card.name == "Walled Village"
-                and getattr(player, "walled_villages_played", 0) <= 1
+                and player.turn.walled_villages_played <= 1
             ):
                 return False
             if card.name == "Border Guard" and getattr(
@@ -2884,7 +2961,7 @@ class GameState:
                 return False
             if (
                 card.is_treasure
-                and getattr(player, "panic_active", False)
+                and player.panic_active
                 and card.name in self.supply
             ):
                 return False
@@ -2898,12 +2975,13 @@ class GameState:
         # the hook for cards that will actually be discarded from play this
         # cleanup (filtered above) — otherwise cards like Anvil could grant
         # their bonus while being set aside by Trickster, etc.
-        for card in list(player.in_play):
-            if (
-                hasattr(card, "on_discard_from_play")
-                and _will_be_discarded_from_play(card)
-            ):
-                card.on_discard_from_play(self, player)
+        if self.hooks.discard_from_play:
+            for card in list(player.in_play):
+                if (
+                    hasattr(card, "on_discard_from_play")
+                    and _will_be_discarded_from_play(card)
+                ):
+                    card.on_discard_from_play(self, player)
 
         # Plunder Patient trait: at end of turn, mat cards from Patient pile.
         patient_pile = self.trait_piles.get("Patient")
@@ -2945,7 +3023,7 @@ class GameState:
                 player.deck.append(card)
             elif (
                 card.name == "Walled Village"
-                and getattr(player, "walled_villages_played", 0) <= 1
+                and player.turn.walled_villages_played <= 1
             ):
                 player.deck.append(card)
             elif (
@@ -2957,7 +3035,7 @@ class GameState:
                 player.deck.append(card)
             elif (
                 card.is_treasure
-                and getattr(player, "panic_active", False)
+                and player.panic_active
                 and card.name in self.supply
             ):
                 # Rising Sun Panic: discarded Treasures return to their pile
@@ -3003,38 +3081,38 @@ class GameState:
         player.trickster_uses_remaining = 0
 
         # Outpost: schedule an extra turn for this player with a 3-card hand.
-        outpost_extra_turn = bool(getattr(player, "outpost_pending", False))
+        outpost_extra_turn = bool(player.outpost_pending)
         cards_to_draw = 3 if outpost_extra_turn else 5
 
         # Nocturne — The River's Gift: +1 Card at end of turn (per active copy).
         # Druid's set-aside River's Gift also delivers the cleanup draw.
         rivers_count = sum(
-            1 for b in getattr(player, "active_boons", []) if b == "The River's Gift"
+            1 for b in player.active_boons if b == "The River's Gift"
         )
         rivers_count += sum(
             1
-            for b in getattr(player, "druid_active_boons", [])
+            for b in player.druid_active_boons
             if b == "The River's Gift"
         )
         cards_to_draw += rivers_count
         # Allies "Order of Masons" bonus: +1 Card per 2 Favors spent
         # this turn end (banked above before cleanup runs).
-        bonus = getattr(player, "order_of_masons_bonus", 0)
+        bonus = player.order_of_masons_bonus
         if bonus:
             cards_to_draw += bonus
             player.order_of_masons_bonus = 0
 
         # Adventures Expedition: +2 cards at end-of-turn redraw.
-        cards_to_draw += getattr(player, "expedition_extra_draws", 0)
+        cards_to_draw += player.expedition_extra_draws
         player.expedition_extra_draws = 0
 
         # Cornucopia & Guilds 2E Farrier overpay: +N cards into next hand.
-        cards_to_draw += getattr(player, "farrier_pending_draw", 0)
+        cards_to_draw += player.farrier_pending_draw
         player.farrier_pending_draw = 0
 
         # Adventures: -1 Card tokens (Borrow, Relic, Bridge Troll). Each token
         # removes one card from the next end-of-turn draw and is then removed.
-        minus_tokens = getattr(player, "minus_card_tokens", 0)
+        minus_tokens = player.minus_card_tokens
         if minus_tokens > 0:
             cards_to_draw = max(0, cards_to_draw - minus_tokens)
             player.minus_card_tokens = 0
@@ -3044,7 +3122,7 @@ class GameState:
 
         # Rising Sun Foresight: cards set aside earlier go into hand after
         # drawing the next hand.
-        if getattr(player, "foresight_set_aside", None):
+        if player.foresight_set_aside:
             player.hand.extend(player.foresight_set_aside)
             player.foresight_set_aside = []
 
@@ -3053,7 +3131,7 @@ class GameState:
             player.deck.append(card)
 
         # Nocturne — Faithful Hound: set-aside Hounds return to hand at end of turn
-        if getattr(player, "hound_set_aside", None):
+        if player.hound_set_aside:
             player.hand.extend(player.hound_set_aside)
             player.hound_set_aside = []
 
@@ -3062,7 +3140,7 @@ class GameState:
         # immediately discarded. Per the Empires rules, Donate fires "between
         # turns": put hand+deck+discard together, trash any, shuffle the rest
         # into the deck, and draw 5.
-        donates = getattr(player, "donate_pending", 0)
+        donates = player.donate_pending
         if donates:
             for _ in range(donates):
                 self._resolve_donate(player)
@@ -3083,35 +3161,35 @@ class GameState:
         # finishes their turn (and before the attacker's following turn).
         player.haunted_woods_attacks = 0
         player.swamp_hag_attacks = 0
-        player.ignore_action_bonuses = False
-        player.collection_played = 0
-        player.goons_played = 0
-        player.groundskeeper_bonus = 0
-        player.topdeck_gains = False
-        player.way_of_seal_active = False
-        player.cannot_buy_actions = False
-        player.envious_effect_active = False
-        player.cost_reduction = 0
-        player.innovation_used = False
-        player.citadel_used = False
+        player.turn.ignore_action_bonuses = False
+        player.turn.collection_played = 0
+        player.turn.goons_played = 0
+        player.turn.groundskeeper_bonus = 0
+        player.turn.topdeck_gains = False
+        player.turn.way_of_seal_active = False
+        player.turn.cannot_buy_actions = False
+        player.turn.envious_effect_active = False
+        player.turn.cost_reduction = 0
+        player.turn.innovation_used = False
+        player.turn.citadel_used = False
 
         # Empires Landmarks: end-of-turn hook (Baths). Fired before
         # cards_gained_this_turn resets so the landmark can inspect it.
         for landmark in self.landmarks:
             landmark.on_turn_end(self, player)
 
-        player.cards_gained_this_turn = 0
+        player.turn.cards_gained_this_turn = 0
         player.cards_gained_this_buy_phase = 0
-        player.gained_victory_this_buy_phase = False
+        player.turn.gained_victory_this_buy_phase = False
         player.flagship_pending = [
             card for card in player.flagship_pending if card in player.duration
         ]
-        player.highwayman_blocked_this_turn = False
-        player.insignia_active = False
+        player.turn.highwayman_blocked_this_turn = False
+        player.turn.insignia_active = False
         player.sailor_play_uses = 0
         player.corsair_trashed_this_turn = False
         # Rotate gain history for Smugglers.
-        player.gained_cards_last_turn = list(getattr(player, "gained_cards_this_turn", []))
+        player.gained_cards_last_turn = list(player.gained_cards_this_turn)
         player.gained_cards_this_turn = []
         # Outpost bookkeeping.
         player.outpost_taken_last_turn = outpost_extra_turn
@@ -3155,6 +3233,12 @@ class GameState:
         if self.is_game_over():
             return
 
+        if self.profiler is not None:
+            self.profiler.call("phase", self.phase, self._run_phase)
+        else:
+            self._run_phase()
+
+    def _run_phase(self):
         if self.phase == "start":
             self.handle_start_phase()
         elif self.phase == "action":
@@ -3173,7 +3257,7 @@ class GameState:
 
         Unlike :meth:`is_game_over`, this is a pure inspection of the
         supply: the Province pile is empty, the Colony pile is empty
-        (when in use), or three supply piles are gone. It deliberately
+        (when in use), or :attr:`pile_end_count` supply piles are gone. It deliberately
         ignores mid-turn / Fleet sequencing so it can be used to predict
         the effect of a *prospective* gain during a player's buy phase.
 
@@ -3183,7 +3267,7 @@ class GameState:
         """
         province_depleted = "Province" in self.supply and self.supply["Province"] == 0
         colony_depleted = "Colony" in self.supply and self.supply["Colony"] == 0
-        return province_depleted or colony_depleted or self.empty_piles >= 3
+        return province_depleted or colony_depleted or self.empty_piles >= self.pile_end_count
 
     def _buy_could_end_game(self, player: PlayerState, card: "Card") -> bool:
         """Loose, cheap pre-check for whether a buy could end the game.
@@ -3194,9 +3278,9 @@ class GameState:
         * Province / Colony at ``<= 1`` — only the last copy ends the
           game via that pile, and no engine effect gains two of either
           in a single buy commit.
-        * ``empty_piles >= 2`` — a single buy with Hoard, Border
-          Village, Hill Fort, etc. can empty a third pile via
-          side-effect gains, so this stays at two-piles-already-empty.
+        * ``empty_piles`` one short of :attr:`pile_end_count` — a single
+          buy with Hoard, Border Village, Hill Fort, etc. can empty the
+          last pile via side-effect gains, so this stays one pile early.
 
         Tightening the Province/Colony thresholds from ``<= 2`` to
         ``<= 1`` roughly halves the deep-copy frequency near the end of
@@ -3210,7 +3294,7 @@ class GameState:
             return True
         if "Colony" in self.supply and self.supply["Colony"] <= 1:
             return True
-        if self.empty_piles >= 2:
+        if self.empty_piles >= self.pile_end_count - 1:
             return True
         return False
 
@@ -3300,7 +3384,12 @@ class GameState:
         """
         candidates = list(affordable)
         while candidates:
-            choice = player.ai.choose_buy(self, candidates + [None])
+            was_choosing_buy = getattr(self, "_choosing_buy_phase", False)
+            self._choosing_buy_phase = True
+            try:
+                choice = player.ai.choose_buy(self, candidates + [None])
+            finally:
+                self._choosing_buy_phase = was_choosing_buy
             if choice is None:
                 return None
             if choice not in candidates:
@@ -3331,7 +3420,7 @@ class GameState:
 
         province_depleted = self.supply.get("Province", 0) == 0
         colony_depleted = "Colony" in self.supply and self.supply.get("Colony", 0) == 0
-        normal_end = province_depleted or colony_depleted or self.empty_piles >= 3
+        normal_end = province_depleted or colony_depleted or self.empty_piles >= self.pile_end_count
 
         # If the current player is mid-turn (has not yet finished cleanup),
         # never short-circuit into the Fleet extra round or game-end logic.
@@ -3399,11 +3488,11 @@ class GameState:
             self.log_callback("Game over: Colonies depleted")
             return True
 
-        # 3. Three supply piles empty
+        # 3. Three supply piles empty (four with 5-6 players)
         empty_piles = self.empty_piles
-        if empty_piles >= 3:
+        if empty_piles >= self.pile_end_count:
             self._update_final_metrics()
-            self.log_callback("Game over: Three piles depleted")
+            self.log_callback(f"Game over: {empty_piles} piles depleted")
             return True
 
         # 4. Hard turn limit
@@ -3603,7 +3692,7 @@ class GameState:
         # by a player from the deck so they aren't drawn.
         reserved: set[str] = set(self.druid_boons)
         for p in self.players:
-            for b in getattr(p, "active_boons", []):
+            for b in p.active_boons:
                 reserved.add(b)
         while self.boons_deck and self.boons_deck[-1] in reserved:
             self.boons_deck.pop()
@@ -3666,6 +3755,27 @@ class GameState:
     ) -> "Card | None":
         """Add a card to a player's discard or deck, honoring topdeck effects.
 
+        See :meth:`_gain_card` for the full rules.
+        """
+        if type(card) in HOOKED_CLASSES:
+            self.hooks.admit(card.name)
+        if self.profiler is not None:
+            gained = self.profiler.call("gain", card.name, self._gain_card, player, card, to_deck, from_supply)
+        else:
+            gained = self._gain_card(player, card, to_deck, from_supply)
+        if gained is not None:
+            player.vp_ledger.add(gained)
+        return gained
+
+    def _gain_card(
+        self,
+        player: PlayerState,
+        card: Card,
+        to_deck: bool,
+        from_supply: bool,
+    ) -> "Card | None":
+        """Add a card to a player's discard or deck, honoring topdeck effects.
+
         ``from_supply`` controls supply-restoration semantics. The default
         (``True``) matches the historical contract: the caller has already
         decremented the supply for ``card.name``, so Trader's reaction and
@@ -3677,6 +3787,9 @@ class GameState:
         reclaimed instead of the newly gained copy.
         """
 
+        self.invalidate_cost_cache()
+        self.invalidate_features()
+
         if (
             from_supply
             and self._is_ferryman_reserved_pile_name(card.name)
@@ -3699,24 +3812,25 @@ class GameState:
         actual_card = reclaimed or card
         destination_is_deck = to_deck
 
-        if not reclaimed:
+        hooks = self.hooks
+        if not reclaimed and hooks.trader:
             actual_card = self._handle_trader_exchange(
                 player, card, actual_card, destination_is_deck, from_supply=from_supply
             )
 
-        if not destination_is_deck and getattr(player, "topdeck_gains", False):
+        if not destination_is_deck and player.turn.topdeck_gains:
             destination_is_deck = True
 
         if (
             not destination_is_deck
-            and getattr(player, "way_of_seal_active", False)
+            and player.turn.way_of_seal_active
             and player.ai.should_topdeck_with_way_of_seal(self, player, actual_card)
         ):
             destination_is_deck = True
 
         if (
             not destination_is_deck
-            and getattr(player, "insignia_active", False)
+            and player.turn.insignia_active
             and player.ai.should_topdeck_with_insignia(self, player, actual_card)
         ):
             destination_is_deck = True
@@ -3724,7 +3838,8 @@ class GameState:
         # Prosperity 2E: Tiara — while in play, gains may be topdecked.
         if (
             not destination_is_deck
-            and any(card.name == "Tiara" for card in player.in_play)
+            and hooks.tiara
+            and player.in_play.count_name("Tiara")
             and player.ai.should_topdeck_with_tiara(self, player, actual_card)
         ):
             destination_is_deck = True
@@ -3746,7 +3861,10 @@ class GameState:
 
         self._handle_gatekeeper_exile(player, actual_card, destination_is_deck, reclaimed)
 
-        actual_card.on_gain(self, player)
+        if self.profiler is not None:
+            self.profiler.call("on_gain", actual_card.name, actual_card.on_gain, self, player)
+        else:
+            actual_card.on_gain(self, player)
 
         # Rising Sun: Kintsugi event needs to know whether the player has
         # ever gained a Gold.
@@ -3759,23 +3877,30 @@ class GameState:
             self.prophecy.on_gain(self, player, actual_card)
 
         self._handle_trade_route_token(actual_card)
-        self._handle_watchtower_reaction(player, actual_card)
-        self._handle_royal_seal_reaction(player, actual_card)
+        if hooks.watchtower:
+            self._handle_watchtower_reaction(player, actual_card)
+        if hooks.royal_seal:
+            self._handle_royal_seal_reaction(player, actual_card)
 
         for project in player.projects:
             if hasattr(project, "on_gain"):
                 project.on_gain(self, player, actual_card)
 
-        if getattr(player, "groundskeeper_bonus", 0) and actual_card.is_victory:
-            player.vp_tokens += player.groundskeeper_bonus
+        if player.turn.groundskeeper_bonus and actual_card.is_victory:
+            player.vp_tokens += player.turn.groundskeeper_bonus
 
-        self._trigger_invest_draw(actual_card.name, player)
-        self._handle_fools_gold_reactions(player, actual_card)
+        if hooks.invest:
+            self._trigger_invest_draw(actual_card.name, player)
+        if hooks.fools_gold:
+            self._handle_fools_gold_reactions(player, actual_card)
         self._track_action_gain(player, actual_card)
-        self._handle_cargo_ship_gain(player, actual_card)
-        self._handle_menagerie_gain_reactions(player, actual_card)
+        if hooks.cargo_ship:
+            self._handle_cargo_ship_gain(player, actual_card)
+        if hooks.sleigh_sheepdog:
+            self._handle_menagerie_gain_reactions(player, actual_card)
         self._handle_opponent_gain_hooks(player, actual_card)
-        self._handle_livery_gain(player, actual_card)
+        if hooks.livery:
+            self._handle_livery_gain(player, actual_card)
 
         if (
             hasattr(player, "cards_gained_this_buy_phase")
@@ -3787,19 +3912,16 @@ class GameState:
                 player.gained_action_or_treasure_this_buy_phase = True
 
         if actual_card.is_victory and player is self.current_player and self.phase == "buy":
-            player.gained_victory_this_buy_phase = True
+            player.turn.gained_victory_this_buy_phase = True
 
         # Treasury cares about Victory cards gained anywhere on your turn
         # (Action phase via Workshop / Charm / Ironworks counts too).
         if actual_card.is_victory and player is self.current_player:
-            player.gained_victory_this_turn = True
-
-        if hasattr(player, "cards_gained_this_turn"):
-            player.cards_gained_this_turn += 1
+            player.turn.gained_victory_this_turn = True
 
+        player.turn.cards_gained_this_turn += 1
         # Nocturne — Devil's Workshop and Monastery key off this counter
-        if hasattr(player, "cards_gained_this_turn_count"):
-            player.cards_gained_this_turn_count += 1
+        player.turn.cards_gained_this_turn_count += 1
 
         # Track names of cards gained this turn (for Smugglers).
         if hasattr(player, "gained_cards_this_turn"):
@@ -3823,14 +3945,15 @@ class GameState:
         self._handle_landing_party_gain(player, actual_card)
 
         # Plunder Mining Road: first Treasure gained → gain a Treasure to hand.
-        self._handle_mining_road_gain(player, actual_card)
+        if hooks.mining_road:
+            self._handle_mining_road_gain(player, actual_card)
         # Adventures: Tavern triggers — Duplicate may be called when a card is
         # gained costing up to $6.
         self._call_tavern_triggers(player, "gain", actual_card)
 
         # Adventures Travelling Fair: optionally topdeck this gain.
         if (
-            getattr(player, "travelling_fair_active", False)
+            player.turn.travelling_fair_active
             and self.phase == "buy"
             and player is self.current_player
             and not destination_is_deck
@@ -3850,10 +3973,11 @@ class GameState:
         # Generic "while this is in play, when you gain a card ..." hook used
         # by Allies cards like Galleria and Skirmisher. In-play cards may
         # implement on_owner_gain(game_state, player, gained_card).
-        for card in list(player.in_play) + list(player.duration):
-            hook = getattr(card, "on_owner_gain", None)
-            if hook is not None:
-                hook(self, player, actual_card)
+        if hooks.owner_gain:
+            for card in list(player.in_play) + list(player.duration):
+                hook = getattr(card, "on_owner_gain", None)
+                if hook is not None:
+                    hook(self, player, actual_card)
 
         # Allies hook: the chosen Ally may react to the active player's gains
         # (Architects' Guild, Band of Nomads, Trappers' Lodge).
@@ -3989,7 +4113,7 @@ class GameState:
 
     def _handle_sailor_gain(self, player: PlayerState, gained_card: Card) -> None:
         """Trigger Sailor's "may play this gain" effect for the gainer's own gains."""
-        if getattr(player, "sailor_play_uses", 0) <= 0:
+        if player.sailor_play_uses <= 0:
             return
         for card in list(player.duration):
             if card.name == "Sailor" and hasattr(card, "on_gain_for_owner"):
@@ -4095,7 +4219,7 @@ class GameState:
         be returned to hand at the start of the next turn; otherwise we
         simply consume the pending count without setting anything aside.
         """
-        if getattr(player, "deliver_pending_count", 0) <= 0:
+        if player.deliver_pending_count <= 0:
             return
         # Always consume the trigger — Deliver locks onto the first gain
         # this turn regardless of where it ends up.
@@ -4118,11 +4242,11 @@ class GameState:
             return
         if not gained_card.is_treasure:
             return
-        if not any(card.name == "Mining Road" for card in player.in_play):
+        if not player.in_play.count_name("Mining Road"):
             return
-        if getattr(player, "mining_road_triggered", False):
+        if player.turn.mining_road_triggered:
             return
-        player.mining_road_triggered = True
+        player.turn.mining_road_triggered = True
 
         candidates = []
         for _name, card, _count in self._iter_gainable_supply_cards():
@@ -4145,7 +4269,7 @@ class GameState:
         self, player: PlayerState, card: Card, on_deck: bool, reclaimed: "Card | None"
     ) -> None:
         """Exile a gained Action/Treasure if the player is under Gatekeeper attack."""
-        if getattr(player, "gatekeeper_attacks", 0) <= 0:
+        if player.gatekeeper_attacks <= 0:
             return
         if not (card.is_action or card.is_treasure):
             return
@@ -4271,7 +4395,7 @@ class GameState:
     def _handle_royal_seal_reaction(self, player: PlayerState, gained_card: Card) -> None:
         """Allow Royal Seal to topdeck newly gained cards."""
 
-        if not any(card.name == "Royal Seal" for card in player.in_play):
+        if not player.in_play.count_name("Royal Seal"):
             return
 
         if not player.ai.should_topdeck_with_royal_seal(self, player, gained_card):
@@ -4377,14 +4501,14 @@ class GameState:
         if not card.is_action:
             return
 
-        player.actions_gained_this_turn += 1
+        player.turn.actions_gained_this_turn += 1
 
         if (
-            player.actions_gained_this_turn == 3
-            and not player.cauldron_triggered
-            and any(card_in_play.name == "Cauldron" for card_in_play in player.in_play)
+            player.turn.actions_gained_this_turn == 3
+            and not player.turn.cauldron_triggered
+            and player.in_play.count_name("Cauldron")
         ):
-            player.cauldron_triggered = True
+            player.turn.cauldron_triggered = True
 
             cauldron_card = next(
                 (c for c in player.in_play if c.name == "Cauldron"),
@@ -4601,7 +4725,10 @@ class GameState:
 
     def trash_card(self, player: PlayerState, card: Card) -> None:
         """Move a card to the trash and trigger related effects."""
+        self.invalidate_cost_cache()
+        self.invalidate_features()
         self.trash.append(card)
+        player.vp_ledger.remove(card)
         card.on_trash(self, player)
 
         # Resolve project triggers for trashing
@@ -4614,13 +4741,13 @@ class GameState:
             landmark.on_trash(self, player, card)
 
         # Renaissance Priest: +$2 for each Priest played this turn.
-        priest_count = getattr(player, "priest_played_this_turn", 0)
+        priest_count = player.turn.priest_played_this_turn
         if priest_count and player is self.current_player:
             player.coins += 2 * priest_count
 
         # Plunder Crucible: track trashes-this-turn.
         if player is self.current_player:
-            player.cards_trashed_this_turn = getattr(player, "cards_trashed_this_turn", 0) + 1
+            player.turn.cards_trashed_this_turn += 1
 
         # Plunder Pious trait.
         self._handle_pious_trash(player, card)
@@ -4693,6 +4820,8 @@ class GameState:
             for project in player.projects:
                 if hasattr(project, "on_opponent_gain"):
                     project.on_opponent_gain(self, player, gained_card)
+            if not self.hooks.opponent_gain:
+                continue
             # Duration cards (Monkey, Blockade) can react to opponent gains.
             for card in list(player.duration):
                 if hasattr(card, "on_opponent_gain"):
@@ -4735,7 +4864,7 @@ class GameState:
         play even if no copy can actually be gained (empty/non-supply pile),
         so that Kiln does not silently carry over to a later play.
         """
-        pending = getattr(player, "kiln_pending", 0)
+        pending = player.turn.kiln_pending
         if pending <= 0:
             return
         # Don't trigger on Kiln itself when it would re-trigger on its own play.
@@ -4744,7 +4873,7 @@ class GameState:
 
         # The trigger fires on this play regardless of whether a copy can be
         # gained — consume the pending charge up-front.
-        player.kiln_pending = pending - 1
+        player.turn.kiln_pending = pending - 1
 
         if self.supply.get(played_card.name, 0) <= 0:
             return
@@ -4766,7 +4895,7 @@ class GameState:
             return
         if gained_card.cost.coins < 4:
             return
-        livery_count = sum(1 for c in player.in_play if c.name == "Livery")
+        livery_count = player.in_play.count_name("Livery")
         if livery_count <= 0:
             return
         from ..cards.registry import get_card
@@ -4781,7 +4910,7 @@ class GameState:
         """Let any opposing Corsair trash the first Silver/Gold of the turn."""
         if treasure_card.name not in {"Silver", "Gold"}:
             return False
-        if getattr(treasure_player, "corsair_trashed_this_turn", False):
+        if treasure_player.corsair_trashed_this_turn:
             return False
 
         for other in self.players:
@@ -4836,14 +4965,14 @@ class GameState:
         self, buyer: PlayerState, bought_card: Card
     ) -> None:
         """Adventures Haunted Woods / Swamp Hag triggers on opponent buys."""
-        if getattr(buyer, "haunted_woods_attacks", 0) > 0 and buyer.hand:
+        if buyer.haunted_woods_attacks > 0 and buyer.hand:
             ordered = buyer.ai.order_cards_for_topdeck(
                 self, buyer, list(buyer.hand)
             )
             buyer.hand = []
             for card in ordered:
                 buyer.deck.append(card)
-        if getattr(buyer, "swamp_hag_attacks", 0) > 0:
+        if buyer.swamp_hag_attacks > 0:
             for _ in range(buyer.swamp_hag_attacks):
                 if self.supply.get("Curse", 0) <= 0:
                     break
@@ -4946,7 +5075,7 @@ class GameState:
         ``_end_inherited_estate_overlay`` once all play and post-play hooks
         have completed.
         """
-        inherited_name = getattr(player, "inherited_action_name", None)
+        inherited_name = player.inherited_action_name
         if not inherited_name:
             return None
         inherited_card = get_card(inherited_name)
@@ -4980,6 +5109,7 @@ class GameState:
         estate.play_effect = inherited_cls.play_effect.__get__(
             estate, type(estate)
         )
+        self._reindex_zones_holding(estate)
         # Bind Reserve / Duration callbacks too. They are looked up by
         # ``_call_tavern_triggers`` and ``do_duration_phase`` from the
         # card sitting on the Tavern mat / in the duration zone — long
@@ -4998,6 +5128,15 @@ class GameState:
             )
         return saved
 
+    def _reindex_zones_holding(self, card: Card) -> None:
+        """Refresh the indexed zones and VP ledger holding ``card`` after it
+        was renamed or retyped."""
+        for player in self.players:
+            player.vp_ledger.invalidate(card)
+            for zone in (player.hand, player.in_play):
+                if any(held is card for held in zone):
+                    zone.reindex()
+
     def _end_inherited_estate_overlay(
         self, estate: Card, saved: "dict | None"
     ) -> None:
@@ -5007,6 +5146,7 @@ class GameState:
         estate.stats = saved["stats"]
         estate.types = saved["types"]
         estate.play_effect = saved["play_effect"]
+        self._reindex_zones_holding(estate)
         # Only restore on_duration / on_call_from_tavern if the Estate
         # originally had them. When it didn't (the common case for an
         # Estate inheriting a Reserve or Duration card), we leave the
@@ -5029,6 +5169,7 @@ class GameState:
         idx = self.players.index(player)
         key = (idx, pile_name)
         self.pile_tokens.setdefault(key, set()).add(token_kind)
+        self.invalidate_cost_cache()
 
     def remove_pile_token(
         self, player: PlayerState, pile_name: str, token_kind: str
@@ -5039,6 +5180,7 @@ class GameState:
             self.pile_tokens[key].discard(token_kind)
             if not self.pile_tokens[key]:
                 del self.pile_tokens[key]
+            self.invalidate_cost_cache()
 
     def has_pile_token(
         self, player: PlayerState, pile_name: str, token_kind: str
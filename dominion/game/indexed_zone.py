@@ -0,0 +1,223 @@
+"""Card lists that keep a name count and type buckets up to date.
+
+The action and treasure phases ask the same questions of the hand and the
+play area on every step: which cards in hand are Actions, which are
+Treasures, is Tiara in play. Answering each with a scan makes turns with
+dozens of plays quadratic. An :class:`IndexedZone` is still a ``list`` of
+Card objects, so identity checks, ``remove``, slicing and the many card
+call sites that mutate zones directly keep working. Each mutation also
+updates:
+
+* :meth:`count_name`: copies of a card name, answered in O(1);
+* :meth:`actions` / :meth:`treasures`: the Action / Treasure cards in zone
+  order. ``append``, ``extend`` and removals keep these buckets current.
+  Inserting mid-list or reordering marks them stale, and the next query
+  rebuilds them with one scan.
+
+Names and types are read when a card enters or leaves. Code that renames
+or retypes a card while it sits in a zone (the Inheritance overlay) calls
+:meth:`reindex`. :meth:`check` compares the index with a fresh scan; the
+phase loops run it on every step when ``PY_OVERLORD_CHECK_ZONES`` is set.
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+from typing import Iterable, Optional
+
+from dominion.cards.base_card import _TYPE_BITS, Card, CardType
+
+_ACTION = _TYPE_BITS[CardType.ACTION]
+_TREASURE = _TYPE_BITS[CardType.TREASURE]
+
+
+def zone_checks_enabled() -> bool:
+    """Whether ``PY_OVERLORD_CHECK_ZONES`` asks the engine to verify indexes."""
+    return os.environ.get("PY_OVERLORD_CHECK_ZONES", "") not in ("", "0")
+
+
+class IndexedZone(list):
+    """A list of cards with a per-name count and Action/Treasure buckets."""
+
+    __slots__ = ("_names", "_actions", "_treasures")
+
+    def __init__(self, cards: Iterable[Card] = ()) -> None:
+        super().__init__(cards)
+        self.reindex()
+
+    def reindex(self) -> None:
+        """Recount names; the buckets are rebuilt on their next query."""
+        names: dict[str, int] = {}
+        for card in self:
+            names[card.name] = names.get(card.name, 0) + 1
+        self._names = names
+        self._actions: Optional[list[Card]] = None
+        self._treasures: Optional[list[Card]] = None
+
+    # -- queries ----------------------------------------------------------
+
+    def count_name(self, name: str) -> int:
+        """Number of cards named ``name``."""
+        return self._names.get(name, 0)
+
+    def actions(self) -> list[Card]:
+        """Action cards in zone order (a new list)."""
+        if self._actions is None:
+            self._actions = [card for card in self if card._type_mask & _ACTION]
+        return list(self._actions)
+
+    def treasures(self) -> list[Card]:
+        """Treasure cards in zone order (a new list)."""
+        if self._treasures is None:
+            self._treasures = [card for card in self if card._type_mask & _TREASURE]
+        return list(self._treasures)
+
+    def check(self) -> None:
+        """Raise AssertionError if the index disagrees with the cards."""
+        fresh = IndexedZone(self)
+        assert self._names == fresh._names, f"name index {self._names} != {fresh._names}"
+        if self._actions is not None:
+            assert self._actions == fresh.actions(), "stale Action bucket"
+        if self._treasures is not None:
+            assert self._treasures == fresh.treasures(), "stale Treasure bucket"
+
+    # -- bookkeeping ------------------------------------------------------
+
+    def _add(self, card: Card) -> None:
+        names = self._names
+        names[card.name] = names.get(card.name, 0) + 1
+        mask = card._type_mask
+        if mask & _ACTION and self._actions is not None:
+            self._actions.append(card)
+        if mask & _TREASURE and self._treasures is not None:
+            self._treasures.append(card)
+
+    def _drop(self, card: Card) -> None:
+        names = self._names
+        count = names.get(card.name, 0) - 1
+        if count > 0:
+            names[card.name] = count
+        else:
+            names.pop(card.name, None)
+        mask = card._type_mask
+        if not mask & (_ACTION | _TREASURE):
+            return
+        if card in self:
+            # The same object held twice: which copy left decides the
+            # bucket order, so rebuild rather than guess.
+            self._reordered()
+            return
+        if mask & _ACTION and self._actions is not None:
+            _remove_identity(self._actions, card)
+        if mask & _TREASURE and self._treasures is not None:
+            _remove_identity(self._treasures, card)
+
+    def _reordered(self) -> None:
+        self._actions = self._treasures = None
+
+    # -- list mutators ----------------------------------------------------
+
+    def append(self, card: Card) -> None:
+        super().append(card)
+        self._add(card)
+
+    def extend(self, cards: Iterable[Card]) -> None:
+        cards = list(cards)
+        super().extend(cards)
+        for card in cards:
+            self._add(card)
+
+    def __iadd__(self, cards: Iterable[Card]) -> IndexedZone:
+        self.extend(cards)
+        return self
+
+    def insert(self, index: int, card: Card) -> None:
+        at_end = index >= len(self)
+        super().insert(index, card)
+        if at_end:
+            self._add(card)
+        else:
+            self._reordered()
+            self._names[card.name] = self._names.get(card.name, 0) + 1
+
+    def remove(self, card: Card) -> None:
+        # Cards compare by identity, so the removed entry is ``card`` itself.
+        super().remove(card)
+        self._drop(card)
+
+    def pop(self, index: int = -1) -> Card:
+        card = super().pop(index)
+        self._drop(card)
+        return card
+
+    def clear(self) -> None:
+        super().clear()
+        self._names = {}
+        self._actions = []
+        self._treasures = []
+
+    def __setitem__(self, key, value) -> None:
+        if isinstance(key, slice):
+            super().__setitem__(key, value)
+            self.reindex()
+            return
+        old = self[key]
+        super().__setitem__(key, value)
+        names = self._names
+        count = names.get(old.name, 0) - 1
+        if count > 0:
+            names[old.name] = count
+        else:
+            names.pop(old.name, None)
+        names[value.name] = names.get(value.name, 0) + 1
+        self._reordered()
+
+    def __delitem__(self, key) -> None:
+        if isinstance(key, slice):
+            super().__delitem__(key)
+            self.reindex()
+            return
+        card = self[key]
+        super().__delitem__(key)
+        self._drop(card)
+
+    def __imul__(self, times: int) -> IndexedZone:
+        super().__imul__(times)
+        self.reindex()
+        return self
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._reordered()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._reordered()
+
+    # -- copying ----------------------------------------------------------
+
+    def __copy__(self) -> IndexedZone:
+        return type(self)(self)
+
+    def __deepcopy__(self, memo: dict) -> IndexedZone:
+        new = type(self)()
+        memo[id(self)] = new
+        list.extend(new, (copy.deepcopy(card, memo) for card in self))
+        new.reindex()
+        return new
+
+    def __reduce__(self):
+        # Items are appended after the zone is memoized, so cards that refer
+        # back to it pickle without recursing.
+        return (type(self), (), None, iter(self))
+
+
+def _remove_identity(cards: list[Card], card: Card) -> None:
+    if cards and cards[-1] is card:
+        cards.pop()
+        return
+    for i, held in enumerate(cards):
+        if held is card:
+            del cards[i]
+            return
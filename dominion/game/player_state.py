@@ -1,9 +1,12 @@
 import random
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from dominion.cards.base_card import Card
 from dominion.cards.registry import get_card
+from dominion.game.indexed_zone import IndexedZone
+from dominion.game.turn_state import TurnState
+from dominion.game.vp_ledger import VPLedger
 
 
 @dataclass
@@ -33,8 +36,6 @@ class PlayerState:
     deluded: bool = False
     envious: bool = False
     misery: int = 0
-    cannot_buy_actions: bool = False
-    envious_effect_active: bool = False
 
     # Misc counters
     vp_tokens: int = 0
@@ -50,34 +51,15 @@ class PlayerState:
     corsair_trashed_this_turn: bool = False
     gained_cards_this_turn: list[str] = field(default_factory=list)
     gained_cards_last_turn: list[str] = field(default_factory=list)
-    ignore_action_bonuses: bool = False
-    collection_played: int = 0
-    goons_played: int = 0
-    merchant_guilds_played: int = 0
-    cost_reduction: int = 0
-    innovation_used: bool = False
-    citadel_used: bool = False
     journey_token_face_up: bool = True
-    groundskeeper_bonus: int = 0
-    crossroads_played: int = 0
-    fools_gold_played: int = 0
-    actions_gained_this_turn: int = 0
-    cauldron_triggered: bool = False
     trickster_uses_remaining: int = 0
     trickster_set_aside: list[Card] = field(default_factory=list)
-    charm_next_buy_copies: int = 0
-    walled_villages_played: int = 0
-    fortune_doubled_this_turn: bool = False
     # Empires Enchantress: opponent's first Action play this turn is replaced.
     enchantress_active: bool = False
-    enchantress_used_this_turn: bool = False
     # Allies Warlord: while positive, cannot play a third same-name Action.
     warlord_restriction_count: int = 0
     # Empires Donate: count of pending Donate events to resolve at end of buy.
     donate_pending: int = 0
-    # Rising Sun: Daimyo replays the next non-Command Action card played
-    daimyo_pending: int = 0
-    continue_used_this_turn: bool = False
     foresight_set_aside: list = field(default_factory=list)
     # Rising Sun: Kintsugi event cares whether Gold has ever been gained.
     kintsugi_has_gained_gold: bool = False
@@ -88,32 +70,19 @@ class PlayerState:
     rapid_expansion_set_aside: list = field(default_factory=list)
     flourishing_trade_active: bool = False
 
-    # Turn tracking
+    # Turn tracking. Per-turn counters and flags live on ``turn`` (see
+    # dominion.game.turn_state); read and write them as ``player.turn.<field>``.
+    turn: TurnState = field(default_factory=TurnState)
     turns_taken: int = 0
     actions_played: int = 0
-    actions_this_turn: int = 0
-    coins_spent_this_turn: int = 0
-    bought_this_turn: list[str] = field(default_factory=list)
-    banned_buys: list[str] = field(default_factory=list)
     delayed_cards: list[Card] = field(default_factory=list)
     seize_the_day_used: bool = False
-    topdeck_gains: bool = False
-    way_of_seal_active: bool = False
-    gained_five_this_turn: bool = False
     gained_five_last_turn: bool = False
-    cards_gained_this_turn: int = 0
     cards_gained_this_buy_phase: int = 0
-    gained_victory_this_buy_phase: bool = False
-    gained_victory_this_turn: bool = False
     flagship_pending: list[Card] = field(default_factory=list)
     highwayman_attacks: int = 0
-    highwayman_blocked_this_turn: bool = False
-    insignia_active: bool = False
     # Plunder cards / events / traits.
     fated_pile: str = ""
-    cards_trashed_this_turn: int = 0
-    mining_road_triggered: bool = False
-    search_triggered: bool = False
     avoid_pending: int = 0
     deliver_pending: list = field(default_factory=list)
     # Plunder Deliver event: number of upcoming gains to set aside, and the
@@ -122,10 +91,7 @@ class PlayerState:
     deliver_set_aside: list = field(default_factory=list)
     bury_mat: list = field(default_factory=list)
     prepare_set_aside: list = field(default_factory=list)
-    # Plunder Launch event: once-per-turn lockout (reset at turn start).
-    launch_used: bool = False
-    # Plunder Journey event: once-per-turn lockout and extra-turn pending flag.
-    journey_used_this_turn: bool = False
+    # Plunder Journey event: extra-turn pending flag.
     journey_extra_turn_pending: bool = False
     # Generic "the current turn is an extra turn from any source" flag, used
     # by Journey to enforce its "not a 3rd in a row" restriction. Set at end
@@ -134,16 +100,8 @@ class PlayerState:
     took_extra_turn_last_turn: bool = False
     cage_state: object = None
     grotto_set_aside: list = field(default_factory=list)
-    # Prosperity 2E: Tiara grants once-per-turn replay-treasure
-    tiara_replay_used: bool = False
-    # Prosperity 2E: War Chest tracks names already used this turn
-    war_chest_named_this_turn: list[str] = field(default_factory=list)
     # Prosperity 2E: Clerk attack — duration self-replay
     clerk_pending_replay: list[Card] = field(default_factory=list)
-    # Intrigue 1E: each Coppersmith played gives a +$1 bonus per Copper played.
-    coppersmiths_played: int = 0
-    # Renaissance Priest: rest-of-turn +$2 on trash trigger.
-    priest_played_this_turn: int = 0
     # Renaissance Cargo Ship / Buy phase end tracking
     gained_action_or_treasure_this_buy_phase: bool = False
     # Nocturne — persistent Boons received this/last turn.
@@ -155,8 +113,6 @@ class PlayerState:
     druid_active_boons: list[str] = field(default_factory=list)
     # Nocturne — Lost in the Woods state from Fool.
     lost_in_the_woods: bool = False
-    # Nocturne — Cards gained this turn (count). Used by Devil's Workshop, Monastery.
-    cards_gained_this_turn_count: int = 0
     # Nocturne — pending start-of-next-turn effects.
     pending_cobbler_gains: int = 0
     pending_den_of_sin_draws: int = 0
@@ -181,17 +137,14 @@ class PlayerState:
     champions_in_play: int = 0
     # Adventures Hireling: stays in play, +1 Card per turn.
     hirelings_in_play: int = 0
-    # Adventures Mission: skip the buy phase on the extra turn.
-    mission_used_this_turn: bool = False
+    # Adventures Mission: the next turn is Mission's extra turn, which
+    # skips the buy phase.
+    mission_extra_turn_pending: bool = False
     mission_no_buy_turn: bool = False
     # Allies Voyage: on the granted extra turn, only 3 cards may be played
     # from hand.
     voyage_extra_turn_pending: bool = False
     voyage_cards_from_hand_remaining: int | None = None
-    # Adventures Pilgrimage.
-    pilgrimage_used_this_turn: bool = False
-    # Adventures Travelling Fair: while active, may topdeck gains this turn.
-    travelling_fair_active: bool = False
     # Adventures Save event.
     save_set_aside: list[Card] = field(default_factory=list)
     # Promo Summon event: cards gained via Summon, played at start of next turn.
@@ -203,9 +156,6 @@ class PlayerState:
     # Adventures Inheritance.
     inherited_action_name: "str | None" = None
     inheritance_used: bool = False
-    # Adventures Borrow / Alms once-per-turn locks.
-    borrow_used_this_turn: bool = False
-    alms_used_this_turn: bool = False
     # Adventures Bridge Troll.
     bridge_trolls_in_play: int = 0
     # Adventures Haunted Woods / Swamp Hag pending.
@@ -217,6 +167,22 @@ class PlayerState:
     # Cornucopia & Guilds 2E — Farmhands on-gain set-aside: cards queued to
     # be played at the start of the next turn.
     farmhands_set_aside: list[Card] = field(default_factory=list)
+    # Menagerie Gatekeeper: Gatekeeper attacks still affecting this player.
+    gatekeeper_attacks: int = 0
+    # Menagerie Reap event / Way of the Squirrel / Way of the Turtle:
+    # effects waiting for the start of the next turn.
+    reap_set_aside: list[Card] = field(default_factory=list)
+    squirrel_pending: int = 0
+    turtle_set_aside: list[Card] = field(default_factory=list)
+    # Nocturne Faithful Hound: Hounds set aside until end of turn.
+    hound_set_aside: list[Card] = field(default_factory=list)
+    # Allies Order of Masons: extra cards drawn at the next cleanup.
+    order_of_masons_bonus: int = 0
+    # Adventures Training: pile carrying this player's +$1 token.
+    training_pile: "str | None" = None
+    # Back-reference set by GameState (see ``get_victory_points``).
+    game_state: object = field(default=None, repr=False, compare=False)
+    _vp_ledger: Optional[VPLedger] = field(default=None, init=False, repr=False, compare=False)
 
     def initialize(
         self,
@@ -268,6 +234,8 @@ class PlayerState:
         self.exile = []
         self.invested_exile = []
 
+        self.turn = TurnState()
+
         # Reset resources
         self.actions = 1
         self.buys = 1
@@ -287,32 +255,14 @@ class PlayerState:
         self.corsair_trashed_this_turn = False
         self.gained_cards_this_turn = []
         self.gained_cards_last_turn = []
-        self.ignore_action_bonuses = False
-        self.collection_played = 0
-        self.goons_played = 0
-        self.merchant_guilds_played = 0
-        self.cost_reduction = 0
-        self.innovation_used = False
-        self.citadel_used = False
         self.journey_token_face_up = True
-        self.groundskeeper_bonus = 0
-        self.crossroads_played = 0
-        self.fools_gold_played = 0
-        self.actions_gained_this_turn = 0
-        self.cauldron_triggered = False
         self.trickster_uses_remaining = 0
         self.trickster_set_aside = []
-        self.charm_next_buy_copies = 0
-        self.walled_villages_played = 0
-        self.fortune_doubled_this_turn = False
-        # Enchantress flags persist across turns (cleared by caster's duration
-        # trigger), but reset here for game start.
+        # The Enchantress flag persists across turns (cleared by the caster's
+        # duration trigger), but is reset here for game start.
         self.enchantress_active = False
-        self.enchantress_used_this_turn = False
         self.warlord_restriction_count = 0
         self.donate_pending = 0
-        self.daimyo_pending = 0
-        self.continue_used_this_turn = False
         self.foresight_set_aside = []
         self.kintsugi_has_gained_gold = False
         self.biding_time_set_aside = []
@@ -322,55 +272,30 @@ class PlayerState:
         self.flourishing_trade_active = False
         self.turns_taken = 0
         self.actions_played = 0
-        self.actions_this_turn = 0
-        self.coins_spent_this_turn = 0
-        self.bought_this_turn = []
-        self.banned_buys = []
         self.delayed_cards = []
         self.seize_the_day_used = False
-        self.topdeck_gains = False
-        self.way_of_seal_active = False
-        self.gained_five_this_turn = False
         self.gained_five_last_turn = False
-        self.cards_gained_this_turn = 0
         self.cards_gained_this_buy_phase = 0
-        self.gained_victory_this_buy_phase = False
-        self.gained_victory_this_turn = False
         self.flagship_pending = []
         self.highwayman_attacks = 0
-        self.highwayman_blocked_this_turn = False
-        self.insignia_active = False
-        self.cards_trashed_this_turn = 0
-        self.mining_road_triggered = False
-        self.search_triggered = False
         self.avoid_pending = 0
         self.deliver_pending = []
         self.deliver_pending_count = 0
         self.deliver_set_aside = []
         self.bury_mat = []
         self.prepare_set_aside = []
-        self.launch_used = False
-        self.journey_used_this_turn = False
         self.journey_extra_turn_pending = False
         self.took_extra_turn_last_turn = False
         self.cage_state = None
         self.grotto_set_aside = []
-        self.tiara_replay_used = False
-        self.war_chest_named_this_turn = []
         self.clerk_pending_replay = []
-        self.gained_victory_this_buy_phase = False
         self.deluded = False
         self.envious = False
         self.misery = 0
-        self.cannot_buy_actions = False
-        self.envious_effect_active = False
-        self.coppersmiths_played = 0
-        self.priest_played_this_turn = 0
         self.gained_action_or_treasure_this_buy_phase = False
         self.active_boons = []
         self.druid_active_boons = []
         self.lost_in_the_woods = False
-        self.cards_gained_this_turn_count = 0
         self.pending_cobbler_gains = 0
         self.pending_den_of_sin_draws = 0
         self.pending_ghost_town_actions = 0
@@ -387,25 +312,28 @@ class PlayerState:
         self.minus_coin_tokens = 0
         self.champions_in_play = 0
         self.hirelings_in_play = 0
-        self.mission_used_this_turn = False
         self.mission_no_buy_turn = False
         self.voyage_extra_turn_pending = False
         self.voyage_cards_from_hand_remaining = None
-        self.pilgrimage_used_this_turn = False
-        self.travelling_fair_active = False
         self.save_set_aside = []
         self.summon_set_aside = []
         self.expedition_extra_draws = 0
         self.plan_trash_piles = set()
         self.inherited_action_name = None
         self.inheritance_used = False
-        self.borrow_used_this_turn = False
-        self.alms_used_this_turn = False
         self.bridge_trolls_in_play = 0
         self.haunted_woods_attacks = 0
         self.swamp_hag_attacks = 0
         self.farrier_pending_draw = 0
         self.farmhands_set_aside = []
+        self.mission_extra_turn_pending = False
+        self.gatekeeper_attacks = 0
+        self.reap_set_aside = []
+        self.squirrel_pending = 0
+        self.turtle_set_aside = []
+        self.hound_set_aside = []
+        self.order_of_masons_bonus = 0
+        self.training_pile = None
 
         if draw_starting_hand:
             self.draw_cards(5)
@@ -505,6 +433,14 @@ class PlayerState:
     def count(self, card_name: str) -> int:
         return self.count_in_deck(card_name)
 
+    @property
+    def vp_ledger(self) -> VPLedger:
+        """This player's :class:`VPLedger`, created on first use."""
+        ledger = self._vp_ledger
+        if ledger is None:
+            ledger = self._vp_ledger = VPLedger()
+        return ledger
+
     def get_victory_points(self, _game_state=None) -> int:
         """Calculate total victory points for the player.
 
@@ -517,11 +453,7 @@ class PlayerState:
         instantiate a bare ``PlayerState`` will simply get the no-game
         behaviour, which is what they expect.
         """
-        total = (
-            sum(card.get_victory_points(self) for card in self.all_cards())
-            + self.vp_tokens
-            - 2 * self.misery
-        )
+        total = self.vp_ledger.card_vp(self, self._card_zones()) + self.vp_tokens - 2 * self.misery
         if _game_state is None:
             _game_state = getattr(self, "game_state", None)
         if _game_state is not None:
@@ -533,9 +465,9 @@ class PlayerState:
                     total += hook(_game_state, self)
         return total
 
-    def all_cards(self) -> list[Card]:
-        """Return a list of all cards the player possesses."""
-        zones = [
+    def _card_zones(self) -> list[list[Card]]:
+        """Every zone holding cards the player owns."""
+        return [
             self.hand,
             self.deck,
             self.discard,
@@ -556,9 +488,11 @@ class PlayerState:
             self.farmhands_set_aside,
         ]
 
+    def all_cards(self) -> list[Card]:
+        """Return a list of all cards the player possesses."""
         cards: list[Card] = []
         seen_ids: set[int] = set()
-        for zone in zones:
+        for zone in self._card_zones():
             for card in zone:
                 card_id = id(card)
                 if card_id in seen_ids:
@@ -593,6 +527,26 @@ class PlayerState:
         return breakdown
 
 
+# Zones the phase loops query by name and type on every step.
+INDEXED_ZONES = ("hand", "in_play")
+
+
+def _indexed_zone(name: str) -> property:
+    # The property shadows the instance ``__dict__`` entry of the same name,
+    # so ``vars(player)`` and pickles keep the dataclass field names.
+    def fget(self: PlayerState) -> IndexedZone:
+        return self.__dict__[name]
+
+    def fset(self: PlayerState, value) -> None:
+        self.__dict__[name] = value if type(value) is IndexedZone else IndexedZone(value)
+
+    return property(fget, fset, doc=f"``{name}`` as an :class:`IndexedZone`.")
+
+
+for _name in INDEXED_ZONES:
+    setattr(PlayerState, _name, _indexed_zone(_name))
+
+
 if TYPE_CHECKING:
     # Only imported for type checking to avoid runtime circular imports
     from dominion.ai.base_ai import AI
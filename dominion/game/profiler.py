@@ -0,0 +1,129 @@
+"""Opt-in timing of engine phases, card effects and AI decisions.
+
+Attach a :class:`GameProfiler` to a game with
+``game_state.set_profiler(profiler)`` and ``profiler.instrument_ai(ai)``
+for each player's AI. The engine then times, by ``(category, key)``:
+
+* ``phase``: each phase handler run by ``play_turn`` (key: phase name),
+* ``card``: each ``Card.on_play`` (key: card name),
+* ``gain``: each ``gain_card`` including its hooks (key: card name),
+* ``on_gain`` / ``on_buy``: the gained or bought card's own ``on_gain`` /
+  ``on_buy`` (key: card, Event or Project name),
+* ``priority``: each ``_choose_from_priority`` scan (key: list name),
+* ``condition``: each ``PriorityRule`` condition (key: its ``_source``),
+* ``ai``: each ``choose_*``/``should_*``/``order_*`` AI method (key:
+  ``"<strategy>: <method>"``).
+
+Sections nest (a card play inside the action phase, a condition inside a
+priority scan), so each entry records both inclusive time and self time,
+which excludes nested timed sections. One profiler can be shared by many
+games to aggregate a whole battle. With no profiler attached the engine
+pays one attribute check per hook.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+_AI_PREFIXES = ("choose_", "should_", "order_")
+_ai_methods_cache: dict[type, tuple[str, ...]] = {}
+
+
+def condition_label(condition: Any) -> str:
+    """Name a priority-rule condition for profiling output."""
+    return getattr(condition, "_source", None) or getattr(condition, "__qualname__", None) or repr(condition)
+
+
+class GameProfiler:
+    """Aggregate call counts, inclusive time and self time per section."""
+
+    def __init__(self) -> None:
+        # (category, key) -> [calls, inclusive seconds, self seconds]
+        self.stats: dict[tuple[str, str], list] = {}
+        self._child_time: list[float] = []
+
+    def call(self, category: str, key: str, func: Callable, *args, **kwargs):
+        """Run ``func(*args, **kwargs)`` and charge its time to ``(category, key)``."""
+        stack = self._child_time
+        stack.append(0.0)
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            entry = self.stats.get((category, key))
+            if entry is None:
+                entry = self.stats[(category, key)] = [0, 0.0, 0.0]
+            entry[0] += 1
+            entry[1] += elapsed
+            entry[2] += elapsed - children
+
+    def instrument_ai(self, ai: Any) -> None:
+        """Time every decision method on ``ai`` (instance-level wrappers)."""
+        cls = type(ai)
+        names = _ai_methods_cache.get(cls)
+        if names is None:
+            names = tuple(n for n in dir(cls) if n.startswith(_AI_PREFIXES) and callable(getattr(cls, n, None)))
+            _ai_methods_cache[cls] = names
+        strategy = getattr(getattr(ai, "strategy", None), "name", None) or cls.__name__
+        for name in names:
+            setattr(ai, name, self._wrap(f"{strategy}: {name}", getattr(ai, name)))
+
+    def _wrap(self, key: str, method: Callable) -> Callable:
+        def timed(*args, **kwargs):
+            return self.call("ai", key, method, *args, **kwargs)
+
+        return timed
+
+    def merge(self, other: GameProfiler) -> None:
+        """Add ``other``'s totals into this profiler."""
+        for section, (calls, total, own) in other.stats.items():
+            entry = self.stats.setdefault(section, [0, 0.0, 0.0])
+            entry[0] += calls
+            entry[1] += total
+            entry[2] += own
+
+    def report(self, top: Optional[int] = None) -> dict[str, list[dict[str, Any]]]:
+        """Per-category rows sorted by self time, slowest first.
+
+        Times are in milliseconds; ``mean_us`` is inclusive microseconds
+        per call.
+        """
+        categories: dict[str, list[dict[str, Any]]] = {}
+        for (category, key), (calls, total, own) in self.stats.items():
+            categories.setdefault(category, []).append(
+                {
+                    "key": key,
+                    "calls": calls,
+                    "total_ms": total * 1000,
+                    "self_ms": own * 1000,
+                    "mean_us": total / calls * 1e6 if calls else 0.0,
+                }
+            )
+        for rows in categories.values():
+            rows.sort(key=lambda row: row["self_ms"], reverse=True)
+            if top is not None:
+                del rows[top:]
+        return categories
+
+    def format_report(self, top: int = 10) -> str:
+        """Render :meth:`report` as plain-text tables."""
+        return format_profile(self.report(top), top)
+
+
+def format_profile(report: dict[str, list[dict[str, Any]]], top: int = 10) -> str:
+    """Render a profile report (e.g. ``results["profile"]``) as text tables."""
+    lines = []
+    for category in sorted(report):
+        lines.append(f"\n[{category}]")
+        lines.append(f"{'self ms':>10} {'total ms':>10} {'calls':>9} {'us/call':>9}  key")
+        for row in report[category][:top]:
+            lines.append(
+                f"{row['self_ms']:>10.1f} {row['total_ms']:>10.1f} {row['calls']:>9} "
+                f"{row['mean_us']:>9.1f}  {row['key']}"
+            )
+    return "\n".join(lines)
@@ -0,0 +1,159 @@
+"""Per-turn player state, reset in one step at the start of each turn.
+
+Every counter and once-per-turn flag that ``GameState.handle_start_phase``
+used to reset one assignment at a time lives on a slotted
+:class:`TurnState`, reached as ``player.turn.<field>``. Starting a turn is
+``player.turn = TurnState()``.
+"""
+
+from __future__ import annotations
+
+
+class TurnState:
+    """Counters and once-per-turn flags of the turn in progress."""
+
+    __slots__ = (
+        "actions_this_turn",
+        "bought_this_turn",
+        "coins_spent_this_turn",
+        "banned_buys",
+        "ignore_action_bonuses",
+        "cost_reduction",
+        "collection_played",
+        "goons_played",
+        "merchant_guilds_played",
+        "crossroads_played",
+        "fools_gold_played",
+        "walled_villages_played",
+        "coppersmiths_played",
+        "priest_played_this_turn",
+        "merchant_silver_bonus",
+        "merchant_silver_bonus_used",
+        "groundskeeper_bonus",
+        "innovation_used",
+        "citadel_used",
+        "actions_gained_this_turn",
+        "cauldron_triggered",
+        "cards_gained_this_turn",
+        "cards_gained_this_turn_count",
+        "gained_five_this_turn",
+        "gained_victory_this_buy_phase",
+        "gained_victory_this_turn",
+        "cards_trashed_this_turn",
+        "highwayman_blocked_this_turn",
+        "topdeck_gains",
+        "way_of_seal_active",
+        "insignia_active",
+        "charm_next_buy_copies",
+        "cannot_buy_actions",
+        "envious_effect_active",
+        "fortune_doubled_this_turn",
+        "harbor_village_pending",
+        "continue_used_this_turn",
+        "cavalry_returned_this_turn",
+        "kiln_pending",
+        "daimyo_pending",
+        "tiara_replay_used",
+        "war_chest_named_this_turn",
+        "enchantress_used_this_turn",
+        "acolyte_trashed_this_turn",
+        "mining_road_triggered",
+        "search_triggered",
+        "launch_used",
+        "journey_used_this_turn",
+        "borrow_used_this_turn",
+        "alms_used_this_turn",
+        "pilgrimage_used_this_turn",
+        "mission_used_this_turn",
+        "travelling_fair_active",
+    )
+
+    def __init__(self) -> None:
+        self.actions_this_turn = 0
+        self.bought_this_turn: list[str] = []
+        self.coins_spent_this_turn = 0
+        self.banned_buys: list[str] = []
+        self.ignore_action_bonuses = False
+        self.cost_reduction = 0
+        # Cards whose bonus lasts for the rest of the turn once played.
+        self.collection_played = 0
+        self.goons_played = 0
+        self.merchant_guilds_played = 0
+        self.crossroads_played = 0
+        self.fools_gold_played = 0
+        self.walled_villages_played = 0
+        # Intrigue 1E: each Coppersmith played gives a +$1 bonus per Copper played.
+        self.coppersmiths_played = 0
+        # Renaissance Priest: rest-of-turn +$2 on trash trigger.
+        self.priest_played_this_turn = 0
+        # Merchant: +$1 for each Merchant on the first Silver played.
+        self.merchant_silver_bonus = 0
+        self.merchant_silver_bonus_used = False
+        self.groundskeeper_bonus = 0
+        self.innovation_used = False
+        self.citadel_used = False
+        # Gain tracking.
+        self.actions_gained_this_turn = 0
+        self.cauldron_triggered = False
+        self.cards_gained_this_turn = 0
+        # Nocturne — Devil's Workshop and Monastery.
+        self.cards_gained_this_turn_count = 0
+        self.gained_five_this_turn = False
+        self.gained_victory_this_buy_phase = False
+        self.gained_victory_this_turn = False
+        # Plunder Crucible.
+        self.cards_trashed_this_turn = 0
+        self.highwayman_blocked_this_turn = False
+        # Gains go on top of the deck this turn.
+        self.topdeck_gains = False
+        self.way_of_seal_active = False
+        self.insignia_active = False
+        self.charm_next_buy_copies = 0
+        # Hex penalties applied for this turn's buy phase.
+        self.cannot_buy_actions = False
+        self.envious_effect_active = False
+        self.fortune_doubled_this_turn = False
+        # Plunder Harbor Village: +$1 after the next Action that gives +$.
+        self.harbor_village_pending = 0
+        self.continue_used_this_turn = False
+        # Menagerie.
+        self.cavalry_returned_this_turn = False
+        self.kiln_pending = 0
+        # Rising Sun Daimyo: replay the next non-Command Action this turn.
+        self.daimyo_pending = 0
+        # Prosperity 2E: Tiara's once-per-turn replay and War Chest names.
+        self.tiara_replay_used = False
+        self.war_chest_named_this_turn: list[str] = []
+        # Empires Enchantress: first Action played this turn is replaced.
+        self.enchantress_used_this_turn = False
+        # Allies Acolyte: gain an Augur once per turn when trashed.
+        self.acolyte_trashed_this_turn = False
+        # Plunder once-per-turn triggers and events.
+        self.mining_road_triggered = False
+        self.search_triggered = False
+        self.launch_used = False
+        self.journey_used_this_turn = False
+        # Adventures once-per-turn events.
+        self.borrow_used_this_turn = False
+        self.alms_used_this_turn = False
+        self.pilgrimage_used_this_turn = False
+        self.mission_used_this_turn = False
+        self.travelling_fair_active = False
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TurnState):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        changed = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in self.__slots__
+            if getattr(self, name) != getattr(_DEFAULT, name)
+        )
+        return f"TurnState({changed})"
+
+
+_DEFAULT = TurnState()
@@ -0,0 +1,198 @@
+"""Incremental victory-point ledger for one player.
+
+``PlayerState.get_victory_points`` used to call ``get_victory_points`` on
+every owned card, and cards such as Gardens, Duke or the Castles walk the
+whole deck again for each copy. :class:`VPLedger` keeps, per player:
+
+* a :class:`DeckSummary` (card counts by name, action/victory/Castle
+  counts),
+* the summed static VP of cards that do not override
+  ``get_victory_points`` (``stats.vp``), and
+* the cards whose VP depends only on deck composition. These define
+  ``deck_victory_points(deck)``, which is evaluated against the summary
+  and cached until the summary changes.
+
+Cards that override ``get_victory_points`` without a deck term (e.g.
+Distant Lands, which depends on the Tavern mat) are still asked directly
+on every query.
+
+The engine reports gains and trashes through :meth:`VPLedger.add` and
+:meth:`VPLedger.remove`. Cards also move in and out of a player's zones in
+many other ways (returned to a pile, passed, exchanged), so every query
+first compares a cheap signature of the zones (card count and summed
+object ids) with the one the ledger expects and rebuilds on mismatch. The
+ledger holds references to the cards it counts, so their ids cannot be
+reused while counted. A card that is renamed or retyped in place (the
+Inheritance overlay) keeps its id, so the engine calls
+:meth:`VPLedger.invalidate` around the change instead.
+
+Set ``VPLedger.validate = True`` to recompute the full total on every
+query and fail loudly on any difference; the test suite enables it for
+every test (see ``tests/conftest.py``).
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING, ClassVar, Iterable, Optional, Sequence
+
+from dominion.cards.base_card import Card
+
+if TYPE_CHECKING:
+    from dominion.game.player_state import PlayerState
+
+_STATIC, _DECK, _OPAQUE = 0, 1, 2
+_kinds: dict[type, int] = {}
+
+
+def _kind(card: Card) -> int:
+    cls = type(card)
+    kind = _kinds.get(cls)
+    if kind is None:
+        if getattr(cls, "deck_victory_points", None) is not None:
+            kind = _DECK
+        elif cls.get_victory_points is Card.get_victory_points:
+            kind = _STATIC
+        else:
+            kind = _OPAQUE
+        _kinds[cls] = kind
+    return kind
+
+
+def zone_signature(zones: Iterable[Sequence[Card]]) -> tuple[int, int]:
+    """``(card count, sum of card ids)`` over ``zones``."""
+    count = total = 0
+    for zone in zones:
+        if zone:
+            count += len(zone)
+            total += sum(map(id, zone))
+    return count, total
+
+
+class DeckSummary:
+    """Deck-composition facts that deck VP terms are computed from."""
+
+    __slots__ = ("size", "counts", "victory_counts", "actions", "castles")
+
+    def __init__(self) -> None:
+        self.size = 0
+        self.counts: Counter[str] = Counter()
+        # Victory cards only, by name (Territory counts distinct names).
+        self.victory_counts: Counter[str] = Counter()
+        self.actions = 0
+        self.castles = 0
+
+    @property
+    def victories(self) -> int:
+        return sum(self.victory_counts.values())
+
+    @property
+    def distinct_names(self) -> int:
+        return len(self.counts)
+
+    def _update(self, card: Card, delta: int) -> None:
+        name = card.name
+        self.size += delta
+        count = self.counts[name] + delta
+        if count:
+            self.counts[name] = count
+        else:
+            del self.counts[name]
+        if card.is_victory:
+            count = self.victory_counts[name] + delta
+            if count:
+                self.victory_counts[name] = count
+            else:
+                del self.victory_counts[name]
+        if card.is_action:
+            self.actions += delta
+        if card.is_castle:
+            self.castles += delta
+
+
+class VPLedger:
+    """Running VP total of one player's cards (tokens, Landmarks excluded)."""
+
+    validate: ClassVar[bool] = False
+
+    __slots__ = ("_cards", "_signature", "summary", "_static_vp", "_deck_cards", "_deck_vp", "_opaque")
+
+    def __init__(self) -> None:
+        self._cards: dict[int, Card] = {}
+        self._signature: Optional[tuple[int, int]] = None
+        self.summary = DeckSummary()
+        self._static_vp = 0
+        self._deck_cards: list[Card] = []
+        self._deck_vp: Optional[int] = None
+        self._opaque: list[Card] = []
+
+    def rebuild(self, cards: Iterable[Card], signature: tuple[int, int]) -> None:
+        """Recount from scratch; ``signature`` describes the zones ``cards`` came from."""
+        self.__init__()
+        for card in cards:
+            self._add(card)
+        self._signature = signature
+
+    def invalidate(self, card: Card) -> None:
+        """Recount on the next query if ``card`` is counted.
+
+        Call this when a counted card's name, types or stats change, so a
+        later :meth:`remove` does not subtract values it never added.
+        """
+        if id(card) in self._cards:
+            self._signature = None
+
+    def add(self, card: Card) -> None:
+        """Record that ``card`` entered the player's zones."""
+        if self._signature is None or id(card) in self._cards:
+            return
+        self._add(card)
+        count, total = self._signature
+        self._signature = (count + 1, total + id(card))
+
+    def remove(self, card: Card) -> None:
+        """Record that ``card`` left the player's zones."""
+        if self._signature is None or id(card) not in self._cards:
+            return
+        del self._cards[id(card)]
+        self.summary._update(card, -1)
+        kind = _kind(card)
+        if kind == _STATIC:
+            self._static_vp -= card.stats.vp
+        elif kind == _DECK:
+            self._deck_cards.remove(card)
+        else:
+            self._opaque.remove(card)
+        self._deck_vp = None
+        count, total = self._signature
+        self._signature = (count - 1, total - id(card))
+
+    def _add(self, card: Card) -> None:
+        self._cards[id(card)] = card
+        self.summary._update(card, 1)
+        kind = _kind(card)
+        if kind == _STATIC:
+            self._static_vp += card.stats.vp
+        elif kind == _DECK:
+            self._deck_cards.append(card)
+        else:
+            self._opaque.append(card)
+        self._deck_vp = None
+
+    def card_vp(self, player: PlayerState, zones: Sequence[Sequence[Card]]) -> int:
+        """Total VP of ``player``'s cards, whose zones are ``zones``."""
+        signature = zone_signature(zones)
+        if signature != self._signature:
+            self.rebuild(player.all_cards(), signature)
+        deck_vp = self._deck_vp
+        if deck_vp is None:
+            summary = self.summary
+            deck_vp = self._deck_vp = sum(card.deck_victory_points(summary) for card in self._deck_cards)
+        total = self._static_vp + deck_vp
+        for card in self._opaque:
+            total += card.get_victory_points(player)
+        if VPLedger.validate:
+            expected = sum(card.get_victory_points(player) for card in player.all_cards())
+            if total != expected:
+                raise AssertionError(f"VP ledger says {total}, full recount says {expected}")
+        return total
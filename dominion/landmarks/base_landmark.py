@@ -48,7 +48,7 @@ class Landmark:
     def on_turn_end(self, game_state, player) -> None:
         """Fired during cleanup, before per-turn flags reset.
 
-        ``player.cards_gained_this_turn`` still reflects this turn's gains
+        ``player.turn.cards_gained_this_turn`` still reflects this turn's gains
         when this hook runs (used by Baths).
         """
         pass
@@ -121,7 +121,7 @@ class Baths(Landmark):
     def on_turn_end(self, game_state, player) -> None:
         if self.vp_pool <= 0:
             return
-        if getattr(player, "cards_gained_this_turn", 0) > 0:
+        if player.turn.cards_gained_this_turn > 0:
             return
         take = min(2, self.vp_pool)
         self.vp_pool -= take
@@ -277,7 +277,7 @@ class Labyrinth(Landmark):
         if self.vp_pool <= 0:
             return
         # cards_gained_this_turn was just incremented by gain_card; check ==2.
-        if player.cards_gained_this_turn == 2:
+        if player.turn.cards_gained_this_turn == 2:
             take = min(2, self.vp_pool)
             self.vp_pool -= take
             player.vp_tokens += take
@@ -13,7 +13,7 @@ class Canal(Project):
         # The discount is "during your turns" — continuous from the
         # moment Canal is bought. Apply immediately so any further buys
         # this same turn benefit; on_turn_start re-applies on later turns.
-        player.cost_reduction += 1
+        player.turn.cost_reduction += 1
 
     def on_turn_start(self, game_state, player) -> None:
-        player.cost_reduction += 1
+        player.turn.cost_reduction += 1
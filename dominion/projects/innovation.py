@@ -9,10 +9,10 @@ class Innovation(Project):
         super().__init__("Innovation", CardCost(coins=6))
 
     def on_gain(self, game_state, player, card):
-        if not card.is_action or player.innovation_used:
+        if not card.is_action or player.turn.innovation_used:
             return
 
-        player.innovation_used = True
+        player.turn.innovation_used = True
 
         # Remove the card from wherever it was gained
         if card in player.discard:
@@ -264,6 +264,12 @@ def generate_sweep_report(
     for v in variants:
         p_str = f'{v["p_value"]:.4f}' if not v["is_baseline"] else "-"
         avg_str = f'{v["avg_score"]:.1f}' if not v["is_baseline"] else "-"
+        # Sweeps played on common seeds report the win-rate change against
+        # the baseline mirror on those seeds.
+        if "paired_delta" in v and not v["is_baseline"]:
+            paired_str = f'{v["paired_delta"]:+.1f} &plusmn; {v["paired_ci"]:.1f} pts'
+        else:
+            paired_str = "-"
         style = ' style="background: #e3f2fd;"' if v["is_baseline"] else ""
         table_rows += (
             f"<tr{style}>"
@@ -272,6 +278,7 @@ def generate_sweep_report(
             f'<td>{v["losses"]}</td>'
             f'<td>{v["win_rate"]:.1f}%</td>'
             f"<td>{avg_str}</td>"
+            f"<td>{paired_str}</td>"
             f"<td>{p_str}</td>"
             f"</tr>\n"
         )
@@ -357,7 +364,7 @@ def generate_sweep_report(
 
     <h2>Summary</h2>
     <table>
-        <tr><th>Variant</th><th>Wins</th><th>Losses</th><th>Win Rate</th><th>Avg Score</th><th>p-value</th></tr>
+        <tr><th>Variant</th><th>Wins</th><th>Losses</th><th>Win Rate</th><th>Avg Score</th><th>Paired &Delta; vs Mirror</th><th>p-value</th></tr>
         {table_rows}
     </table>
 
@@ -378,9 +385,16 @@ def generate_leaderboard_html(
     *,
     verbose: bool = False,
 ) -> None:
-    """Create an HTML leaderboard report for many strategies."""
+    """Create an HTML leaderboard report for many strategies.
+
+    Results from a rating tournament (entries with ``rating``,
+    ``rating_low`` and ``rating_high``) are ranked by rating and get an
+    extra column with the confidence interval.
+    """
     sns.set_theme(style="whitegrid")
-    sorted_items = sorted(results.items(), key=lambda i: i[1]["win_rate"], reverse=True)
+    rated = all("rating" in stats for stats in results.values())
+    sort_key = "rating" if rated else "win_rate"
+    sorted_items = sorted(results.items(), key=lambda i: i[1][sort_key], reverse=True)
     strategies = [name for name, _ in sorted_items]
     win_rates = [stats["win_rate"] for _, stats in sorted_items]
 
@@ -398,12 +412,18 @@ def generate_leaderboard_html(
         cards = stats.get("cards", [])
         cards_str = ", ".join(cards) if cards else "-"
         desc = stats.get("description", "")
+        rating_cell = (
+            f"<td>{stats['rating']:.0f} ({stats['rating_low']:.0f}&ndash;{stats['rating_high']:.0f})</td>"
+            if rated
+            else ""
+        )
         rows += (
-            f"<tr><td>{rank}</td><td>{name}</td><td class='desc'>{desc}</td>"
+            f"<tr><td>{rank}</td><td>{name}</td><td class='desc'>{desc}</td>{rating_cell}"
             f"<td>{stats['wins']}</td>"
             f"<td>{stats['losses']}</td><td>{stats['win_rate']:.1f}%</td>"
             f"<td class='cards'>{cards_str}</td></tr>\n"
         )
+    rating_header = "<th>Rating (95% CI)</th>" if rated else ""
 
     html = f"""
     <html>
@@ -425,7 +445,7 @@ def generate_leaderboard_html(
     <h1>Strategy Leaderboard</h1>
     <img src="data:image/png;base64,{bar_png}" />
     <table>
-        <tr><th>#</th><th>Strategy</th><th>Description</th><th>Wins</th><th>Losses</th><th>Win Rate</th><th>Kingdom Cards Used</th></tr>
+        <tr><th>#</th><th>Strategy</th><th>Description</th>{rating_header}<th>Wins</th><th>Losses</th><th>Win Rate</th><th>Kingdom Cards Used</th></tr>
         {rows}
     </table>
     </body>
@@ -0,0 +1,282 @@
+"""Streaming HTML battle reports with bounded memory.
+
+:func:`generate_html_report` needs every game's result in memory and
+renders seaborn figures once the battle is over. For long battles,
+:class:`StreamingBattleReport` instead folds each game into fixed-size
+histograms and online statistics as it finishes and can rewrite the page
+at any point, so a 100k-game battle produces a live report whose memory
+use does not grow with the number of games. Charts are inline SVG, which
+is cheap enough to regenerate every few hundred games.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from collections import deque
+from html import escape
+from pathlib import Path
+from typing import Any, Optional
+
+from dominion.reporting.html_report import _decision_firings_section
+
+_COLORS = ("#2196F3", "#FF9800")
+
+
+def wilson_interval(successes: int, trials: int, z: float = 1.96) -> tuple[float, float]:
+    """Wilson score interval for a binomial proportion."""
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denom = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denom
+    half = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+class RunningStats:
+    """Count, mean, variance, min and max in O(1) memory (Welford)."""
+
+    __slots__ = ("count", "mean", "_m2", "minimum", "maximum")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class Histogram:
+    """Integer histogram over ``[low, high]`` with under/overflow counters."""
+
+    __slots__ = ("low", "high", "counts", "underflow", "overflow")
+
+    def __init__(self, low: int, high: int) -> None:
+        if high < low:
+            raise ValueError("high must be >= low")
+        self.low = low
+        self.high = high
+        self.counts = [0] * (high - low + 1)
+        self.underflow = 0
+        self.overflow = 0
+
+    def add(self, value: int) -> None:
+        if value < self.low:
+            self.underflow += 1
+        elif value > self.high:
+            self.overflow += 1
+        else:
+            self.counts[value - self.low] += 1
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts) + self.underflow + self.overflow
+
+
+def _svg_histograms(histograms: list[tuple[str, Histogram]], x_label: str) -> str:
+    """Render histograms sharing a range as grouped SVG bars."""
+    if not histograms:
+        return ""
+    low, high = histograms[0][1].low, histograms[0][1].high
+    # Trim empty bins at both ends so the chart uses its width.
+    used = [i for i in range(high - low + 1) if any(h.counts[i] for _, h in histograms)]
+    if not used:
+        return "<p>No games yet.</p>"
+    first, last = used[0], used[-1]
+    bins = last - first + 1
+    peak = max(max(h.counts[first : last + 1]) for _, h in histograms)
+
+    width, height, pad = 720, 240, 30
+    slot = (width - 2 * pad) / bins
+    bar = slot / (len(histograms) + 0.5)
+    parts = [
+        f'<svg width="{width}" height="{height + 40}" xmlns="http://www.w3.org/2000/svg">',
+        f'<line x1="{pad}" y1="{height}" x2="{width - pad}" y2="{height}" stroke="#999"/>',
+    ]
+    for i in range(bins):
+        x0 = pad + i * slot
+        for k, (label, hist) in enumerate(histograms):
+            count = hist.counts[first + i]
+            if not count:
+                continue
+            h = (height - pad) * count / peak
+            parts.append(
+                f'<rect x="{x0 + k * bar:.1f}" y="{height - h:.1f}" width="{bar:.1f}" height="{h:.1f}" '
+                f'fill="{_COLORS[k % len(_COLORS)]}"><title>{escape(label)}: {low + first + i} '
+                f'({count})</title></rect>'
+            )
+        if bins <= 40 or i % max(1, bins // 20) == 0:
+            parts.append(
+                f'<text x="{x0 + slot / 2:.1f}" y="{height + 14}" font-size="10" '
+                f'text-anchor="middle">{low + first + i}</text>'
+            )
+    parts.append(
+        f'<text x="{width / 2}" y="{height + 34}" font-size="12" text-anchor="middle">{escape(x_label)}</text>'
+    )
+    for k, (label, _) in enumerate(histograms):
+        parts.append(
+            f'<rect x="{pad + k * 180}" y="4" width="12" height="12" fill="{_COLORS[k % len(_COLORS)]}"/>'
+            f'<text x="{pad + k * 180 + 16}" y="14" font-size="12">{escape(label)}</text>'
+        )
+    parts.append("</svg>")
+
+    overflow = sum(h.overflow for _, h in histograms)
+    underflow = sum(h.underflow for _, h in histograms)
+    note = ""
+    if overflow or underflow:
+        note = f"<p class='note'>Outside chart range: {underflow} below {low}, {overflow} above {high}.</p>"
+    return "".join(parts) + note
+
+
+class StreamingBattleReport:
+    """Incrementally built report for a battle between two strategies.
+
+    Feed every finished game to :meth:`add_game` (the dicts StrategyBattle
+    appends to ``detailed_results``). The page is rewritten every
+    ``write_every`` games and carries a meta refresh while the battle runs;
+    :meth:`finish` writes the final page. Only the ``max_log_links`` most
+    recent log paths are kept.
+    """
+
+    def __init__(
+        self,
+        strategy1: str,
+        strategy2: str,
+        output_path: Path,
+        *,
+        write_every: int = 500,
+        max_turns: int = 100,
+        max_margin: int = 100,
+        max_log_links: int = 200,
+        refresh_seconds: int = 30,
+    ) -> None:
+        self.strategy1 = strategy1
+        self.strategy2 = strategy2
+        self.output_path = Path(output_path)
+        self.write_every = write_every
+        self.refresh_seconds = refresh_seconds
+        self.games = 0
+        self.wins = {strategy1: 0, strategy2: 0}
+        self.turns = {strategy1: Histogram(0, max_turns), strategy2: Histogram(0, max_turns)}
+        self.margins = {strategy1: Histogram(0, max_margin), strategy2: Histogram(0, max_margin)}
+        self.turn_stats = RunningStats()
+        self.margin_stats = RunningStats()
+        self.score_stats = {strategy1: RunningStats(), strategy2: RunningStats()}
+        self.recent_logs: deque[tuple[int, str]] = deque(maxlen=max_log_links)
+        self.decision_firings: Optional[dict[str, Any]] = None
+        self.finished = False
+
+    def add_game(self, game: dict[str, Any]) -> None:
+        """Fold one game result into the report."""
+        winner = game["winner"]
+        self.games += 1
+        self.wins[winner] = self.wins.get(winner, 0) + 1
+        if winner in self.turns:
+            self.turns[winner].add(game["turns"])
+            self.margins[winner].add(game["margin"])
+        self.turn_stats.add(game["turns"])
+        self.margin_stats.add(game["margin"])
+        self.score_stats[self.strategy1].add(game["strategy1_score"])
+        self.score_stats[self.strategy2].add(game["strategy2_score"])
+        if game.get("log_path"):
+            self.recent_logs.append((game["game_number"], game["log_path"]))
+
+        if self.write_every and self.games % self.write_every == 0:
+            self.write()
+
+    def finish(self, results: Optional[dict[str, Any]] = None) -> None:
+        """Write the final page, including decision firings from ``results``."""
+        if results is not None:
+            self.decision_firings = results.get("decision_firings")
+        self.finished = True
+        self.write()
+
+    def write(self) -> None:
+        """Rewrite the report atomically so readers never see a partial page."""
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.output_path.with_name(self.output_path.name + ".tmp")
+        tmp_path.write_text(self.render())
+        os.replace(tmp_path, self.output_path)
+
+    def render(self) -> str:
+        s1, s2 = self.strategy1, self.strategy2
+        title = f"{escape(s1)} vs {escape(s2)}"
+
+        win_rows = ""
+        for name in (s1, s2):
+            wins = self.wins.get(name, 0)
+            low, high = wilson_interval(wins, self.games)
+            rate = wins / self.games if self.games else 0.0
+            score = self.score_stats[name]
+            win_rows += (
+                f"<tr><td>{escape(name)}</td><td>{wins}</td><td>{rate:.1%}</td>"
+                f"<td>{low:.1%} &ndash; {high:.1%}</td><td>{score.mean:.1f}</td></tr>"
+            )
+
+        status = "Complete" if self.finished else "Running (page refreshes automatically)"
+        refresh = "" if self.finished else f'<meta http-equiv="refresh" content="{self.refresh_seconds}">'
+
+        log_items = ""
+        for game_number, log_path in self.recent_logs:
+            rel = os.path.relpath(log_path, self.output_path.parent)
+            log_items += f'<li><a href="{escape(rel)}">Game {game_number}</a></li>'
+        logs_section = f"<h2>Recent Game Logs</h2><ul>{log_items}</ul>" if log_items else ""
+
+        firings_section = (
+            _decision_firings_section({"decision_firings": self.decision_firings})
+            if self.decision_firings
+            else ""
+        )
+
+        return f"""
+    <html>
+    <head>
+        <title>{title} Comparison</title>
+        {refresh}
+        <style>
+            body {{ font-family: Arial, sans-serif; margin: 40px; }}
+            h1 {{ text-align: center; }}
+            svg {{ display: block; margin: 20px auto; }}
+            table {{ margin: 20px auto; border-collapse: collapse; width: 80%; }}
+            th, td {{ border: 1px solid #ccc; padding: 8px 12px; text-align: left; }}
+            th {{ background: #f5f5f5; }}
+            tr:nth-child(even) {{ background: #fafafa; }}
+            .note {{ text-align: center; color: #666; font-size: 0.9em; }}
+        </style>
+    </head>
+    <body>
+    <h1>{title} Comparison</h1>
+    <p>Status: {status}. Games played: {self.games}</p>
+    <h2>Win Rates</h2>
+    <table>
+        <tr><th>Strategy</th><th>Wins</th><th>Win Rate</th><th>95% Wilson Interval</th><th>Avg Score</th></tr>
+        {win_rows}
+    </table>
+    <p class="note">Turns: mean {self.turn_stats.mean:.1f}, sd {self.turn_stats.stdev:.1f}.
+    Margin: mean {self.margin_stats.mean:.1f}, sd {self.margin_stats.stdev:.1f}.</p>
+    <h2>Game Length (Turns) by Winner</h2>
+    {_svg_histograms([(s1, self.turns[s1]), (s2, self.turns[s2])], "Turns to finish")}
+    <h2>Margin of Victory by Winner</h2>
+    {_svg_histograms([(s1, self.margins[s1]), (s2, self.margins[s2])], "Victory margin")}
+    {firings_section}
+    {logs_section}
+    </body>
+    </html>
+    """
@@ -4,6 +4,7 @@ from typing import Optional
 import numpy as np
 from dominion.cards.base_card import Card
 from dominion.cards.registry import get_card
+from dominion.game.black_market import kingdom_uses_potion
 
 
 BASE_CARDS = ["Copper", "Silver", "Gold", "Estate", "Duchy", "Province", "Curse"]
@@ -22,17 +23,12 @@ class ActionEncoder:
         self.kingdom_cards = list(kingdom_cards)
         # Alchemy: GameState.setup_supply auto-adds the Potion Treasure to
         # the basic Supply whenever a potion-cost card is reachable —
-        # either as a kingdom pile, OR via Black Market's deck (built from
-        # all unused registered cards). Reserve a Potion slot in either
-        # case so action masking can't KeyError mid-game. Black Market is
-        # the conservative fallback because the encoder only sees the
-        # kingdom list, not the (random, runtime) Black Market deck.
+        # either as a kingdom pile, OR via Black Market's deck (every
+        # eligible card outside the Supply, whatever the shuffle). Reserve
+        # a Potion slot exactly then so action masking can't KeyError
+        # mid-game.
         extras: list[str] = []
-        kingdom_has_potion_cost = any(
-            get_card(name).cost.potions > 0 for name in self.kingdom_cards
-        )
-        black_market_in_kingdom = "Black Market" in self.kingdom_cards
-        if kingdom_has_potion_cost or black_market_in_kingdom:
+        if kingdom_uses_potion(self.kingdom_cards):
             extras.append("Potion")
         self.all_cards = BASE_CARDS + extras + self.kingdom_cards
         self.card_to_idx = {name: i for i, name in enumerate(self.all_cards)}
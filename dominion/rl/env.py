@@ -15,17 +15,21 @@ from dominion.rl.action_encoder import ActionEncoder
 from dominion.rl.random_ai import RandomAI
 from dominion.rl.rl_ai import RLAI
 from dominion.rl.state_encoder import StateEncoder
+from dominion.simulation.seating import check_player_count
 
 
 class DominionEnv(gym.Env):
     """Gymnasium environment for training RL agents on Dominion.
 
-    The agent plays as player 0 against an opponent (default: RandomAI).
-    The game runs in a background thread; each step() corresponds to one
-    decision point (action, treasure, or buy choice).
+    The agent plays as player 0 against ``num_players - 1`` opponents
+    (default: RandomAI). ``opponent_ai`` is one AI for a 2-player game or
+    a list with one AI per opponent seat. The game runs in a background
+    thread; each step() corresponds to one decision point (action,
+    treasure, or buy choice).
 
     Observations are encoded game states. Actions are card choices.
-    Reward is +1 for win, -1 for loss, 0 otherwise.
+    Reward is +1 for beating every opponent, -1 when any opponent has more
+    VP, 0 otherwise.
     """
 
     metadata = {"render_modes": []}
@@ -35,15 +39,24 @@ class DominionEnv(gym.Env):
         kingdom_cards: list[str],
         opponent_ai: Optional[Any] = None,
         max_turns: int = 100,
+        num_players: int = 2,
     ):
         super().__init__()
 
+        check_player_count(num_players)
+        if isinstance(opponent_ai, (list, tuple)):
+            if len(opponent_ai) != num_players - 1:
+                raise ValueError(f"need {num_players - 1} opponent AIs, got {len(opponent_ai)}")
+        elif opponent_ai is not None and num_players > 2:
+            raise ValueError("pass one opponent AI per seat for games with more than two players")
+
         self.kingdom_cards = list(kingdom_cards)
-        self._opponent_factory = opponent_ai  # AI instance or None
+        self._opponent_factory = opponent_ai  # AI instance, list of AIs, or None
         self.max_turns = max_turns
+        self.num_players = num_players
 
         # Encoders
-        self.state_encoder = StateEncoder(kingdom_cards)
+        self.state_encoder = StateEncoder(kingdom_cards, max_opponents=num_players - 1)
         self.action_encoder = ActionEncoder(kingdom_cards)
 
         # Gym spaces
@@ -85,7 +98,12 @@ class DominionEnv(gym.Env):
 
         # Create fresh AIs
         self.rl_ai = RLAI(name="RLAgent")
-        opponent = RandomAI() if self._opponent_factory is None else self._opponent_factory
+        if self._opponent_factory is None:
+            opponents = [RandomAI() for _ in range(self.num_players - 1)]
+        elif isinstance(self._opponent_factory, (list, tuple)):
+            opponents = list(self._opponent_factory)
+        else:
+            opponents = [self._opponent_factory]
 
         # Set up game
         self.game_state = GameState(players=[], supply={})
@@ -93,7 +111,7 @@ class DominionEnv(gym.Env):
         self.game_state.log_callback = lambda msg: None
         kingdom_card_objects = [get_card(name) for name in self.kingdom_cards]
         self.game_state.initialize_game(
-            [self.rl_ai, opponent],
+            [self.rl_ai, *opponents],
             kingdom_card_objects,
         )
 
@@ -200,10 +218,9 @@ class DominionEnv(gym.Env):
         return {"action_mask": mask}
 
     def _calculate_reward(self) -> float:
-        rl_player = self.game_state.players[0]
-        opponent = self.game_state.players[1]
+        rl_player, *opponents = self.game_state.players
         rl_vp = rl_player.get_victory_points()
-        opp_vp = opponent.get_victory_points()
+        opp_vp = max(opponent.get_victory_points() for opponent in opponents)
         if rl_vp > opp_vp:
             return 1.0
         elif rl_vp < opp_vp:
@@ -2,7 +2,7 @@
 
 import numpy as np
 from dominion.game.game_state import GameState
-from dominion.cards.registry import get_card
+from dominion.game.black_market import kingdom_uses_potion
 
 
 # Phase 1 fixed kingdom: simple engine cards
@@ -23,24 +23,23 @@ class StateEncoder:
     - Deck size (normalized) - 1 value
     - Discard size (normalized) - 1 value
     - Supply counts (one per pile) - M values
-    - Opponent hand size, deck size - 2 values
+    - Opponent hand size, deck size - 2 values per opponent seat
+
+    Opponents are encoded in turn order starting with the player to the
+    left, in ``max_opponents`` slots; games with fewer opponents leave the
+    remaining slots at zero, so one encoder serves 2-player up to
+    ``max_opponents + 1``-player games.
     """
 
-    def __init__(self, kingdom_cards: list[str]):
+    def __init__(self, kingdom_cards: list[str], max_opponents: int = 1):
         """Initialize encoder with the kingdom card names."""
         self.kingdom_cards = list(kingdom_cards)
-        # Alchemy: include Potion in the encoding whenever the supply may
-        # contain a Potion pile — either because a kingdom card has a
-        # potion cost, or because Black Market is in the kingdom and its
-        # deck can pull any unused Alchemy card (see
-        # GameState.setup_supply). Conservative for Black Market because
-        # the encoder only knows the kingdom list, not the runtime BM deck.
+        self.max_opponents = max_opponents
+        # Alchemy: include Potion in the encoding whenever the supply will
+        # contain a Potion pile — because a kingdom card has a potion cost,
+        # or because Black Market's deck holds one (see kingdom_uses_potion).
         extras: list[str] = []
-        kingdom_has_potion_cost = any(
-            get_card(name).cost.potions > 0 for name in self.kingdom_cards
-        )
-        black_market_in_kingdom = "Black Market" in self.kingdom_cards
-        if kingdom_has_potion_cost or black_market_in_kingdom:
+        if kingdom_uses_potion(self.kingdom_cards):
             extras.append("Potion")
         self.all_cards = BASE_CARDS + extras + self.kingdom_cards
         self.card_to_idx = {name: i for i, name in enumerate(self.all_cards)}
@@ -52,8 +51,8 @@ class StateEncoder:
         # Hand counts = len(all_cards)
         # Deck size, discard size = 2
         # Supply counts = len(all_cards)
-        # Opponent info = 2
-        self._obs_size = 3 + 1 + 3 + len(self.all_cards) + 2 + len(self.all_cards) + 2
+        # Opponent info = 2 per opponent slot
+        self._obs_size = 3 + 1 + 3 + len(self.all_cards) + 2 + len(self.all_cards) + 2 * max_opponents
 
     @property
     def observation_size(self) -> int:
@@ -65,9 +64,13 @@ class StateEncoder:
         obs = np.zeros(self._obs_size, dtype=np.float32)
         idx = 0
 
-        player = game_state.players[player_index]
-        opponent_index = 1 - player_index
-        opponent = game_state.players[opponent_index]
+        players = game_state.players
+        player = players[player_index]
+        num_opponents = len(players) - 1
+        if num_opponents > self.max_opponents:
+            raise ValueError(
+                f"encoder has {self.max_opponents} opponent slot(s), game has {num_opponents} opponents"
+            )
 
         # Resources (normalized to reasonable ranges)
         obs[idx] = player.actions / 10.0  # Usually 0-5
@@ -105,11 +108,13 @@ class StateEncoder:
             obs[idx] = count / 12.0  # Most piles start at 10-12
             idx += 1
 
-        # Opponent info
-        obs[idx] = len(opponent.hand) / 10.0
-        idx += 1
-        obs[idx] = (len(opponent.deck) + len(opponent.discard)) / 30.0
-        idx += 1
+        # Opponent info, in turn order after this player
+        for offset in range(1, num_opponents + 1):
+            opponent = players[(player_index + offset) % len(players)]
+            obs[idx] = len(opponent.hand) / 10.0
+            idx += 1
+            obs[idx] = (len(opponent.deck) + len(opponent.discard)) / 30.0
+            idx += 1
 
         return obs
 
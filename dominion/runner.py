@@ -157,6 +157,13 @@ def main():
         default=None,
         help="Number of games to play per strategy evaluation (default: config value, else 30)",
     )
+    parser.add_argument(
+        "--players",
+        type=int,
+        default=2,
+        help="Seats per evaluation game, 2-6; with more than 2 the candidate faces copies of each "
+        "panel opponent and fitness uses finishing place (default: 2)",
+    )
     parser.add_argument("--board", help="Board definition file containing kingdom cards and landscapes")
     parser.add_argument(
         "--seed-strategy",
@@ -279,6 +286,7 @@ def main():
         games_per_eval=games_per_eval,
         board_config=board_config,
         default_baseline_panel=True,
+        players=args.players,
     )
 
     # Load strategies from module:function paths
@@ -0,0 +1,325 @@
+"""Evaluate strategy pairings across many boards as one sharded job.
+
+``leaderboard.py``, ``compare_custom_board_strategies.py`` and the
+landscape sanity check each handle one board per invocation. A nightly
+"all boards x all strategies" sweep instead goes through :func:`run_batch`:
+every (board, pairing) cell is split into blocks of seeded games
+(:class:`WorkUnit`) that a process pool works through. Each worker keeps a
+warm :class:`StrategyBattle` per board and loads each strategy once, so a
+unit only pays for its games. Game ``n`` of a cell reseeds the RNG with
+``seed + n`` and seats the first strategy first on even ``n``, exactly as
+``StrategyBattle.run_battle(..., seed=seed)`` does, so a cell's totals do
+not depend on the block size or the number of processes.
+
+The units are merged back into one table, one row per (board, pairing),
+that :func:`write_table` saves as CSV.
+
+Usage:
+    python -m dominion.simulation.batch_runner --boards boards/*.txt \\
+        --strategies "Big Money" "Big Money Smithy" "Chapel Witch" \\
+        --games 200 --processes 8 --output reports/all_boards.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import logging
+import multiprocessing as mp
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Optional, Sequence
+
+from dominion.ai.genetic_ai import GeneticAI
+from dominion.boards.loader import BoardConfig, load_board
+from dominion.simulation.strategy_battle import StrategyBattle
+from dominion.strategy.enhanced_strategy import EnhancedStrategy
+
+logger = logging.getLogger(__name__)
+
+TABLE_COLUMNS = (
+    "board",
+    "strategy_a",
+    "strategy_b",
+    "games",
+    "a_wins",
+    "b_wins",
+    "a_win_rate",
+    "avg_a_score",
+    "avg_b_score",
+    "avg_margin",
+    "avg_turns",
+)
+
+
+class WorkUnit(NamedTuple):
+    """Games ``first_game`` .. ``first_game + games - 1`` of one cell."""
+
+    board: int
+    pairing: int
+    first_game: int
+    games: int
+
+
+class UnitResult(NamedTuple):
+    """Totals of one work unit, from the first strategy's side."""
+
+    unit: WorkUnit
+    a_wins: int
+    a_total_score: int
+    b_total_score: int
+    total_turns: int
+
+
+def load_boards(paths: Sequence[str | Path]) -> list[tuple[str, BoardConfig]]:
+    """Load board files, named by file stem."""
+    return [(Path(path).stem, load_board(path)) for path in paths]
+
+
+def round_robin_pairings(strategy_names: Sequence[str]) -> list[tuple[str, str]]:
+    """Every unordered pair of ``strategy_names``, in list order."""
+    return list(combinations(strategy_names, 2))
+
+
+def plan_units(boards: int, pairings: int, games: int, block_size: int) -> list[WorkUnit]:
+    """Split ``games`` per (board, pairing) cell into blocks of ``block_size``."""
+    if block_size < 1:
+        raise ValueError("block_size must be at least 1")
+    return [
+        WorkUnit(board, pairing, first, min(block_size, games - first))
+        for board in range(boards)
+        for pairing in range(pairings)
+        for first in range(0, games, block_size)
+    ]
+
+
+# Worker-side state. The boards and pairings arrive once per worker through
+# the pool initializer; battles and strategies are built on first use.
+_WORKER_CONTEXT: Optional[tuple[list[tuple[str, BoardConfig]], list[tuple[str, str]], int]] = None
+_WORKER_BATTLES: dict[int, StrategyBattle] = {}
+_WORKER_STRATEGIES: dict[str, EnhancedStrategy] = {}
+
+
+def _init_worker(
+    boards: list[tuple[str, BoardConfig]], pairings: list[tuple[str, str]], seed: int
+) -> None:
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = (boards, pairings, seed)
+    _WORKER_BATTLES.clear()
+    _WORKER_STRATEGIES.clear()
+
+
+def _worker_battle(board: int) -> StrategyBattle:
+    battle = _WORKER_BATTLES.get(board)
+    if battle is None:
+        boards, _, _ = _WORKER_CONTEXT
+        battle = _WORKER_BATTLES[board] = StrategyBattle(board_config=boards[board][1], log_frequency=0)
+    return battle
+
+
+def _worker_strategy(battle: StrategyBattle, name: str) -> EnhancedStrategy:
+    strategy = _WORKER_STRATEGIES.get(name)
+    if strategy is None:
+        strategy = battle.strategy_loader.get_strategy(name)
+        if strategy is None:
+            raise ValueError(f"Could not find strategy: {name}")
+        _WORKER_STRATEGIES[name] = strategy
+    return strategy
+
+
+def _play_unit(unit: WorkUnit) -> UnitResult:
+    """Play one work unit. Lives at module level so it can be sent to a ProcessPoolExecutor."""
+    _, pairings, seed = _WORKER_CONTEXT
+    battle = _worker_battle(unit.board)
+    a_name, b_name = pairings[unit.pairing]
+    strategy_a = _worker_strategy(battle, a_name)
+    strategy_b = _worker_strategy(battle, b_name)
+    references = battle._determine_board_references(strategy_a, strategy_b)
+    landscapes = {
+        "events": references.events,
+        "projects": references.projects,
+        "ways": references.ways,
+        "landmarks": references.landmarks,
+        "allies": references.allies,
+    }
+
+    a_wins = a_total_score = b_total_score = total_turns = 0
+    for game_num in range(unit.first_game, unit.first_game + unit.games):
+        random.seed(seed + game_num)
+        ai_a = GeneticAI(strategy_a)
+        ai_b = GeneticAI(strategy_b)
+        seats = (ai_a, ai_b) if game_num % 2 == 0 else (ai_b, ai_a)
+        winner, scores, _, turns = battle.run_game(*seats, references.kingdom_cards, **landscapes)
+        if winner == ai_a:
+            a_wins += 1
+        a_total_score += scores[ai_a.name]
+        b_total_score += scores[ai_b.name]
+        total_turns += turns
+    return UnitResult(unit, a_wins, a_total_score, b_total_score, total_turns)
+
+
+def run_batch(
+    boards: Sequence[tuple[str, BoardConfig]],
+    pairings: Sequence[tuple[str, str]],
+    games: int,
+    *,
+    seed: int = 0,
+    block_size: int = 50,
+    processes: int = 0,
+    on_unit: Optional[Callable[[UnitResult], None]] = None,
+) -> list[dict[str, Any]]:
+    """Play ``games`` games of every pairing on every board.
+
+    Returns one row per (board, pairing) in board-then-pairing order, with
+    the columns of :data:`TABLE_COLUMNS`. With ``processes`` > 1 the work
+    units run in a process pool; the rows are the same either way.
+    ``on_unit`` sees each unit's result as it finishes.
+    """
+    boards = list(boards)
+    pairings = list(pairings)
+    units = plan_units(len(boards), len(pairings), games, block_size)
+    results: list[UnitResult] = []
+
+    def finished(result: UnitResult) -> None:
+        results.append(result)
+        if on_unit is not None:
+            on_unit(result)
+
+    if processes <= 1:
+        _init_worker(boards, pairings, seed)
+        try:
+            for unit in units:
+                finished(_play_unit(unit))
+        finally:
+            _init_worker([], [], seed)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(boards, pairings, seed),
+        ) as pool:
+            # Chunks keep consecutive units (same board) on one worker.
+            for result in pool.map(_play_unit, units, chunksize=max(1, len(units) // (processes * 4))):
+                finished(result)
+
+    return consolidate(boards, pairings, results)
+
+
+def consolidate(
+    boards: Sequence[tuple[str, BoardConfig]],
+    pairings: Sequence[tuple[str, str]],
+    results: Sequence[UnitResult],
+) -> list[dict[str, Any]]:
+    """Merge unit results into one row per (board, pairing) that played games."""
+    totals: dict[tuple[int, int], list[int]] = {}
+    for result in results:
+        key = (result.unit.board, result.unit.pairing)
+        cell = totals.setdefault(key, [0, 0, 0, 0, 0])
+        cell[0] += result.unit.games
+        cell[1] += result.a_wins
+        cell[2] += result.a_total_score
+        cell[3] += result.b_total_score
+        cell[4] += result.total_turns
+
+    rows = []
+    for key in sorted(totals):
+        games, a_wins, a_score, b_score, turns = totals[key]
+        board_name = boards[key[0]][0]
+        a_name, b_name = pairings[key[1]]
+        rows.append(
+            {
+                "board": board_name,
+                "strategy_a": a_name,
+                "strategy_b": b_name,
+                "games": games,
+                "a_wins": a_wins,
+                "b_wins": games - a_wins,
+                "a_win_rate": a_wins / games * 100,
+                "avg_a_score": a_score / games,
+                "avg_b_score": b_score / games,
+                "avg_margin": (a_score - b_score) / games,
+                "avg_turns": turns / games,
+            }
+        )
+    return rows
+
+
+def write_table(rows: Sequence[dict[str, Any]], path: str | Path) -> Path:
+    """Write consolidated rows as CSV."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=TABLE_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run strategy pairings across many boards in one job")
+    parser.add_argument("--boards", nargs="+", required=True, help="Board definition files")
+    parser.add_argument(
+        "--strategies",
+        nargs="+",
+        default=[],
+        help="Strategies to play round-robin on every board",
+    )
+    parser.add_argument(
+        "--pair",
+        nargs=2,
+        action="append",
+        default=[],
+        metavar=("A", "B"),
+        help="Also play this pairing (repeatable)",
+    )
+    parser.add_argument("--games", type=int, default=100, help="Games per pairing per board (default: 100)")
+    parser.add_argument("--seed", type=int, default=0, help="Game n of each cell uses seed + n (default: 0)")
+    parser.add_argument("--block-size", type=int, default=50, help="Games per work unit (default: 50)")
+    parser.add_argument("--processes", type=int, default=0, help="Worker processes (default: run inline)")
+    parser.add_argument("--output", type=Path, default=None, help="CSV file for the consolidated table")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    pairings = round_robin_pairings(args.strategies)
+    pairings += [tuple(pair) for pair in args.pair if tuple(pair) not in pairings]
+    if not pairings:
+        parser.error("give at least two --strategies or one --pair")
+
+    boards = load_boards(args.boards)
+    units = plan_units(len(boards), len(pairings), args.games, args.block_size)
+    logger.info(
+        "%d boards x %d pairings x %d games: %d work units",
+        len(boards), len(pairings), args.games, len(units),
+    )
+    done = 0
+
+    def progress(result: UnitResult) -> None:
+        nonlocal done
+        done += 1
+        if done % 10 == 0 or done == len(units):
+            logger.info("[%d/%d] units done", done, len(units))
+
+    rows = run_batch(
+        boards,
+        pairings,
+        args.games,
+        seed=args.seed,
+        block_size=args.block_size,
+        processes=args.processes,
+        on_unit=progress,
+    )
+    for row in rows:
+        logger.info(
+            "%s: %s vs %s %.1f%% (margin %+.1f)",
+            row["board"], row["strategy_a"], row["strategy_b"], row["a_win_rate"], row["avg_margin"],
+        )
+    if args.output is not None:
+        logger.info("Table: %s", write_table(rows, args.output))
+
+
+if __name__ == "__main__":
+    main()
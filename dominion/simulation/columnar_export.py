@@ -0,0 +1,243 @@
+"""Columnar, batched export of per-game results.
+
+Battle and training results otherwise live in nested dicts or per-game
+logs, which are slow to reparse at scale. :class:`ColumnarResultWriter`
+buffers one row per game as columns and writes every ``batch_size`` rows
+to a new part file in a directory:
+
+* ``part-NNNNN.parquet`` when ``pyarrow`` is installed,
+* ``part-NNNNN.npz`` when only ``numpy`` is installed,
+* ``part-NNNNN.json`` (one ``{column: [values]}`` object) otherwise.
+
+Fixed columns describe the game (seed, seats, scores, turns, winner seat,
+end condition); games with more than two players add ``seat2``/``score2``
+and so on. Counters are sparse columns named ``buys.<card>``,
+``plays.<card>`` and ``fired.<seat>.<list>.<rule>``; games that did not
+touch a counter get 0. :func:`read_columns` loads every part back into a
+single ``{column: list}`` mapping.
+
+``.npz`` parts hold plain typed arrays so they load without pickling:
+empty cells (``seat2`` in a two-player game) are stored as ``-1`` or
+``""`` with a ``missing.<column>`` mask beside them, and come back as
+``None``.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
+
+if TYPE_CHECKING:  # Avoid circular imports at runtime
+    from dominion.game.game_state import GameState
+    from dominion.simulation.game_logger import GameMetrics
+
+try:  # Optional dependencies, in order of preference
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+FIXED_COLUMNS = (
+    "game_id",
+    "seed",
+    "seat0",
+    "seat1",
+    "score0",
+    "score1",
+    "turns",
+    "winner_seat",
+    "end_condition",
+)
+COUNTER_PREFIXES = ("buys.", "plays.", "fired.")
+# Prefix of the .npz masks that mark empty cells of a column.
+MISSING_PREFIX = "missing."
+
+
+def end_condition(state: GameState) -> str:
+    """Name the condition that ended ``state``'s game."""
+    if state.supply.get("Province", 1) == 0:
+        return "provinces"
+    if "Colony" in state.supply and state.supply["Colony"] == 0:
+        return "colonies"
+    if state.empty_piles >= state.pile_end_count:
+        return "piles"
+    return "turn_limit"
+
+
+def game_row(
+    game_id: int,
+    seed: Optional[int],
+    seats: list[str],
+    scores: list[int],
+    turns: int,
+    winner_seat: int,
+    end: str,
+    metrics: Optional[GameMetrics] = None,
+    firings: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    """Build one export row from a finished game.
+
+    ``firings`` maps a seat label to a StrategyBattle decision-firing dict;
+    its ``priority_rules`` counts become ``fired.*`` columns.
+    """
+    row: dict[str, Any] = {
+        "game_id": game_id,
+        "seed": -1 if seed is None else seed,
+        "seat0": seats[0],
+        "seat1": seats[1],
+        "score0": scores[0],
+        "score1": scores[1],
+        "turns": turns,
+        "winner_seat": winner_seat,
+        "end_condition": end,
+    }
+    # Games with more than two players add seat2/score2 and so on; rows
+    # of smaller games leave those columns empty.
+    for seat in range(2, len(seats)):
+        row[f"seat{seat}"] = seats[seat]
+        row[f"score{seat}"] = scores[seat]
+    if metrics is not None:
+        for card, count in metrics.cards_bought.items():
+            row[f"buys.{card}"] = count
+        for card, count in metrics.cards_played.items():
+            row[f"plays.{card}"] = count
+    for seat, stats in (firings or {}).items():
+        for list_name, rules in (stats.get("priority_rules") or {}).items():
+            for rule_key, count in rules.items():
+                row[f"fired.{seat}.{list_name}.{rule_key}"] = count
+    return row
+
+
+def _default_for(column: str) -> Any:
+    return 0 if column.startswith(COUNTER_PREFIXES) else None
+
+
+class ColumnarResultWriter:
+    """Buffer per-game rows as columns and write them in batches.
+
+    ``fmt`` is ``"auto"`` (best available), ``"parquet"``, ``"npz"`` or
+    ``"json"``. Use as a context manager, or call :meth:`close`, so the
+    last partial batch is written.
+    """
+
+    def __init__(self, directory: Union[str, Path], batch_size: int = 10_000, fmt: str = "auto"):
+        if fmt == "auto":
+            fmt = "parquet" if pq is not None else "npz" if np is not None else "json"
+        if fmt == "parquet" and pq is None:
+            raise ImportError("pyarrow is required for Parquet export")
+        if fmt == "npz" and np is None:
+            raise ImportError("numpy is required for .npz export")
+        if fmt not in ("parquet", "npz", "json"):
+            raise ValueError(f"unknown export format: {fmt}")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.fmt = fmt
+        self.rows_written = 0
+        self._part = len(list(self.directory.glob("part-*")))
+        self._columns: dict[str, list] = {}
+        self._pending = 0
+
+    def __enter__(self) -> ColumnarResultWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def add(self, row: dict[str, Any]) -> None:
+        """Append one game row, flushing when the batch is full."""
+        columns = self._columns
+        for name, value in row.items():
+            column = columns.get(name)
+            if column is None:
+                column = columns[name] = [_default_for(name)] * self._pending
+            column.append(value)
+        self._pending += 1
+        for name, column in columns.items():
+            if len(column) < self._pending:
+                column.append(_default_for(name))
+        if self._pending >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered rows as a new part file."""
+        if not self._pending:
+            return
+        path = self.directory / f"part-{self._part:05d}.{self.fmt}"
+        if self.fmt == "parquet":
+            pq.write_table(pa.table(self._columns), path)
+        elif self.fmt == "npz":
+            np.savez_compressed(path, **_npz_arrays(self._columns))
+        else:
+            path.write_text(json.dumps(self._columns))
+        self._part += 1
+        self.rows_written += self._pending
+        self._columns = {}
+        self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+
+
+def _npz_arrays(columns: dict[str, list]) -> dict[str, Any]:
+    """Typed arrays for ``columns``, with a mask for columns that have gaps."""
+    arrays = {}
+    for name, values in columns.items():
+        missing = [value is None for value in values]
+        if any(missing):
+            fill = "" if any(isinstance(value, str) for value in values) else -1
+            values = [fill if gap else value for value, gap in zip(values, missing)]
+            arrays[MISSING_PREFIX + name] = np.asarray(missing)
+        arrays[name] = np.asarray(values)
+    return arrays
+
+
+def _read_part(path: Path) -> dict[str, list]:
+    if path.suffix == ".parquet":
+        if pq is None:
+            raise ImportError("pyarrow is required to read Parquet exports")
+        return pq.read_table(path).to_pydict()
+    if path.suffix == ".npz":
+        if np is None:
+            raise ImportError("numpy is required to read .npz exports")
+        with np.load(path) as data:
+            part = {name: data[name].tolist() for name in data.files if not name.startswith(MISSING_PREFIX)}
+            for name in data.files:
+                if name.startswith(MISSING_PREFIX):
+                    column = part[name[len(MISSING_PREFIX) :]]
+                    for index in np.flatnonzero(data[name]):
+                        column[index] = None
+            return part
+    return json.loads(path.read_text())
+
+
+def read_columns(directory: Union[str, Path], columns: Optional[Iterable[str]] = None) -> dict[str, list]:
+    """Concatenate every part in ``directory`` into ``{column: values}``.
+
+    Parts may have different counter columns; missing values are filled
+    the same way the writer fills them.
+    """
+    wanted = set(columns) if columns is not None else None
+    merged: dict[str, list] = {}
+    total = 0
+    for path in sorted(Path(directory).glob("part-*")):
+        part = _read_part(path)
+        size = len(next(iter(part.values()), []))
+        for name, values in part.items():
+            if wanted is not None and name not in wanted:
+                continue
+            column = merged.get(name)
+            if column is None:
+                column = merged[name] = [_default_for(name)] * total
+            column.extend(values)
+        total += size
+        for name, column in merged.items():
+            if len(column) < total:
+                column.extend([_default_for(name)] * (total - len(column)))
+    return merged
@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
@@ -39,20 +40,66 @@ class GameMetrics:
         }
 
 
+@dataclass
+class RunMetrics:
+    """Aggregate metrics over every game a logger has seen.
+
+    Keyed by card name only (never by AI name, which is unique per AI
+    instance), so memory stays flat however many games are played.
+    """
+
+    games: int = 0
+    total_turns: int = 0
+    max_turns: int = 0
+    cards_played: dict[str, int] = field(default_factory=dict)
+    cards_bought: dict[str, int] = field(default_factory=dict)
+
+    def add_game(self, metrics: GameMetrics) -> None:
+        self.games += 1
+        self.total_turns += metrics.turn_count
+        self.max_turns = max(self.max_turns, metrics.turn_count)
+        for name, count in metrics.cards_played.items():
+            self.cards_played[name] = self.cards_played.get(name, 0) + count
+        for name, count in metrics.cards_bought.items():
+            self.cards_bought[name] = self.cards_bought.get(name, 0) + count
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "games": self.games,
+            "avg_turns": self.total_turns / self.games if self.games else 0.0,
+            "max_turns": self.max_turns,
+            "cards_played": dict(self.cards_played),
+            "cards_bought": dict(self.cards_bought),
+        }
+
+
 class GameLogger:
-    """Enhanced logging system for Dominion games."""
+    """Enhanced logging system for Dominion games.
+
+    Memory is bounded for long runs: ``game_logs`` keeps only the most
+    recent ``max_recent_logs`` entries, per-game metrics are folded into
+    ``run_metrics``, and sampled games append one line each to a single
+    ``metrics/<run_id>.jsonl`` file.
+    """
 
-    def __init__(self, log_folder: str = "game_logs", log_frequency: int = 10):
+    def __init__(self, log_folder: str = "game_logs", log_frequency: int = 10, max_recent_logs: int = 1000):
         self.log_folder = log_folder
         self.log_frequency = log_frequency
         self.current_game_id: Optional[str] = None
         self.current_log_path: Optional[str] = None
         self.current_metrics = GameMetrics()
-        self.game_logs: list[Optional[str]] = []
+        # Metrics of the most recently ended game, for per-game exports.
+        self.last_metrics: Optional[GameMetrics] = None
+        self.run_metrics = RunMetrics()
+        self.game_logs: deque[Optional[str]] = deque(maxlen=max_recent_logs)
         self.game_count = 0
         self.should_log_to_file = False
         self.training_progress: Optional[tqdm] = None
-        self.name_map: dict[str, str] = {}
+        self.run_id = f"run_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        self.metrics_path = os.path.join(log_folder, "metrics", f"{self.run_id}.jsonl")
+        self._players: list[GeneticAI] = []
+        self._name_map: Optional[dict[str, str]] = None
+        self._file_handler: Optional[logging.FileHandler] = None
 
         # Only create log directories and file logger when logging is enabled
         if log_frequency > 0:
@@ -78,16 +125,10 @@ class GameLogger:
         else:
             self.should_log_to_file = (self.game_count - 1) % self.log_frequency == 0
 
-        # Create readable player descriptions and map them for later use. This
-        # mapping is useful even when we aren't logging to file so that any
-        # console messages use the friendly names as well.
-        descriptions = []
-        self.name_map = {}
-        for idx, ai in enumerate(players, start=1):
-            strategy_name = getattr(ai.strategy, "name", "Unknown Strategy")
-            friendly = f"Player {idx} ({strategy_name})"
-            self.name_map[ai.name] = friendly
-            descriptions.append(friendly)
+        # Friendly names are built on first use (see ``name_map``) so games
+        # that are neither written nor narrated don't pay for them.
+        self._players = list(players)
+        self._name_map = None
 
         if self.should_log_to_file:
             # Include microseconds to avoid filename collisions when multiple
@@ -98,17 +139,27 @@ class GameLogger:
             # Set up file handler for this game
             log_path = os.path.join(self.log_folder, f"{self.current_game_id}.log")
             self.current_log_path = log_path
-            file_handler = logging.FileHandler(log_path)
+            self._file_handler = logging.FileHandler(log_path)
             formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s", datefmt="%H:%M:%S")
-            file_handler.setFormatter(formatter)
-            self.file_logger.addHandler(file_handler)
+            self._file_handler.setFormatter(formatter)
+            self.file_logger.addHandler(self._file_handler)
 
             # Enhanced game start logging
             self.file_logger.info("=" * 60)
             self.file_logger.info(f"Starting Game {self.game_count}")
-            self.file_logger.info(f"Players: {', '.join(descriptions)}")
+            self.file_logger.info(f"Players: {', '.join(self.name_map.values())}")
             self.file_logger.info("=" * 60)
 
+    @property
+    def name_map(self) -> dict[str, str]:
+        """Map AI names to readable player descriptions for the current game."""
+        if self._name_map is None:
+            self._name_map = {}
+            for idx, ai in enumerate(self._players, start=1):
+                strategy_name = getattr(ai.strategy, "name", "Unknown Strategy")
+                self._name_map[ai.name] = f"Player {idx} ({strategy_name})"
+        return self._name_map
+
     def format_player_name(self, name: str) -> str:
         """Format player name to be more readable."""
         if name in self.name_map:
@@ -217,19 +268,26 @@ class GameLogger:
 
             self.file_logger.info("=" * 60 + "\n")
 
-            # Save metrics
-            metrics_path = os.path.join(self.log_folder, "metrics", f"{self.current_game_id}_metrics.json")
-            with open(metrics_path, "w") as f:
-                json.dump(self.current_metrics.to_dict(), f, indent=2)
+            self._append_metrics_line(
+                {
+                    "game_id": self.current_game_id,
+                    "game_number": self.game_count,
+                    "winner": winner,
+                    "scores": dict(scores),
+                    **self.current_metrics.to_dict(),
+                }
+            )
 
-            # Remove file handler
-            for handler in self.file_logger.handlers[:]:
-                self.file_logger.removeHandler(handler)
+            # Remove and close this game's file handler
+            if self._file_handler is not None:
+                self.file_logger.removeHandler(self._file_handler)
+                self._file_handler.close()
+                self._file_handler = None
 
-            # Track log path for reporting
-            self.game_logs.append(log_path)
-        else:
-            self.game_logs.append(None)
+        # Track log path for reporting (None for games not written to file)
+        self.game_logs.append(log_path)
+        self.run_metrics.add_game(self.current_metrics)
+        self.last_metrics = self.current_metrics
 
         # Reset game state
         self.current_game_id = None
@@ -239,6 +297,20 @@ class GameLogger:
 
         return log_path
 
+    def _append_metrics_line(self, record: dict[str, Any]) -> None:
+        """Append one JSON record to this run's metrics file."""
+        with open(self.metrics_path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def write_run_summary(self) -> None:
+        """Append the aggregate ``run_metrics`` to this run's metrics file.
+
+        Each call appends the totals so far, so the last summary line
+        covers every game the logger has seen.
+        """
+        if self.log_frequency > 0:
+            self._append_metrics_line({"run_summary": self.run_metrics.to_dict()})
+
     def start_training(self, total_generations: int):
         """Initialize training progress tracking."""
         self.training_progress = tqdm(
@@ -6,7 +6,10 @@ from typing import Callable, Optional, Tuple
 import coloredlogs
 
 from dominion.boards.loader import BoardConfig
+from dominion.simulation.columnar_export import ColumnarResultWriter, game_row
 from dominion.simulation.game_logger import GameLogger
+from dominion.simulation.niching import niche_counts, top_card_overlap, top_gain_cards
+from dominion.simulation.seating import check_player_count, placement_score, seating
 from dominion.simulation.strategy_battle import StrategyBattle, canonical_way_name
 from dominion.strategy.enhanced_strategy import PriorityRule, WayRule
 from dominion.strategy.strategies.base_strategy import BaseStrategy
@@ -71,6 +74,8 @@ class GeneticTrainer:
         hall_of_fame_size: int = 3,
         hall_of_fame_interval: int = 10,
         structured_genome: bool = True,
+        result_export: Optional[ColumnarResultWriter] = None,
+        players: int = 2,
     ):
         if kingdom_cards is None:
             if board_config is None:
@@ -133,6 +138,18 @@ class GeneticTrainer:
             from dominion.simulation.structured_genome import KingdomInfo
             self._kingdom_info = KingdomInfo.from_kingdom(kingdom_cards or [])
 
+        # Optional columnar sink receiving one row per evaluation game;
+        # train() flushes it when training ends.
+        self.result_export = result_export
+        self._exported_games = 0
+
+        # Seats per evaluation game. With more than two, the candidate plays
+        # against ``players - 1`` copies of each panel opponent, seats rotate
+        # every game, and "win rate" becomes the mean placement score (100
+        # for first, 0 for last) with margin measured against the best
+        # opponent.
+        self.players = check_player_count(players)
+
         self.battle_system = StrategyBattle(kingdom_cards, log_folder, board_config=board_config)
         if not self.kingdom_cards:
             raise ValueError("kingdom_cards cannot be empty")
@@ -163,12 +180,12 @@ class GeneticTrainer:
         self.best_eval_breakdown: list[tuple] = []
 
         # Cache card type lookups for filtering
-        from dominion.cards.registry import get_card
+        from dominion.cards.metadata import get_card_metadata
         self._kingdom_action_cards = []
         self._kingdom_treasure_cards = []
         for card_name in self.kingdom_cards:
             try:
-                card = get_card(card_name)
+                card = get_card_metadata(card_name)
                 if card.is_action:
                     self._kingdom_action_cards.append(card_name)
                 if card.is_treasure:
@@ -549,27 +566,40 @@ class GeneticTrainer:
                     }.items()
                     if value
                 }
+                if self.players > 2:
+                    rate, avg_margin = self._evaluate_multiplayer(
+                        strategy, opponent, i, games_per_opp, kingdom_card_names, landscape_kwargs
+                    )
+                    if self.shape_rewards:
+                        breakdown.append((opponent.name, rate, avg_margin, self._shape_fitness(rate, avg_margin)))
+                    else:
+                        breakdown.append((opponent.name, rate))
+                    continue
                 wins = 0
                 margin_total = 0.0
                 for game_num in range(games_per_opp):
+                    game_seed = self._game_seed(i, game_num) if seeding else None
                     if seeding:
-                        random.seed(self._game_seed(i, game_num))
+                        random.seed(game_seed)
                     ai1 = GeneticAI(strategy)
                     ai2 = GeneticAI(opponent)
                     if game_num % 2 == 0:
-                        winner, scores, _l, _t = self.battle_system.run_game(
+                        winner, scores, _l, turns = self.battle_system.run_game(
                             ai1,
                             ai2,
                             kingdom_card_names,
                             **landscape_kwargs,
                         )
                     else:
-                        winner, scores, _l, _t = self.battle_system.run_game(
+                        winner, scores, _l, turns = self.battle_system.run_game(
                             ai2,
                             ai1,
                             kingdom_card_names,
                             **landscape_kwargs,
                         )
+                    if self.result_export is not None:
+                        seats = (ai1, ai2) if game_num % 2 == 0 else (ai2, ai1)
+                        self._export_game(game_seed, seats, winner, scores, turns)
                     if winner == ai1:
                         wins += 1
                     # ``scores`` is keyed by ai.name; an empty dict means no
@@ -602,17 +632,73 @@ class GeneticTrainer:
             if rng_snapshot is not None:
                 random.setstate(rng_snapshot)
 
+    def _evaluate_multiplayer(
+        self,
+        strategy: BaseStrategy,
+        opponent: BaseStrategy,
+        opponent_index: int,
+        games: int,
+        kingdom_card_names: list[str],
+        landscape_kwargs: dict,
+    ) -> tuple[float, float]:
+        """Play ``strategy`` against ``players - 1`` copies of ``opponent``.
+
+        Returns ``(mean placement score, mean margin over the best
+        opponent)``; see ``players`` in ``__init__``.
+        """
+        from dominion.ai.genetic_ai import GeneticAI
+
+        seeding = self._eval_seed_context is not None
+        placement_total = 0.0
+        margin_total = 0.0
+        for game_num in range(games):
+            game_seed = self._game_seed(opponent_index, game_num) if seeding else None
+            if seeding:
+                random.seed(game_seed)
+            candidate = GeneticAI(strategy)
+            opponents = [GeneticAI(opponent) for _ in range(self.players - 1)]
+            seats = seating([candidate] + opponents, game_num)
+            winner, scores, _l, turns = self.battle_system.run_multiplayer_game(
+                seats,
+                kingdom_card_names,
+                **landscape_kwargs,
+            )
+            if self.result_export is not None:
+                self._export_game(game_seed, seats, winner, scores, turns)
+            place = self.battle_system.last_placements.index(candidate.name)
+            placement_total += placement_score(place, self.players)
+            best_opponent = max(scores.get(ai.name, 0) for ai in opponents)
+            margin_total += scores.get(candidate.name, 0) - best_opponent
+        return placement_total / games, margin_total / games
+
+    def _export_game(self, game_seed, seats, winner, scores, turns) -> None:
+        """Add one evaluation game to ``result_export``; ``seats`` holds the AIs in seat order."""
+        self.result_export.add(
+            game_row(
+                self._exported_games,
+                game_seed,
+                [ai.strategy.name for ai in seats],
+                [scores.get(ai.name, 0) for ai in seats],
+                turns,
+                list(seats).index(winner),
+                self.battle_system.last_end_condition,
+                self.battle_system.logger.last_metrics,
+            )
+        )
+        self._exported_games += 1
+
     def _game_seed(self, opponent_index: int, game_num: int) -> int:
         """Derive the RNG seed for one game of a seeded evaluation.
 
-        Consecutive seat-swapped games (game_num 2k and 2k+1) share a seed so
-        each shuffle sequence is played from both seats. The seed depends only
+        Each block of ``players`` consecutive seat-rotated games (game_num
+        2k and 2k+1 with two players) shares a seed so each shuffle sequence
+        is played from every seat. The seed depends only
         on (base, phase context, opponent, pair index) — never on the candidate
         — which is what makes the random numbers *common* across candidates.
         The context contains only ints, so the hash (and therefore the seeds)
         is reproducible across processes for a fixed ``eval_seed``.
         """
-        pair_index = game_num // 2
+        pair_index = game_num // self.players
         return hash((self._eval_seed_base, self._eval_seed_context, opponent_index, pair_index)) & 0x7FFFFFFF
 
     def _eval_with_budget(self, strategy: BaseStrategy, games: int, context: Optional[tuple]) -> float:
@@ -960,25 +1046,21 @@ class GeneticTrainer:
         population: list[BaseStrategy],
         raw_fitness: list[float],
         threshold: float = 0.8,
-        similarity=None,
+        features=None,
     ) -> list[float]:
         """Divide each individual's fitness by its niche count (members within
         ``threshold`` similarity, including itself). Clones lose to unique
         strategies at the same skill level.
 
-        ``similarity`` defaults to the raw top-5 gain overlap; structured-menu
-        runs pass :func:`kingdom_similarity` instead so the shared greening
-        skeleton doesn't put the whole population in one niche."""
-        if similarity is None:
-            similarity = GeneticTrainer._strategy_similarity
-        shared: list[float] = []
-        for i, individual in enumerate(population):
-            niche = sum(
-                1 for other in population
-                if similarity(individual, other) >= threshold
-            )
-            shared.append(raw_fitness[i] / max(1, niche))
-        return shared
+        ``features`` maps a strategy to the card set similarity compares and
+        defaults to the raw top-5 gain cards; structured-menu runs pass
+        :func:`kingdom_features` instead so the shared greening skeleton
+        doesn't put the whole population in one niche. Each set is built
+        once per call and niches come from :func:`niche_counts`."""
+        if features is None:
+            features = top_gain_cards
+        niches = niche_counts([features(individual) for individual in population], threshold)
+        return [fitness / max(1, niche) for fitness, niche in zip(raw_fitness, niches)]
 
     @staticmethod
     def _strategy_similarity(a: BaseStrategy, b: BaseStrategy) -> float:
@@ -989,10 +1071,7 @@ class GeneticTrainer:
         at 5), so identical small strategies (e.g. 3 rules each) still score
         1.0 instead of being artificially capped at 0.6 and dodging fitness
         sharing."""
-        top_a = {r.card_name for r in a.gain_priority[:5]}
-        top_b = {r.card_name for r in b.gain_priority[:5]}
-        denom = max(1, min(5, max(len(top_a), len(top_b))))
-        return len(top_a & top_b) / denom
+        return top_card_overlap(top_gain_cards(a), top_gain_cards(b))
 
     @staticmethod
     def _normalize_priority_list(rules: list[PriorityRule]) -> list[PriorityRule]:
@@ -1224,13 +1303,13 @@ class GeneticTrainer:
                 self.logger.update_training(gen, self._best_confirmed, avg_fitness)
 
                 # Diversity pressure: shared fitness for selection, random immigrants
-                similarity = None
+                features = None
                 if self.structured_genome:
-                    from dominion.simulation.structured_genome import kingdom_similarity
-                    similarity = kingdom_similarity
+                    from dominion.simulation.structured_genome import kingdom_features
+                    features = kingdom_features
                 shared_fitness = self._apply_fitness_sharing(
                     population, fitness_scores, threshold=self.sharing_threshold,
-                    similarity=similarity,
+                    features=features,
                 )
                 if self.population_size < 4 or self.immigrant_fraction <= 0:
                     immigrants = 0
@@ -1246,6 +1325,9 @@ class GeneticTrainer:
 
             # End training progress tracking
             self.logger.end_training()
+            self.battle_system.logger.write_run_summary()
+            if self.result_export is not None:
+                self.result_export.flush()
 
             # If no candidate was ever evaluated (e.g. empty population),
             # surface the shaped fitness as -inf-equivalent 0.0 so callers
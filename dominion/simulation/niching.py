@@ -0,0 +1,68 @@
+"""Fitness-sharing niche counts from top-of-menu card sets.
+
+GA similarity is the overlap of the card sets two strategies put at the top
+of their gain menus: ``|A & B|`` divided by the larger set size, capped at
+:data:`TOP_K` and at least 1 (:func:`top_card_overlap`). Checking it pair by
+pair rebuilds both sets for each of the ``P**2`` pairs every generation.
+:func:`niche_counts` instead encodes each genome's set once, as a
+fixed-length 0/1 row over the cards the generation uses, and takes every
+pairwise overlap at once: ``M @ M.T`` when ``numpy`` is installed, integer
+bit masks and ``int.bit_count`` over the distinct masks otherwise.
+Overlaps are exact integers and the ratio is the same float division, so
+niches match the pairwise check at any threshold.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Sequence
+
+from dominion.strategy.strategies.base_strategy import BaseStrategy
+
+try:  # Optional dependency
+    import numpy as np
+except ImportError:
+    np = None
+
+# Menu entries compared, and the cap on the similarity divisor.
+TOP_K = 5
+
+
+def top_gain_cards(strategy: BaseStrategy) -> set[str]:
+    """Card names of the first :data:`TOP_K` gain rules."""
+    return {rule.card_name for rule in strategy.gain_priority[:TOP_K]}
+
+
+def top_card_overlap(a: set[str], b: set[str]) -> float:
+    """Shared cards as a fraction of the larger set (capped at TOP_K)."""
+    denom = max(1, min(TOP_K, max(len(a), len(b))))
+    return len(a & b) / denom
+
+
+def niche_counts(card_sets: Sequence[set[str]], threshold: float) -> list[int]:
+    """For each set, how many sets (itself included) overlap it by ``threshold`` or more."""
+    index: dict[str, int] = {}
+    rows = [[index.setdefault(card, len(index)) for card in cards] for cards in card_sets]
+
+    if np is not None:
+        sizes = [len(cards) for cards in card_sets]
+        members = np.zeros((len(rows), len(index)), dtype=np.int64)
+        for i, columns in enumerate(rows):
+            members[i, columns] = 1
+        overlap = members @ members.T
+        denom = np.clip(np.maximum.outer(sizes, sizes), 1, TOP_K)
+        return (overlap / denom >= threshold).sum(axis=1).tolist()
+
+    # Clones share a mask, so compare distinct masks and weight by copies.
+    masks = [sum(1 << column for column in columns) for columns in rows]
+    copies = Counter(masks)
+    distinct = [(mask, mask.bit_count()) for mask in copies]
+    niches = {}
+    for mask, size in distinct:
+        niche = 0
+        for other, other_size in distinct:
+            denom = max(1, min(TOP_K, max(size, other_size)))
+            if (mask & other).bit_count() / denom >= threshold:
+                niche += copies[other]
+        niches[mask] = niche
+    return [niches[mask] for mask in masks]
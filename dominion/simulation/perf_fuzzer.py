@@ -0,0 +1,452 @@
+"""Fuzz the engine for slow card implementations and slow turns.
+
+``PHASE_STEP_LIMIT`` only stops loops that never end; a card that
+deep-copies state, rescans every zone per card or churns through
+``get_card`` still finishes, just slowly. The fuzzer plays games on seeded
+random boards (:func:`~dominion.boards.random_board.random_board`) with
+:class:`RandomAI` in every seat, which makes random legal choices and so
+reaches far more card code than a strategy does, under an
+:class:`AllocationProfiler`. Per card it reports, for ``on_play``,
+``on_gain`` and ``on_buy``:
+
+* calls, mean inclusive and self time, and the slowest single call,
+* Card instances created per call (``get_card``, copies and deepcopies),
+* with ``memory=True``, peak bytes allocated per call, from ``tracemalloc``
+  (which slows every call down, so compare times within one mode only).
+
+It also keeps the slowest turns with the cards played in them. Board
+``k`` uses seed ``seed + k`` and game ``j`` on the board with seed ``s``
+reseeds the RNG with ``"s:j"``, as in the robustness sweep, so any game in
+the report can be replayed with :func:`play_game`.
+
+Usage:
+    python -m dominion.simulation.perf_fuzzer --boards 200 --games 3 --processes 8
+    python -m dominion.simulation.perf_fuzzer --boards 50 --memory --output reports/fuzz.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import logging
+import multiprocessing as mp
+import random
+import tracemalloc
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Iterator, NamedTuple, Optional, Sequence
+
+from dominion.allies.registry import get_ally
+from dominion.boards.random_board import RandomBoard, random_board
+from dominion.cards.base_card import Card
+from dominion.cards.registry import get_card
+from dominion.events.registry import get_event
+from dominion.game.game_state import GameState
+from dominion.game.profiler import GameProfiler
+from dominion.landmarks.registry import get_landmark
+from dominion.projects.registry import get_project
+from dominion.rl.random_ai import RandomAI
+from dominion.ways.registry import get_way
+
+logger = logging.getLogger(__name__)
+
+# Profiler category -> the card hook it times.
+HOOKS = {"card": "on_play", "on_gain": "on_gain", "on_buy": "on_buy"}
+
+# Card instances created while counting_card_instances() is active.
+_created = [0]
+
+
+def _counting_new(cls, *args, **kwargs):
+    _created[0] += 1
+    return object.__new__(cls)
+
+
+@contextmanager
+def counting_card_instances() -> Iterator[None]:
+    """Count every Card instance created, including copies, while active."""
+    if "__new__" in Card.__dict__:
+        yield
+        return
+    Card.__new__ = staticmethod(_counting_new)
+    try:
+        yield
+    finally:
+        del Card.__new__
+
+
+@contextmanager
+def _tracing() -> Iterator[None]:
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        yield
+    finally:
+        if started:
+            tracemalloc.stop()
+
+
+class AllocationProfiler(GameProfiler):
+    """A :class:`GameProfiler` that also records allocations per section.
+
+    ``extra`` maps ``(category, key)`` to ``[slowest call seconds, Card
+    instances created, peak bytes summed over calls, largest peak bytes]``.
+    Card instances are counted inside :func:`counting_card_instances` and
+    peak bytes only with ``memory=True`` while ``tracemalloc`` is tracing.
+    ``turn_plays`` collects the cards played since the caller last reset it.
+    """
+
+    def __init__(self, memory: bool = False) -> None:
+        super().__init__()
+        self.memory = memory
+        self.extra: dict[tuple[str, str], list] = {}
+        self.turn_plays: list[str] = []
+        # Per open section: [traced bytes at entry, highest peak seen].
+        self._peaks: list[list[int]] = []
+
+    def call(self, category: str, key: str, func: Callable, *args, **kwargs):
+        if category == "card":
+            self.turn_plays.append(key)
+        created = _created[0]
+        memory = self.memory and tracemalloc.is_tracing()
+        if memory:
+            # reset_peak() is global, so fold the running peak into the
+            # enclosing section before restarting it for this one.
+            current, peak = tracemalloc.get_traced_memory()
+            if self._peaks and peak > self._peaks[-1][1]:
+                self._peaks[-1][1] = peak
+            tracemalloc.reset_peak()
+            self._peaks.append([current, current])
+        start = perf_counter()
+        try:
+            return super().call(category, key, func, *args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            entry = self.extra.get((category, key))
+            if entry is None:
+                entry = self.extra[(category, key)] = [0.0, 0, 0, 0]
+            if elapsed > entry[0]:
+                entry[0] = elapsed
+            entry[1] += _created[0] - created
+            if memory:
+                base, high = self._peaks.pop()
+                high = max(high, tracemalloc.get_traced_memory()[1])
+                if self._peaks and high > self._peaks[-1][1]:
+                    self._peaks[-1][1] = high
+                entry[2] += high - base
+                entry[3] = max(entry[3], high - base)
+
+    def merge(self, other: GameProfiler) -> None:
+        super().merge(other)
+        for section, (slowest, created, peak_total, peak_max) in getattr(other, "extra", {}).items():
+            entry = self.extra.setdefault(section, [0.0, 0, 0, 0])
+            entry[0] = max(entry[0], slowest)
+            entry[1] += created
+            entry[2] += peak_total
+            entry[3] = max(entry[3], peak_max)
+
+
+class TurnSample(NamedTuple):
+    """One player's turn, for the slowest-turns list."""
+
+    seconds: float
+    board_seed: int
+    game: int
+    turn: int
+    player: int
+    plays: tuple[str, ...]
+    cards_created: int
+
+
+class FuzzResult(NamedTuple):
+    """What one board's games produced."""
+
+    board_seed: int
+    games: int
+    stats: dict[tuple[str, str], list]
+    extra: dict[tuple[str, str], list]
+    turns: list[TurnSample]
+    failures: list[tuple[int, int, int, str]]  # (board seed, game, turn, error)
+    seconds: float
+
+
+def _new_game(board: RandomBoard, players: int, profiler: Optional[GameProfiler]) -> GameState:
+    config = board.config
+    state = GameState(players=[], supply={})
+    state.log_callback = lambda *_: None
+    state.set_profiler(profiler)
+    state.initialize_game(
+        [RandomAI() for _ in range(players)],
+        [get_card(name) for name in config.kingdom_cards],
+        use_shelters=board.use_shelters,
+        events=[get_event(name) for name in config.events],
+        projects=[get_project(name) for name in config.projects],
+        ways=[get_way(name) for name in config.ways],
+        landmarks=[get_landmark(name) for name in config.landmarks],
+        allies=[get_ally(name) for name in config.allies],
+        traits=config.traits,
+    )
+    return state
+
+
+def start_game(board_seed: int, game: int, players: int = 2, profiler: Optional[GameProfiler] = None) -> GameState:
+    """Set up game ``game`` of the fuzz on the board for ``board_seed``."""
+    random.seed(f"{board_seed}:{game}")
+    return _new_game(random_board(board_seed), players, profiler)
+
+
+def play_turns(
+    state: GameState,
+    on_turn: Optional[Callable[[GameState, int, int, float, int], None]] = None,
+) -> GameState:
+    """Play ``state`` to the end, timing each player's turn.
+
+    ``on_turn(state, turn, player, seconds, cards_created)`` runs after
+    each turn. Exceptions (including ``PhaseStepLimitExceeded``) propagate
+    with ``state`` left at the failing turn.
+    """
+    profiler = state.profiler
+    turn = player = created = 0
+    start: Optional[float] = None
+
+    def finish_turn() -> None:
+        if on_turn is not None and start is not None:
+            on_turn(state, turn, player, perf_counter() - start, _created[0] - created)
+
+    while not state.is_game_over():
+        if state.phase == "start":
+            finish_turn()
+            turn, player, created = state.turn_number, state.current_player_index, _created[0]
+            if isinstance(profiler, AllocationProfiler):
+                profiler.turn_plays = []
+            start = perf_counter()
+        state.play_turn()
+    finish_turn()
+    return state
+
+
+def play_game(board_seed: int, game: int, players: int = 2, profiler: Optional[GameProfiler] = None) -> GameState:
+    """Replay game ``game`` of the fuzz on the board for ``board_seed``."""
+    return play_turns(start_game(board_seed, game, players, profiler))
+
+
+def fuzz_board(
+    board_seed: int,
+    games: int,
+    players: int = 2,
+    memory: bool = False,
+    top_turns: int = 20,
+) -> FuzzResult:
+    """Fuzz ``games`` games on one random board.
+
+    Lives at module level so it can be sent to a ProcessPoolExecutor.
+    """
+    wall = perf_counter()
+    profiler = AllocationProfiler(memory)
+    slowest: list[TurnSample] = []
+    failures: list[tuple[int, int, int, str]] = []
+    game = 0
+
+    def on_turn(state: GameState, turn: int, player: int, seconds: float, created: int) -> None:
+        sample = TurnSample(seconds, board_seed, game, turn, player, tuple(profiler.turn_plays), created)
+        if len(slowest) < top_turns:
+            heapq.heappush(slowest, sample)
+        elif top_turns:
+            heapq.heappushpop(slowest, sample)
+
+    with counting_card_instances(), _tracing() if memory else nullcontext():
+        for game in range(games):
+            state = None
+            try:
+                state = start_game(board_seed, game, players, profiler)
+                play_turns(state, on_turn)
+            except Exception as error:  # noqa: BLE001 - the fuzz records every failure
+                turn = state.turn_number if state is not None else 0
+                failures.append((board_seed, game, turn, f"{type(error).__name__}: {error}"))
+
+    return FuzzResult(
+        board_seed,
+        games,
+        profiler.stats,
+        profiler.extra,
+        sorted(slowest, reverse=True),
+        failures,
+        perf_counter() - wall,
+    )
+
+
+def rank_cards(profiler: AllocationProfiler, min_calls: int = 1) -> dict[str, list[dict[str, Any]]]:
+    """Per hook, one row per card, slowest mean self time first."""
+    ranked: dict[str, list[dict[str, Any]]] = {hook: [] for hook in HOOKS.values()}
+    for (category, key), (calls, total, own) in profiler.stats.items():
+        hook = HOOKS.get(category)
+        if hook is None or calls < min_calls:
+            continue
+        slowest, created, peak_total, peak_max = profiler.extra.get((category, key), (0.0, 0, 0, 0))
+        row = {
+            "card": key,
+            "calls": calls,
+            "mean_us": total / calls * 1e6,
+            "self_us": own / calls * 1e6,
+            "max_us": slowest * 1e6,
+            "cards_created": created / calls,
+        }
+        if profiler.memory:
+            row["peak_kib"] = peak_total / calls / 1024
+            row["max_peak_kib"] = peak_max / 1024
+        ranked[hook].append(row)
+    for rows in ranked.values():
+        rows.sort(key=lambda row: row["self_us"], reverse=True)
+    return ranked
+
+
+def run_fuzz(
+    boards: int,
+    games: int,
+    *,
+    seed: int = 0,
+    players: int = 2,
+    memory: bool = False,
+    top_turns: int = 20,
+    min_calls: int = 1,
+    processes: int = 0,
+    on_board: Optional[Callable[[FuzzResult], None]] = None,
+) -> dict[str, Any]:
+    """Fuzz ``games`` games on each of ``boards`` random boards.
+
+    Returns ``cards`` (:func:`rank_cards`), the ``top_turns`` slowest
+    ``turns``, ``failures`` and totals. With ``processes`` > 1 boards run
+    in a process pool; everything but the timings is the same either way.
+    """
+    seeds = range(seed, seed + boards)
+    results: list[FuzzResult] = []
+
+    def finished(result: FuzzResult) -> None:
+        results.append(result)
+        if on_board is not None:
+            on_board(result)
+
+    if processes <= 1:
+        for board_seed in seeds:
+            finished(fuzz_board(board_seed, games, players, memory, top_turns))
+    else:
+        with ProcessPoolExecutor(max_workers=processes, mp_context=mp.get_context("spawn")) as pool:
+            for result in pool.map(
+                fuzz_board,
+                seeds,
+                [games] * boards,
+                [players] * boards,
+                [memory] * boards,
+                [top_turns] * boards,
+                chunksize=max(1, boards // (processes * 8)),
+            ):
+                finished(result)
+
+    merged = AllocationProfiler(memory)
+    for result in results:
+        board_profile = AllocationProfiler(memory)
+        board_profile.stats, board_profile.extra = result.stats, result.extra
+        merged.merge(board_profile)
+    turns = heapq.nlargest(top_turns, (sample for result in results for sample in result.turns))
+    failures = sorted(failure for result in results for failure in result.failures)
+
+    return {
+        "boards": boards,
+        "games": boards * games,
+        "seed": seed,
+        "memory": memory,
+        "cards": rank_cards(merged, min_calls),
+        "turns": [sample._asdict() for sample in turns],
+        "failures": [
+            {"board": board_seed, "game": game, "turn": turn, "error": error}
+            for board_seed, game, turn, error in failures
+        ],
+        "seconds": sum(result.seconds for result in results),
+    }
+
+
+def _plays(plays: Sequence[str], limit: int = 6) -> str:
+    counts = Counter(plays).most_common()
+    text = ", ".join(f"{name} x{count}" if count > 1 else name for name, count in counts[:limit])
+    return text + (", ..." if len(counts) > limit else "")
+
+
+def format_report(report: dict[str, Any], top: int = 10) -> str:
+    """Render a fuzz report as plain text."""
+    lines = [
+        f"{report['boards']} boards, {report['games']} games, "
+        f"{len(report['failures'])} failed, {report['seconds']:.1f}s"
+    ]
+    for hook, rows in report["cards"].items():
+        if not rows:
+            continue
+        memory = "peak_kib" in rows[0]
+        lines.append(f"\n[{hook}] slowest by self time")
+        header = f"{'self us':>9} {'mean us':>9} {'max us':>9} {'calls':>8} {'cards':>6}"
+        lines.append(header + (f" {'peak KiB':>9}" if memory else "") + "  card")
+        for row in rows[:top]:
+            line = (
+                f"{row['self_us']:>9.1f} {row['mean_us']:>9.1f} {row['max_us']:>9.0f} "
+                f"{row['calls']:>8} {row['cards_created']:>6.1f}"
+            )
+            lines.append(line + (f" {row['peak_kib']:>9.1f}" if memory else "") + f"  {row['card']}")
+    if report["turns"]:
+        lines.append("\nslowest turns (board seed / game / turn / player)")
+        for sample in report["turns"][:top]:
+            lines.append(
+                f"{sample['seconds'] * 1000:>8.1f} ms  {sample['board_seed']}/{sample['game']}/"
+                f"{sample['turn']}/{sample['player']}  {sample['cards_created']} cards created: "
+                f"{_plays(sample['plays'])}"
+            )
+    for failure in report["failures"][:top]:
+        lines.append(f"failed {failure['board']}/{failure['game']} turn {failure['turn']}: {failure['error']}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time card hooks and turns on random boards with random play")
+    parser.add_argument("--boards", type=int, default=50, help="Random boards to sample (default: 50)")
+    parser.add_argument("--games", type=int, default=3, help="Games per board (default: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="Board k uses seed + k (default: 0)")
+    parser.add_argument("--players", type=int, default=2, help="Random players per game (default: 2)")
+    parser.add_argument("--memory", action="store_true", help="Also measure peak bytes per call (slower)")
+    parser.add_argument("--min-calls", type=int, default=5, help="Leave out cards timed fewer times")
+    parser.add_argument("--top", type=int, default=15, help="Rows per table and slowest turns kept")
+    parser.add_argument("--processes", type=int, default=0, help="Worker processes (default: run inline)")
+    parser.add_argument("--output", type=Path, default=None, help="Write the report as JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    done = 0
+
+    def progress(result: FuzzResult) -> None:
+        nonlocal done
+        done += 1
+        if done % 25 == 0 or done == args.boards:
+            logger.info("[%d/%d] boards done", done, args.boards)
+
+    report = run_fuzz(
+        args.boards,
+        args.games,
+        seed=args.seed,
+        players=args.players,
+        memory=args.memory,
+        top_turns=args.top,
+        min_calls=args.min_calls,
+        processes=args.processes,
+        on_board=progress,
+    )
+    logger.info(format_report(report, args.top))
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        logger.info("Report: %s", args.output)
+
+
+if __name__ == "__main__":
+    main()
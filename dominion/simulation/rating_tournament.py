@@ -0,0 +1,266 @@
+"""Adaptive rating tournaments (Bradley-Terry) for large strategy pools.
+
+A full round-robin costs ``N * (N - 1) / 2`` matchups and spends as many
+games on lopsided pairs as on close ones. :class:`RatingTournament`
+instead fits a Bradley-Terry model to seat-paired results, repeatedly
+plays the pair whose next games are expected to shrink rank uncertainty
+the most, and stops once every pair of adjacent strategies has separated
+confidence intervals (or the game budget runs out).
+
+The engine is independent of how games are played: it calls
+``play_pair(a, b, games, offset)`` and expects the number of games ``a``
+won, or ``None`` if the pair cannot be played (it is then never offered
+again). ``offset`` counts games already played between the pair, so
+callers can derive fresh seeds (see :func:`play_stored_matchup`).
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+# Elo-style display scale: 400 points is a factor of ten in win odds.
+_ELO_SCALE = 400 / math.log(10)
+_ELO_CENTER = 1500
+
+
+@dataclass
+class Rating:
+    """A strategy's fitted rating on the Elo scale, with its uncertainty."""
+
+    name: str
+    rating: float
+    sigma: float
+    wins: int
+    losses: int
+
+    def interval(self, z: float) -> tuple[float, float]:
+        return self.rating - z * self.sigma, self.rating + z * self.sigma
+
+
+@dataclass
+class RatingTournament:
+    """Bradley-Terry tournament with information-driven pairing.
+
+    ``batch_games`` games (rounded up to an even number so seats balance)
+    are played each round. ``z`` sets the confidence width used both for
+    the stopping rule and to decide which pairs are still ambiguous.
+    ``max_games`` caps the total; by default it equals what a round-robin
+    of ``batch_games`` per pair would cost.
+    """
+
+    names: list[str]
+    play_pair: Callable[[str, str, int, int], Optional[int]]
+    batch_games: int = 10
+    z: float = 1.96
+    max_games: Optional[int] = None
+    seed: Optional[int] = None
+    games_played: int = 0
+    wins: dict[tuple[str, str], int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if len(self.names) < 2:
+            raise ValueError("a rating tournament needs at least two strategies")
+        if len(set(self.names)) != len(self.names):
+            raise ValueError("strategy names must be unique")
+        self.batch_games += self.batch_games % 2
+        if self.max_games is None:
+            n = len(self.names)
+            self.max_games = n * (n - 1) // 2 * self.batch_games
+        self._rng = random.Random(self.seed)
+        self._strength = {name: 1.0 for name in self.names}
+        self._unplayable: set[frozenset[str]] = set()
+
+    # ------------------------------------------------------------------
+    # Results bookkeeping
+
+    def games_between(self, a: str, b: str) -> int:
+        return self.wins.get((a, b), 0) + self.wins.get((b, a), 0)
+
+    def record(self, a: str, b: str, games: int, a_wins: int) -> None:
+        """Add ``games`` results between ``a`` and ``b``."""
+        self.wins[(a, b)] = self.wins.get((a, b), 0) + a_wins
+        self.wins[(b, a)] = self.wins.get((b, a), 0) + games - a_wins
+        self.games_played += games
+
+    # ------------------------------------------------------------------
+    # Model
+
+    def fit(self, iterations: int = 500, tolerance: float = 1e-9) -> None:
+        """Fit Bradley-Terry strengths with Hunter's MM updates.
+
+        Every strategy also gets one virtual win and one virtual loss
+        against a fixed opponent of strength 1. This acts as a weak prior:
+        unbeaten or winless strategies keep finite ratings and the scale
+        stays anchored.
+        """
+        opponents: dict[str, list[tuple[str, int]]] = {name: [] for name in self.names}
+        total_wins = {name: 1 for name in self.names}
+        for (a, b), a_wins in self.wins.items():
+            total_wins[a] += a_wins
+            if a < b:
+                games = self.games_between(a, b)
+                opponents[a].append((b, games))
+                opponents[b].append((a, games))
+
+        strength = self._strength
+        for _ in range(iterations):
+            delta = 0.0
+            for name in self.names:
+                s = strength[name]
+                denom = 2 / (s + 1)
+                for other, games in opponents[name]:
+                    denom += games / (s + strength[other])
+                updated = total_wins[name] / denom
+                delta = max(delta, abs(math.log(updated / s)))
+                strength[name] = updated
+            if delta < tolerance:
+                break
+
+    def win_probability(self, a: str, b: str) -> float:
+        sa, sb = self._strength[a], self._strength[b]
+        return sa / (sa + sb)
+
+    def ratings(self) -> list[Rating]:
+        """Current ratings, best first.
+
+        ``sigma`` comes from each strategy's own Fisher information, which
+        ignores correlations between ratings but is cheap and conservative
+        enough to drive pairing and stopping.
+        """
+        info = {name: 0.0 for name in self.names}
+        wins = {name: 0 for name in self.names}
+        losses = {name: 0 for name in self.names}
+        for name in self.names:
+            s = self._strength[name]
+            p = s / (s + 1)
+            info[name] += 2 * p * (1 - p)
+        for (a, b), a_wins in self.wins.items():
+            wins[a] += a_wins
+            losses[b] += a_wins
+            if a < b:
+                p = self.win_probability(a, b)
+                games = self.games_between(a, b)
+                info[a] += games * p * (1 - p)
+                info[b] += games * p * (1 - p)
+
+        thetas = {name: math.log(self._strength[name]) for name in self.names}
+        mean_theta = sum(thetas.values()) / len(thetas)
+        result = []
+        for name in self.names:
+            result.append(
+                Rating(
+                    name=name,
+                    rating=_ELO_CENTER + _ELO_SCALE * (thetas[name] - mean_theta),
+                    sigma=_ELO_SCALE / math.sqrt(info[name]),
+                    wins=wins[name],
+                    losses=losses[name],
+                )
+            )
+        result.sort(key=lambda r: r.rating, reverse=True)
+        return result
+
+    # ------------------------------------------------------------------
+    # Pairing and stopping
+
+    def is_resolved(self) -> bool:
+        """True when every adjacent pair in the ranking has separated intervals."""
+        ranked = self.ratings()
+        return all(
+            upper.interval(self.z)[0] > lower.interval(self.z)[1]
+            for upper, lower in zip(ranked, ranked[1:])
+        )
+
+    def next_pair(self) -> Optional[tuple[str, str]]:
+        """Pick the pair whose next games are expected to teach us the most.
+
+        Only pairs with overlapping intervals are candidates (their order
+        is still in doubt). A game between ``a`` and ``b`` carries Fisher
+        information ``p * (1 - p)`` about their rating difference, and it
+        helps most where that difference is still uncertain, so the score
+        is ``p * (1 - p) * (sigma_a^2 + sigma_b^2)``. Ties are broken at
+        random. Returns ``None`` when no playable pair is left.
+        """
+        ranked = self.ratings()
+        best_score = -1.0
+        best: list[tuple[str, str]] = []
+        for i, ra in enumerate(ranked):
+            low_a = ra.interval(self.z)[0]
+            for rb in ranked[i + 1 :]:
+                if rb.interval(self.z)[1] < low_a:
+                    # Upper bounds are not sorted when sigmas differ, so a
+                    # later, wider interval may still overlap.
+                    continue
+                if frozenset((ra.name, rb.name)) in self._unplayable:
+                    continue
+                p = self.win_probability(ra.name, rb.name)
+                score = p * (1 - p) * (ra.sigma ** 2 + rb.sigma ** 2)
+                if score > best_score + 1e-12:
+                    best_score, best = score, [(ra.name, rb.name)]
+                elif abs(score - best_score) <= 1e-12:
+                    best.append((ra.name, rb.name))
+        if not best:
+            # Every adjacent pair is separated; refine the closest one.
+            adjacent = [
+                (upper.name, lower.name)
+                for upper, lower in zip(ranked, ranked[1:])
+                if frozenset((upper.name, lower.name)) not in self._unplayable
+            ]
+            if not adjacent:
+                return None
+            best = [min(adjacent, key=lambda pair: abs(self.win_probability(*pair) - 0.5))]
+        return self._rng.choice(best)
+
+    def run(self, progress: Optional[Callable[[str, str, int, int], None]] = None) -> list[Rating]:
+        """Play rounds until the ranking is resolved or the budget is spent.
+
+        Each strategy first plays one batch against its neighbour in a
+        shuffled ring, so the comparison graph is connected before
+        information-driven pairing takes over. ``progress`` is called after
+        every batch with ``(a, b, games, a_wins)``.
+        """
+        ring = list(self.names)
+        self._rng.shuffle(ring)
+        pairs = list(zip(ring, ring[1:] + ring[:1])) if len(ring) > 2 else [(ring[0], ring[1])]
+        for a, b in pairs:
+            if self.games_played + self.batch_games > self.max_games:
+                break
+            self._play(a, b, progress)
+        self.fit()
+
+        while self.games_played + self.batch_games <= self.max_games and not self.is_resolved():
+            pair = self.next_pair()
+            if pair is None:
+                break
+            self._play(*pair, progress)
+            self.fit()
+        return self.ratings()
+
+    def _play(self, a: str, b: str, progress) -> None:
+        offset = self.games_between(a, b)
+        a_wins = self.play_pair(a, b, self.batch_games, offset)
+        if a_wins is None:
+            self._unplayable.add(frozenset((a, b)))
+            return
+        self.record(a, b, self.batch_games, a_wins)
+        if progress is not None:
+            progress(a, b, self.batch_games, a_wins)
+
+
+def ratings_to_leaderboard(ratings: list[Rating], z: float = 1.96) -> dict[str, dict]:
+    """Convert ratings to the results dict used by ``generate_leaderboard_html``."""
+    results = {}
+    for r in ratings:
+        games = r.wins + r.losses
+        low, high = r.interval(z)
+        results[r.name] = {
+            "wins": r.wins,
+            "losses": r.losses,
+            "win_rate": r.wins / games * 100 if games else 0.0,
+            "rating": r.rating,
+            "rating_low": low,
+            "rating_high": high,
+        }
+    return results
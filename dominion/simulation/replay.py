@@ -0,0 +1,409 @@
+"""Compact binary game replays and deterministic re-simulation.
+
+Text logs cost a file handler and kilobytes per game, so long runs only
+log every ``log_frequency``-th game. A replay instead stores what is
+needed to play a game again:
+
+* the seed the global RNG was reset to before the game,
+* the board (kingdom, landscapes, traits, shelters),
+* each seat's strategy name plus a short fingerprint of its rules,
+* the final scores and turn count, and
+* every AI decision, encoded as a small integer (usually the index of the
+  chosen option among the arguments offered to the AI).
+
+A record is usually a few hundred bytes. The engine only draws randomness
+from the seeded global RNG, so :func:`replay_game` re-simulates a game with
+full file logging and checks the re-played decisions against the stored
+ones; the first mismatch is reported, which also exposes engine or strategy
+changes made since the game was recorded.
+
+File layout: ``MAGIC`` followed by records, each a varint length and a
+zlib-compressed body, so writers can append to an existing file.
+
+Usage::
+
+    python -m dominion.simulation.replay games.replay --list
+    python -m dominion.simulation.replay games.replay --game 42
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import random
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Optional, Union
+
+log = logging.getLogger(__name__)
+
+MAGIC = b"DRPL\x01"
+
+# AI methods whose return value is a decision worth recording.
+_DECISION_PREFIXES = ("choose_", "should_", "order_")
+_decision_methods_cache: dict[type, tuple[str, ...]] = {}
+
+# Low two bits of every decision code.
+_TAG_SPECIAL = 0  # None / False / True / hashed other value
+_TAG_INDEX = 1  # index of the result in a list argument
+_TAG_INT = 2  # zigzag-encoded integer
+_TAG_SEQUENCE = 3  # length, followed by one code per element
+
+
+# ---------------------------------------------------------------------------
+# Varints
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _read_varint_from(stream: BinaryIO) -> Optional[int]:
+    value = shift = 0
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            if shift:
+                raise ValueError("truncated replay record")
+            return None
+        value |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
+
+
+# ---------------------------------------------------------------------------
+# Decision encoding
+
+
+def _find_index(value: Any, args: tuple, kwargs: dict) -> Optional[int]:
+    containers = [arg for arg in (*args, *kwargs.values()) if isinstance(arg, (list, tuple))]
+    for container in containers:
+        for i, item in enumerate(container):
+            if item is value:
+                return i
+    if isinstance(value, (str, int)):
+        for container in containers:
+            for i, item in enumerate(container):
+                if type(item) is type(value) and item == value:
+                    return i
+    return None
+
+
+def encode_decision(result: Any, args: tuple = (), kwargs: Optional[dict] = None) -> list[int]:
+    """Encode one AI decision as a list of non-negative integer codes."""
+    kwargs = kwargs or {}
+    if result is None:
+        return [_TAG_SPECIAL]
+    if isinstance(result, bool):
+        return [((1 + result) << 2) | _TAG_SPECIAL]
+    index = _find_index(result, args, kwargs)
+    if index is not None:
+        return [(index << 2) | _TAG_INDEX]
+    if isinstance(result, int):
+        zigzag = result * 2 if result >= 0 else -result * 2 - 1
+        return [(zigzag << 2) | _TAG_INT]
+    if isinstance(result, (list, tuple)):
+        codes = [(len(result) << 2) | _TAG_SEQUENCE]
+        for item in result:
+            codes.extend(encode_decision(item, args, kwargs))
+        return codes
+    # Anything else is summarized by a stable hash of its name.
+    key = getattr(result, "name", None) or type(result).__name__
+    return [((3 + (zlib.crc32(str(key).encode("utf-8")) & 0xFFFF)) << 2) | _TAG_SPECIAL]
+
+
+def _decision_methods(cls: type) -> tuple[str, ...]:
+    names = _decision_methods_cache.get(cls)
+    if names is None:
+        names = tuple(
+            name
+            for name in dir(cls)
+            if name.startswith(_DECISION_PREFIXES) and callable(getattr(cls, name, None))
+        )
+        _decision_methods_cache[cls] = names
+    return names
+
+
+class DecisionRecorder:
+    """Collect the decisions of one or more AIs into a single code stream.
+
+    :meth:`attach` wraps every ``choose_*``, ``should_*`` and ``order_*``
+    method on the AI instance (wrapping whatever is bound at the time, so
+    it composes with other instrumentation). Decisions from all attached
+    AIs interleave in the order the engine asks for them.
+    """
+
+    def __init__(self) -> None:
+        self.codes: list[int] = []
+        self.decisions = 0
+
+    def attach(self, ai: Any) -> None:
+        for name in _decision_methods(type(ai)):
+            setattr(ai, name, self._wrap(getattr(ai, name)))
+
+    def _wrap(self, method):
+        codes = self.codes
+
+        def recorded(*args, **kwargs):
+            result = method(*args, **kwargs)
+            codes.extend(encode_decision(result, args, kwargs))
+            self.decisions += 1
+            return result
+
+        return recorded
+
+    def to_bytes(self) -> bytes:
+        out = bytearray()
+        for code in self.codes:
+            _write_varint(out, code)
+        return bytes(out)
+
+
+def decode_codes(data: bytes) -> list[int]:
+    """Decode a decision stream back into its integer codes."""
+    codes = []
+    pos = 0
+    while pos < len(data):
+        code, pos = _read_varint(data, pos)
+        codes.append(code)
+    return codes
+
+
+# ---------------------------------------------------------------------------
+# Records
+
+
+@dataclass
+class ReplayRecord:
+    """Everything needed to re-simulate one game. Seats are in turn order."""
+
+    seed: int
+    kingdom: list[str]
+    strategies: list[str]
+    fingerprints: list[str]
+    scores: list[int]
+    turns: int
+    decisions: bytes
+    landscapes: dict[str, list[str]] = field(default_factory=dict)
+    traits: dict[str, str] = field(default_factory=dict)
+    use_shelters: bool = False
+
+    def to_bytes(self) -> bytes:
+        header = {"k": self.kingdom, "s": self.strategies, "f": self.fingerprints, "r": self.scores}
+        if self.landscapes:
+            header["l"] = self.landscapes
+        if self.traits:
+            header["t"] = self.traits
+        if self.use_shelters:
+            header["sh"] = 1
+        body = bytearray()
+        _write_varint(body, self.seed)
+        _write_varint(body, self.turns)
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        _write_varint(body, len(header_bytes))
+        body += header_bytes
+        body += self.decisions
+        return zlib.compress(bytes(body), 9)
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> ReplayRecord:
+        body = zlib.decompress(payload)
+        seed, pos = _read_varint(body, 0)
+        turns, pos = _read_varint(body, pos)
+        size, pos = _read_varint(body, pos)
+        header = json.loads(body[pos : pos + size])
+        return cls(
+            seed=seed,
+            kingdom=header["k"],
+            strategies=header["s"],
+            fingerprints=header["f"],
+            scores=header["r"],
+            turns=turns,
+            decisions=body[pos + size :],
+            landscapes=header.get("l", {}),
+            traits=header.get("t", {}),
+            use_shelters=bool(header.get("sh")),
+        )
+
+
+class ReplayWriter:
+    """Append replay records to a file, creating it with a header if needed."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        self.records_written = 0
+
+    def __enter__(self) -> ReplayWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, record: ReplayRecord) -> None:
+        payload = record.to_bytes()
+        prefix = bytearray()
+        _write_varint(prefix, len(payload))
+        self._file.write(prefix)
+        self._file.write(payload)
+        self.records_written += 1
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def read_replays(path: Union[str, Path]) -> Iterator[ReplayRecord]:
+    """Yield every record stored in ``path``, in the order written."""
+    with open(path, "rb") as stream:
+        if stream.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a replay file")
+        while True:
+            size = _read_varint_from(stream)
+            if size is None:
+                return
+            payload = stream.read(size)
+            if len(payload) != size:
+                raise ValueError("truncated replay record")
+            yield ReplayRecord.from_bytes(payload)
+
+
+def load_replay(path: Union[str, Path], index: int) -> ReplayRecord:
+    """Return the ``index``-th record (0-based) in ``path``."""
+    for i, record in enumerate(read_replays(path)):
+        if i == index:
+            return record
+    raise IndexError(f"{path} has no game {index}")
+
+
+def short_fingerprint(strategy: Any) -> str:
+    from dominion.simulation.result_store import strategy_fingerprint
+
+    return strategy_fingerprint(strategy)[:16]
+
+
+# ---------------------------------------------------------------------------
+# Re-simulation
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of re-simulating a recorded game."""
+
+    scores: list[int]
+    turns: int
+    log_path: Optional[str]
+    diverged_at: Optional[int]
+    changed_strategies: list[str]
+
+    @property
+    def matches(self) -> bool:
+        return self.diverged_at is None
+
+
+def _first_difference(expected: list[int], actual: list[int]) -> Optional[int]:
+    for i, (a, b) in enumerate(zip(expected, actual)):
+        if a != b:
+            return i
+    if len(expected) != len(actual):
+        return min(len(expected), len(actual))
+    return None
+
+
+def replay_game(record: ReplayRecord, log_folder: str = "replay_logs") -> ReplayResult:
+    """Play ``record`` again with every event logged to ``log_folder``.
+
+    Strategies are looked up by name; a fingerprint mismatch means the
+    strategy changed since recording and the replay will likely diverge.
+    ``diverged_at`` is the index of the first decision code that differs.
+    """
+    from dominion.ai.genetic_ai import GeneticAI
+    from dominion.boards.loader import BoardConfig
+    from dominion.simulation.strategy_battle import StrategyBattle
+
+    board = BoardConfig(kingdom_cards=list(record.kingdom), traits=dict(record.traits), **record.landscapes)
+    battle = StrategyBattle(
+        log_folder=log_folder,
+        use_shelters=record.use_shelters,
+        board_config=board,
+        log_frequency=1,
+    )
+
+    strategies = []
+    changed = []
+    for name, fingerprint in zip(record.strategies, record.fingerprints):
+        strategy = battle.strategy_loader.get_strategy(name)
+        if strategy is None:
+            raise ValueError(f"Unknown strategy in replay: {name}")
+        if short_fingerprint(strategy) != fingerprint:
+            log.warning("Strategy %s changed since this game was recorded", name)
+            changed.append(name)
+        strategies.append(strategy)
+
+    random.seed(record.seed)
+    recorder = DecisionRecorder()
+    ais = [GeneticAI(strategy) for strategy in strategies]
+    for ai in ais:
+        recorder.attach(ai)
+    _winner, scores, log_path, turns = battle.run_multiplayer_game(ais, list(record.kingdom), **record.landscapes)
+
+    return ReplayResult(
+        scores=[scores[ai.name] for ai in ais],
+        turns=turns,
+        log_path=log_path,
+        diverged_at=_first_difference(decode_codes(record.decisions), recorder.codes),
+        changed_strategies=changed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List or re-simulate recorded Dominion games")
+    parser.add_argument("replay_file", type=Path, help="File written with --replays")
+    parser.add_argument("--list", action="store_true", help="List the recorded games")
+    parser.add_argument("--game", type=int, help="Re-simulate game N (0-based) with full logging")
+    parser.add_argument("--log-folder", default="replay_logs", help="Where to write the replayed game's log")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.list or args.game is None:
+        for i, record in enumerate(read_replays(args.replay_file)):
+            seats = " vs ".join(f"{name} ({score})" for name, score in zip(record.strategies, record.scores))
+            log.info("%6d  seed=%d  turns=%d  %s", i, record.seed, record.turns, seats)
+        return
+
+    record = load_replay(args.replay_file, args.game)
+    result = replay_game(record, log_folder=args.log_folder)
+    log.info("Log written to %s", result.log_path)
+    if result.matches and result.scores == record.scores:
+        log.info("Replay matches the recorded game.")
+    else:
+        log.warning(
+            "Replay diverged at decision code %s (scores %s, recorded %s)",
+            result.diverged_at,
+            result.scores,
+            record.scores,
+        )
+
+
+if __name__ == "__main__":
+    main()
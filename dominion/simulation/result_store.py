@@ -0,0 +1,323 @@
+"""Persistent, content-addressed store of head-to-head game results.
+
+Tournament tools replay every pairing on each run even when only one
+strategy changed. :class:`ResultStore` keeps every finished game in a
+local SQLite file keyed by
+
+* a fingerprint of each strategy's rules (card names and the ``_source``
+  of every condition, plus the source of any custom strategy class),
+* a fingerprint of the board,
+* the game's seed, and
+* :func:`engine_source_hash`, a hash of the source of every module that
+  decides how a game plays out.
+
+:func:`play_stored_matchup` plays only the games that are missing from the
+store and aggregates the rest from disk, so re-running a 30-strategy
+leaderboard after adding one strategy costs that strategy's pairings only.
+Rows written under another engine version are never read, so any edit to
+the rules, cards or AI makes old results stale without a manual bump.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import random
+import sqlite3
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Union
+
+from dominion.ai.genetic_ai import GeneticAI
+from dominion.strategy.enhanced_strategy import EnhancedStrategy
+
+# Sources under the ``dominion`` package that decide a game's outcome.
+# Strategy definitions are hashed per strategy (strategy_fingerprint) and
+# boards per board, so neither is part of the engine version.
+ENGINE_SOURCES = (
+    "game",
+    "cards",
+    "ai",
+    "events",
+    "projects",
+    "ways",
+    "landmarks",
+    "allies",
+    "traits",
+    "prophecies",
+    "artifacts",
+    "strategy",
+    "boons.py",
+    "hexes.py",
+    "simulation/strategy_battle.py",
+)
+_ENGINE_EXCLUDES = ("strategy/strategies/",)
+_PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+_RULE_LISTS = ("gain_priority", "action_priority", "treasure_priority", "trash_priority")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    strategy_a TEXT NOT NULL,
+    strategy_b TEXT NOT NULL,
+    board TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    engine_version TEXT NOT NULL,
+    a_won INTEGER NOT NULL,
+    a_score INTEGER NOT NULL,
+    b_score INTEGER NOT NULL,
+    turns INTEGER NOT NULL,
+    PRIMARY KEY (strategy_a, strategy_b, board, seed, engine_version)
+)
+"""
+
+
+def _digest(parts: Iterable[str]) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def engine_source_hash(root: Path = _PACKAGE_ROOT) -> str:
+    """Hash the engine modules under ``root`` (the ``dominion`` package)."""
+    parts = []
+    for entry in ENGINE_SOURCES:
+        path = root / entry
+        files = sorted(path.rglob("*.py")) if path.is_dir() else [path]
+        for file in files:
+            name = file.relative_to(root).as_posix()
+            if name.startswith(_ENGINE_EXCLUDES) or not file.is_file():
+                continue
+            parts.append(name)
+            parts.append(file.read_text(encoding="utf-8"))
+    return _digest(parts)[:16]
+
+
+def _condition_source(condition) -> str:
+    if condition is None:
+        return "None"
+    source = getattr(condition, "_source", None)
+    if source:
+        return source
+    # Plain lambdas have no ``_source``, and their repr embeds a memory
+    # address that changes from run to run.
+    try:
+        return inspect.getsource(condition).strip()
+    except (OSError, TypeError):
+        return getattr(condition, "__qualname__", None) or type(condition).__name__
+
+
+def strategy_fingerprint(strategy: EnhancedStrategy) -> str:
+    """Hash a strategy's serialized rules.
+
+    Strategies that subclass :class:`EnhancedStrategy` with custom methods
+    also hash their class source, so editing that code invalidates their
+    stored games.
+    """
+    parts = [strategy.name]
+    for list_name in _RULE_LISTS:
+        parts.append(list_name)
+        for rule in getattr(strategy, list_name, []):
+            parts.append(f"{rule.card_name}|{_condition_source(rule.condition)}")
+    parts.append("way_policy")
+    for rule in getattr(strategy, "way_policy", []):
+        parts.append(f"{rule.card_name}|{rule.way_name}|{_condition_source(rule.condition)}")
+
+    cls = type(strategy)
+    if cls is not EnhancedStrategy:
+        try:
+            parts.append(inspect.getsource(cls))
+        except (OSError, TypeError):
+            parts.append(f"{cls.__module__}.{cls.__qualname__}")
+    return _digest(parts)
+
+
+def board_fingerprint(
+    board_path: Optional[Union[str, Path]] = None,
+    kingdom_cards: Optional[Iterable[str]] = None,
+    **landscapes: Optional[Iterable[str]],
+) -> str:
+    """Hash a board file's contents, or an explicit kingdom and landscapes.
+
+    Use ``board_path`` when games are played on a board file; tools that
+    derive the kingdom from the strategies pass the card names instead.
+    """
+    if board_path is not None:
+        return hashlib.sha256(Path(board_path).read_bytes()).hexdigest()
+    parts = ["kingdom", *sorted(kingdom_cards or [])]
+    for kind in sorted(landscapes):
+        parts.append(kind)
+        parts.extend(sorted(landscapes[kind] or []))
+    return _digest(parts)
+
+
+@dataclass(frozen=True)
+class StoredGame:
+    """One finished game, seen from strategy A's side."""
+
+    a_won: bool
+    a_score: int
+    b_score: int
+    turns: int
+
+    def flipped(self) -> StoredGame:
+        return StoredGame(not self.a_won, self.b_score, self.a_score, self.turns)
+
+
+@dataclass
+class MatchupResult:
+    """Aggregate of a matchup's games, from strategy A's side."""
+
+    games: int = 0
+    a_wins: int = 0
+    a_total_score: int = 0
+    b_total_score: int = 0
+    total_turns: int = 0
+    played: int = 0
+
+    @property
+    def b_wins(self) -> int:
+        return self.games - self.a_wins
+
+    def add(self, game: StoredGame) -> None:
+        self.games += 1
+        self.a_wins += game.a_won
+        self.a_total_score += game.a_score
+        self.b_total_score += game.b_score
+        self.total_turns += game.turns
+
+
+class ResultStore:
+    """SQLite-backed cache of game results.
+
+    Pairs are stored in a canonical order (lower fingerprint first), so A
+    vs B and B vs A share rows. :meth:`record` does not commit: rows are
+    written in one transaction on :meth:`commit` or :meth:`close`, so a
+    tournament that keeps one store open pays for a single commit.
+    Several processes may write to the same file; SQLite serializes the
+    transactions, so concurrent writers should commit per matchup.
+    """
+
+    def __init__(self, path: Union[str, Path], engine_version: Optional[str] = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.engine_version = engine_version or engine_source_hash()
+        self._conn = sqlite3.connect(str(self.path), timeout=60)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def __enter__(self) -> ResultStore:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def commit(self) -> None:
+        """Write every game recorded since the last commit."""
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+    def lookup(self, strategy_a: str, strategy_b: str, board: str, seeds: Iterable[int]) -> dict[int, StoredGame]:
+        """Return the stored games among ``seeds``, from ``strategy_a``'s side."""
+        swap = strategy_a > strategy_b
+        first, second = (strategy_b, strategy_a) if swap else (strategy_a, strategy_b)
+        wanted = set(seeds)
+        rows = self._conn.execute(
+            "SELECT seed, a_won, a_score, b_score, turns FROM games "
+            "WHERE strategy_a = ? AND strategy_b = ? AND board = ? AND engine_version = ?",
+            (first, second, board, self.engine_version),
+        )
+        found = {}
+        for seed, a_won, a_score, b_score, turns in rows:
+            if seed in wanted:
+                game = StoredGame(bool(a_won), a_score, b_score, turns)
+                found[seed] = game.flipped() if swap else game
+        return found
+
+    def record(self, strategy_a: str, strategy_b: str, board: str, seed: int, game: StoredGame) -> None:
+        """Store one game, given from ``strategy_a``'s side."""
+        if strategy_a > strategy_b:
+            strategy_a, strategy_b = strategy_b, strategy_a
+            game = game.flipped()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO games VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                strategy_a,
+                strategy_b,
+                board,
+                seed,
+                self.engine_version,
+                int(game.a_won),
+                game.a_score,
+                game.b_score,
+                game.turns,
+            ),
+        )
+
+    def prune_stale(self) -> int:
+        """Delete rows from other engine versions; return how many were removed."""
+        cursor = self._conn.execute("DELETE FROM games WHERE engine_version != ?", (self.engine_version,))
+        self._conn.commit()
+        return cursor.rowcount
+
+
+def play_stored_matchup(
+    store: ResultStore,
+    battle: Any,
+    strategy_a: EnhancedStrategy,
+    strategy_b: EnhancedStrategy,
+    num_games: int,
+    board: str,
+    kingdom_cards: Optional[list[str]],
+    *,
+    seed: int = 0,
+    ai_factory: Callable[[EnhancedStrategy], Any] = GeneticAI,
+    **game_kwargs: Any,
+) -> MatchupResult:
+    """Aggregate ``num_games`` games of A vs B, playing only the missing ones.
+
+    Game ``i`` uses seed ``seed + i`` (the global RNG is reseeded before it
+    is played). The strategy with the lower fingerprint sits first on even
+    seeds, so a game's result does not depend on which side the caller
+    names first. ``battle`` only needs a ``StrategyBattle``-style
+    ``run_game``; ``game_kwargs`` are forwarded to it.
+    """
+    key_a = strategy_fingerprint(strategy_a)
+    key_b = strategy_fingerprint(strategy_b)
+    seeds = [seed + i for i in range(num_games)]
+    stored = store.lookup(key_a, key_b, board, seeds)
+
+    result = MatchupResult()
+    for game_seed in seeds:
+        game = stored.get(game_seed)
+        if game is None:
+            game = _play_game(battle, strategy_a, strategy_b, key_a <= key_b, game_seed, kingdom_cards, ai_factory, game_kwargs)
+            store.record(key_a, key_b, board, game_seed, game)
+            result.played += 1
+        result.add(game)
+    return result
+
+
+def _play_game(battle, strategy_a, strategy_b, a_is_canonical_first, game_seed, kingdom_cards, ai_factory, game_kwargs):
+    random.seed(game_seed)
+    ai_a = ai_factory(strategy_a)
+    ai_b = ai_factory(strategy_b)
+    a_first = a_is_canonical_first == (game_seed % 2 == 0)
+    if a_first:
+        winner, scores, _, turns = battle.run_game(ai_a, ai_b, kingdom_cards, **game_kwargs)
+    else:
+        winner, scores, _, turns = battle.run_game(ai_b, ai_a, kingdom_cards, **game_kwargs)
+    return StoredGame(
+        a_won=winner is ai_a,
+        a_score=scores.get(ai_a.name, 0),
+        b_score=scores.get(ai_b.name, 0),
+        turns=turns,
+    )
@@ -0,0 +1,334 @@
+"""Play many games on many random boards and report what goes wrong.
+
+A robustness sweep samples ``K`` boards with
+:func:`~dominion.boards.random_board.random_board` (board ``k`` uses seed
+``seed + k``) and plays ``M`` games on each, in a process pool when asked.
+Game ``j`` on the board with seed ``s`` reseeds the RNG with the string
+``"s:j"``, so any game can be replayed alone. The report covers:
+
+* crashes -- any exception while setting up or playing a game, grouped by
+  error and the innermost ``dominion`` frame, with the boards they hit;
+  runaway turns (``PhaseStepLimitExceeded``) are counted separately,
+* long games -- games reaching ``long_game_turns`` turns or the engine's
+  turn limit,
+* timing outliers -- cards whose mean ``on_play`` or gain time is far above
+  the median card's, from a :class:`GameProfiler` shared by each board's
+  games.
+
+Seats are filled by ``"random"`` (:class:`RandomAI`, the default, which
+reaches the most card code), ``"playout"`` (:class:`PlayoutAI`) or a
+strategy name, to see how a strategy holds up across kingdoms.
+
+Usage:
+    python -m dominion.simulation.robustness_sweep --boards 1000 --games 5 --processes 8
+    python -m dominion.simulation.robustness_sweep --boards 200 --players "Big Money" random \\
+        --save-boards reports/crash_boards --output reports/sweep.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import multiprocessing as mp
+import random
+import statistics
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, NamedTuple, Optional, Sequence
+
+from dominion.boards.random_board import RandomBoard, format_board, random_board
+from dominion.game.game_state import PhaseStepLimitExceeded
+from dominion.game.profiler import GameProfiler
+from dominion.simulation.strategy_battle import StrategyBattle
+
+logger = logging.getLogger(__name__)
+
+# Profiler categories checked for timing outliers.
+TIMED_CATEGORIES = ("card", "gain")
+
+
+class GameFailure(NamedTuple):
+    """One game that raised instead of finishing."""
+
+    board_seed: int
+    game: int
+    kind: str  # "step_limit" or "crash"
+    error: str
+    location: str
+
+
+class BoardResult(NamedTuple):
+    """Everything one board's games produced."""
+
+    seed: int
+    games: int
+    turns: list[int]
+    long_games: list[tuple[int, int, str]]  # (game, turns, end condition)
+    failures: list[GameFailure]
+    profile: dict[tuple[str, str], list]
+    seconds: float
+
+
+def _make_ai(spec: str, battle: StrategyBattle):
+    from dominion.ai.genetic_ai import GeneticAI
+    from dominion.ai.rollout_ai import PlayoutAI
+    from dominion.rl.random_ai import RandomAI
+
+    if spec == "random":
+        return RandomAI()
+    if spec == "playout":
+        return PlayoutAI()
+    strategy = battle.strategy_loader.get_strategy(spec)
+    if strategy is None:
+        raise ValueError(f"Could not find strategy: {spec}")
+    return GeneticAI(strategy)
+
+
+def _location(error: BaseException) -> str:
+    """``file:line in function`` of the innermost frame inside ``dominion``."""
+    frames = traceback.extract_tb(error.__traceback__)
+    inside = [frame for frame in frames if "/dominion/" in frame.filename.replace("\\", "/")]
+    frame = (inside or frames or [None])[-1]
+    if frame is None:
+        return ""
+    path = frame.filename.replace("\\", "/")
+    path = path[path.rfind("/dominion/") + 1 :] if "/dominion/" in path else path
+    return f"{path}:{frame.lineno} in {frame.name}"
+
+
+def sweep_board(
+    board_seed: int,
+    games: int,
+    players: Sequence[str] = ("random", "random"),
+    long_game_turns: int = 80,
+) -> BoardResult:
+    """Play ``games`` games on the random board for ``board_seed``.
+
+    Lives at module level so it can be sent to a ProcessPoolExecutor.
+    """
+    start = perf_counter()
+    board = random_board(board_seed)
+    battle = StrategyBattle(board_config=board.config, use_shelters=board.use_shelters, log_frequency=0)
+    profiler = GameProfiler()
+    turns: list[int] = []
+    long_games: list[tuple[int, int, str]] = []
+    failures: list[GameFailure] = []
+
+    for game in range(games):
+        random.seed(f"{board_seed}:{game}")
+        try:
+            ais = [_make_ai(spec, battle) for spec in players]
+            _, _, _, game_turns = battle.run_multiplayer_game(ais, board.config.kingdom_cards, profiler=profiler)
+        except PhaseStepLimitExceeded as error:
+            failures.append(GameFailure(board_seed, game, "step_limit", str(error), _location(error)))
+            continue
+        except Exception as error:  # noqa: BLE001 - every crash is a finding
+            failures.append(
+                GameFailure(board_seed, game, "crash", f"{type(error).__name__}: {error}", _location(error))
+            )
+            continue
+        turns.append(game_turns)
+        if game_turns >= long_game_turns or battle.last_end_condition == "turn_limit":
+            long_games.append((game, game_turns, battle.last_end_condition))
+
+    return BoardResult(board_seed, games, turns, long_games, failures, profiler.stats, perf_counter() - start)
+
+
+def timing_outliers(
+    profiler: GameProfiler, factor: float = 10.0, min_calls: int = 5
+) -> dict[str, list[dict[str, Any]]]:
+    """Cards whose mean time per call is at least ``factor`` times the median card's.
+
+    Only cards timed at least ``min_calls`` times take part. Rows are
+    :meth:`GameProfiler.report` rows plus ``ratio`` to the median.
+    """
+    report = profiler.report()
+    outliers: dict[str, list[dict[str, Any]]] = {}
+    for category in TIMED_CATEGORIES:
+        rows = [row for row in report.get(category, []) if row["calls"] >= min_calls]
+        if not rows:
+            outliers[category] = []
+            continue
+        median = statistics.median(row["mean_us"] for row in rows) or 1e-9
+        slow = [dict(row, ratio=row["mean_us"] / median) for row in rows if row["mean_us"] >= factor * median]
+        outliers[category] = sorted(slow, key=lambda row: row["mean_us"], reverse=True)
+    return outliers
+
+
+def summarize(results: Sequence[BoardResult], *, outlier_factor: float = 10.0) -> dict[str, Any]:
+    """Combine board results into the sweep report."""
+    results = sorted(results, key=lambda result: result.seed)
+    games = sum(result.games for result in results)
+    failures = [failure for result in results for failure in result.failures]
+    crashes = [failure for failure in failures if failure.kind == "crash"]
+    step_limits = [failure for failure in failures if failure.kind == "step_limit"]
+    turns = [t for result in results for t in result.turns]
+
+    groups: dict[tuple[str, str], dict[str, Any]] = {}
+    for failure in crashes:
+        group = groups.setdefault(
+            (failure.error, failure.location),
+            {"error": failure.error, "location": failure.location, "count": 0, "boards": []},
+        )
+        group["count"] += 1
+        if failure.board_seed not in group["boards"]:
+            group["boards"].append(failure.board_seed)
+
+    merged = GameProfiler()
+    for result in results:
+        board_profile = GameProfiler()
+        board_profile.stats = result.profile
+        merged.merge(board_profile)
+
+    return {
+        "boards": len(results),
+        "games": games,
+        "completed": len(turns),
+        "crashes": len(crashes),
+        "crash_rate": len(crashes) / games * 100 if games else 0.0,
+        "crash_groups": sorted(groups.values(), key=lambda group: group["count"], reverse=True),
+        "step_limit": len(step_limits),
+        "step_limit_boards": sorted({failure.board_seed for failure in step_limits}),
+        "avg_turns": sum(turns) / len(turns) if turns else 0.0,
+        "long_games": [
+            {"board": result.seed, "game": game, "turns": game_turns, "end": end}
+            for result in results
+            for game, game_turns, end in result.long_games
+        ],
+        "timing_outliers": timing_outliers(merged, factor=outlier_factor),
+        "seconds": sum(result.seconds for result in results),
+    }
+
+
+def run_sweep(
+    boards: int,
+    games: int,
+    *,
+    seed: int = 0,
+    players: Sequence[str] = ("random", "random"),
+    long_game_turns: int = 80,
+    outlier_factor: float = 10.0,
+    processes: int = 0,
+    on_board: Optional[Callable[[BoardResult], None]] = None,
+) -> dict[str, Any]:
+    """Play ``games`` games on each of ``boards`` random boards; see :func:`summarize`.
+
+    With ``processes`` > 1 boards are spread over a process pool; the
+    report is the same either way apart from timings.
+    """
+    seeds = range(seed, seed + boards)
+    players = tuple(players)
+    results: list[BoardResult] = []
+
+    def finished(result: BoardResult) -> None:
+        results.append(result)
+        if on_board is not None:
+            on_board(result)
+
+    if processes <= 1:
+        for board_seed in seeds:
+            finished(sweep_board(board_seed, games, players, long_game_turns))
+    else:
+        with ProcessPoolExecutor(max_workers=processes, mp_context=mp.get_context("spawn")) as pool:
+            futures = pool.map(
+                sweep_board,
+                seeds,
+                [games] * boards,
+                [players] * boards,
+                [long_game_turns] * boards,
+                chunksize=max(1, boards // (processes * 8)),
+            )
+            for result in futures:
+                finished(result)
+
+    return summarize(results, outlier_factor=outlier_factor)
+
+
+def save_board(board: RandomBoard, directory: str | Path) -> Path:
+    """Write ``board`` as ``random_<seed>.txt`` for ``load_board``."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"random_{board.seed}.txt"
+    header = f"# random_board({board.seed}){', with Shelters' if board.use_shelters else ''}\n"
+    path.write_text(header + format_board(board.config), encoding="utf-8")
+    return path
+
+
+def format_report(report: dict[str, Any], top: int = 10) -> str:
+    """Render a sweep report as plain text."""
+    lines = [
+        f"{report['boards']} boards, {report['games']} games, {report['completed']} completed "
+        f"in {report['seconds']:.1f}s (avg {report['avg_turns']:.1f} turns)",
+        f"crashes: {report['crashes']} ({report['crash_rate']:.2f}%), "
+        f"step limit: {report['step_limit']}, long games: {len(report['long_games'])}",
+    ]
+    for group in report["crash_groups"][:top]:
+        boards = ", ".join(str(seed) for seed in group["boards"][:5])
+        lines.append(f"  {group['count']:>5}x {group['error']}")
+        lines.append(f"         at {group['location']} (boards {boards})")
+    for category, rows in report["timing_outliers"].items():
+        if rows:
+            lines.append(f"slow {category}:")
+            for row in rows[:top]:
+                lines.append(f"  {row['key']}: {row['mean_us']:.0f} us/call ({row['ratio']:.0f}x median, {row['calls']} calls)")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Play games on random boards and report crashes and outliers")
+    parser.add_argument("--boards", type=int, default=100, help="Random boards to sample (default: 100)")
+    parser.add_argument("--games", type=int, default=5, help="Games per board (default: 5)")
+    parser.add_argument("--seed", type=int, default=0, help="Board k uses seed + k (default: 0)")
+    parser.add_argument(
+        "--players",
+        nargs="+",
+        default=["random", "random"],
+        help='One entry per seat: "random", "playout" or a strategy name (default: two random seats)',
+    )
+    parser.add_argument("--long-game-turns", type=int, default=80, help="Report games this long (default: 80)")
+    parser.add_argument("--outlier-factor", type=float, default=10.0, help="Slow-card threshold vs the median")
+    parser.add_argument("--processes", type=int, default=0, help="Worker processes (default: run inline)")
+    parser.add_argument("--save-boards", type=Path, default=None, help="Directory for boards that crashed")
+    parser.add_argument("--output", type=Path, default=None, help="Write the report as JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    done = 0
+
+    def progress(result: BoardResult) -> None:
+        nonlocal done
+        done += 1
+        if result.failures:
+            logger.info("board %d: %d failed games", result.seed, len(result.failures))
+        if done % 50 == 0 or done == args.boards:
+            logger.info("[%d/%d] boards done", done, args.boards)
+
+    report = run_sweep(
+        args.boards,
+        args.games,
+        seed=args.seed,
+        players=args.players,
+        long_game_turns=args.long_game_turns,
+        outlier_factor=args.outlier_factor,
+        processes=args.processes,
+        on_board=progress,
+    )
+    logger.info(format_report(report))
+
+    if args.save_boards is not None:
+        failing = {seed for group in report["crash_groups"] for seed in group["boards"]}
+        failing.update(report["step_limit_boards"])
+        for board_seed in sorted(failing):
+            save_board(random_board(board_seed), args.save_boards)
+        logger.info("Saved %d boards to %s", len(failing), args.save_boards)
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        logger.info("Report: %s", args.output)
+
+
+if __name__ == "__main__":
+    main()
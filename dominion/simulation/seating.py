@@ -0,0 +1,54 @@
+"""Seat rotation and finishing order for games with more than two players.
+
+Two-player battles cancel first-player advantage by swapping seats every
+other game. With ``n`` seats the same idea is a cyclic rotation:
+:func:`seat_schedule` returns ``n`` seatings in which every player sits in
+every seat exactly once, the fewest games that can cancel seat bias. When
+one strategy is evaluated against copies of a single opponent (the genetic
+trainer's case) the opponents are interchangeable, so the rotation also
+cancels who-sits-next-to-whom effects such as which player receives an
+attacker's Curses first.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, TypeVar
+
+T = TypeVar("T")
+
+MIN_PLAYERS = 2
+MAX_PLAYERS = 6
+
+
+def check_player_count(players: int) -> int:
+    """Return ``players`` if the engine supports that many seats."""
+    if not MIN_PLAYERS <= players <= MAX_PLAYERS:
+        raise ValueError(f"games need {MIN_PLAYERS}-{MAX_PLAYERS} players, got {players}")
+    return players
+
+
+def seat_schedule(players: int) -> list[tuple[int, ...]]:
+    """Seatings that put each of ``players`` players in each seat once.
+
+    Entry ``r`` lists player indices in seat order (seat 0 goes first).
+    For two players this is ``[(0, 1), (1, 0)]``, the usual alternation.
+    """
+    check_player_count(players)
+    return [tuple((seat + shift) % players for seat in range(players)) for shift in range(players)]
+
+
+def seating(items: Sequence[T], game_num: int) -> list[T]:
+    """``items`` in the seat order game ``game_num`` uses under :func:`seat_schedule`."""
+    n = len(items)
+    shift = game_num % n
+    return [items[(seat + shift) % n] for seat in range(n)]
+
+
+def placement_score(place: int, players: int) -> float:
+    """Map a finishing place (0 = first) onto 100 for first down to 0 for last.
+
+    With two players this is the win rate contribution of one game (100 for
+    the winner, 0 for the loser); with more players it also rewards
+    finishing second over finishing last.
+    """
+    return 100.0 * (players - 1 - place) / (players - 1)
@@ -1,11 +1,12 @@
 import argparse
 import logging
+import random
 import re
 from dataclasses import dataclass
 from datetime import datetime
 from logging import getLogger
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from dominion.ai.genetic_ai import GeneticAI
 from dominion.allies.registry import ALLY_TYPES, get_ally
@@ -13,10 +14,15 @@ from dominion.boards.loader import BoardConfig, load_board
 from dominion.cards.registry import CARD_ALIASES, CARD_TYPES, get_card
 from dominion.events.registry import EVENT_TYPES, get_event
 from dominion.game.game_state import GameState
+from dominion.game.profiler import GameProfiler, format_profile
 from dominion.landmarks.registry import LANDMARK_TYPES, get_landmark
 from dominion.projects.registry import PROJECT_TYPES, get_project
 from dominion.reporting.html_report import generate_html_report
+from dominion.reporting.streaming_report import StreamingBattleReport
+from dominion.simulation.columnar_export import ColumnarResultWriter, end_condition, game_row
 from dominion.simulation.game_logger import GameLogger
+from dominion.simulation.replay import DecisionRecorder, ReplayRecord, ReplayWriter, short_fingerprint
+from dominion.simulation.seating import check_player_count, placement_score, seating
 from dominion.strategy.enhanced_strategy import EnhancedStrategy, PriorityRule
 from dominion.strategy.strategy_loader import StrategyLoader
 from dominion.traits import apply_trait
@@ -106,6 +112,9 @@ class StrategyBattle:
         self.strategy_loader = StrategyLoader()  # Now automatically loads all strategies
         self.use_shelters = use_shelters
         self.verbose = verbose
+        self.last_end_condition: Optional[str] = None
+        # Names of the last game's AIs from first place to last.
+        self.last_placements: list[str] = []
 
     def _extract_cards_from_strategy(self, strat: EnhancedStrategy) -> set[str]:
         """Return all names referenced by a strategy's priority lists."""
@@ -184,9 +193,9 @@ class StrategyBattle:
         return StrategyBoardReferences(kingdom_cards, events, projects, ways, landmarks, allies)
 
     def _determine_board_references(
-        self, strat1: EnhancedStrategy, strat2: EnhancedStrategy
+        self, strat1: EnhancedStrategy, strat2: EnhancedStrategy, *others: EnhancedStrategy
     ) -> StrategyBoardReferences:
-        """Compute cards and landscapes from both strategies if not explicitly set."""
+        """Compute cards and landscapes from every strategy if not explicitly set."""
         if self.kingdom_cards is not None:
             if self.board_config:
                 return StrategyBoardReferences(
@@ -200,6 +209,8 @@ class StrategyBattle:
             return StrategyBoardReferences(self.kingdom_cards, [], [], [], [], [])
 
         all_names = self._extract_cards_from_strategy(strat1) | self._extract_cards_from_strategy(strat2)
+        for strat in others:
+            all_names |= self._extract_cards_from_strategy(strat)
         return self._split_board_references(all_names)
 
     def _determine_kingdom_cards(self, strat1: EnhancedStrategy, strat2: EnhancedStrategy) -> list[str]:
@@ -355,8 +366,71 @@ class StrategyBattle:
         ai.choose_way = tracked_choose_way
         ai.choose_buy = tracked_choose_buy
 
-    def run_battle(self, strategy1_name: str, strategy2_name: str, num_games: int = 100) -> dict[str, Any]:
-        """Run multiple games between two strategies"""
+    @staticmethod
+    def _replay_landscapes(board_references: StrategyBoardReferences) -> dict[str, list[str]]:
+        return {
+            key: list(value)
+            for key, value in {
+                "events": board_references.events,
+                "projects": board_references.projects,
+                "ways": board_references.ways,
+                "landmarks": board_references.landmarks,
+                "allies": board_references.allies,
+            }.items()
+            if value
+        }
+
+    def _replay_record(
+        self,
+        seed: int,
+        kingdom_card_names: list[str],
+        seat_names: list[str],
+        fingerprints: dict[str, str],
+        scores: list[int],
+        turns: int,
+        recorder: DecisionRecorder,
+        landscapes: dict[str, list[str]],
+    ) -> ReplayRecord:
+        """A replay of one game; seat lists are in turn order."""
+        return ReplayRecord(
+            seed=seed,
+            kingdom=list(kingdom_card_names),
+            strategies=list(seat_names),
+            fingerprints=[fingerprints[name] for name in seat_names],
+            scores=scores,
+            turns=turns,
+            decisions=recorder.to_bytes(),
+            landscapes=landscapes,
+            traits=dict(self.board_config.traits) if self.board_config else {},
+            use_shelters=self.use_shelters,
+        )
+
+    def run_battle(
+        self,
+        strategy1_name: str,
+        strategy2_name: str,
+        num_games: int = 100,
+        *,
+        on_game: Optional[Callable[[dict[str, Any]], None]] = None,
+        keep_details: bool = True,
+        seed: Optional[int] = None,
+        export: Optional[ColumnarResultWriter] = None,
+        replays: Optional[ReplayWriter] = None,
+        profile: bool = False,
+    ) -> dict[str, Any]:
+        """Run multiple games between two strategies.
+
+        ``on_game`` receives each game's result dict as soon as the game
+        ends (e.g. ``StreamingBattleReport.add_game``). With
+        ``keep_details=False`` those dicts are not collected in
+        ``detailed_results``, so memory stays flat for very long battles.
+        With ``seed``, game ``n`` reseeds the RNG with ``seed + n``.
+        ``export`` receives one columnar row per game. ``replays`` receives
+        a compact replay of every game; unseeded battles then draw a fresh
+        seed per game so each replay can be re-simulated. With ``profile``,
+        ``results["profile"]`` holds a :class:`GameProfiler` report
+        aggregated over every game.
+        """
         # Get strategies from loader
         strategy1 = self.strategy_loader.get_strategy(strategy1_name)
         strategy2 = self.strategy_loader.get_strategy(strategy2_name)
@@ -386,6 +460,9 @@ class StrategyBattle:
             },
         }
 
+        profiler = GameProfiler() if profile else None
+        log_paths: list[str] = []
+
         # Run the games
         if self.verbose:
             logger.info("\nRunning %d games between:", num_games)
@@ -429,13 +506,33 @@ class StrategyBattle:
                 or "(no landscapes)",
             )
 
+        if replays is not None:
+            fingerprints = {
+                strategy1_name: short_fingerprint(strategy1),
+                strategy2_name: short_fingerprint(strategy2),
+            }
+            replay_landscapes = self._replay_landscapes(board_references)
+
         for game_num in range(num_games):
             if self.verbose:
                 logger.info("Playing game %d/%d...", game_num + 1, num_games)
 
+            game_seed = None
+            if seed is not None:
+                game_seed = seed + game_num
+            elif replays is not None:
+                game_seed = random.randrange(2**31)
+            if game_seed is not None:
+                random.seed(game_seed)
+
             # Create fresh AIs for each game using new strategy instances
             ai1 = GeneticAI(strategy1)
             ai2 = GeneticAI(strategy2)
+            recorder = None
+            if replays is not None:
+                recorder = DecisionRecorder()
+                recorder.attach(ai1)
+                recorder.attach(ai2)
             game_decision_firings = {
                 "strategy1": self._empty_decision_firings(strategy1_name),
                 "strategy2": self._empty_decision_firings(strategy2_name),
@@ -457,6 +554,7 @@ class StrategyBattle:
                     ways=board_references.ways,
                     landmarks=board_references.landmarks,
                     allies=board_references.allies,
+                    profiler=profiler,
                 )
             else:
                 winner, scores, log_path, turns = self.run_game(
@@ -469,6 +567,7 @@ class StrategyBattle:
                     ways=board_references.ways,
                     landmarks=board_references.landmarks,
                     allies=board_references.allies,
+                    profiler=profiler,
                 )
 
             # Record results
@@ -482,7 +581,41 @@ class StrategyBattle:
                 "log_path": log_path,
                 "decision_firings": game_decision_firings,
             }
-            results["detailed_results"].append(game_result)
+            if log_path is not None:
+                log_paths.append(log_path)
+            if keep_details:
+                results["detailed_results"].append(game_result)
+            if on_game is not None:
+                on_game(game_result)
+            seats = (ai1, ai2) if game_num % 2 == 0 else (ai2, ai1)
+            labels = {ai1: strategy1_name, ai2: strategy2_name}
+            if recorder is not None:
+                replays.write(
+                    self._replay_record(
+                        game_seed,
+                        kingdom_card_names,
+                        [labels[ai] for ai in seats],
+                        fingerprints,
+                        [scores[ai.name] for ai in seats],
+                        turns,
+                        recorder,
+                        replay_landscapes,
+                    )
+                )
+            if export is not None:
+                export.add(
+                    game_row(
+                        game_num,
+                        game_seed,
+                        [labels[ai] for ai in seats],
+                        [scores[ai.name] for ai in seats],
+                        turns,
+                        seats.index(winner),
+                        self.last_end_condition,
+                        self.logger.last_metrics,
+                        game_decision_firings,
+                    )
+                )
             self._merge_decision_firings(
                 results["decision_firings"]["strategy1"],
                 game_decision_firings["strategy1"],
@@ -506,7 +639,137 @@ class StrategyBattle:
         results["strategy1_avg_score"] = results["strategy1_total_score"] / num_games
         results["strategy2_avg_score"] = results["strategy2_total_score"] / num_games
 
-        results["log_paths"] = list(self.logger.game_logs)
+        results["log_paths"] = log_paths
+        if profiler is not None:
+            results["profile"] = profiler.report()
+        self.logger.write_run_summary()
+
+        return results
+
+    def run_tournament(
+        self,
+        strategy_names: list[str],
+        num_games: int = 100,
+        *,
+        on_game: Optional[Callable[[dict[str, Any]], None]] = None,
+        keep_details: bool = True,
+        seed: Optional[int] = None,
+        replays: Optional[ReplayWriter] = None,
+        profile: bool = False,
+    ) -> dict[str, Any]:
+        """Run games with one seat per entry of ``strategy_names`` (2-6 seats).
+
+        Seats rotate cyclically from game to game (see
+        :func:`~dominion.simulation.seating.seat_schedule`), so seat bias
+        cancels exactly when ``num_games`` is a multiple of the seat count.
+        A name may appear more than once; every per-strategy list in the
+        result is indexed like ``strategy_names``. Besides wins and scores,
+        ``avg_placement_score`` rates finishing order from 100 (always
+        first) to 0 (always last). ``on_game``, ``keep_details``, ``seed``,
+        ``replays`` and ``profile`` behave as in :meth:`run_battle`.
+        """
+        players = check_player_count(len(strategy_names))
+        strategies = [self.strategy_loader.get_strategy(name) for name in strategy_names]
+        missing = [name for name, strategy in zip(strategy_names, strategies) if not strategy]
+        if missing:
+            logger.warning("Could not find strategies: %s", ', '.join(missing))
+            raise ValueError(f"Could not find strategies: {', '.join(missing)}")
+
+        results: dict[str, Any] = {
+            "strategy_names": list(strategy_names),
+            "players": players,
+            "games_played": num_games,
+            "wins": [0] * players,
+            "total_score": [0] * players,
+            "total_placement_score": [0.0] * players,
+            "seat_wins": [0] * players,
+            "detailed_results": [],
+        }
+        profiler = GameProfiler() if profile else None
+        log_paths: list[str] = []
+        board_references = self._determine_board_references(*strategies)
+        landscape_kwargs = {
+            "events": board_references.events,
+            "projects": board_references.projects,
+            "ways": board_references.ways,
+            "landmarks": board_references.landmarks,
+            "allies": board_references.allies,
+        }
+        if replays is not None:
+            fingerprints = {
+                name: short_fingerprint(strategy) for name, strategy in zip(strategy_names, strategies)
+            }
+            replay_landscapes = self._replay_landscapes(board_references)
+
+        for game_num in range(num_games):
+            game_seed = None
+            if seed is not None:
+                game_seed = seed + game_num
+            elif replays is not None:
+                game_seed = random.randrange(2**31)
+            if game_seed is not None:
+                random.seed(game_seed)
+            ais = [GeneticAI(strategy) for strategy in strategies]
+            recorder = None
+            if replays is not None:
+                recorder = DecisionRecorder()
+                for ai in ais:
+                    recorder.attach(ai)
+            seats = seating(range(players), game_num)
+            winner, scores, log_path, turns = self.run_multiplayer_game(
+                [ais[entrant] for entrant in seats],
+                board_references.kingdom_cards,
+                profiler=profiler,
+                **landscape_kwargs,
+            )
+            entrant_of = {ai.name: entrant for entrant, ai in enumerate(ais)}
+            placements = [entrant_of[name] for name in self.last_placements]
+
+            for place, entrant in enumerate(placements):
+                results["total_placement_score"][entrant] += placement_score(place, players)
+            for entrant, ai in enumerate(ais):
+                results["total_score"][entrant] += scores[ai.name]
+            results["wins"][placements[0]] += 1
+            results["seat_wins"][seats.index(placements[0])] += 1
+
+            game_result = {
+                "game_number": game_num + 1,
+                "seating": [strategy_names[entrant] for entrant in seats],
+                "scores": [scores[ais[entrant].name] for entrant in seats],
+                "placements": placements,
+                "winner": strategy_names[placements[0]],
+                "turns": turns,
+                "log_path": log_path,
+            }
+            if log_path is not None:
+                log_paths.append(log_path)
+            if keep_details:
+                results["detailed_results"].append(game_result)
+            if on_game is not None:
+                on_game(game_result)
+            if recorder is not None:
+                replays.write(
+                    self._replay_record(
+                        game_seed,
+                        board_references.kingdom_cards,
+                        game_result["seating"],
+                        fingerprints,
+                        game_result["scores"],
+                        turns,
+                        recorder,
+                        replay_landscapes,
+                    )
+                )
+
+        games = max(num_games, 1)
+        results["win_rate"] = [wins / games * 100 for wins in results["wins"]]
+        results["avg_score"] = [total / games for total in results["total_score"]]
+        results["avg_placement_score"] = [total / games for total in results["total_placement_score"]]
+        results["seat_win_rate"] = [wins / games * 100 for wins in results["seat_wins"]]
+        results["log_paths"] = log_paths
+        if profiler is not None:
+            results["profile"] = profiler.report()
+        self.logger.write_run_summary()
 
         return results
 
@@ -521,6 +784,17 @@ class StrategyBattle:
             key=lambda p: (p.get_victory_points(), -p.turns_taken),
         )
 
+    @staticmethod
+    def _finishing_order(players):
+        """Players from first place to last, ranked like :meth:`_select_winner`.
+
+        Ties keep seat order, so the first entry is always the winner."""
+        return sorted(
+            players,
+            key=lambda p: (p.get_victory_points(), -p.turns_taken),
+            reverse=True,
+        )
+
     def run_game(
         self,
         ai1: GeneticAI,
@@ -533,18 +807,54 @@ class StrategyBattle:
         ways: Optional[list[str]] = None,
         landmarks: Optional[list[str]] = None,
         allies: Optional[list[str]] = None,
+        profiler: Optional[GameProfiler] = None,
+    ) -> tuple[GeneticAI, dict[str, int], Optional[str], int]:
+        """Run a single game between two AIs, timing it with ``profiler`` if given."""
+        return self.run_multiplayer_game(
+            [ai1, ai2],
+            kingdom_card_names,
+            decision_stats_by_ai=decision_stats_by_ai,
+            events=events,
+            projects=projects,
+            ways=ways,
+            landmarks=landmarks,
+            allies=allies,
+            profiler=profiler,
+        )
+
+    def run_multiplayer_game(
+        self,
+        ais: list[GeneticAI],
+        kingdom_card_names: list[str],
+        *,
+        decision_stats_by_ai: Optional[dict[GeneticAI, dict[str, Any]]] = None,
+        events: Optional[list[str]] = None,
+        projects: Optional[list[str]] = None,
+        ways: Optional[list[str]] = None,
+        landmarks: Optional[list[str]] = None,
+        allies: Optional[list[str]] = None,
+        profiler: Optional[GameProfiler] = None,
     ) -> tuple[GeneticAI, dict[str, int], Optional[str], int]:
-        """Run a single game between two AIs."""
+        """Run a single game with ``ais`` seated in order (2-6 players).
+
+        Returns the same tuple as :meth:`run_game`; the full finishing order
+        is left in ``last_placements``.
+        """
+        check_player_count(len(ais))
         if decision_stats_by_ai:
             for ai, stats in decision_stats_by_ai.items():
                 self._instrument_ai_decisions(ai, stats)
+        if profiler is not None:
+            for ai in ais:
+                profiler.instrument_ai(ai)
 
         # Start game logging with actual AI objects for better descriptions
-        self.logger.start_game([ai1, ai2])
+        self.logger.start_game(list(ais))
 
         # Set up game state and attach logger for structured logging
         game_state = GameState(players=[], supply={})
         game_state.set_logger(self.logger)
+        game_state.set_profiler(profiler)
 
         # Initialize game
         kingdom_cards, event_objs, project_objs, way_objs, landmark_objs, ally_objs = self._prepare_board_components(
@@ -556,7 +866,7 @@ class StrategyBattle:
             allies,
         )
         game_state.initialize_game(
-            [ai1, ai2],
+            list(ais),
             kingdom_cards,
             use_shelters=self.use_shelters,
             events=event_objs,
@@ -573,8 +883,11 @@ class StrategyBattle:
 
         # Get results
         final_turns = game_state.turn_number
+        self.last_end_condition = end_condition(game_state)
         scores = {p.ai.name: p.get_victory_points() for p in game_state.players}
-        winner = self._select_winner(game_state.players).ai
+        placements = self._finishing_order(game_state.players)
+        self.last_placements = [p.ai.name for p in placements]
+        winner = placements[0].ai
 
         # End game logging and capture log path if any
         log_path = self.logger.end_game(winner.name, scores, game_state.supply, game_state.players)
@@ -617,6 +930,40 @@ def main():
     )
     parser.add_argument("--print", dest="do_print", action="store_true", help="Print results to console")
     parser.add_argument("--no-report", action="store_true", help="Do not generate an HTML report")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Build the report incrementally with bounded memory, rewriting it as games finish",
+    )
+    parser.add_argument(
+        "--stream-every",
+        type=int,
+        default=500,
+        help="With --stream, rewrite the report every N games (default: 500)",
+    )
+    parser.add_argument("--seed", type=int, help="Seed game N with SEED + N for reproducible battles")
+    parser.add_argument(
+        "--export",
+        type=Path,
+        help="Write one columnar row per game (Parquet, .npz or JSON parts) to this directory",
+    )
+    parser.add_argument(
+        "--replays",
+        type=Path,
+        help="Append a compact replay of every game to this file (see dominion.simulation.replay)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time phases, card plays, gains, AI decisions and rule conditions, and print the slowest",
+    )
+    parser.add_argument(
+        "--also",
+        action="append",
+        default=[],
+        metavar="STRATEGY",
+        help="Seat another strategy (repeatable, up to 6 players); prints a rotated-seat tournament summary",
+    )
     parser.add_argument("--log", action="store_true", help="Write detailed game logs to battle_logs/")
     parser.add_argument("--log-frequency", type=int, default=10, help="Log every Nth game (1 = every game). Only applies when --log is used.")
 
@@ -624,7 +971,7 @@ def main():
 
     board_config = load_board(args.board) if args.board else None
 
-    if args.do_print:
+    if args.do_print or args.profile:
         logging.basicConfig(level=logging.INFO)
 
     # Only write game logs when --log is passed; otherwise disable file logging
@@ -637,30 +984,73 @@ def main():
         log_frequency=log_freq,
     )
 
-    results = battle.run_battle(args.strategy1_name, args.strategy2_name, args.games)
+    if args.also:
+        logging.basicConfig(level=logging.INFO)
+        replays = ReplayWriter(args.replays) if args.replays else None
+        results = battle.run_tournament(
+            [args.strategy1_name, args.strategy2_name, *args.also],
+            args.games,
+            keep_details=False,
+            seed=args.seed,
+            replays=replays,
+            profile=args.profile,
+        )
+        if replays is not None:
+            replays.close()
+        log_tournament_results(results)
+        if args.profile:
+            logger.info("\nProfile (slowest sections by self time):%s", format_profile(results["profile"]))
+        return
 
-    if args.do_print:
-        log_results(results)
+    # Determine output path: auto-generate if not provided
+    if args.output is None:
 
-    if not args.no_report:
-        # Determine output path: auto-generate if not provided
-        if args.output is None:
+        def _slugify_filename(name: str) -> str:
+            slug = name.replace("-", " ").replace("_", " ").lower().replace(" ", "_")
+            return re.sub(r"[^a-z0-9_]+", "", slug)
 
-            def _slugify_filename(name: str) -> str:
-                slug = name.replace("-", " ").replace("_", " ").lower().replace(" ", "_")
-                return re.sub(r"[^a-z0-9_]+", "", slug)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        filename = (
+            f"{_slugify_filename(args.strategy1_name)}_vs_{_slugify_filename(args.strategy2_name)}_"
+            f"{args.games}games_{timestamp}_report.html"
+        )
+        output_path = Path("reports") / filename
+    else:
+        output_path = args.output
+
+    stream = None
+    if args.stream and not args.no_report:
+        stream = StreamingBattleReport(
+            args.strategy1_name, args.strategy2_name, output_path, write_every=args.stream_every
+        )
 
-            strat1 = results["strategy1_name"]
-            strat2 = results["strategy2_name"]
-            games = results["games_played"]
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-            filename = (
-                f"{_slugify_filename(strat1)}_vs_{_slugify_filename(strat2)}_" f"{games}games_{timestamp}_report.html"
-            )
-            output_path = Path("reports") / filename
-        else:
-            output_path = args.output
+    export = ColumnarResultWriter(args.export) if args.export else None
+    replays = ReplayWriter(args.replays) if args.replays else None
+    results = battle.run_battle(
+        args.strategy1_name,
+        args.strategy2_name,
+        args.games,
+        on_game=stream.add_game if stream else None,
+        keep_details=stream is None,
+        seed=args.seed,
+        export=export,
+        replays=replays,
+        profile=args.profile,
+    )
+
+    if export is not None:
+        export.close()
+    if replays is not None:
+        replays.close()
 
+    if args.do_print:
+        log_results(results)
+    if args.profile:
+        logger.info("\nProfile (slowest sections by self time):%s", format_profile(results["profile"]))
+
+    if stream is not None:
+        stream.finish(results)
+    elif not args.no_report:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         generate_html_report(results, output_path)
 
@@ -697,6 +1087,21 @@ def log_results(results: dict[str, Any]):
             logger.info("  Log: %s", game['log_path'])
 
 
+def log_tournament_results(results: dict[str, Any]) -> None:
+    """Print a multi-seat tournament summary from :meth:`StrategyBattle.run_tournament`."""
+    logger.info("\n=== Tournament Results (%d players) ===", results["players"])
+    logger.info("\nGames played: %d", results["games_played"])
+    for seat, name in enumerate(results["strategy_names"]):
+        logger.info("\n%s (seat %d at game 1):", name, seat + 1)
+        logger.info("  Wins: %d (%.1f%%)", results["wins"][seat], results["win_rate"][seat])
+        logger.info("  Average Score: %.1f", results["avg_score"][seat])
+        logger.info("  Placement Score: %.1f", results["avg_placement_score"][seat])
+    logger.info(
+        "\nWin rate by seat: %s",
+        ", ".join(f"{rate:.1f}%" for rate in results["seat_win_rate"]),
+    )
+
+
 def log_decision_firings(results: dict[str, Any]) -> None:
     """Print choose_way and choose_gain instrumentation summaries."""
     decision_firings = results.get("decision_firings") or {}
@@ -26,7 +26,8 @@ import random as _random_module
 import re
 from dataclasses import dataclass, field
 
-from dominion.cards.registry import get_card
+from dominion.cards.metadata import get_card_metadata
+from dominion.simulation.niching import top_card_overlap
 from dominion.strategy.enhanced_strategy import PriorityRule
 from dominion.strategy.strategies.base_strategy import BaseStrategy
 
@@ -67,7 +68,7 @@ class KingdomInfo:
             if name in BASIC_CARDS:
                 continue
             try:
-                card = get_card(name)
+                card = get_card_metadata(name)
             except ValueError:
                 continue
             info.costs[name] = card.cost.coins
@@ -410,6 +411,10 @@ def normalize_menu(strategy: BaseStrategy, info: KingdomInfo) -> BaseStrategy:
 # ---------------------------------------------------------------------------
 
 
+# Stands in for "no kingdom picks"; not a card name.
+_NO_KINGDOM_PICKS = "<no kingdom picks>"
+
+
 def _top_kingdom_picks(strategy: BaseStrategy, n: int = 5) -> set[str]:
     picks: list[str] = []
     for rule in strategy.gain_priority:
@@ -421,6 +426,14 @@ def _top_kingdom_picks(strategy: BaseStrategy, n: int = 5) -> set[str]:
     return set(picks)
 
 
+def kingdom_features(strategy: BaseStrategy) -> set[str]:
+    """The card set :func:`kingdom_similarity` compares.
+
+    A strategy with no kingdom picks gets one placeholder entry, so two
+    such strategies count as identical and never match one with picks."""
+    return _top_kingdom_picks(strategy) or {_NO_KINGDOM_PICKS}
+
+
 def kingdom_similarity(a: BaseStrategy, b: BaseStrategy) -> float:
     """Top-5 overlap of *kingdom* gain picks, ignoring the shared skeleton.
 
@@ -429,9 +442,4 @@ def kingdom_similarity(a: BaseStrategy, b: BaseStrategy) -> float:
     niche and fitness sharing would punish the whole population uniformly.
     What distinguishes strategies is which kingdom cards they pick, in
     priority order."""
-    top_a = _top_kingdom_picks(a)
-    top_b = _top_kingdom_picks(b)
-    if not top_a and not top_b:
-        return 1.0
-    denom = max(1, min(5, max(len(top_a), len(top_b))))
-    return len(top_a & top_b) / denom
+    return top_card_overlap(kingdom_features(a), kingdom_features(b))
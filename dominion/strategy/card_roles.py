@@ -8,12 +8,10 @@ manual metadata table.
 
 from __future__ import annotations
 
-import inspect
 from dataclasses import dataclass
 from functools import lru_cache
 
-from dominion.cards.base_card import Card
-from dominion.cards.registry import get_card
+from dominion.cards.metadata import get_card_metadata
 
 
 @dataclass(frozen=True)
@@ -25,68 +23,20 @@ class CardRoleProfile:
         return role in self.roles
 
 
-def _class_source(card: Card) -> str:
-    try:
-        return inspect.getsource(type(card))
-    except (OSError, TypeError):
-        return ""
-
-
 @lru_cache(maxsize=None)
 def infer_card_roles(card_name: str) -> CardRoleProfile:
-    """Infer broad strategic roles for a card name."""
+    """Infer broad strategic roles for a card name.
+
+    The roles come from the card metadata table (see
+    ``dominion.cards.metadata``), which reads each card's stats, types and
+    class source once.
+    """
 
     try:
-        card = get_card(card_name)
+        meta = get_card_metadata(card_name)
     except (KeyError, ValueError):
         return CardRoleProfile(card_name, frozenset())
-    if card is None:
-        return CardRoleProfile(card_name, frozenset())
-
-    roles: set[str] = set()
-    source = _class_source(card)
-
-    if card.is_action:
-        roles.add("action")
-        if card.stats.actions > 0:
-            roles.add("nonterminal")
-            roles.add("village")
-        else:
-            roles.add("terminal")
-        if card.stats.cards >= 1 and card.stats.actions >= 1:
-            roles.add("cantrip")
-        if card.stats.cards >= 2:
-            roles.add("draw")
-        if card.stats.cards >= 2 and card.stats.actions == 0:
-            roles.add("terminal_draw")
-        if card.stats.coins >= 2 or card.stats.buys > 0:
-            roles.add("payload")
-        if card.is_attack:
-            roles.add("attack")
-        if card.is_duration:
-            roles.add("duration")
-        if card.is_command:
-            roles.add("command")
-
-    if card.is_treasure:
-        roles.add("treasure")
-        if card.stats.coins >= 2:
-            roles.add("payload")
-
-    if card.is_victory:
-        roles.add("victory")
-
-    lowered = source.lower()
-    if "trash" in lowered:
-        roles.add("trasher")
-    if "gain_card(" in source:
-        roles.add("gainer")
-    if "discard" in lowered and card.is_action:
-        roles.add("sifter")
-    if "choose_" in source or "should_" in source:
-        roles.add("mode_or_choice")
-
-    return CardRoleProfile(card.name, frozenset(roles))
+    return CardRoleProfile(meta.name, meta.roles)
 
 
 def cards_with_role(card_names: list[str], role: str) -> list[str]:
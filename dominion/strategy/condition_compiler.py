@@ -0,0 +1,306 @@
+"""Compile priority lists into single specialized decision functions.
+
+Every :class:`PriorityRule` helper tags its closure with a ``_source``
+string such as ``PriorityRule.and_(PriorityRule.max_in_deck('Smithy', 2),
+PriorityRule.turn_number('<=', 10))``. Evaluating those closures one by one
+repeats work: ``and_``/``or_`` run generator chains, and each leaf re-reads
+state (``max_in_deck`` walks ``all_cards()`` for every card it checks,
+``score_diff`` recomputes everybody's VP).
+
+:func:`compile_priority` parses each rule's ``_source`` into a small AST,
+maps every leaf onto shared *inputs* (the deck, the list of its card names,
+per-card counts, the score difference, hand counts, ...) and emits one Python function per
+priority list. Inputs are computed lazily, at most once per decision, and
+shared by all rules of the list. ``and_``/``or_`` become plain
+short-circuiting ``and``/``or``.
+
+The compiled function returns the index of the first rule whose card is
+offered and whose condition passes, exactly like the closure walk in
+:meth:`EnhancedStrategy._choose_from_priority`: a rule is only evaluated
+when its card is among the choices, and an exception while evaluating a
+rule makes that rule fail. Conditions without a parsable ``_source`` (hand
+written lambdas, unknown helpers) are called as-is.
+"""
+
+from __future__ import annotations
+
+import ast
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+
+from dominion.game import features
+
+if TYPE_CHECKING:  # Avoid circular imports at runtime
+    from dominion.strategy.enhanced_strategy import PriorityRule
+
+# Same operators as PriorityRule._OP_MAP.
+_OPS = frozenset(("<", "<=", ">", ">=", "==", "!="))
+_UNSET = object()
+_card_name = attrgetter("name")
+
+# Generated code for each shared input. ``{A}`` stands for the memoized
+# deck (``features.deck_cards``). Assignment expressions are not allowed in a
+# comprehension's iterable, so inputs derived from the deck go through
+# helper functions. Inputs that are also worth sharing across lists come
+# from the decision's feature cache (dominion.game.features).
+_INPUTS: dict[str, str] = {
+    "deck": "_deck_cards(s, me)",
+    "names": "list(map(_card_name, {A}))",
+    "turn": "s.turn_number",
+    "empty_piles": "_empty_piles(s)",
+    "actions_in_play": "sum(1 for c in me.in_play if c.is_action)",
+    "actions_in_hand": "sum(1 for c in me.hand if c.is_action)",
+    "terminals_in_hand": "sum(1 for c in me.hand if c.is_action and c.stats.actions == 0)",
+    "treasures_in_hand": "sum(1 for c in me.hand if c.is_treasure)",
+    "action_density": "_action_density(s, me)",
+    "score_diff": "_score_diff(s, me)",
+}
+
+
+class _Unsupported(Exception):
+    """Raised for sources the compiler does not understand."""
+
+
+def parse_source(source: str) -> tuple:
+    """Parse a condition ``_source`` into a nested tuple AST.
+
+    Nodes are ``("and", children)``, ``("or", children)``, ``("true",)`` or
+    ``(helper_name, args)``. Raises ``ValueError`` for anything else.
+    """
+    try:
+        node = ast.parse(source, mode="eval").body
+        return _parse_node(node)
+    except (SyntaxError, _Unsupported) as exc:
+        raise ValueError(f"cannot compile condition: {source}") from exc
+
+
+def _parse_node(node: ast.AST) -> tuple:
+    if not (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == "PriorityRule"
+        and not node.keywords
+    ):
+        raise _Unsupported
+    name = node.func.attr
+    if name in ("and_", "or_"):
+        children = tuple(_parse_node(arg) for arg in node.args)
+        if not children:
+            return ("true",)
+        return ("and" if name == "and_" else "or", children)
+    if name == "always_true":
+        return ("true",)
+    try:
+        args = tuple(ast.literal_eval(arg) for arg in node.args)
+    except ValueError as exc:
+        raise _Unsupported from exc
+    return (name, args)
+
+
+class _Emitter:
+    """Build the body of a compiled priority function."""
+
+    def __init__(self) -> None:
+        self.slots: dict[str, str] = {}
+        self.opaque: list[Callable] = []
+
+    def ref(self, key: str, expr: Optional[str] = None) -> str:
+        """Code that yields input ``key``, computing it on first use."""
+        var = self.slots.get(key)
+        if var is None:
+            var = self.slots[key] = f"_v{len(self.slots)}"
+        if expr is None:
+            expr = _INPUTS[key]
+        if "{A}" in expr:
+            expr = expr.replace("{A}", self.ref("deck"))
+        return f"({var} if {var} is not _U else ({var} := {expr}))"
+
+    def count(self, card: Any) -> str:
+        if not isinstance(card, str):
+            raise _Unsupported
+        return self.ref(f"count:{card}", f"{self.ref('names')}.count({card!r})")
+
+    def compare(self, value: str, op: Any, amount: Any) -> str:
+        if op not in _OPS or not isinstance(amount, (int, float)) or isinstance(amount, bool):
+            raise _Unsupported
+        return f"({value} {op} {amount!r})"
+
+    def emit(self, node: tuple) -> str:
+        kind = node[0]
+        if kind == "true":
+            return "True"
+        if kind in ("and", "or"):
+            return "(" + f" {kind} ".join(self.emit(child) for child in node[1]) + ")"
+        handler = getattr(self, f"_leaf_{kind}", None)
+        if handler is None:
+            raise _Unsupported
+        try:
+            return handler(*node[1])
+        except TypeError as exc:  # wrong number of arguments
+            raise _Unsupported from exc
+
+    # Leaves -- each mirrors the closure built by the PriorityRule helper
+    # of the same name.
+
+    def _leaf_provinces_left(self, op, amount):
+        return self.compare(self.ref("provinces", 's.supply.get("Province", 0)'), op, amount)
+
+    def _leaf_colonies_left(self, op, amount):
+        value = self.ref("colonies", 's.supply.get("Colony", 0)')
+        return f'("Colony" in s.supply and {self.compare(value, op, amount)})'
+
+    def _leaf_turn_number(self, op, amount):
+        return self.compare(self.ref("turn"), op, amount)
+
+    def _leaf_resources(self, res, op, amount):
+        if not isinstance(res, str) or not res.isidentifier():
+            raise _Unsupported
+        if res == "hand_size":
+            return self.compare("len(me.hand)", op, amount)
+        return self.compare(f"me.{res}", op, amount)
+
+    def _leaf_has_cards(self, cards, amount):
+        if not isinstance(cards, (list, tuple)) or isinstance(amount, bool) or not isinstance(amount, int):
+            raise _Unsupported
+        total = " + ".join(self.count(card) for card in cards) or "0"
+        if amount <= 0:
+            return f"(({total}) == 0)"
+        return f"(({total}) >= {amount!r})"
+
+    def _leaf_has_no_cards(self, cards):
+        return self._leaf_has_cards(cards, 0)
+
+    def _leaf_max_in_deck(self, card, amount):
+        return self.compare(self.count(card), "<", amount)
+
+    def _leaf_deck_count_diff(self, card_a, card_b, op, amount):
+        return self.compare(f"({self.count(card_a)} - {self.count(card_b)})", op, amount)
+
+    def _leaf_actions_in_play(self, op, amount):
+        return self.compare(self.ref("actions_in_play"), op, amount)
+
+    def _leaf_actions_gained_this_turn(self, op, amount):
+        return self.compare("me.turn.actions_gained_this_turn", op, amount)
+
+    def _leaf_cards_gained_this_turn(self, op, amount):
+        return self.compare("me.turn.cards_gained_this_turn", op, amount)
+
+    def _leaf_card_in_play(self, card):
+        if not isinstance(card, str):
+            raise _Unsupported
+        return self.ref(f"in_play:{card}", f"any(c.name == {card!r} for c in me.in_play)")
+
+    def _leaf_card_in_hand(self, card):
+        if not isinstance(card, str):
+            raise _Unsupported
+        return self.ref(f"in_hand:{card}", f"any(c.name == {card!r} for c in me.hand)")
+
+    def _leaf_actions_in_hand(self, op, amount):
+        return self.compare(self.ref("actions_in_hand"), op, amount)
+
+    def _leaf_terminals_in_hand(self, op, amount):
+        return self.compare(self.ref("terminals_in_hand"), op, amount)
+
+    def _leaf_treasures_in_hand(self, op, amount):
+        return self.compare(self.ref("treasures_in_hand"), op, amount)
+
+    def _leaf_excess_actions(self, op, amount):
+        return self.compare(f"(me.actions - {self.ref('terminals_in_hand')})", op, amount)
+
+    def _leaf_empty_piles(self, op, amount):
+        return self.compare(self.ref("empty_piles"), op, amount)
+
+    def _leaf_deck_size(self, op, amount):
+        return self.compare(f"len({self.ref('deck')})", op, amount)
+
+    def _leaf_action_density(self, op, percent):
+        return self.compare(self.ref("action_density"), op, percent)
+
+    def _leaf_score_diff(self, op, amount):
+        return self.compare(self.ref("score_diff"), op, amount)
+
+    def condition(self, condition: Optional[Callable]) -> Optional[str]:
+        """Code for one rule's condition, or None when it always passes."""
+        if condition is None:
+            return None
+        source = getattr(condition, "_source", None)
+        if source:
+            try:
+                return self.emit(parse_source(source))
+            except (ValueError, _Unsupported):
+                pass
+        # Fall back to calling the closure itself.
+        self.opaque.append(condition)
+        return f"_c[{len(self.opaque) - 1}](s, me)"
+
+
+def _emit_function(rules: Iterable[PriorityRule]) -> tuple[str, list[Callable]]:
+    emitter = _Emitter()
+    body = []
+    for index, rule in enumerate(rules):
+        code = emitter.condition(rule.condition)
+        body.append(f"    if {rule.card!r} in present:")
+        if code is None:
+            body.append(f"        return {index}")
+            continue
+        body.append("        try:")
+        body.append(f"            if {code}:")
+        body.append(f"                return {index}")
+        body.append("        except Exception:")
+        body.append("            pass")
+    body.append("    return -1")
+
+    lines = ["def _priority(s, me, present):"]
+    if emitter.slots:
+        lines.append("    " + " = ".join(emitter.slots.values()) + " = _U")
+    lines.extend(body)
+    return "\n".join(lines), emitter.opaque
+
+
+def compile_priority(rules: Iterable[PriorityRule]) -> Callable[[Any, Any, Any], int]:
+    """Compile ``rules`` into ``fn(state, player, present_card_names) -> index``.
+
+    Returns the index of the first rule that fires, or ``-1``. The result
+    reflects the rules (cards and condition objects) at compile time.
+    """
+    code, opaque = _emit_function(rules)
+    namespace: dict[str, Any] = {
+        "_U": _UNSET,
+        "_c": tuple(opaque),
+        "_card_name": _card_name,
+        "_deck_cards": features.deck_cards,
+        "_empty_piles": features.empty_piles,
+        "_action_density": features.action_density,
+        "_score_diff": features.score_diff,
+    }
+    exec(compile(code, "<priority>", "exec"), namespace)
+    fn = namespace["_priority"]
+    fn._source = code  # type: ignore[attr-defined]
+    return fn
+
+
+class CompiledPriorityCache:
+    """Per-strategy cache of compiled priority lists.
+
+    Entries are keyed by the list's identity and revalidated on every use:
+    the list must still hold the same rules, and no rule's card or
+    condition may have been reassigned since compiling (tracked through
+    ``PriorityRule.generation``). GA mutations therefore trigger a
+    recompile.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: dict[int, tuple[list, tuple, int, Callable]] = {}
+
+    def get(self, rules: list[PriorityRule], generation: int) -> Callable[[Any, Any, Any], int]:
+        """Compiled function for ``rules``; pass the current ``PriorityRule.generation``."""
+        entry = self._entries.get(id(rules))
+        # The entry keeps ``rules`` alive, so its id cannot be reused.
+        if entry is None or entry[2] != generation or entry[1] != tuple(rules):
+            snapshot = tuple(rules)
+            entry = (rules, snapshot, generation, compile_priority(snapshot))
+            self._entries[id(rules)] = entry
+        return entry[3]
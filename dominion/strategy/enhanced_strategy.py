@@ -11,8 +11,11 @@ from dataclasses import dataclass
 from typing import Callable, Iterable, Optional, ClassVar
 
 from dominion.cards.base_card import Card
+from dominion.game import features
 from dominion.game.game_state import GameState
 from dominion.game.player_state import PlayerState
+from dominion.game.profiler import condition_label
+from dominion.strategy.condition_compiler import CompiledPriorityCache
 
 
 @dataclass
@@ -29,6 +32,15 @@ class PriorityRule:
     # Condition is an optional callable that receives (state, player) and returns a bool.
     condition: Optional[Callable[["GameState", "PlayerState"], bool]] = None
 
+    # Bumped whenever any rule's card or condition is reassigned, so
+    # compiled priority lists (see condition_compiler) know to rebuild.
+    generation: ClassVar[int] = 0
+
+    def __setattr__(self, name, value):
+        if (name == "condition" or name == "card") and name in self.__dict__:
+            PriorityRule.generation += 1
+        object.__setattr__(self, name, value)
+
     @property
     def card_name(self) -> str:
         return self.card
@@ -95,22 +107,22 @@ class PriorityRule:
         """
         card_list = list(cards)
         if amount <= 0:
-            fn = lambda _s, me, _cards=card_list: sum(me.count_in_deck(c) for c in _cards) == 0
+            fn = lambda s, me, _cards=card_list: sum(features.deck_count(s, me, c) for c in _cards) == 0
         else:
-            fn = lambda _s, me, _amount=amount, _cards=card_list: sum(me.count_in_deck(c) for c in _cards) >= _amount
+            fn = lambda s, me, _amount=amount, _cards=card_list: sum(features.deck_count(s, me, c) for c in _cards) >= _amount
         return PriorityRule._tag_source(fn, f"PriorityRule.has_cards({card_list!r}, {amount!r})")
 
     @staticmethod
     def has_no_cards(cards: Iterable[str]) -> Callable[["GameState", "PlayerState"], bool]:
         """Explicit spelling for "none of these cards are in the deck"."""
         card_list = list(cards)
-        fn = lambda _s, me, _cards=card_list: sum(me.count_in_deck(c) for c in _cards) == 0
+        fn = lambda s, me, _cards=card_list: sum(features.deck_count(s, me, c) for c in _cards) == 0
         return PriorityRule._tag_source(fn, f"PriorityRule.has_no_cards({card_list!r})")
 
     @staticmethod
     def max_in_deck(card_name: str, amount: int) -> Callable[["GameState", "PlayerState"], bool]:
         """True when the player has strictly fewer than ``amount`` copies of ``card_name``."""
-        fn = lambda _s, me, _amount=amount, _card=card_name: me.count_in_deck(_card) < _amount
+        fn = lambda s, me, _amount=amount, _card=card_name: features.deck_count(s, me, _card) < _amount
         return PriorityRule._tag_source(fn, f"PriorityRule.max_in_deck({card_name!r}, {amount!r})")
 
     @staticmethod
@@ -127,20 +139,20 @@ class PriorityRule:
         """True when the number of actions gained this turn satisfies the comparison.
 
         Useful for Cauldron-style triggers ("when this is the Nth action gained
-        while X is in play"). Reads ``player.actions_gained_this_turn``, which
+        while X is in play"). Reads ``player.turn.actions_gained_this_turn``, which
         is reset to 0 at the start of each of the player's turns."""
         cmp = PriorityRule._OP_MAP[op]
-        fn = lambda _s, me, _amount=amount, _cmp=cmp: _cmp(me.actions_gained_this_turn, _amount)
+        fn = lambda _s, me, _amount=amount, _cmp=cmp: _cmp(me.turn.actions_gained_this_turn, _amount)
         return PriorityRule._tag_source(fn, f"PriorityRule.actions_gained_this_turn({op!r}, {amount!r})")
 
     @staticmethod
     def cards_gained_this_turn(op: str, amount: int) -> Callable[["GameState", "PlayerState"], bool]:
         """True when the number of cards gained this turn satisfies the comparison.
 
-        Reads ``player.cards_gained_this_turn``, which is reset to 0 at the start
+        Reads ``player.turn.cards_gained_this_turn``, which is reset to 0 at the start
         of each of the player's turns."""
         cmp = PriorityRule._OP_MAP[op]
-        fn = lambda _s, me, _amount=amount, _cmp=cmp: _cmp(me.cards_gained_this_turn, _amount)
+        fn = lambda _s, me, _amount=amount, _cmp=cmp: _cmp(me.turn.cards_gained_this_turn, _amount)
         return PriorityRule._tag_source(fn, f"PriorityRule.cards_gained_this_turn({op!r}, {amount!r})")
 
     @staticmethod
@@ -207,8 +219,8 @@ class PriorityRule:
     def deck_count_diff(card_a: str, card_b: str, op: str, amount: int) -> Callable[["GameState", "PlayerState"], bool]:
         """True when (count of card_a in deck) minus (count of card_b in deck) satisfies the comparison."""
         cmp = PriorityRule._OP_MAP[op]
-        fn = lambda _s, me, _a=card_a, _b=card_b, _amount=amount, _cmp=cmp: _cmp(
-            me.count_in_deck(_a) - me.count_in_deck(_b), _amount
+        fn = lambda s, me, _a=card_a, _b=card_b, _amount=amount, _cmp=cmp: _cmp(
+            features.deck_count(s, me, _a) - features.deck_count(s, me, _b), _amount
         )
         return PriorityRule._tag_source(fn, f"PriorityRule.deck_count_diff({card_a!r}, {card_b!r}, {op!r}, {amount!r})")
 
@@ -216,14 +228,14 @@ class PriorityRule:
     def empty_piles(op: str, amount: int) -> Callable[["GameState", "PlayerState"], bool]:
         """True when the number of emptied supply piles satisfies the comparison."""
         cmp = PriorityRule._OP_MAP[op]
-        fn = lambda s, _me, _amount=amount, _cmp=cmp: _cmp(s.empty_piles, _amount)
+        fn = lambda s, _me, _amount=amount, _cmp=cmp: _cmp(features.empty_piles(s), _amount)
         return PriorityRule._tag_source(fn, f"PriorityRule.empty_piles({op!r}, {amount!r})")
 
     @staticmethod
     def deck_size(op: str, amount: int) -> Callable[["GameState", "PlayerState"], bool]:
         """True when the player's total deck size (all zones) satisfies the comparison."""
         cmp = PriorityRule._OP_MAP[op]
-        fn = lambda _s, me, _amount=amount, _cmp=cmp: _cmp(len(me.all_cards()), _amount)
+        fn = lambda s, me, _amount=amount, _cmp=cmp: _cmp(len(features.deck_cards(s, me)), _amount)
         return PriorityRule._tag_source(fn, f"PriorityRule.deck_size({op!r}, {amount!r})")
 
     @staticmethod
@@ -232,14 +244,8 @@ class PriorityRule:
         Empty decks are treated as 0% density."""
         cmp = PriorityRule._OP_MAP[op]
 
-        def _eval(_s, me, _amount=percent, _cmp=cmp):
-            cards = me.all_cards()
-            if not cards:
-                return _cmp(0, _amount)
-            density = sum(1 for c in cards if c.is_action) * 100 // len(cards)
-            return _cmp(density, _amount)
-
-        return PriorityRule._tag_source(_eval, f"PriorityRule.action_density({op!r}, {percent!r})")
+        fn = lambda s, me, _amount=percent, _cmp=cmp: _cmp(features.action_density(s, me), _amount)
+        return PriorityRule._tag_source(fn, f"PriorityRule.action_density({op!r}, {percent!r})")
 
     @staticmethod
     def score_diff(op: str, amount: int) -> Callable[["GameState", "PlayerState"], bool]:
@@ -247,15 +253,8 @@ class PriorityRule:
         Useful for endgame decisions (e.g. trigger pile-out when ahead)."""
         cmp = PriorityRule._OP_MAP[op]
 
-        def _eval(s, me, _amount=amount, _cmp=cmp):
-            my_vp = me.get_victory_points(s)
-            opp_vps = [
-                p.get_victory_points(s) for p in s.players if p is not me
-            ]
-            opp_best = max(opp_vps) if opp_vps else 0
-            return _cmp(my_vp - opp_best, _amount)
-
-        return PriorityRule._tag_source(_eval, f"PriorityRule.score_diff({op!r}, {amount!r})")
+        fn = lambda s, me, _amount=amount, _cmp=cmp: _cmp(features.score_diff(s, me), _amount)
+        return PriorityRule._tag_source(fn, f"PriorityRule.score_diff({op!r}, {amount!r})")
 
     @staticmethod
     def always_true() -> Callable[["GameState", "PlayerState"], bool]:
@@ -308,6 +307,12 @@ class EnhancedStrategy:
     engine can later interpret.
     """
 
+    # Evaluate priority lists with functions built by
+    # ``dominion.strategy.condition_compiler`` instead of calling each rule's
+    # closure. Profiled games always use the closures so every condition
+    # is timed separately.
+    compile_conditions: ClassVar[bool] = True
+
     def __init__(self) -> None:
         self.name: str = "Unnamed"
         self.description: str = ""
@@ -320,6 +325,13 @@ class EnhancedStrategy:
         self.way_policy: list[WayRule] = []
         self._decision_trace_callback = None
 
+    def __getstate__(self):
+        # Compiled priority functions are generated code and cannot be
+        # pickled; copies recompile on first use.
+        state = self.__dict__.copy()
+        state.pop("_compiled_priorities", None)
+        return state
+
     # ------------------------------------------------------------------
     def _choose_from_priority(
         self,
@@ -334,6 +346,31 @@ class EnhancedStrategy:
         The rule condition is either ``None`` (always true) or a
         ``Callable[[GameState, PlayerState], bool]`` evaluated directly.
         """
+        feature_cache = getattr(state, "feature_cache", None)
+        if feature_cache is None:  # lightweight test doubles
+            return self._scan_priority(priority, choices, state, player, list_name, None)
+        # Conditions share VP totals, deck counts, etc. for this decision.
+        with feature_cache():
+            profiler = state.profiler
+            if profiler is not None:
+                return profiler.call(
+                    "priority", list_name, self._scan_priority, priority, choices, state, player, list_name, profiler
+                )
+            return self._scan_priority(priority, choices, state, player, list_name, None)
+
+    def _scan_priority(self, priority, choices, state, player, list_name, profiler) -> Optional[Card]:
+        if profiler is None and self.compile_conditions:
+            cache = self.__dict__.get("_compiled_priorities")
+            if cache is None:
+                cache = self._compiled_priorities = CompiledPriorityCache()
+            present = {card.name for card in choices if card is not None}
+            index = cache.get(priority, PriorityRule.generation)(state, player, present)
+            if index < 0:
+                return None
+            rule = priority[index]
+            for card in choices:
+                if card is not None and card.name == rule.card:
+                    return self._rule_fired(list_name, rule, card, state, player)
 
         for rule in priority:
             for card in choices:
@@ -345,26 +382,32 @@ class EnhancedStrategy:
                     passes = True
                 else:
                     try:
-                        passes = bool(cond(state, player))
+                        if profiler is None:
+                            passes = bool(cond(state, player))
+                        else:
+                            passes = bool(profiler.call("condition", condition_label(cond), cond, state, player))
                     except Exception:
                         passes = False
 
                 if passes:
-                    # Mark the rule as having fired at least once. The
-                    # ``rule_pruning`` module uses this signal during GA
-                    # evolution to drop rules that never affect a buy/play
-                    # decision across an entire fitness-eval window.
-                    rule._fired = True
-                    callback = getattr(self, "_decision_trace_callback", None)
-                    if callback is not None:
-                        try:
-                            callback(list_name, rule, card, state, player)
-                        except Exception:
-                            pass
-                    return card
+                    return self._rule_fired(list_name, rule, card, state, player)
 
         return None
 
+    def _rule_fired(self, list_name, rule, card, state, player) -> Card:
+        # Mark the rule as having fired at least once. The
+        # ``rule_pruning`` module uses this signal during GA
+        # evolution to drop rules that never affect a buy/play
+        # decision across an entire fitness-eval window.
+        rule._fired = True
+        callback = getattr(self, "_decision_trace_callback", None)
+        if callback is not None:
+            try:
+                callback(list_name, rule, card, state, player)
+            except Exception:
+                pass
+        return card
+
     # ------------------------------------------------------------------
     def choose_action(self, state, player, choices):
         # Handle Trail reaction trigger: if Trail is the only real option
@@ -447,7 +490,7 @@ class EnhancedStrategy:
     def _collection_action_gain_choice(self, state, player, choices, normal):
         """Prefer useful Action gains over low-value money while Collection is active."""
 
-        if getattr(player, "collection_played", 0) <= 0:
+        if player.turn.collection_played <= 0:
             return normal
 
         if normal is not None and getattr(normal, "is_action", False):
@@ -14,7 +14,7 @@ from dataclasses import dataclass
 from typing import Iterable, Literal, Optional
 
 from dominion.boards.loader import BoardConfig
-from dominion.cards.registry import get_card
+from dominion.cards.metadata import get_card_metadata
 from dominion.strategy.enhanced_strategy import EnhancedStrategy, PriorityRule, WayRule
 from dominion.strategy.card_roles import infer_card_roles
 from dominion.strategy.genome_simplification import simplify_strategy
@@ -271,7 +271,7 @@ def _board_has_non_card_off_menu_gain_paths(board_config: BoardConfig | None) ->
 def _board_has_attack(board_config: BoardConfig) -> bool:
     for card_name in board_config.kingdom_cards:
         try:
-            if get_card(card_name).is_attack:
+            if get_card_metadata(card_name).is_attack:
                 return True
         except ValueError:
             continue
@@ -281,7 +281,7 @@ def _board_has_attack(board_config: BoardConfig) -> bool:
 def _board_has_omen(board_config: BoardConfig) -> bool:
     for card_name in board_config.kingdom_cards:
         try:
-            if get_card(card_name).is_omen:
+            if get_card_metadata(card_name).is_omen:
                 return True
         except ValueError:
             continue
@@ -291,7 +291,7 @@ def _board_has_omen(board_config: BoardConfig) -> bool:
 def _board_has_fate_or_doom(board_config: BoardConfig) -> bool:
     for card_name in board_config.kingdom_cards:
         try:
-            card = get_card(card_name)
+            card = get_card_metadata(card_name)
         except ValueError:
             continue
         if card.is_fate or card.is_doom:
@@ -86,7 +86,7 @@ class HunterFestivalInfirmaryStrategy(EnhancedStrategy):
             return cards["Province"]
 
         if (
-            player.cards_gained_this_turn >= 1
+            player.turn.cards_gained_this_turn >= 1
             and coins >= 5
             and colonies <= 4
             and "Triumph" in cards
@@ -23,6 +23,7 @@ nested side-effect play is in progress, the helpers fall back to
 """
 
 from contextlib import contextmanager
+from dataclasses import replace
 
 from .base_way import Way
 
@@ -166,15 +167,12 @@ class WayOfTheChameleon(Way):
                         if self_card.stats.coins > 0:
                             state["coins_requested"] += self_card.stats.coins
 
-                        saved_cards = self_card.stats.cards
-                        saved_coins = self_card.stats.coins
-                        self_card.stats.cards = 0
-                        self_card.stats.coins = 0
+                        saved_stats = self_card.stats
+                        self_card.stats = replace(saved_stats, cards=0, coins=0)
                         try:
                             original(self_card, gs)
                         finally:
-                            self_card.stats.cards = saved_cards
-                            self_card.stats.coins = saved_coins
+                            self_card.stats = saved_stats
                     else:
                         # Nested side-effect play, OR the targeted card
                         # being re-entered from inside its own body
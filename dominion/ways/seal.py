@@ -10,4 +10,4 @@ class WayOfTheSeal(Way):
     def apply(self, game_state, card) -> None:
         player = game_state.current_player
         player.coins += 1
-        player.way_of_seal_active = True
+        player.turn.way_of_seal_active = True
@@ -10,4 +10,4 @@ class WayOfTheSquirrel(Way):
     def apply(self, game_state, card) -> None:
         player = game_state.current_player
         # Bank 2 cards to draw at start of next turn.
-        player.squirrel_pending = getattr(player, "squirrel_pending", 0) + 2
+        player.squirrel_pending += 2
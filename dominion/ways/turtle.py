@@ -12,6 +12,4 @@ class WayOfTheTurtle(Way):
         # Remove the just-played card from in_play and stash it for next turn.
         if card in player.in_play:
             player.in_play.remove(card)
-        if not hasattr(player, "turtle_set_aside"):
-            player.turtle_set_aside = []
         player.turtle_set_aside.append(card)
@@ -28,6 +28,7 @@ from dominion.analysis.seed_genomes import build_seed_genomes, trick_signature
 from dominion.boards.loader import load_board
 from dominion.reporting.html_report import generate_leaderboard_html
 from dominion.simulation.genetic_trainer import GeneticTrainer
+from dominion.simulation.result_store import ResultStore, board_fingerprint, play_stored_matchup
 from dominion.simulation.strategy_battle import StrategyBattle
 from dominion.strategy.enhanced_strategy import EnhancedStrategy
 from runner import save_strategy_as_python
@@ -67,18 +68,29 @@ def run_matchup(battle, factory_a, factory_b, num_games):
     return a_wins, num_games - a_wins
 
 
-def round_robin(strategies, battle, num_games):
-    """Run a round-robin tournament, return {name: {wins, losses, win_rate}}."""
+def round_robin(strategies, battle, num_games, store=None, board_key=None):
+    """Run a round-robin tournament, return {name: {wins, losses, win_rate}}.
+
+    With a :class:`ResultStore`, games already stored for ``board_key`` are
+    read back instead of replayed.
+    """
     names = list(strategies.keys())
+    kingdom = battle.board_config.kingdom_cards if battle.board_config else None
     results = {n: {"wins": 0, "losses": 0} for n in names}
 
     for i in range(len(names)):
         for j in range(i + 1, len(names)):
             na, nb = names[i], names[j]
             logger.info("  %s vs %s (%d games)...", na, nb, num_games)
-            a_wins, b_wins = run_matchup(
-                battle, strategies[na], strategies[nb], num_games
-            )
+            if store is not None:
+                matchup = play_stored_matchup(
+                    store, battle, strategies[na](), strategies[nb](), num_games, board_key, kingdom
+                )
+                a_wins, b_wins = matchup.a_wins, matchup.b_wins
+            else:
+                a_wins, b_wins = run_matchup(
+                    battle, strategies[na], strategies[nb], num_games
+                )
             results[na]["wins"] += a_wins
             results[na]["losses"] += b_wins
             results[nb]["wins"] += b_wins
@@ -166,6 +178,10 @@ def main():
         "--output-dir", type=Path, default=Path("generated_strategies"),
         help="Directory to save evolved strategies (default: generated_strategies/)",
     )
+    parser.add_argument(
+        "--results-db", type=Path, default=None,
+        help="SQLite result store; tournament games already stored are reused instead of replayed",
+    )
 
     args = parser.parse_args()
 
@@ -224,6 +240,8 @@ def main():
         return
 
     battle = StrategyBattle(board_config=board_config, log_frequency=0)
+    store = ResultStore(args.results_db) if args.results_db else None
+    board_key = board_fingerprint(args.board)
 
     # --- Phase 1: Seed Tournament ---
     logger.info("=" * 60)
@@ -232,7 +250,9 @@ def main():
     logger.info("  Seeds: %s", ", ".join(seeds.keys()))
     logger.info("=" * 60)
 
-    seed_results = round_robin(seeds, battle, args.tournament_games)
+    seed_results = round_robin(seeds, battle, args.tournament_games, store, board_key)
+    if store is not None:
+        store.commit()
 
     logger.info("\nSeed Rankings:")
     ranked = sorted(seed_results.items(), key=lambda x: x[1]["win_rate"], reverse=True)
@@ -339,7 +359,9 @@ def main():
         s = strat
         all_strategies[name] = lambda _s=s: deepcopy(_s)
 
-    final_results = round_robin(all_strategies, battle, args.tournament_games)
+    final_results = round_robin(all_strategies, battle, args.tournament_games, store, board_key)
+    if store is not None:
+        store.close()
 
     logger.info("\nFinal Rankings:")
     final_ranked = sorted(final_results.items(), key=lambda x: x[1]["win_rate"], reverse=True)
@@ -7,30 +7,125 @@ and produces an HTML comparison report.
 import argparse
 import importlib
 import logging
+import math
+import multiprocessing as mp
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from copy import deepcopy
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Optional
 
 from dominion.ai.genetic_ai import GeneticAI
-from dominion.boards.loader import load_board
+from dominion.boards.loader import BoardConfig, load_board
 from dominion.reporting.html_report import generate_sweep_report
 from dominion.simulation.strategy_battle import StrategyBattle
 from dominion.strategy.enhanced_strategy import EnhancedStrategy, PriorityRule
 
 logger = logging.getLogger(__name__)
 
+# Worker-side context for parallel sweeps, set once per worker process by
+# ``_init_worker``. The parent process never touches these.
+_WORKER_CONTEXT: Optional[tuple[StrategyBattle, dict[str, EnhancedStrategy], EnhancedStrategy]] = None
+
+
+def _play_games(
+    battle: StrategyBattle,
+    variant: EnhancedStrategy,
+    baseline: EnhancedStrategy,
+    kingdom_cards: Optional[list[str]],
+    game_numbers: list[int],
+    seed: int,
+) -> list[dict[str, Any]]:
+    """Play the seeded games ``game_numbers`` of ``variant`` vs ``baseline``.
+
+    Game ``n`` reseeds the RNG with ``seed + n`` and seats the variant first
+    on even ``n``, so every variant (and the baseline mirror) sees an
+    identical game set.
+    """
+    results = []
+    for game_num in game_numbers:
+        random.seed(seed + game_num)
+        ai_variant = GeneticAI(variant)
+        ai_baseline = GeneticAI(baseline)
+
+        if game_num % 2 == 0:
+            winner, scores, _, turns = battle.run_game(ai_variant, ai_baseline, kingdom_cards)
+        else:
+            winner, scores, _, turns = battle.run_game(ai_baseline, ai_variant, kingdom_cards)
+
+        variant_score = scores[ai_variant.name]
+        baseline_score = scores[ai_baseline.name]
+        results.append(
+            {
+                "game_number": game_num + 1,
+                "variant_won": winner == ai_variant,
+                "variant_score": variant_score,
+                "baseline_score": baseline_score,
+                "margin": variant_score - baseline_score,
+                "turns": turns,
+            }
+        )
+    return results
+
+
+def _init_worker(
+    board_config: Optional[BoardConfig],
+    strategies: dict[str, EnhancedStrategy],
+    baseline: EnhancedStrategy,
+) -> None:
+    """Process-pool initializer: keep the sweep's strategies and one battle per worker."""
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = (StrategyBattle(board_config=board_config, log_frequency=0), strategies, baseline)
+
+
+def _play_chunk(name: str, game_numbers: list[int], seed: int) -> tuple[str, list[dict[str, Any]]]:
+    """Process-pool entry point: play a chunk of games for one variant."""
+    battle, strategies, baseline = _WORKER_CONTEXT
+    return name, _play_games(battle, strategies[name], baseline, battle.kingdom_cards, game_numbers, seed)
+
+
+def _paired_difference(variant_games: list[dict[str, Any]], mirror_games: list[dict[str, Any]]) -> tuple[float, float]:
+    """Mean and 95% half-width of per-game (variant win - mirror win).
+
+    The mirror is the baseline playing itself on the same seed and seat, so
+    seat and shuffle luck shared by both games cancels out of the difference.
+    """
+    diffs = [
+        int(v["variant_won"]) - int(m["variant_won"])
+        for v, m in zip(variant_games, mirror_games)
+    ]
+    n = len(diffs)
+    if n == 0:
+        return 0.0, 0.0
+    mean = sum(diffs) / n
+    if n < 2:
+        return mean, 0.0
+    var = sum((d - mean) ** 2 for d in diffs) / (n - 1)
+    return mean, 1.96 * math.sqrt(var / n)
+
 
 class HypothesisTester:
-    """Sweep a single parameter and battle variants against a baseline."""
+    """Sweep a single parameter and battle variants against a baseline.
+
+    Every variant plays the same seeded game set against the baseline, and
+    the baseline's own mirror games on that set are played once and shared
+    as a paired control (common random numbers). With ``processes`` > 1,
+    games run in a forked process pool.
+    """
 
     def __init__(
         self,
         board: Optional[str] = None,
         games: int = 500,
+        *,
+        seed: int = 0,
+        processes: int = 0,
     ) -> None:
         self.board = board
         self.games = games
+        self.seed = seed
+        self.processes = processes
 
     def sweep(
         self,
@@ -40,6 +135,7 @@ class HypothesisTester:
         condition_factory: Callable[[Any], Callable],
         values: list,
         labels: Optional[list[str]] = None,
+        on_result: Optional[Callable[[dict[str, Any]], None]] = None,
     ) -> dict[str, Any]:
         """Sweep a condition parameter and battle each variant against the baseline.
 
@@ -50,6 +146,7 @@ class HypothesisTester:
             condition_factory: Callable(value) -> condition callable.
             values: List of parameter values to sweep.
             labels: Optional display labels for each value.
+            on_result: Optional callback, see :meth:`compare`.
 
         Returns:
             Dict with sweep results suitable for ``generate_sweep_report``.
@@ -86,13 +183,14 @@ class HypothesisTester:
 
                 variants[label] = _make_factory()
 
-        return self.compare(variants=variants)
+        return self.compare(variants=variants, on_result=on_result)
 
     def compare(
         self,
         variants: dict[str, Callable[[], EnhancedStrategy]],
         board: Optional[str] = None,
         games: Optional[int] = None,
+        on_result: Optional[Callable[[dict[str, Any]], None]] = None,
     ) -> dict[str, Any]:
         """Battle named variants against the first (baseline).
 
@@ -100,6 +198,8 @@ class HypothesisTester:
             variants: Ordered dict mapping name -> strategy factory.
             board: Board file override (falls back to instance default).
             games: Number of games override (falls back to instance default).
+            on_result: Optional callback receiving the partial results dict
+                each time a variant finishes, so reports can stream.
 
         Returns:
             Dict with comparison results suitable for ``generate_sweep_report``.
@@ -108,110 +208,133 @@ class HypothesisTester:
         num_games = games or self.games
 
         board_config = load_board(board_path) if board_path else None
-
-        battle = StrategyBattle(
-            board_config=board_config,
-            log_frequency=0,
-        )
+        kingdom_cards = board_config.kingdom_cards if board_config else None
 
         names = list(variants.keys())
         baseline_name = names[0]
-        baseline_factory = variants[baseline_name]
-
-        all_results: list[dict[str, Any]] = []
-
-        for name in names:
-            factory = variants[name]
-            is_baseline = name == baseline_name
-            entry: dict[str, Any] = {
-                "name": name,
-                "is_baseline": is_baseline,
-                "wins": 0,
-                "losses": 0,
-                "total_score": 0,
-                "baseline_total_score": 0,
-                "detailed_results": [],
-            }
+        # Build each strategy once; strategies hold no per-game state, so
+        # every game of a variant shares the same object.
+        strategies = {name: variants[name]() for name in names}
+        baseline = strategies[baseline_name]
 
-            if is_baseline:
-                # Baseline vs itself: report 50% by convention
-                entry["wins"] = num_games // 2
-                entry["losses"] = num_games - num_games // 2
-                entry["win_rate"] = 50.0
-                entry["avg_score"] = 0.0
-                entry["avg_baseline_score"] = 0.0
-                entry["p_value"] = 1.0
-                all_results.append(entry)
-                continue
-
-            kingdom_cards = board_config.kingdom_cards if board_config else None
-
-            for game_num in range(num_games):
-                variant_strat = factory()
-                baseline_strat = baseline_factory()
-                ai_variant = GeneticAI(variant_strat)
-                ai_baseline = GeneticAI(baseline_strat)
-
-                if game_num % 2 == 0:
-                    winner, scores, _, turns = battle.run_game(
-                        ai_variant, ai_baseline, kingdom_cards
-                    )
-                else:
-                    winner, scores, _, turns = battle.run_game(
-                        ai_baseline, ai_variant, kingdom_cards
-                    )
-
-                variant_won = winner == ai_variant
-                variant_score = scores[ai_variant.name]
-                baseline_score = scores[ai_baseline.name]
-
-                entry["total_score"] += variant_score
-                entry["baseline_total_score"] += baseline_score
-
-                if variant_won:
-                    entry["wins"] += 1
-                else:
-                    entry["losses"] += 1
-
-                entry["detailed_results"].append(
-                    {
-                        "game_number": game_num + 1,
-                        "variant_won": variant_won,
-                        "variant_score": variant_score,
-                        "baseline_score": baseline_score,
-                        "margin": variant_score - baseline_score,
-                        "turns": turns,
-                    }
+        results: dict[str, Any] = {
+            "baseline_name": baseline_name,
+            "games_per_matchup": num_games,
+            "seed": self.seed,
+            "variants": [],
+        }
+        finished: dict[str, list[dict[str, Any]]] = {}
+
+        def finish(name: str, games_played: list[dict[str, Any]]) -> None:
+            finished[name] = sorted(games_played, key=lambda g: g["game_number"])
+            # Entries are emitted in sweep order; the baseline mirror is the
+            # paired control, so nothing is reported before it is known.
+            for pending in names[len(results["variants"]):]:
+                if pending not in finished or baseline_name not in finished:
+                    break
+                results["variants"].append(
+                    self._summarize(pending, pending == baseline_name, finished[pending], finished[baseline_name])
+                )
+                if on_result is not None:
+                    on_result(results)
+
+        game_numbers = list(range(num_games))
+        if self.processes > 1 and "fork" in mp.get_all_start_methods():
+            chunk = max(1, math.ceil(num_games / self.processes))
+            pending_games = {name: [] for name in names}
+            remaining = {name: 0 for name in names}
+            # Variant strategies hold lambda conditions and cannot be pickled;
+            # forked workers inherit the initializer arguments unpickled.
+            with ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=mp.get_context("fork"),
+                initializer=_init_worker,
+                initargs=(board_config, strategies, baseline),
+            ) as pool:
+                futures = []
+                for name in names:
+                    for start in range(0, num_games, chunk):
+                        futures.append(pool.submit(_play_chunk, name, game_numbers[start : start + chunk], self.seed))
+                        remaining[name] += 1
+                for future in as_completed(futures):
+                    name, chunk_games = future.result()
+                    pending_games[name].extend(chunk_games)
+                    remaining[name] -= 1
+                    if remaining[name] == 0:
+                        finish(name, pending_games[name])
+        else:
+            battle = StrategyBattle(board_config=board_config, log_frequency=0)
+            for name in names:
+                finish(
+                    name,
+                    _play_games(battle, strategies[name], baseline, kingdom_cards, game_numbers, self.seed),
                 )
 
-            entry["win_rate"] = entry["wins"] / num_games * 100
-            entry["avg_score"] = entry["total_score"] / num_games
-            entry["avg_baseline_score"] = entry["baseline_total_score"] / num_games
-
-            # p-value via binomial test
-            from scipy.stats import binomtest
-
-            entry["p_value"] = binomtest(
-                entry["wins"], num_games, p=0.5, alternative="two-sided"
-            ).pvalue
-
-            logger.info(
-                "%s: %d/%d (%.1f%%) p=%.4f",
-                name,
-                entry["wins"],
-                num_games,
-                entry["win_rate"],
-                entry["p_value"],
-            )
-
-            all_results.append(entry)
+        return results
 
-        return {
-            "baseline_name": baseline_name,
-            "games_per_matchup": num_games,
-            "variants": all_results,
+    @staticmethod
+    def _summarize(
+        name: str,
+        is_baseline: bool,
+        games_played: list[dict[str, Any]],
+        mirror_games: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        num_games = len(games_played)
+        wins = sum(g["variant_won"] for g in games_played)
+        total_score = sum(g["variant_score"] for g in games_played)
+        baseline_total_score = sum(g["baseline_score"] for g in games_played)
+        entry: dict[str, Any] = {
+            "name": name,
+            "is_baseline": is_baseline,
+            "wins": wins,
+            "losses": num_games - wins,
+            "total_score": total_score,
+            "baseline_total_score": baseline_total_score,
+            "detailed_results": games_played,
         }
 
+        if is_baseline:
+            # Baseline vs itself: report 50% by convention, but keep the
+            # mirror's actual seat-side record for reference.
+            entry["mirror_win_rate"] = wins / num_games * 100 if num_games else 0.0
+            entry["wins"] = num_games // 2
+            entry["losses"] = num_games - num_games // 2
+            entry["win_rate"] = 50.0
+            entry["avg_score"] = 0.0
+            entry["avg_baseline_score"] = 0.0
+            entry["p_value"] = 1.0
+            entry["paired_delta"] = 0.0
+            entry["paired_ci"] = 0.0
+            entry["detailed_results"] = []
+            return entry
+
+        entry["win_rate"] = wins / num_games * 100
+        entry["avg_score"] = total_score / num_games
+        entry["avg_baseline_score"] = baseline_total_score / num_games
+
+        # Win-rate change relative to the baseline mirror on the same seeds,
+        # in percentage points, with a 95% interval.
+        delta, half_width = _paired_difference(games_played, mirror_games)
+        entry["paired_delta"] = delta * 100
+        entry["paired_ci"] = half_width * 100
+
+        # p-value via binomial test
+        from scipy.stats import binomtest
+
+        entry["p_value"] = binomtest(wins, num_games, p=0.5, alternative="two-sided").pvalue
+
+        logger.info(
+            "%s: %d/%d (%.1f%%) p=%.4f, paired delta %+.1f +/- %.1f pts",
+            name,
+            wins,
+            num_games,
+            entry["win_rate"],
+            entry["p_value"],
+            entry["paired_delta"],
+            entry["paired_ci"],
+        )
+        return entry
+
 
 def _load_strategy(spec: str) -> Callable[[], EnhancedStrategy]:
     """Load a module:function spec and return the factory callable."""
@@ -266,6 +389,18 @@ def main():
         default=500,
         help="Number of games per matchup (default: 500)",
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Base seed; game n of every variant uses seed + n (default: 0)",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=0,
+        help="Worker processes for games; 0 or 1 runs serially (default: 0)",
+    )
     parser.add_argument(
         "--output",
         type=Path,
@@ -300,7 +435,16 @@ def main():
         expr = condition_template.replace("{x}", repr(x))
         return eval(f"PriorityRule.{expr}")  # noqa: S307
 
-    tester = HypothesisTester(board=args.board, games=args.games)
+    tester = HypothesisTester(
+        board=args.board, games=args.games, seed=args.seed, processes=args.processes
+    )
+
+    if args.output is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_path = Path("reports") / f"hypothesis_{timestamp}.html"
+    else:
+        output_path = args.output
+    output_path.parent.mkdir(parents=True, exist_ok=True)
 
     logger.info(
         "Sweeping %s on %s.%s with values %s",
@@ -317,16 +461,11 @@ def main():
         condition_factory=condition_factory,
         values=values,
         labels=labels,
+        # Rewrite the report as each variant finishes so long sweeps can be
+        # inspected while they run.
+        on_result=lambda partial: generate_sweep_report(partial, output_path),
     )
 
-    # Generate report
-    if args.output is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = Path("reports") / f"hypothesis_{timestamp}.html"
-    else:
-        output_path = args.output
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
     generate_sweep_report(results, output_path)
     logger.info("Report written to %s", output_path)
 
@@ -11,6 +11,8 @@ Curse) or present in the board's kingdom.
 Usage:
     python leaderboard.py --board boards/siege_engine.txt
     python leaderboard.py --board boards/siege_engine.txt --games 1000
+    python leaderboard.py --board boards/siege_engine.txt --results-db results/matchups.sqlite
+    python leaderboard.py --board boards/siege_engine.txt --rating --games 20
 """
 
 import argparse
@@ -25,6 +27,8 @@ import coloredlogs
 from dominion.ai.genetic_ai import GeneticAI
 from dominion.boards.loader import load_board
 from dominion.reporting.html_report import generate_leaderboard_html
+from dominion.simulation.rating_tournament import RatingTournament, ratings_to_leaderboard
+from dominion.simulation.result_store import ResultStore, board_fingerprint, play_stored_matchup
 from dominion.simulation.strategy_battle import StrategyBattle
 
 logger = logging.getLogger(__name__)
@@ -124,30 +128,50 @@ def discover_strategies(board_kingdom: set[str]) -> dict[str, callable]:
     return strategies
 
 
-def round_robin(strategies, battle, num_games):
-    """Run a round-robin tournament, return {name: {wins, losses, win_rate}}."""
+def play_pair(strategies, battle, na, nb, num_games, store=None, board_key=None, seed=0):
+    """Play ``num_games`` seat-alternated games of ``na`` vs ``nb``; return ``na``'s wins.
+
+    With a :class:`ResultStore`, games ``seed`` .. ``seed + num_games - 1``
+    already stored for ``board_key`` are read back instead of replayed.
+    """
+    kingdom = battle.board_config.kingdom_cards if battle.board_config else None
+    if store is not None:
+        matchup = play_stored_matchup(
+            store, battle, strategies[na](), strategies[nb](), num_games, board_key, kingdom, seed=seed
+        )
+        logger.info("  %d stored, %d played", num_games - matchup.played, matchup.played)
+        return matchup.a_wins
+
+    a_wins = 0
+    for g in range(num_games):
+        ai_a = GeneticAI(strategies[na]())
+        ai_b = GeneticAI(strategies[nb]())
+        if g % 2 == 0:
+            winner, _, _, _ = battle.run_game(ai_a, ai_b, kingdom)
+        else:
+            winner, _, _, _ = battle.run_game(ai_b, ai_a, kingdom)
+        if winner == ai_a:
+            a_wins += 1
+    return a_wins
+
+
+def round_robin(strategies, battle, num_games, store=None, board_key=None):
+    """Run a round-robin tournament, return {name: {wins, losses, win_rate}}.
+
+    With a :class:`ResultStore`, games already stored for ``board_key`` are
+    read back instead of replayed.
+    """
     names = list(strategies.keys())
     results = {n: {"wins": 0, "losses": 0} for n in names}
     total = len(names) * (len(names) - 1) // 2
     done = 0
 
-    kingdom = battle.board_config.kingdom_cards if battle.board_config else None
-
     for i in range(len(names)):
         for j in range(i + 1, len(names)):
             na, nb = names[i], names[j]
             done += 1
             logger.info("[%d/%d] %s vs %s (%d games)...", done, total, na, nb, num_games)
-            a_wins = 0
-            for g in range(num_games):
-                ai_a = GeneticAI(strategies[na]())
-                ai_b = GeneticAI(strategies[nb]())
-                if g % 2 == 0:
-                    winner, _, _, _ = battle.run_game(ai_a, ai_b, kingdom)
-                else:
-                    winner, _, _, _ = battle.run_game(ai_b, ai_a, kingdom)
-                if winner == ai_a:
-                    a_wins += 1
+            a_wins = play_pair(strategies, battle, na, nb, num_games, store, board_key)
             b_wins = num_games - a_wins
             results[na]["wins"] += a_wins
             results[na]["losses"] += b_wins
@@ -166,6 +190,28 @@ def round_robin(strategies, battle, num_games):
     return results
 
 
+def rating_tournament(strategies, battle, batch_games, max_games=None, store=None, board_key=None):
+    """Rate strategies with an adaptive Bradley-Terry tournament.
+
+    Returns the same shape as :func:`round_robin` plus ``rating``,
+    ``rating_low`` and ``rating_high`` for each strategy.
+    """
+    def play(na, nb, games, offset):
+        return play_pair(strategies, battle, na, nb, games, store, board_key, seed=offset)
+
+    def progress(na, nb, games, a_wins):
+        logger.info("[%d games] %s %d - %d %s", tournament.games_played, na, a_wins, games - a_wins, nb)
+
+    tournament = RatingTournament(list(strategies), play, batch_games=batch_games, max_games=max_games)
+    ratings = tournament.run(progress)
+    logger.info(
+        "Rating tournament: %d games, ranking %s",
+        tournament.games_played,
+        "resolved" if tournament.is_resolved() else "not fully resolved (budget spent)",
+    )
+    return ratings_to_leaderboard(ratings, tournament.z)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate a leaderboard for a board")
     parser.add_argument(
@@ -180,6 +226,19 @@ def main():
         "--output", type=Path, default=None,
         help="Output HTML file (default: auto-generated in reports/)",
     )
+    parser.add_argument(
+        "--rating", action="store_true",
+        help="Run an adaptive rating tournament instead of a full round-robin; "
+             "--games is then the batch size per pairing round",
+    )
+    parser.add_argument(
+        "--max-games", type=int, default=None,
+        help="Total game budget for --rating (default: cost of the round-robin)",
+    )
+    parser.add_argument(
+        "--results-db", type=Path, default=None,
+        help="SQLite result store; games already stored are reused instead of replayed",
+    )
     args = parser.parse_args()
 
     board_config = load_board(args.board)
@@ -202,7 +261,16 @@ def main():
     logger.info("")
 
     battle = StrategyBattle(board_config=board_config, log_frequency=0)
-    results = round_robin(strategies, battle, args.games)
+    store = ResultStore(args.results_db) if args.results_db else None
+    board_key = board_fingerprint(args.board)
+    try:
+        if args.rating:
+            results = rating_tournament(strategies, battle, args.games, args.max_games, store, board_key)
+        else:
+            results = round_robin(strategies, battle, args.games, store, board_key)
+    finally:
+        if store is not None:
+            store.close()
 
     # Enrich results with description and kingdom cards used
     for name, factory in strategies.items():
@@ -213,12 +281,20 @@ def main():
 
     logger.info("")
     logger.info("Leaderboard:")
-    ranked = sorted(results.items(), key=lambda x: x[1]["win_rate"], reverse=True)
+    sort_key = "rating" if args.rating else "win_rate"
+    ranked = sorted(results.items(), key=lambda x: x[1][sort_key], reverse=True)
     for rank, (name, stats) in enumerate(ranked, 1):
-        logger.info(
-            "  #%d %s: %d-%d (%.1f%%)",
-            rank, name, stats["wins"], stats["losses"], stats["win_rate"],
-        )
+        if args.rating:
+            logger.info(
+                "  #%d %s: %.0f [%.0f, %.0f] %d-%d",
+                rank, name, stats["rating"], stats["rating_low"], stats["rating_high"],
+                stats["wins"], stats["losses"],
+            )
+        else:
+            logger.info(
+                "  #%d %s: %d-%d (%.1f%%)",
+                rank, name, stats["wins"], stats["losses"], stats["win_rate"],
+            )
 
     if args.output is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Fixed engine benchmark: seeded strategy games, timed and call-counted.
+
+Every perf change to the engine should show a net gain here. The workload
+is a fixed set of strategy matchups, each game seeded by its index, so two
+runs on the same tree play identical games. It only uses APIs that predate
+the engine perf work, so the same file measures older commits too::
+
+    git worktree add /tmp/base <rev>
+    PYTHONPATH=/tmp/base python scripts/bench_engine.py --calls
+
+Usage
+-----
+    python scripts/bench_engine.py                  # best-of-3 CPU seconds
+    python scripts/bench_engine.py --calls          # profiled call count
+    python scripts/bench_engine.py --calls --check  # fail above CALL_BUDGET
+
+Call counts are exact for a given tree, so ``--check`` (and
+``tests/test_bench_engine.py``, which runs four games of the first
+matchup) catches regressions that CPU timing noise would hide.
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import logging
+import pstats
+import random
+import sys
+import tempfile
+import time
+from typing import Sequence
+
+MATCHUPS = (
+    ("Big Money", "Big Money Smithy"),
+    ("Chapel Witch", "Big Money"),
+    ("Village Smithy Lab", "Chapel Witch"),
+    ("Wizards Lich Engine", "Lisbon Festival Bigmoney"),
+)
+GAMES_PER_MATCHUP = 10
+
+# Profiled calls for the full workload (7.79M when set) and for the first
+# matchup's first four games under the test suite, which validates the VP
+# ledger (0.59M). Both leave about 4% headroom; lower them when a change
+# makes the engine cheaper.
+CALL_BUDGET = 8_100_000
+SMOKE_CALL_BUDGET = 620_000
+
+
+def play(matchups: Sequence[tuple[str, str]] = MATCHUPS, games: int = GAMES_PER_MATCHUP) -> int:
+    """Play ``games`` seeded games per matchup and return the games played."""
+    from dominion.ai.genetic_ai import GeneticAI
+    from dominion.simulation.strategy_battle import StrategyBattle
+
+    logging.disable(logging.CRITICAL)
+    played = 0
+    with tempfile.TemporaryDirectory(prefix="bench-engine-") as log_folder:
+        battle = StrategyBattle(log_folder=log_folder, log_frequency=0)
+        for name1, name2 in matchups:
+            strategy1 = battle.strategy_loader.get_strategy(name1)
+            strategy2 = battle.strategy_loader.get_strategy(name2)
+            kingdom = battle._determine_kingdom_cards(strategy1, strategy2)
+            for game in range(games):
+                random.seed(game)
+                battle.run_game(GeneticAI(strategy1), GeneticAI(strategy2), kingdom)
+                played += 1
+    return played
+
+
+def count_calls(matchups: Sequence[tuple[str, str]] = MATCHUPS, games: int = GAMES_PER_MATCHUP) -> int:
+    """Python function calls made while playing the workload."""
+    play(matchups, 1)  # warm registries and caches outside the profile
+    profile = cProfile.Profile()
+    profile.runcall(play, matchups, games)
+    return pstats.Stats(profile).total_calls
+
+
+def cpu_seconds(repeat: int, matchups: Sequence[tuple[str, str]] = MATCHUPS, games: int = GAMES_PER_MATCHUP) -> float:
+    """Best CPU time over ``repeat`` runs of the workload."""
+    play(matchups, 1)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        play(matchups, games)
+        best = min(best, time.process_time() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time and call-count a fixed set of seeded strategy games")
+    parser.add_argument("--games", type=int, default=GAMES_PER_MATCHUP, help="Games per matchup")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs; the best is reported")
+    parser.add_argument("--calls", action="store_true", help="Report profiled function calls instead of time")
+    parser.add_argument("--check", action="store_true", help="With --calls, exit 1 above CALL_BUDGET")
+    args = parser.parse_args()
+
+    games = len(MATCHUPS) * args.games
+    if args.calls:
+        calls = count_calls(games=args.games)
+        print(f"{games} games: {calls:,} calls")
+        if args.check and calls > CALL_BUDGET:
+            print(f"over budget: {calls:,} > {CALL_BUDGET:,}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        print(f"{games} games: {cpu_seconds(args.repeat, games=args.games):.2f}s CPU (best of {args.repeat})")
+
+
+if __name__ == "__main__":
+    main()
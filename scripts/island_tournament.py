@@ -37,6 +37,7 @@ import coloredlogs
 
 from dominion.ai.genetic_ai import GeneticAI
 from dominion.boards.loader import load_board
+from dominion.simulation.result_store import ResultStore, board_fingerprint, play_stored_matchup
 from dominion.simulation.strategy_battle import StrategyBattle
 from dominion.strategy.enhanced_strategy import EnhancedStrategy
 from dominion.strategy.strategy_loader import StrategyLoader
@@ -188,10 +189,14 @@ def _run_matchup(
     b_ref: str,
     games: int,
     board_path: str,
+    results_db: Optional[str] = None,
 ) -> dict:
     """Play ``games`` games between strategies ``a_ref`` and ``b_ref`` on the
     given board. Returns a result dict with wins, margins, and turn counts.
 
+    With ``results_db``, games already in that result store are reused and
+    only the missing ones are played.
+
     Lives at module level so it can be sent to a ProcessPoolExecutor."""
     loader = StrategyLoader()
     a_name, a_strategy = _resolve_strategy(a_ref, loader)
@@ -209,23 +214,39 @@ def _run_matchup(
     b_total_score = 0
     total_turns = 0
 
-    for i in range(games):
-        ai_a = GeneticAI(a_strategy)
-        ai_b = GeneticAI(b_strategy)
-        # Alternate first player to remove the seat advantage.
-        if i % 2 == 0:
-            winner, scores, _, turns = battle.run_game(
-                ai_a, ai_b, board_config.kingdom_cards
-            )
-        else:
-            winner, scores, _, turns = battle.run_game(
-                ai_b, ai_a, board_config.kingdom_cards
+    if results_db:
+        with ResultStore(results_db) as store:
+            matchup = play_stored_matchup(
+                store,
+                battle,
+                a_strategy,
+                b_strategy,
+                games,
+                board_fingerprint(board_path),
+                board_config.kingdom_cards,
             )
-        if winner == ai_a:
-            a_wins += 1
-        a_total_score += scores.get(ai_a.name, 0)
-        b_total_score += scores.get(ai_b.name, 0)
-        total_turns += turns
+        a_wins = matchup.a_wins
+        a_total_score = matchup.a_total_score
+        b_total_score = matchup.b_total_score
+        total_turns = matchup.total_turns
+    else:
+        for i in range(games):
+            ai_a = GeneticAI(a_strategy)
+            ai_b = GeneticAI(b_strategy)
+            # Alternate first player to remove the seat advantage.
+            if i % 2 == 0:
+                winner, scores, _, turns = battle.run_game(
+                    ai_a, ai_b, board_config.kingdom_cards
+                )
+            else:
+                winner, scores, _, turns = battle.run_game(
+                    ai_b, ai_a, board_config.kingdom_cards
+                )
+            if winner == ai_a:
+                a_wins += 1
+            a_total_score += scores.get(ai_a.name, 0)
+            b_total_score += scores.get(ai_b.name, 0)
+            total_turns += turns
 
     return {
         "a_name": a_name,
@@ -312,6 +333,10 @@ def main() -> None:
         help="Cap parallel workers. 0 = number of matchups.",
     )
     parser.add_argument("--output", help="Write the Markdown report to this path.")
+    parser.add_argument(
+        "--results-db",
+        help="SQLite result store; games already stored are reused and only missing ones are played.",
+    )
     args = parser.parse_args()
 
     refs: list[str] = []
@@ -382,7 +407,7 @@ def main() -> None:
         ctx = mp.get_context("spawn")
         with ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx) as ex:
             futures = {
-                ex.submit(_run_matchup, a_ref, b_ref, args.games, board_path): (a_name, b_name)
+                ex.submit(_run_matchup, a_ref, b_ref, args.games, board_path, args.results_db): (a_name, b_name)
                 for a_name, b_name, a_ref, b_ref in matchups
             }
             for fut in as_completed(futures):
@@ -400,7 +425,7 @@ def main() -> None:
     else:
         for a_name, b_name, a_ref, b_ref in matchups:
             try:
-                r = _run_matchup(a_ref, b_ref, args.games, board_path)
+                r = _run_matchup(a_ref, b_ref, args.games, board_path, args.results_db)
                 raw_results.append(r)
                 logger.info(
                     "%s vs %s: %.1f%% (margin %+.1f)",
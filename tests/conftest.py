@@ -3,6 +3,8 @@ import random
 
 import pytest
 
+from dominion.game.vp_ledger import VPLedger
+
 
 @pytest.fixture
 def seed_rng(request):
@@ -11,3 +13,21 @@ def seed_rng(request):
         seed = int(os.environ.get("PY_OVERLORD_TEST_SEED", "1729"))
     random.seed(seed)
     yield seed
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _card_metadata_cache(tmp_path_factory):
+    """Keep the card metadata table out of the developer's ~/.cache."""
+    previous = os.environ.get("PY_OVERLORD_CACHE_DIR")
+    os.environ["PY_OVERLORD_CACHE_DIR"] = str(tmp_path_factory.mktemp("py-overlord-cache"))
+    yield
+    if previous is None:
+        del os.environ["PY_OVERLORD_CACHE_DIR"]
+    else:
+        os.environ["PY_OVERLORD_CACHE_DIR"] = previous
+
+
+@pytest.fixture(autouse=True)
+def _validate_vp_ledger(monkeypatch):
+    """Check every incremental VP total against a full recount."""
+    monkeypatch.setattr(VPLedger, "validate", True)
@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 import gymnasium as gym
 from dominion.rl.env import DominionEnv
+from dominion.rl.random_ai import RandomAI
 from dominion.rl.state_encoder import PHASE1_KINGDOM
 
 
@@ -114,3 +115,20 @@ class TestDominionEnv:
         np.testing.assert_array_equal(obs1, obs2)
         env1.close()
         env2.close()
+
+    def test_multiplayer_game_runs_to_the_end(self):
+        env = DominionEnv(kingdom_cards=PHASE1_KINGDOM, num_players=4)
+        obs, info = env.reset(seed=3)
+        assert obs.shape == (env.state_encoder.observation_size,)
+        assert len(env.game_state.players) == 4
+
+        terminated = truncated = False
+        while not (terminated or truncated):
+            action = np.where(info["action_mask"])[0][0]
+            obs, reward, terminated, truncated, info = env.step(action)
+        assert reward in (-1.0, 0.0, 1.0)
+        env.close()
+
+    def test_multiplayer_needs_one_opponent_per_seat(self):
+        with pytest.raises(ValueError):
+            DominionEnv(kingdom_cards=PHASE1_KINGDOM, opponent_ai=RandomAI(), num_players=3)
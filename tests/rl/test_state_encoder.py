@@ -110,3 +110,28 @@ class TestStateEncoder:
         obs2 = encoder.encode(game_state2, player_index=0)
 
         assert not np.array_equal(obs1, obs2)
+
+    def test_opponent_slots_follow_turn_order(self):
+        """Each opponent gets its own slot; unused slots stay zero."""
+        encoder = StateEncoder(PHASE1_KINGDOM, max_opponents=3)
+        assert encoder.observation_size == StateEncoder(PHASE1_KINGDOM).observation_size + 4
+
+        game_state = GameState(players=[], supply={})
+        kingdom_cards = [get_card(name) for name in PHASE1_KINGDOM]
+        game_state.initialize_game([RLAI(), RandomAI(), RandomAI()], kingdom_cards)
+        game_state.players[2].hand = []
+
+        obs = encoder.encode(game_state, player_index=1)
+
+        assert obs[-6] == 0.0  # player 2 (next after player 1) has an empty hand
+        assert obs[-4] == 0.5  # player 0 holds 5 cards
+        assert obs[-2:].tolist() == [0.0, 0.0]
+
+    def test_too_many_opponents_raises(self):
+        encoder = StateEncoder(PHASE1_KINGDOM)
+        game_state = GameState(players=[], supply={})
+        kingdom_cards = [get_card(name) for name in PHASE1_KINGDOM]
+        game_state.initialize_game([RLAI(), RandomAI(), RandomAI()], kingdom_cards)
+
+        with pytest.raises(ValueError):
+            encoder.encode(game_state, player_index=0)
@@ -88,7 +88,7 @@ def test_travelling_fair_gives_2_buys_and_topdeck_active():
     TravellingFair = get_event("Travelling Fair")
     TravellingFair.on_buy(state, player)
     assert player.buys == 3
-    assert player.travelling_fair_active is True
+    assert player.turn.travelling_fair_active is True
 
 
 def test_bonfire_trashes_in_play():
@@ -137,7 +137,7 @@ def test_mission_grants_extra_no_buy_turn():
     player = state.players[0]
     Mission = get_event("Mission")
     Mission.on_buy(state, player)
-    assert player.mission_used_this_turn
+    assert player.turn.mission_used_this_turn
     # Mission's "no buys" restriction must NOT apply to the current turn —
     # it only applies on the granted extra turn. So the flag is deferred.
     assert not player.mission_no_buy_turn
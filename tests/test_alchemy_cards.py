@@ -1,6 +1,7 @@
 """Tests for Alchemy kingdom cards and the Potion treasure."""
 
 from dominion.cards.registry import get_card
+from dominion.game.board_hooks import BoardHooks
 from dominion.game.game_state import GameState
 from tests.utils import ChooseFirstActionAI
 
@@ -30,6 +31,8 @@ def _two_player_state(kingdom_names=None):
     state = GameState(players=[])
     kingdom = [get_card(n) for n in kingdom_names]
     state.initialize_game([ai1, ai2], kingdom)
+    # Tests put cards straight into zones, so keep every optional hook on.
+    state.hooks = BoardHooks()
     state.supply.setdefault("Curse", 10)
     state.supply.setdefault("Silver", 40)
     state.supply.setdefault("Gold", 30)
@@ -159,7 +162,7 @@ def test_apprentice_uses_effective_cost_with_bridge_active():
     p1.ai = TrashAndPlayAI()
     p1.actions = 0
     # Simulate Bridge having been played: cost_reduction is 1.
-    p1.cost_reduction = 1
+    p1.turn.cost_reduction = 1
     p1.hand = [get_card("Apprentice"), get_card("Mine")]   # Mine costs $5
     p1.deck = [get_card("Copper") for _ in range(8)]
     apprentice = get_card("Apprentice")
@@ -476,12 +479,12 @@ def test_golem_bumps_actions_played_counter():
         [get_card("Estate") for _ in range(5)]
         + [get_card("Smithy"), get_card("Village")]   # top = Village
     )
-    actions_before = p1.actions_this_turn
+    actions_before = p1.turn.actions_this_turn
     g = get_card("Golem")
     p1.in_play.append(g)
     g.on_play(state)
     # Two Action plays → +2 actions_this_turn.
-    assert p1.actions_this_turn - actions_before == 2
+    assert p1.turn.actions_this_turn - actions_before == 2
 
 
 def test_golem_fires_action_played_tavern_triggers():
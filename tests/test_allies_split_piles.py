@@ -272,7 +272,7 @@ def test_garrison_ignores_gains_after_its_played_turn():
     assert garrison.tokens == 1
 
     player.turns_taken += 1
-    player.cards_gained_this_turn = 0
+    player.turn.cards_gained_this_turn = 0
     state.gain_card(player, get_card("Estate"))
 
     assert garrison.tokens == 1
@@ -364,7 +364,7 @@ def test_warlord_blocked_indirect_play_returns_card_to_hand():
 
     assert third_smithy in player.hand
     assert third_smithy not in player.in_play
-    assert player.actions_this_turn == 0
+    assert player.turn.actions_this_turn == 0
 
 
 def test_warlord_blocked_hand_play_refunds_voyage_quota():
@@ -400,7 +400,7 @@ def test_warlord_allows_indirect_play_without_hand_source():
     assert played is True
     assert revealed_smithy not in player.hand
     assert revealed_smithy in player.in_play
-    assert player.actions_this_turn == 1
+    assert player.turn.actions_this_turn == 1
 
 
 def test_warlord_allows_indirect_play_from_non_hand_zone_as_third_copy():
@@ -420,7 +420,7 @@ def test_warlord_allows_indirect_play_from_non_hand_zone_as_third_copy():
     assert trashed_smithy in state.trash
     assert trashed_smithy not in player.in_play
     assert len(player.hand) == 3
-    assert player.actions_this_turn == 1
+    assert player.turn.actions_this_turn == 1
 
 
 def test_warlord_allows_non_hand_play_after_prior_hand_source():
@@ -443,7 +443,7 @@ def test_warlord_allows_non_hand_play_after_prior_hand_source():
     assert smithy not in player.hand
     assert smithy in player.in_play
     assert smithy not in player.discard
-    assert player.actions_this_turn == 1
+    assert player.turn.actions_this_turn == 1
 
 
 def test_warlord_blocked_multiplier_stops_replay_loop():
@@ -462,7 +462,7 @@ def test_warlord_blocked_multiplier_stops_replay_loop():
     assert blocked_smithy not in player.in_play
     assert len(player.hand) == 1
     assert len(player.deck) == 5
-    assert player.actions_this_turn == 0
+    assert player.turn.actions_this_turn == 0
 
 
 def test_warlord_allows_replay_not_from_hand():
@@ -479,7 +479,7 @@ def test_warlord_allows_replay_not_from_hand():
     assert replayed_smithy in player.in_play
     assert replayed_smithy not in player.hand
     assert len(player.hand) == 3
-    assert player.actions_this_turn == 1
+    assert player.turn.actions_this_turn == 1
 
 
 def test_warlord_blocks_inherited_estate_as_third_copy():
@@ -42,7 +42,7 @@ def test_bauble_can_choose_favor_and_topdeck_gain():
     bauble.on_play(state)
 
     assert player.favors == favors_before + 1
-    assert player.topdeck_gains is True
+    assert player.turn.topdeck_gains is True
 
     gained = state.gain_card(player, get_card("Silver"))
     assert player.deck[-1] is gained
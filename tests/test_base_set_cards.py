@@ -72,7 +72,7 @@ def test_merchant_first_silver_gives_bonus_coin():
     play_action(state, player, merchant)
 
     # Merchant draws 1 card and gives +1 Action; bonus is queued.
-    assert player.merchant_silver_bonus >= 1
+    assert player.turn.merchant_silver_bonus >= 1
 
     # Now play the Silver: should get +$2 from Silver + $1 Merchant bonus.
     coins_before = player.coins
@@ -81,7 +81,7 @@ def test_merchant_first_silver_gives_bonus_coin():
     # Silver's on_play applied its base stats (+$2) AND fired play_effect
     # which adds the Merchant bonus (+$1).
     assert player.coins - coins_before == 3
-    assert player.merchant_silver_bonus_used
+    assert player.turn.merchant_silver_bonus_used
 
 
 def test_merchant_only_first_silver_gets_bonus():
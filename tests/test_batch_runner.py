@@ -0,0 +1,64 @@
+"""Cross-board batch runner: work-unit planning, sharding and the consolidated table."""
+
+import csv
+
+import pytest
+
+from dominion.simulation.batch_runner import (
+    TABLE_COLUMNS,
+    WorkUnit,
+    load_boards,
+    plan_units,
+    round_robin_pairings,
+    run_batch,
+    write_table,
+)
+from dominion.simulation.strategy_battle import StrategyBattle
+
+BOARDS = ["boards/big_cards.txt", "boards/wharf_kingdom.txt"]
+PAIRING = ("Big Money", "Big Money Smithy")
+
+
+def test_plan_units_splits_each_cell_into_blocks():
+    units = plan_units(boards=2, pairings=1, games=5, block_size=2)
+    assert units[:3] == [WorkUnit(0, 0, 0, 2), WorkUnit(0, 0, 2, 2), WorkUnit(0, 0, 4, 1)]
+    assert len(units) == 6
+    assert sum(unit.games for unit in units if unit.board == 1) == 5
+    with pytest.raises(ValueError):
+        plan_units(1, 1, 4, 0)
+
+
+def test_round_robin_pairings():
+    assert round_robin_pairings(["A", "B", "C"]) == [("A", "B"), ("A", "C"), ("B", "C")]
+
+
+def test_cells_match_a_seeded_run_battle():
+    boards = load_boards(BOARDS[:1])
+    rows = run_batch(boards, [PAIRING], 4, seed=11, block_size=3)
+
+    battle = StrategyBattle(board_config=boards[0][1], log_frequency=0)
+    expected = battle.run_battle(*PAIRING, 4, seed=11)
+    (row,) = rows
+    assert (row["board"], row["strategy_a"], row["strategy_b"]) == ("big_cards", *PAIRING)
+    assert row["a_wins"] == expected["strategy1_wins"]
+    assert row["avg_a_score"] * 4 == expected["strategy1_total_score"]
+    assert row["avg_b_score"] * 4 == expected["strategy2_total_score"]
+
+
+def test_process_pool_and_block_size_do_not_change_the_table(tmp_path):
+    boards = load_boards(BOARDS)
+    inline = run_batch(boards, [PAIRING], 4, seed=2, block_size=4)
+    pooled = run_batch(boards, [PAIRING], 4, seed=2, block_size=1, processes=2)
+    assert pooled == inline
+    assert [row["board"] for row in inline] == ["big_cards", "wharf_kingdom"]
+
+    path = write_table(inline, tmp_path / "table.csv")
+    with path.open() as handle:
+        read = list(csv.DictReader(handle))
+    assert list(read[0]) == list(TABLE_COLUMNS)
+    assert [int(row["games"]) for row in read] == [4, 4]
+
+
+def test_unknown_strategy_is_reported():
+    with pytest.raises(ValueError, match="Nope"):
+        run_batch(load_boards(BOARDS[:1]), [("Big Money", "Nope")], 1)
@@ -0,0 +1,14 @@
+"""Engine call-count budget on a slice of the fixed engine benchmark."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import bench_engine  # noqa: E402
+
+
+def test_engine_stays_within_call_budget():
+    calls = bench_engine.count_calls(bench_engine.MATCHUPS[:1], 4)
+
+    assert calls <= bench_engine.SMOKE_CALL_BUDGET
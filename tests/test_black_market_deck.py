@@ -0,0 +1,57 @@
+"""Black Market deck construction from the cached eligibility table."""
+
+import random
+
+from dominion.cards.base_card import Card, CardCost, CardStats, CardType
+from dominion.cards.registry import CARD_TYPES, get_card
+from dominion.game.black_market import (
+    black_market_candidates,
+    build_black_market_deck,
+    kingdom_uses_potion,
+)
+from dominion.game.game_state import GameState
+from tests.utils import DummyAI
+
+
+def test_candidates_are_cached_until_the_registry_changes(monkeypatch):
+    table = black_market_candidates()
+    assert black_market_candidates() is table
+
+    class Bazaarlike(Card):
+        def __init__(self):
+            super().__init__("Test Bazaarlike", CardCost(coins=5), CardStats(cards=1), [CardType.ACTION])
+
+    monkeypatch.setitem(CARD_TYPES, "Test Bazaarlike", Bazaarlike)
+    rebuilt = black_market_candidates()
+    assert rebuilt is not table
+    assert rebuilt[-1].name == "Test Bazaarlike"
+
+
+def test_deck_skips_supply_basics_and_landscapes():
+    names = {candidate.name for candidate in black_market_candidates()}
+    assert "Familiar" in names
+    assert not names & {"Copper", "Province", "Curse", "Horse", "Spoils", "Ruins"}
+    assert "Alms" not in names  # an Event
+
+    deck = build_black_market_deck({"Village", "Smithy"}, random.Random(3))
+    assert "Village" not in deck and "Smithy" not in deck
+    assert deck == build_black_market_deck({"Village", "Smithy"}, random.Random(3))
+    assert sorted(deck) == sorted(names - {"Village", "Smithy"})
+
+
+def test_setup_stamps_the_deck_from_the_game_rng():
+    def deck(seed):
+        random.seed(seed)
+        state = GameState(players=[], supply={})
+        state.log_callback = lambda *_: None
+        state.initialize_game([DummyAI(), DummyAI()], [get_card("Black Market"), get_card("Village")])
+        return state.black_market_deck
+
+    assert deck(5) == deck(5)
+    assert deck(5) != deck(6)
+
+
+def test_kingdom_uses_potion():
+    assert kingdom_uses_potion(["Familiar", "Village"])
+    assert not kingdom_uses_potion(["Village", "Smithy"])
+    assert kingdom_uses_potion(["Black Market", "Village"])
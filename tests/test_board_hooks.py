@@ -0,0 +1,82 @@
+"""Board-specialized hooks: which hooks a board enables, and that games are unchanged."""
+
+from dominion.cards.registry import get_card
+from dominion.game.board_hooks import HOOKS, BoardHooks
+from dominion.game.game_state import GameState
+
+from tests.utils import BASE_KINGDOM, make_state
+
+HOOKED = ["Watchtower", "Royal Seal", "Cargo Ship", "Haggler", "Livery", "Sheepdog", "Smithy", "Village", "Mine", "Moat"]
+
+
+def test_uninitialized_state_enables_everything():
+    assert GameState(players=[], supply={}).hooks.enabled() == list(HOOKS)
+
+
+def test_base_board_skips_expansion_hooks():
+    assert make_state(BASE_KINGDOM, seed=4).hooks.enabled() == []
+
+
+def test_kingdom_and_black_market_cards_enable_their_hooks():
+    hooks = make_state(HOOKED, seed=4).hooks
+    assert {"watchtower", "royal_seal", "cargo_ship", "haggler", "livery", "sleigh_sheepdog"} <= set(hooks.enabled())
+    assert not hooks.tiara and not hooks.cleanup_start
+
+    state = make_state(BASE_KINGDOM, seed=4)
+    state.black_market_deck = ["Tiara", "Anvil"]
+    hooks = BoardHooks.for_game(state)
+    assert hooks.tiara and hooks.discard_from_play
+
+
+def test_cards_gained_from_outside_the_board_are_admitted():
+    state = make_state(BASE_KINGDOM, seed=4)
+    assert not state.hooks.royal_seal
+    player = state.players[0]
+    royal_seal = state.gain_card(player, get_card("Royal Seal"), from_supply=False)
+    assert state.hooks.royal_seal
+
+    player.discard.remove(royal_seal)
+    player.in_play = [royal_seal]
+    player.ai.should_topdeck_with_royal_seal = lambda *_: True
+    state.supply["Silver"] -= 1
+    silver = state.gain_card(player, get_card("Silver"))
+
+    assert player.deck[-1] is silver
+
+
+def test_creating_a_card_does_not_admit_it():
+    state = make_state(BASE_KINGDOM, seed=4)
+    get_card("Watchtower")
+    assert not state.hooks.watchtower
+
+
+def test_board_hooks_do_not_change_the_game():
+    def play(all_hooks):
+        state = make_state(HOOKED, seed=11)
+        if all_hooks:
+            state.hooks = BoardHooks()
+        while not state.is_game_over():
+            state.play_turn()
+        return state.turn_number, [sorted(c.name for c in p.all_cards()) for p in state.players]
+
+    assert play(all_hooks=False) == play(all_hooks=True)
+
+
+def test_shadow_cards_enable_the_deck_scan():
+    assert not make_state(BASE_KINGDOM, seed=4).hooks.shadow
+    assert make_state(BASE_KINGDOM[:9] + ["Ninja"], seed=4).hooks.shadow
+
+
+def test_shadow_card_in_deck_is_offered_in_the_action_phase():
+    state = make_state(BASE_KINGDOM, seed=4)
+    player = state.players[0]
+    ninja = get_card("Ninja")
+    player.deck.append(ninja)
+    state.hooks.admit(ninja.name)
+    player.hand = []
+    offered = []
+    player.ai.choose_action = lambda _state, choices: offered.extend(choices) or None
+
+    state.handle_action_phase()
+
+    assert offered == [ninja, None]
@@ -0,0 +1,134 @@
+"""Memoized GameState.get_card_cost: each modifier, cached and invalidated."""
+
+from dominion.cards.registry import get_card
+from dominion.game.game_state import GameState
+from dominion.prophecies.registry import get_prophecy
+
+from tests.utils import ChooseFirstActionAI
+
+
+def _state(n_players=2):
+    ais = [ChooseFirstActionAI() for _ in range(n_players)]
+    state = GameState(players=[])
+    state.log_callback = lambda *_: None
+    state.initialize_game(ais, [get_card("Village"), get_card("Smithy"), get_card("Quarry")])
+    return state
+
+
+def _costs(state, player, names=("Village", "Smithy", "Silver", "Province")):
+    return {name: state.get_card_cost(player, get_card(name)) for name in names}
+
+
+def _assert_cache_agrees(state, player):
+    uncached = _costs(state, player)
+    with state.cost_cache():
+        first = _costs(state, player)
+        second = _costs(state, player)
+    assert first == second == uncached
+    return uncached
+
+
+def test_quarry_discount_is_cached_and_invalidated_by_plays():
+    state = _state()
+    player = state.players[0]
+    player.in_play = [get_card("Quarry")]
+    assert _assert_cache_agrees(state, player)["Village"] == 1
+
+    player.in_play = []
+    with state.cost_cache():
+        assert state.get_card_cost(player, get_card("Smithy")) == 4
+        quarry = get_card("Quarry")
+        player.in_play.append(quarry)
+        quarry.on_play(state)
+        assert state.get_card_cost(player, get_card("Smithy")) == 2
+        assert state.get_card_cost(player, get_card("Silver")) == 3
+
+
+def test_bridge_troll_discount_is_global_and_cached():
+    state = _state()
+    p1, p2 = state.players
+    p2.duration = [get_card("Bridge Troll")]
+    costs = _assert_cache_agrees(state, p1)
+    assert costs["Province"] == 7
+    assert costs["Silver"] == 2
+
+
+def test_cost_reduction_is_cached():
+    state = _state()
+    player = state.players[0]
+    player.turn.cost_reduction = 1
+    assert _assert_cache_agrees(state, player)["Province"] == 7
+
+
+def test_prophecy_cost_modifier_is_cached():
+    state = _state()
+    player = state.players[0]
+    state.prophecy = get_prophecy("Flourishing Trade")
+    state.prophecy.is_active = True
+    assert _assert_cache_agrees(state, player)["Province"] == 7
+
+
+def test_cheap_trait_is_cached():
+    state = _state()
+    player = state.players[0]
+    state.pile_traits["Smithy"] = "Cheap"
+    assert _assert_cache_agrees(state, player)["Smithy"] == 3
+
+
+def test_family_of_inventors_tokens_are_cached():
+    state = _state()
+    player = state.players[0]
+    state.family_inventor_tokens = {"Village": 2}
+    assert _assert_cache_agrees(state, player)["Village"] == 1
+
+
+def test_ferry_token_is_cached_and_invalidated_by_token_moves():
+    state = _state()
+    p1, p2 = state.players
+    state.add_pile_token(p1, "Smithy", "-$2 cost")
+    assert _assert_cache_agrees(state, p1)["Smithy"] == 2
+    assert _assert_cache_agrees(state, p2)["Smithy"] == 4
+
+    with state.cost_cache():
+        assert state.get_card_cost(p1, get_card("Village")) == 3
+        state.move_player_token(p1, "-$2 cost", "Village")
+        assert state.get_card_cost(p1, get_card("Village")) == 1
+        assert state.get_card_cost(p1, get_card("Smithy")) == 4
+
+
+def test_card_cost_modifier_is_never_memoized():
+    state = _state()
+    player = state.players[0]
+    peddler = get_card("Peddler")
+    with state.cost_cache():
+        assert state.get_card_cost(player, peddler) == 8
+        # Peddler's cost depends on Actions in play during the Buy phase.
+        state.phase = "buy"
+        player.in_play = [get_card("Village"), get_card("Smithy")]
+        assert state.get_card_cost(player, peddler) == 4
+
+
+def test_gains_and_trashes_invalidate():
+    state = _state()
+    player = state.players[0]
+    troll = get_card("Bridge Troll")
+    with state.cost_cache():
+        assert state.get_card_cost(player, get_card("Province")) == 8
+        player.in_play.append(troll)
+        state.gain_card(player, get_card("Copper"))
+        assert state.get_card_cost(player, get_card("Province")) == 7
+        player.in_play.remove(troll)
+        state.trash_card(player, troll)
+        assert state.get_card_cost(player, get_card("Province")) == 8
+
+
+def test_cache_is_only_live_inside_block_and_not_cloned():
+    import copy
+
+    state = _state()
+    with state.cost_cache():
+        with state.cost_cache():
+            state.get_card_cost(state.players[0], get_card("Village"))
+        assert state._cost_cache
+        assert copy.deepcopy(state)._cost_cache is None
+    assert state._cost_cache is None
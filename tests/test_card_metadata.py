@@ -0,0 +1,67 @@
+"""Interned, immutable card metadata shared across card instances."""
+
+import dataclasses
+
+import pytest
+
+from dominion.cards.base_card import Card, CardCost, CardStats, CardType
+from dominion.cards.registry import get_card
+
+
+def test_instances_share_interned_cost_stats_and_types():
+    first, second = get_card("Village"), get_card("Village")
+
+    assert first is not second
+    assert first.cost is second.cost
+    assert first.stats is second.stats
+    assert first.types is second.types
+
+
+def test_equal_metadata_is_shared_across_card_classes():
+    # Silver and Village both cost $3.
+    assert get_card("Silver").cost is get_card("Village").cost
+
+
+def test_cost_and_stats_are_frozen():
+    card = get_card("Smithy")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        card.cost.coins = 0
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        card.stats.cards = 0
+    assert dataclasses.replace(card.stats, cards=1) == CardStats(cards=1)
+
+
+def test_type_flags_follow_type_reassignment():
+    estate = get_card("Estate")
+    assert estate.is_victory and not estate.is_action
+
+    estate.types = get_card("Militia").types
+    assert estate.is_action and estate.is_attack and not estate.is_victory
+    assert estate.has_type(CardType.ATTACK)
+    assert get_card("Estate").is_victory
+
+
+def test_loot_extra_types_do_not_leak_between_loot_cards():
+    assert get_card("Amphora").types == (CardType.TREASURE, CardType.DURATION)
+    assert get_card("Doubloons").types == (CardType.TREASURE,)
+
+
+def test_invalid_types_still_rejected():
+    class BadCard(Card):
+        def __init__(self):
+            super().__init__("Bad Card", CardCost(), CardStats(), ["action"])
+
+    with pytest.raises(ValueError, match="invalid type"):
+        BadCard()
+
+
+def test_core_card_state_is_slotted():
+    card = Card("Plain", CardCost(), CardStats(), [CardType.ACTION])
+
+    assert not hasattr(card, "__dict__")
+    card._frog_topdeck = True
+    with pytest.raises(AttributeError):
+        card.undeclared = True
+    assert card.heirloom is None
+    assert get_card("Pixie").heirloom == "Goat"
@@ -0,0 +1,102 @@
+"""Card metadata table: matches the cards, survives the disk cache, tracks the registry."""
+
+import pytest
+
+from dominion.cards import metadata
+from dominion.cards.base_card import CardType
+from dominion.cards.registry import CARD_TYPES, get_card
+
+
+@pytest.fixture
+def fresh_table(monkeypatch, tmp_path):
+    """Forget the in-process table and cache to ``tmp_path``."""
+    monkeypatch.setenv("PY_OVERLORD_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(metadata, "_table", (None, {}))
+    monkeypatch.setattr(metadata, "_by_class", {})
+    return tmp_path
+
+
+def _as_tuple(meta):
+    return (meta.name, meta.cost, meta.stats, meta.types, meta.methods, meta.roles, meta.pile, meta.source_ref)
+
+
+def test_metadata_matches_constructed_cards():
+    for name in ["Village", "Smithy", "Witch", "Gold", "Gardens", "Settlers", "Patrician"]:
+        card = get_card(name)
+        meta = metadata.get_card_metadata(name)
+        assert meta.name == card.name
+        assert meta.cost == card.cost
+        assert meta.stats == card.stats
+        assert meta.types == tuple(card.types)
+        for card_type in CardType:
+            assert meta.has_type(card_type) == card.has_type(card_type)
+            flag = f"is_{card_type.value}"
+            if hasattr(card, flag):
+                assert getattr(meta, flag) == getattr(card, flag)
+
+
+def test_unknown_card_raises_value_error():
+    with pytest.raises(ValueError):
+        metadata.get_card_metadata("Definitely Not A Card")
+
+
+def test_methods_roles_and_piles():
+    assert metadata.get_card_metadata("Village").roles >= {"village", "cantrip"}
+    assert "cost_reducer" in metadata.get_card_metadata("Bridge").roles
+    assert metadata.get_card_metadata("Fortress").overrides("on_trash")
+    assert not metadata.get_card_metadata("Smithy").overrides("on_trash")
+
+    assert metadata.get_card_metadata("Village").pile == ()
+    assert metadata.get_card_metadata("Bustling Village").pile == ("Settlers", "Bustling Village")
+    assert metadata.get_card_metadata("Student").pile == ("Student", "Conjurer", "Sorcerer", "Lich")
+    castles = metadata.get_card_metadata("Castles").pile
+    assert castles[0] == "Humble Castle" and metadata.get_card_metadata("Grand Castle").pile == castles
+    assert "Sir Martin" in metadata.get_card_metadata("Knights").pile
+    assert "Survivors" in metadata.get_card_metadata("Ruins").pile
+
+
+def test_disk_cache_round_trip(fresh_table):
+    built = metadata.card_metadata()
+    files = list(fresh_table.glob("card-metadata-*.json"))
+    assert [f.name for f in files] == [f"card-metadata-{metadata.registry_fingerprint()}.json"]
+
+    metadata._table = (None, {})
+    metadata._by_class.clear()
+    loaded = metadata.card_metadata()
+    assert loaded is not built
+    assert {key: _as_tuple(meta) for key, meta in loaded.items()} == {
+        key: _as_tuple(meta) for key, meta in built.items()
+    }
+
+
+def test_saving_removes_tables_of_other_fingerprints(fresh_table):
+    stale = fresh_table / "card-metadata-0123456789ab.json"
+    stale.write_text("{}")
+    unrelated = fresh_table / "notes.json"
+    unrelated.write_text("{}")
+    metadata.card_metadata()
+    assert not stale.exists()
+    assert unrelated.exists()
+    assert len(list(fresh_table.glob("card-metadata-*.json"))) == 1
+
+
+def test_corrupt_cache_file_is_rebuilt(fresh_table):
+    path = fresh_table / f"card-metadata-{metadata.registry_fingerprint()}.json"
+    path.write_text("{not json")
+    assert metadata.get_card_metadata("Smithy").stats.cards == 3
+
+
+def test_empty_cache_dir_disables_disk_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("PY_OVERLORD_CACHE_DIR", "")
+    assert metadata.cache_dir() is None
+
+
+def test_registry_changes_are_picked_up(monkeypatch):
+    before = metadata.registry_fingerprint()
+
+    class VillageCopy(CARD_TYPES["Village"]):
+        pass
+
+    monkeypatch.setitem(CARD_TYPES, "Test Village Copy", VillageCopy)
+    assert metadata.registry_fingerprint() != before
+    assert metadata.get_card_metadata("Test Village Copy").roles == metadata.get_card_metadata("Village").roles
@@ -53,8 +53,8 @@ def test_cauldron_does_not_fire_on_first_or_second_action_gain():
     state.gain_card(attacker, get_card("Village"))
     state.gain_card(attacker, get_card("Village"))
 
-    assert attacker.actions_gained_this_turn == 2
-    assert not attacker.cauldron_triggered
+    assert attacker.turn.actions_gained_this_turn == 2
+    assert not attacker.turn.cauldron_triggered
     assert not any(c.name == "Curse" for c in defender.discard)
 
 
@@ -67,8 +67,8 @@ def test_cauldron_fires_on_third_action_gain():
     state.gain_card(attacker, get_card("Village"))
     state.gain_card(attacker, get_card("Village"))
 
-    assert attacker.actions_gained_this_turn == 3
-    assert attacker.cauldron_triggered
+    assert attacker.turn.actions_gained_this_turn == 3
+    assert attacker.turn.cauldron_triggered
     # Defender should have received exactly one Curse.
     curses = sum(1 for c in defender.discard if c.name == "Curse")
     assert curses == 1
@@ -84,7 +84,7 @@ def test_cauldron_triggers_only_once_per_turn():
 
     curses = sum(1 for c in defender.discard if c.name == "Curse")
     assert curses == 1
-    assert attacker.cauldron_triggered
+    assert attacker.turn.cauldron_triggered
 
 
 def test_cauldron_skips_non_actions():
@@ -98,8 +98,8 @@ def test_cauldron_skips_non_actions():
     state.gain_card(attacker, get_card("Village"))
     state.gain_card(attacker, get_card("Village"))
 
-    assert attacker.actions_gained_this_turn == 2
-    assert not attacker.cauldron_triggered
+    assert attacker.turn.actions_gained_this_turn == 2
+    assert not attacker.turn.cauldron_triggered
     assert not any(c.name == "Curse" for c in defender.discard)
 
 
@@ -111,7 +111,7 @@ def test_cauldron_requires_cauldron_in_play():
     for _ in range(4):
         state.gain_card(attacker, get_card("Village"))
 
-    assert not attacker.cauldron_triggered
+    assert not attacker.turn.cauldron_triggered
     assert not any(c.name == "Curse" for c in defender.discard)
 
 
@@ -126,7 +126,7 @@ def test_cauldron_blocked_by_moat():
     state.gain_card(attacker, get_card("Village"))
 
     # Trigger fires (counter and flag) but Moat blocks the curse.
-    assert attacker.cauldron_triggered
+    assert attacker.turn.cauldron_triggered
     assert not any(c.name == "Curse" for c in defender.discard)
 
 
@@ -140,7 +140,7 @@ def test_cauldron_blocked_by_lighthouse():
     state.gain_card(attacker, get_card("Village"))
     state.gain_card(attacker, get_card("Village"))
 
-    assert attacker.cauldron_triggered
+    assert attacker.turn.cauldron_triggered
     assert not any(c.name == "Curse" for c in defender.discard)
 
 
@@ -153,7 +153,7 @@ def test_cauldron_counter_resets_at_start_of_turn():
     state.gain_card(attacker, get_card("Village"))
     state.gain_card(attacker, get_card("Village"))
 
-    assert attacker.cauldron_triggered
+    assert attacker.turn.cauldron_triggered
     starting_curses = sum(1 for c in defender.discard if c.name == "Curse")
     assert starting_curses == 1
 
@@ -163,8 +163,8 @@ def test_cauldron_counter_resets_at_start_of_turn():
     state.current_player_index = 0
     state.handle_start_phase()
 
-    assert attacker.actions_gained_this_turn == 0
-    assert not attacker.cauldron_triggered
+    assert attacker.turn.actions_gained_this_turn == 0
+    assert not attacker.turn.cauldron_triggered
 
     # Now a fresh sequence of 3 action gains should fire the curse again
     # (a second Cauldron play would also persist into in_play in real play;
@@ -188,8 +188,8 @@ def test_cauldron_counter_isolated_per_player():
     state.gain_card(p1, get_card("Village"))
     state.gain_card(p1, get_card("Village"))
 
-    assert p0.actions_gained_this_turn == 0
-    assert p1.actions_gained_this_turn == 3
+    assert p0.turn.actions_gained_this_turn == 0
+    assert p1.turn.actions_gained_this_turn == 3
     # Player 1 has no Cauldron in play, so no curse is delivered.
     assert not any(c.name == "Curse" for c in p0.discard)
 
@@ -205,5 +205,5 @@ def test_cauldron_runs_out_of_curse_supply_safely():
     state.gain_card(attacker, get_card("Village"))
 
     # Trigger fired but no curses were available.
-    assert attacker.cauldron_triggered
+    assert attacker.turn.cauldron_triggered
     assert not any(c.name == "Curse" for c in defender.discard)
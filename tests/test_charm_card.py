@@ -86,7 +86,7 @@ def test_charm_copy_option_duplicates_next_purchase():
 
     state.handle_buy_phase()
 
-    assert player.charm_next_buy_copies == 0
+    assert player.turn.charm_next_buy_copies == 0
     assert state.supply["Silver"] == 3
     gained_silvers = [card for card in player.discard if card.name == "Silver"]
     assert len(gained_silvers) == 2
@@ -0,0 +1,108 @@
+"""Columnar per-game export: batching, sparse counters and round trips."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from dominion.cards.registry import get_card
+from dominion.game.game_state import GameState
+from dominion.simulation.columnar_export import (
+    FIXED_COLUMNS,
+    ColumnarResultWriter,
+    end_condition,
+    game_row,
+    read_columns,
+)
+from tests.utils import DummyAI
+
+
+def _row(game_id, **counters):
+    row = game_row(game_id, 100 + game_id, ["A", "B"], [10, 8], 20, 0, "provinces")
+    row.update(counters)
+    return row
+
+
+def test_rows_are_written_in_batches(tmp_path):
+    with ColumnarResultWriter(tmp_path, batch_size=2, fmt="json") as writer:
+        for game_id in range(5):
+            writer.add(_row(game_id))
+        assert writer.rows_written == 4
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "part-00000.json",
+        "part-00001.json",
+        "part-00002.json",
+    ]
+    columns = read_columns(tmp_path)
+    assert set(FIXED_COLUMNS) <= set(columns)
+    assert columns["game_id"] == [0, 1, 2, 3, 4]
+    assert columns["seed"] == [100, 101, 102, 103, 104]
+
+
+def test_sparse_counters_are_backfilled_within_and_across_parts(tmp_path):
+    with ColumnarResultWriter(tmp_path, batch_size=2, fmt="json") as writer:
+        writer.add(_row(0))
+        writer.add(_row(1, **{"buys.Smithy": 2}))
+        writer.add(_row(2, **{"plays.Village": 3}))
+
+    columns = read_columns(tmp_path)
+    assert columns["buys.Smithy"] == [0, 2, 0]
+    assert columns["plays.Village"] == [0, 0, 3]
+
+
+def test_read_columns_selects_requested_columns(tmp_path):
+    with ColumnarResultWriter(tmp_path, fmt="json") as writer:
+        writer.add(_row(0, **{"buys.Gold": 1}))
+
+    assert read_columns(tmp_path, ["turns", "buys.Gold"]) == {"turns": [20], "buys.Gold": [1]}
+
+
+def test_game_row_flattens_metrics_and_rule_firings():
+    # Same shape as GameLogger's GameMetrics
+    metrics = SimpleNamespace(cards_bought={"Silver": 2}, cards_played={"Copper": 7})
+    firings = {"strategy1": {"priority_rules": {"gain": {"Province [always]": 3}}}}
+
+    row = game_row(3, None, ["A", "B"], [6, 12], 15, 1, "piles", metrics, firings)
+
+    assert row["seed"] == -1
+    assert row["winner_seat"] == 1
+    assert row["buys.Silver"] == 2
+    assert row["plays.Copper"] == 7
+    assert row["fired.strategy1.gain.Province [always]"] == 3
+
+
+def test_game_row_adds_columns_for_extra_seats():
+    row = game_row(0, 1, ["A", "B", "C"], [6, 12, 9], 15, 1, "piles")
+
+    assert (row["seat2"], row["score2"]) == ("C", 9)
+    assert "seat2" not in _row(1)
+
+
+def test_npz_round_trips_games_with_mixed_seat_counts(tmp_path):
+    pytest.importorskip("numpy")
+    with ColumnarResultWriter(tmp_path, fmt="npz") as writer:
+        writer.add(game_row(0, 1, ["A", "B"], [6, 12], 15, 1, "provinces"))
+        writer.add(game_row(1, 2, ["A", "B", "C"], [6, 12, 9], 18, 1, "piles"))
+        writer.add(game_row(2, 3, ["A", "B"], [10, 4], 14, 0, "provinces"))
+
+    columns = read_columns(tmp_path)
+
+    assert columns["seat2"] == [None, "C", None]
+    assert columns["score2"] == [None, 9, None]
+    assert columns["seat0"] == ["A", "A", "A"]
+    assert columns["turns"] == [15, 18, 14]
+    assert not any(name.startswith("missing.") for name in columns)
+
+
+def test_end_condition_names_why_the_game_ended():
+    state = GameState(players=[], supply={})
+    state.initialize_game([DummyAI(), DummyAI()], [get_card("Village")])
+    assert end_condition(state) == "turn_limit"
+
+    state.supply["Province"] = 0
+    assert end_condition(state) == "provinces"
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        ColumnarResultWriter(tmp_path, fmt="csv")
@@ -18,6 +18,6 @@ def test_commit_buy_decrements_supply_and_records_buy():
     state._commit_buy(player, get_card("Silver"))
 
     assert state.supply["Silver"] == 9
-    assert "Silver" in player.bought_this_turn
+    assert "Silver" in player.turn.bought_this_turn
     assert player.coins == 0
     assert any(card.name == "Silver" for card in player.discard)
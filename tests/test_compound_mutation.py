@@ -5,6 +5,7 @@ import random
 import sys
 import types
 
+from dominion.game.turn_state import TurnState
 from dominion.simulation.genetic_trainer import GeneticTrainer
 from dominion.strategy.enhanced_strategy import PriorityRule
 from dominion.strategy.strategies.base_strategy import BaseStrategy
@@ -21,6 +22,7 @@ def _make_mock_state(turn_number=5, provinces_left=8, empty_piles=0, players=Non
 
 def _make_mock_player(coins=3, actions=1, buys=1, vp=3, all_cards=None, in_play=None):
     player = types.SimpleNamespace()
+    player.turn = TurnState()
     player.coins = coins
     player.actions = actions
     player.buys = buys
@@ -30,8 +32,8 @@ def _make_mock_player(coins=3, actions=1, buys=1, vp=3, all_cards=None, in_play=
     cards = all_cards if all_cards is not None else []
     player.all_cards = lambda _cards=cards: list(_cards)
     player.get_victory_points = lambda _g=None, _vp=vp: _vp
-    player.actions_gained_this_turn = 0
-    player.cards_gained_this_turn = 0
+    player.turn.actions_gained_this_turn = 0
+    player.turn.cards_gained_this_turn = 0
     return player
 
 
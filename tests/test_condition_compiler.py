@@ -0,0 +1,114 @@
+"""Compiled priority lists pick the same rule as the closure walk."""
+
+import random
+
+import pytest
+
+from dominion.ai.genetic_ai import GeneticAI
+from dominion.cards.registry import get_card
+from dominion.game.game_state import GameState
+from dominion.strategy.condition_compiler import CompiledPriorityCache, compile_priority, parse_source
+from dominion.strategy.enhanced_strategy import EnhancedStrategy, PriorityRule
+from dominion.strategy.strategies.big_money import create_big_money
+
+KINGDOM = ["Smithy", "Village", "Market", "Festival", "Laboratory", "Mine", "Witch", "Moat", "Workshop", "Chapel"]
+
+
+def _mid_game_state(turns=12):
+    random.seed(5)
+    ais = [GeneticAI(create_big_money()), GeneticAI(create_big_money())]
+    state = GameState(players=[], supply={})
+    state.log_callback = lambda *_: None
+    state.initialize_game(ais, [get_card(name) for name in KINGDOM])
+    for _ in range(turns):
+        state.play_turn()
+    return state
+
+
+def _closure_index(rules, state, player, present):
+    for index, rule in enumerate(rules):
+        if rule.card not in present:
+            continue
+        try:
+            if rule.condition is None or rule.condition(state, player):
+                return index
+        except Exception:
+            pass
+    return -1
+
+
+def _rules():
+    return [
+        PriorityRule("Province", PriorityRule.and_(PriorityRule.score_diff("<", 5), PriorityRule.turn_number(">", 30))),
+        PriorityRule("Colony", PriorityRule.colonies_left(">", 0)),
+        PriorityRule("Smithy", PriorityRule.max_in_deck("Smithy", 1)),
+        PriorityRule("Gold", PriorityRule.or_(PriorityRule.has_cards(["Gold", "Silver"], 50), PriorityRule.action_density(">", 90))),
+        PriorityRule("Silver", PriorityRule.deck_count_diff("Copper", "Silver", ">", 2)),
+        PriorityRule("Copper"),
+    ]
+
+
+def test_parse_source_builds_nested_nodes():
+    source = "PriorityRule.and_(PriorityRule.max_in_deck('Smithy', 2), PriorityRule.or_(PriorityRule.always_true()))"
+    assert parse_source(source) == ("and", (("max_in_deck", ("Smithy", 2)), ("or", (("true",),))))
+    with pytest.raises(ValueError):
+        parse_source("some_function(1)")
+
+
+def test_compiled_index_matches_the_closure_walk():
+    state = _mid_game_state()
+    rules = _rules()
+    compiled = compile_priority(rules)
+    names = [rule.card for rule in rules]
+
+    for player in state.players:
+        for size in range(1, len(names) + 1):
+            present = set(random.sample(names, size))
+            assert compiled(state, player, present) == _closure_index(rules, state, player, present)
+
+
+def test_unparsable_and_failing_conditions():
+    state = _mid_game_state(2)
+    player = state.players[0]
+
+    def boom(_state, _player):
+        raise RuntimeError
+
+    rules = [
+        PriorityRule("Gold", boom),
+        PriorityRule("Silver", lambda s, me: s.turn_number > 100),
+        PriorityRule("Copper", lambda s, me: True),
+    ]
+    assert compile_priority(rules)(state, player, {"Gold", "Silver", "Copper"}) == 2
+
+
+def test_cache_recompiles_after_rule_changes():
+    state = _mid_game_state(2)
+    player = state.players[0]
+    rules = [PriorityRule("Gold", PriorityRule.turn_number(">", 100)), PriorityRule("Silver")]
+    cache = CompiledPriorityCache()
+    present = {"Gold", "Silver"}
+
+    first = cache.get(rules, PriorityRule.generation)
+    assert first(state, player, present) == 1
+    assert cache.get(rules, PriorityRule.generation) is first
+
+    rules[0].condition = PriorityRule.turn_number(">=", 1)
+    assert cache.get(rules, PriorityRule.generation)(state, player, present) == 0
+
+    rules.insert(0, PriorityRule("Silver"))
+    assert cache.get(rules, PriorityRule.generation)(state, player, present) == 0
+    assert cache.get(rules, PriorityRule.generation)(state, player, {"Gold"}) == 1
+
+
+def test_strategy_choices_do_not_depend_on_compilation():
+    state = _mid_game_state()
+    strategy = EnhancedStrategy()
+    strategy.gain_priority = _rules()
+    choices = [get_card(name) for name in ("Copper", "Silver", "Gold", "Smithy", "Province")] + [None]
+
+    compiled = [strategy._choose_from_priority(strategy.gain_priority, choices, state, p, "gain") for p in state.players]
+    strategy.compile_conditions = False
+    walked = [strategy._choose_from_priority(strategy.gain_priority, choices, state, p, "gain") for p in state.players]
+
+    assert [c and c.name for c in compiled] == [c and c.name for c in walked]
@@ -78,7 +78,7 @@ def test_continue_marks_used_for_turn():
     """Continue is once-per-turn — a second buy would be blocked."""
     state, player = _new_state("Village")
     Continue().on_buy(state, player)
-    assert player.continue_used_this_turn is True
+    assert player.turn.continue_used_this_turn is True
     assert Continue().may_be_bought(state, player) is False
 
 
@@ -86,7 +86,7 @@ def test_continue_does_not_duplicate_topdecked_gains():
     """If Insignia tops-decks the gain, Continue must still find and play it
     cleanly without leaving the same object in both deck and in_play."""
     state, player = _new_state("Village")
-    player.insignia_active = True
+    player.turn.insignia_active = True
     player.ai.should_topdeck_with_insignia = lambda *a, **k: True
 
     Continue().on_buy(state, player)
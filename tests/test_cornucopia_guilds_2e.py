@@ -1027,9 +1027,9 @@ def test_farmhands_set_aside_action_counts_toward_actions_this_turn():
     player.farmhands_set_aside = [smithy]
     state.current_player_index = 0
 
-    before = player.actions_this_turn
+    before = player.turn.actions_this_turn
     state._resolve_farmhands_set_aside(player)
-    assert player.actions_this_turn == before + 1
+    assert player.turn.actions_this_turn == before + 1
 
 
 def test_shop_played_action_counts_toward_actions_this_turn():
@@ -1038,10 +1038,10 @@ def test_shop_played_action_counts_toward_actions_this_turn():
     village = get_card("Village")
     player.hand = [village]
     player.in_play = [shop]
-    player.actions_this_turn = 0
+    player.turn.actions_this_turn = 0
 
     shop.play_effect(state)
-    assert player.actions_this_turn == 1
+    assert player.turn.actions_this_turn == 1
 
 
 def test_farmhands_set_aside_resolves_even_without_a_played_farmhands():
@@ -421,7 +421,7 @@ def test_urchin_triggers_on_attack_replaced_by_enchantress():
 
     # Mark this player as enchanted (per Empires Enchantress duration effect).
     attacker.enchantress_active = True
-    attacker.enchantress_used_this_turn = False
+    attacker.turn.enchantress_used_this_turn = False
 
     state.current_player_index = 0
     state.phase = "action"
@@ -793,7 +793,7 @@ def test_hovel_trashes_on_victory_buy():
     state.handle_buy_phase()
     # Greedy AI buys most expensive thing it can; Hovel reaction trashes if
     # the buy is a Victory card. Buy might pick Duchy ($5) — Hovel reacts.
-    bought_victory = any(name == "Duchy" for name in player.bought_this_turn)
+    bought_victory = any(name == "Duchy" for name in player.turn.bought_this_turn)
     if bought_victory:
         assert hovel in state.trash
 
@@ -14,7 +14,7 @@ class BuyOverlordThenSilverAI(DummyAI):
                 continue
             if (
                 choice.name == "Overlord"
-                and "Overlord" not in state.current_player.bought_this_turn
+                and "Overlord" not in state.current_player.turn.bought_this_turn
             ):
                 return choice
         for choice in choices:
@@ -59,7 +59,7 @@ def test_buying_debt_card_requires_payment_before_second_purchase():
 
     assert player.debt == 0
     assert player.coins == 0
-    assert player.coins_spent_this_turn == 11
+    assert player.turn.coins_spent_this_turn == 11
     assert state.supply["Overlord"] == 9
     assert state.supply["Silver"] == 9
 
@@ -87,4 +87,4 @@ def test_players_can_pay_debt_without_buys():
 
     assert player.debt == 1
     assert player.coins == 0
-    assert player.coins_spent_this_turn == 3
+    assert player.turn.coins_spent_this_turn == 3
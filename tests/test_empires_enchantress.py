@@ -69,7 +69,7 @@ def test_enchantress_overrides_first_action_play():
     # (so extra turns like Outpost are still affected); only
     # ``enchantress_used_this_turn`` gates the per-turn override.
     assert other.enchantress_active
-    assert other.enchantress_used_this_turn
+    assert other.turn.enchantress_used_this_turn
 
 
 def test_enchantress_only_first_action_overridden():
@@ -88,7 +88,7 @@ def test_enchantress_only_first_action_overridden():
     # First Smithy enchanted (+1 Card +1 Action). Second Smithy plays normally
     # but action count came from Enchantress override (+1 Action).
     # We expect the player drew at least Smithy's 3 cards on the second play.
-    assert other.enchantress_used_this_turn
+    assert other.turn.enchantress_used_this_turn
 
 
 def test_enchantress_overrides_start_of_turn_clerk_reaction():
@@ -107,7 +107,7 @@ def test_enchantress_overrides_start_of_turn_clerk_reaction():
     state.handle_start_phase()
 
     assert clerk in other.in_play
-    assert other.enchantress_used_this_turn
+    assert other.turn.enchantress_used_this_turn
     assert other.coins == 0
     assert len(other.hand) == 1
     assert len(defender.hand) == 5
@@ -130,7 +130,7 @@ def test_enchantress_does_not_override_off_turn_black_cat_reaction():
     black_cat.on_opponent_gain(state, reactor, gainer, get_card("Estate"))
 
     assert black_cat in reactor.in_play
-    assert reactor.enchantress_used_this_turn is False
+    assert reactor.turn.enchantress_used_this_turn is False
     assert len(reactor.hand) == 2
     assert any(card.name == "Curse" for card in gainer.discard)
 
@@ -150,12 +150,12 @@ def test_enchantress_persists_across_opponent_extra_turn():
 
     state.handle_action_phase()
     assert other.enchantress_active
-    assert other.enchantress_used_this_turn
+    assert other.turn.enchantress_used_this_turn
 
     # Simulate the start of the player's next (extra) turn re-arming the
     # per-turn flag. ``handle_start_phase`` resets ``enchantress_used_this_turn``;
     # we mirror that here without invoking the full start sequence.
-    other.enchantress_used_this_turn = False
+    other.turn.enchantress_used_this_turn = False
 
     other.actions = 1
     smithy2 = get_card("Smithy")
@@ -165,7 +165,7 @@ def test_enchantress_persists_across_opponent_extra_turn():
 
     # Override should fire again on the extra turn.
     assert other.enchantress_active
-    assert other.enchantress_used_this_turn
+    assert other.turn.enchantress_used_this_turn
 
 
 def test_enchantress_grants_two_cards_on_caster_next_turn():
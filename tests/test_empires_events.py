@@ -45,7 +45,7 @@ def test_all_thirteen_events_registered():
 def test_triumph_grants_estate_and_vp():
     state = _make_game()
     player = state.players[0]
-    player.cards_gained_this_turn = 3
+    player.turn.cards_gained_this_turn = 3
     Triumph().on_buy(state, player)
     assert any(c.name == "Estate" for c in player.discard)
     # 3 cards gained before + 1 Estate gained == 4 VP.
@@ -460,7 +460,7 @@ def test_baths_fires_through_cleanup_phase():
     state = _make_game([landmark])
     player = state.players[0]
     state.current_player_index = 0
-    player.cards_gained_this_turn = 0
+    player.turn.cards_gained_this_turn = 0
     pool_before = landmark.vp_pool
     state.handle_cleanup_phase()
     assert player.vp_tokens == 2
@@ -479,13 +479,13 @@ def test_baths_unaffected_by_out_of_turn_forced_gains():
     # Out-of-turn forced gain on attacker's turn.
     state.current_player_index = 0
     state.gain_card(defender, get_card("Curse"))
-    assert defender.cards_gained_this_turn == 1
+    assert defender.turn.cards_gained_this_turn == 1
     # Defender's own turn starts: counter resets, defender gains nothing,
     # cleanup fires Baths.
     state.current_player_index = 1
     state.phase = "start"
     state.handle_start_phase()
-    assert defender.cards_gained_this_turn == 0
+    assert defender.turn.cards_gained_this_turn == 0
     pool_before = landmark.vp_pool
     state.phase = "cleanup"
     state.handle_cleanup_phase()
@@ -66,8 +66,8 @@ def test_does_not_buy_last_province_when_behind():
 
     assert state.supply["Province"] == 1  # last Province NOT taken
     assert state.supply["Gold"] == 9  # next-best bought instead
-    assert "Province" not in me.bought_this_turn
-    assert "Gold" in me.bought_this_turn
+    assert "Province" not in me.turn.bought_this_turn
+    assert "Gold" in me.turn.bought_this_turn
 
 
 def test_buys_last_province_when_ahead():
@@ -83,7 +83,7 @@ def test_buys_last_province_when_ahead():
     state.handle_buy_phase()
 
     assert state.supply["Province"] == 0
-    assert "Province" in me.bought_this_turn
+    assert "Province" in me.turn.bought_this_turn
 
 
 def test_does_not_trigger_third_pile_out_when_behind():
@@ -106,7 +106,7 @@ def test_does_not_trigger_third_pile_out_when_behind():
 
     assert state.supply["Market"] == 1  # third pile-out vetoed
     assert state.supply["Copper"] == 29  # next-best bought instead
-    assert "Market" not in me.bought_this_turn
+    assert "Market" not in me.turn.bought_this_turn
 
 
 def test_allow_losing_pileout_override_disables_guard():
@@ -121,7 +121,7 @@ def test_allow_losing_pileout_override_disables_guard():
     state.handle_buy_phase()
 
     assert state.supply["Province"] == 0  # guard disabled, buy went through
-    assert "Province" in me.bought_this_turn
+    assert "Province" in me.turn.bought_this_turn
 
 
 def test_guard_does_not_block_non_game_ending_buy_when_behind():
@@ -135,7 +135,7 @@ def test_guard_does_not_block_non_game_ending_buy_when_behind():
     state.handle_buy_phase()
 
     assert state.supply["Province"] == 7
-    assert "Province" in me.bought_this_turn
+    assert "Province" in me.turn.bought_this_turn
 
 
 def test_guard_skipped_when_goons_would_swing_the_score():
@@ -150,12 +150,12 @@ def test_guard_skipped_when_goons_would_swing_the_score():
     state.supply = {"Province": 1, "Copper": 30}
     me.coins = 8
     me.buys = 1
-    me.goons_played = 2
+    me.turn.goons_played = 2
 
     state.handle_buy_phase()
 
     assert state.supply["Province"] == 0  # winning buy not vetoed
-    assert "Province" in me.bought_this_turn
+    assert "Province" in me.turn.bought_this_turn
 
 
 def test_guard_skipped_when_vp_awarding_landmark_in_play():
@@ -173,7 +173,7 @@ def test_guard_skipped_when_vp_awarding_landmark_in_play():
     state.handle_buy_phase()
 
     assert state.supply["Province"] == 0
-    assert "Province" in me.bought_this_turn
+    assert "Province" in me.turn.bought_this_turn
 
 
 def test_guard_skipped_when_groundskeeper_would_swing_the_score():
@@ -185,12 +185,12 @@ def test_guard_skipped_when_groundskeeper_would_swing_the_score():
     state.supply = {"Province": 1, "Copper": 30}
     me.coins = 8
     me.buys = 1
-    me.groundskeeper_bonus = 2  # +2 VP on the Province gain → real win
+    me.turn.groundskeeper_bonus = 2  # +2 VP on the Province gain → real win
 
     state.handle_buy_phase()
 
     assert state.supply["Province"] == 0  # winning buy not vetoed
-    assert "Province" in me.bought_this_turn
+    assert "Province" in me.turn.bought_this_turn
 
 
 def test_guard_skipped_when_collection_would_swing_the_score():
@@ -208,12 +208,12 @@ def test_guard_skipped_when_collection_would_swing_the_score():
     }
     me.coins = 5
     me.buys = 1
-    me.collection_played = 1  # +VP on the Market (Action) gain
+    me.turn.collection_played = 1  # +VP on the Market (Action) gain
 
     state.handle_buy_phase()
 
     assert state.supply["Market"] == 0  # winning pile-out not vetoed
-    assert "Market" in me.bought_this_turn
+    assert "Market" in me.turn.bought_this_turn
 
 
 def test_guard_skipped_when_exiled_copy_reclaimed():
@@ -234,7 +234,7 @@ def test_guard_skipped_when_exiled_copy_reclaimed():
     state.handle_buy_phase()
 
     assert state.supply["Province"] == 1  # pile restored, game did not end
-    assert "Province" in me.bought_this_turn
+    assert "Province" in me.turn.bought_this_turn
 
 
 class _RevealsTraderAI(PriorityBuyAI):
@@ -255,7 +255,7 @@ def test_guard_skipped_when_trader_can_restore_pile():
 
     state.handle_buy_phase()
 
-    assert "Province" in me.bought_this_turn
+    assert "Province" in me.turn.bought_this_turn
     assert state.supply["Province"] == 1
     assert state.supply["Silver"] == 9
 
@@ -277,7 +277,7 @@ def test_guard_skipped_when_changeling_pile_available():
 
     state.handle_buy_phase()
 
-    assert "Province" in me.bought_this_turn
+    assert "Province" in me.turn.bought_this_turn
     assert state.supply["Province"] == 1
     assert state.supply["Changeling"] == 9
 
@@ -299,8 +299,8 @@ def test_false_negative_blocked_when_hoard_empties_third_pile():
 
     state.handle_buy_phase()
 
-    assert "Province" not in me.bought_this_turn
-    assert "Copper" in me.bought_this_turn
+    assert "Province" not in me.turn.bought_this_turn
+    assert "Copper" in me.turn.bought_this_turn
 
 
 def test_guard_disabled_when_any_ai_marks_decision_hooks_impure():
@@ -313,7 +313,7 @@ def test_guard_disabled_when_any_ai_marks_decision_hooks_impure():
 
     state.handle_buy_phase()
 
-    assert "Province" in me.bought_this_turn
+    assert "Province" in me.turn.bought_this_turn
 
 
 def test_gain_would_lose_game_preserves_rng_state():
@@ -349,4 +349,4 @@ def test_temple_endgame_correctly_handled():
 
     state.handle_buy_phase()
 
-    assert "Temple" not in me.bought_this_turn
+    assert "Temple" not in me.turn.bought_this_turn
@@ -105,7 +105,7 @@ def test_treasure_play_and_buy_estate_when_affordable():
     assert gs.supply["Duchy"] == pre_estate - 1 + (
         gs.supply["Estate"] - gs.supply["Estate"]
     )  # sanity; main check below
-    assert "Duchy" in p.bought_this_turn
+    assert "Duchy" in p.turn.bought_this_turn
     # Duchy gained to discard by default
     assert any(c.name == "Duchy" for c in p.discard)
 
@@ -0,0 +1,51 @@
+"""Decision-scoped feature cache: sharing, invalidation and fallbacks."""
+
+import copy
+from types import SimpleNamespace
+
+from dominion.cards.registry import get_card
+from dominion.game import features
+from dominion.strategy.enhanced_strategy import PriorityRule
+
+from tests.utils import BASE_KINGDOM, make_state
+
+
+def test_values_are_shared_inside_a_block():
+    state = make_state(BASE_KINGDOM, seed=2)
+    player = state.players[0]
+    with state.feature_cache():
+        deck = features.deck_cards(state, player)
+        assert features.deck_cards(state, player) is deck
+        assert features.deck_count(state, player, "Copper") == 7
+        assert features.victory_points(state, player) == 3
+        with state.feature_cache():  # nested blocks share the memo
+            assert features.deck_cards(state, player) is deck
+    assert state.features is None
+    assert features.deck_cards(state, player) is not deck
+
+
+def test_gains_invalidate_the_memo():
+    state = make_state(BASE_KINGDOM, seed=2)
+    player = state.players[0]
+    with state.feature_cache():
+        assert features.deck_count(state, player, "Gold") == 0
+        assert features.score_diff(state, player) == 0
+        state.supply["Province"] -= 1
+        state.gain_card(player, get_card("Province"))
+        assert features.deck_count(state, player, "Province") == 1
+        assert features.score_diff(state, player) == 6
+
+
+def test_helpers_fall_back_without_a_memo():
+    player = SimpleNamespace(count_in_deck=lambda name: 2, all_cards=lambda: [])
+    state = SimpleNamespace(players=[player])
+    assert features.deck_count(state, player, "Smithy") == 2
+    assert features.action_density(state, player) == 0
+    assert PriorityRule.max_in_deck("Smithy", 3)(state, player)
+
+
+def test_clones_start_without_a_memo():
+    state = make_state(BASE_KINGDOM, seed=2)
+    with state.feature_cache():
+        features.empty_piles(state)
+        assert copy.deepcopy(state).features is None
@@ -0,0 +1,75 @@
+"""GameLogger: bounded recent-log buffer, JSONL metrics and run summaries."""
+
+import json
+
+from dominion.simulation.game_logger import GameLogger, GameMetrics, RunMetrics
+from dominion.simulation.strategy_battle import StrategyBattle
+
+
+def _play(logger, turns=10, played=("Smithy",)):
+    logger.start_game([])
+    logger.current_metrics.turn_count = turns
+    for name in played:
+        logger.current_metrics.cards_played[name] = logger.current_metrics.cards_played.get(name, 0) + 1
+    return logger.end_game("p1", {"p1": 5, "p2": 3}, {"Province": 8}, [])
+
+
+def _lines(logger):
+    with open(logger.metrics_path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_recent_logs_are_bounded(tmp_path):
+    logger = GameLogger(log_folder=str(tmp_path), log_frequency=1, max_recent_logs=3)
+    paths = [_play(logger) for _ in range(5)]
+
+    assert list(logger.game_logs) == paths[-3:]
+    assert logger.run_metrics.games == 5
+
+
+def test_sampled_games_append_one_metrics_line_each(tmp_path):
+    logger = GameLogger(log_folder=str(tmp_path), log_frequency=2)
+    paths = [_play(logger, turns=n) for n in (10, 11, 12)]
+
+    assert paths[1] is None
+    lines = _lines(logger)
+    assert [line["game_number"] for line in lines] == [1, 3]
+    assert lines[1]["turn_count"] == 12
+    assert lines[0]["scores"] == {"p1": 5, "p2": 3}
+    assert lines[0]["cards_played"] == {"Smithy": 1}
+
+
+def test_run_metrics_aggregate_every_game():
+    run = RunMetrics()
+    run.add_game(GameMetrics(turn_count=10, cards_played={"Smithy": 2}, cards_bought={"Gold": 1}))
+    run.add_game(GameMetrics(turn_count=14, cards_played={"Smithy": 1, "Village": 3}))
+
+    assert run.to_dict() == {
+        "games": 2,
+        "avg_turns": 12.0,
+        "max_turns": 14,
+        "cards_played": {"Smithy": 3, "Village": 3},
+        "cards_bought": {"Gold": 1},
+    }
+    assert RunMetrics().to_dict()["avg_turns"] == 0.0
+
+
+def test_run_summary_is_appended_last(tmp_path):
+    logger = GameLogger(log_folder=str(tmp_path), log_frequency=1)
+    _play(logger, turns=10)
+    _play(logger, turns=20)
+    logger.write_run_summary()
+
+    summary = _lines(logger)[-1]["run_summary"]
+    assert summary["games"] == 2
+    assert summary["avg_turns"] == 15.0
+
+
+def test_battle_reports_written_logs_and_summary_without_details(tmp_path):
+    battle = StrategyBattle(log_folder=str(tmp_path), log_frequency=2)
+    results = battle.run_battle("Big Money", "Big Money Smithy", 3, keep_details=False, seed=3)
+
+    assert results["detailed_results"] == []
+    assert len(results["log_paths"]) == 2
+    assert all(path.endswith(".log") for path in results["log_paths"])
+    assert _lines(battle.logger)[-1]["run_summary"]["games"] == 3
@@ -39,3 +39,30 @@ def test_gain_card_to_deck_places_card_on_top():
     assert [card.name for card in player.deck] == ["Estate", "Silver"]
     drawn = player.draw_cards(1)
     assert [card.name for card in drawn] == ["Silver"]
+
+
+def _piled_out_state(player_count, empty):
+    kingdom = ["Village", "Smithy", "Market", "Moat", "Cellar"]
+    state = GameState([PlayerState(DummyAI()) for _ in range(player_count)])
+    state.log_callback = lambda *_: None
+    state.setup_supply([get_card(name) for name in kingdom])
+    for name in kingdom[:empty]:
+        state.supply[name] = 0
+    return state
+
+
+def test_five_players_need_four_empty_piles():
+    state = _piled_out_state(5, 3)
+    assert state.pile_end_count == 4
+    assert not state._normal_game_end_reached()
+    assert not state.is_game_over()
+
+    state = _piled_out_state(5, 4)
+    assert state._normal_game_end_reached()
+    assert state.is_game_over()
+
+
+def test_four_players_end_on_three_empty_piles():
+    state = _piled_out_state(4, 3)
+    assert state.pile_end_count == 3
+    assert state.is_game_over()
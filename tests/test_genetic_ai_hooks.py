@@ -76,7 +76,7 @@ def test_enhanced_strategy_collection_bias_prefers_action_over_low_value_treasur
     strategy.gain_priority = [PriorityRule("Silver"), PriorityRule("City")]
     ai = GeneticAI(strategy)
     player = PlayerState(ai)
-    player.collection_played = 1
+    player.turn.collection_played = 1
     state = GameState([player])
     state.supply = {"Silver": 40, "City": 10}
 
@@ -3,6 +3,7 @@ import sys
 import types
 from pathlib import Path
 
+from dominion.game.turn_state import TurnState
 from dominion.simulation.genetic_trainer import GeneticTrainer
 from dominion.strategy.enhanced_strategy import PriorityRule
 from dominion.strategy.strategies.base_strategy import BaseStrategy
@@ -135,13 +136,14 @@ def _make_mock_state(turn_number=5, provinces_left=8, colonies_left=8, empty_pil
 def _make_mock_player(coins=3, actions=1, buys=1, vp=3, all_cards=None):
     """Create a lightweight mock PlayerState."""
     player = types.SimpleNamespace()
+    player.turn = TurnState()
     player.coins = coins
     player.actions = actions
     player.buys = buys
     player.hand = []
     player.in_play = []
-    player.actions_gained_this_turn = 0
-    player.cards_gained_this_turn = 0
+    player.turn.actions_gained_this_turn = 0
+    player.turn.cards_gained_this_turn = 0
     player.count_in_deck = lambda card_name: {"Silver": 2, "Gold": 1}.get(card_name, 0)
     cards = all_cards if all_cards is not None else []
     player.all_cards = lambda _cards=cards: list(_cards)
@@ -1067,3 +1069,25 @@ class TestTrainResetsBestEvalBreakdown:
             "best_eval_breakdown should be reset at the top of train(); "
             f"got stale value {trainer.best_eval_breakdown!r}"
         )
+
+
+def test_multiplayer_evaluation_scores_placements(monkeypatch):
+    trainer = GeneticTrainer(
+        ["Village"], population_size=1, generations=1, games_per_eval=3,
+        shape_rewards=False, players=3,
+    )
+    strategy = make_stub_strategy()
+    seatings = []
+
+    def fake_run_multiplayer_game(ais, kingdom):
+        seatings.append([ai.strategy.name for ai in ais])
+        # Seat order decides the finish: first seat wins, last seat is last.
+        trainer.battle_system.last_placements = [ai.name for ai in ais]
+        return ais[0], {ai.name: 3 - seat for seat, ai in enumerate(ais)}, None, 0
+
+    monkeypatch.setattr(trainer.battle_system, "run_multiplayer_game", fake_run_multiplayer_game)
+
+    fitness = trainer.evaluate_strategy(strategy)
+
+    assert [seats.index("Stub") for seats in seatings] == [0, 2, 1]
+    assert fitness == 50.0
@@ -55,7 +55,7 @@ def test_delusion_blocks_action_buys():
     names = {card.name for card in affordable}
     assert "Silver" in names
     assert "Smithy" not in names
-    assert player.cannot_buy_actions
+    assert player.turn.cannot_buy_actions
 
 
 def test_envy_reduces_silver_output():
@@ -68,7 +68,7 @@ def test_envy_reduces_silver_output():
 
     assert player.coins == 1
     assert not player.envious
-    assert player.envious_effect_active
+    assert player.turn.envious_effect_active
 
 
 def test_misery_affects_scoring():
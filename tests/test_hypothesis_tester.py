@@ -0,0 +1,88 @@
+"""HypothesisTester: paired statistics and streamed, seeded sweep results."""
+
+import pytest
+
+from dominion.strategy.strategies.big_money import create_big_money
+from dominion.strategy.strategies.big_money_smithy import create_big_money_smithy
+from hypothesis_tester import HypothesisTester, _paired_difference
+
+VARIANTS = {"Big Money": create_big_money, "Smithy": create_big_money_smithy}
+KINGDOM = ["Smithy", "Village", "Market", "Festival", "Laboratory", "Mine", "Witch", "Moat", "Workshop", "Chapel"]
+
+
+@pytest.fixture
+def board(tmp_path):
+    path = tmp_path / "board.txt"
+    path.write_text("\n".join(KINGDOM) + "\n")
+    return str(path)
+
+
+def _game(won, score=30, baseline_score=20, number=1):
+    return {
+        "game_number": number,
+        "variant_won": won,
+        "variant_score": score,
+        "baseline_score": baseline_score,
+        "margin": score - baseline_score,
+        "turns": 15,
+    }
+
+
+def test_paired_difference_cancels_shared_outcomes():
+    variant = [_game(True), _game(True), _game(False), _game(True)]
+    mirror = [_game(True), _game(False), _game(False), _game(False)]
+
+    mean, half_width = _paired_difference(variant, mirror)
+
+    # Per-game differences are 0, 1, 0, 1.
+    assert mean == 0.5
+    assert half_width == pytest.approx(1.96 * (1 / 3) ** 0.5 / 2)
+    assert _paired_difference([], []) == (0.0, 0.0)
+    assert _paired_difference([_game(True)], [_game(False)]) == (1.0, 0.0)
+
+
+def test_summarize_reports_paired_delta_and_win_rate():
+    variant = [_game(True, 30, 20), _game(False, 18, 25), _game(True, 28, 22), _game(True, 33, 19)]
+    mirror = [_game(True), _game(True), _game(False), _game(False)]
+
+    entry = HypothesisTester._summarize("Smithy", False, variant, mirror)
+
+    assert entry["wins"] == 3
+    assert entry["losses"] == 1
+    assert entry["win_rate"] == 75.0
+    assert entry["avg_score"] == pytest.approx(27.25)
+    assert entry["avg_baseline_score"] == pytest.approx(21.5)
+    assert entry["paired_delta"] == pytest.approx(25.0)
+    assert 0.0 < entry["p_value"] <= 1.0
+
+
+def test_summarize_baseline_reports_even_record():
+    mirror = [_game(True), _game(True), _game(True), _game(False)]
+
+    entry = HypothesisTester._summarize("Big Money", True, mirror, mirror)
+
+    assert entry["win_rate"] == 50.0
+    assert entry["mirror_win_rate"] == 75.0
+    assert (entry["wins"], entry["losses"]) == (2, 2)
+    assert entry["detailed_results"] == []
+
+
+def test_results_stream_in_sweep_order_and_repeat_for_a_seed(board):
+    streamed = []
+    tester = HypothesisTester(board, games=4, seed=3)
+
+    results = tester.compare(VARIANTS, on_result=lambda partial: streamed.append(list(partial["variants"])))
+
+    assert [[entry["name"] for entry in snapshot] for snapshot in streamed] == [
+        ["Big Money"],
+        ["Big Money", "Smithy"],
+    ]
+    assert streamed[-1] == results["variants"]
+    assert HypothesisTester(board, games=4, seed=3).compare(VARIANTS) == results
+
+
+def test_parallel_sweep_matches_serial_sweep(board):
+    serial = HypothesisTester(board, games=4, seed=3).compare(VARIANTS)
+    parallel = HypothesisTester(board, games=4, seed=3, processes=2).compare(VARIANTS)
+
+    assert parallel == serial
@@ -0,0 +1,126 @@
+"""Name counts and Action/Treasure buckets kept by IndexedZone."""
+
+import copy
+import pickle
+
+import pytest
+
+from dominion.cards.registry import get_card
+from dominion.game.indexed_zone import IndexedZone
+from dominion.game.player_state import PlayerState
+from dominion.simulation.perf_fuzzer import play_game
+
+from tests.utils import DummyAI
+
+
+def _zone(*names):
+    return IndexedZone(get_card(name) for name in names)
+
+
+def _assert_indexed(zone):
+    zone.check()
+    assert zone.actions() == [card for card in zone if card.is_action]
+    assert zone.treasures() == [card for card in zone if card.is_treasure]
+
+
+def test_mutators_keep_index_in_step_with_the_cards():
+    zone = _zone("Copper", "Village", "Silver", "Smithy")
+    _assert_indexed(zone)
+
+    zone.append(get_card("Market"))
+    zone.extend([get_card("Gold"), get_card("Village")])
+    zone += [get_card("Copper")]
+    _assert_indexed(zone)
+    assert zone.count_name("Village") == 2
+    assert zone.count_name("Copper") == 2
+
+    zone.remove(zone[1])
+    zone.pop()
+    del zone[0]
+    _assert_indexed(zone)
+    assert zone.count_name("Copper") == 0
+    assert zone.count_name("Village") == 1
+
+    zone.insert(0, get_card("Festival"))
+    zone[1] = get_card("Platinum")
+    _assert_indexed(zone)
+
+    zone.sort(key=lambda card: card.name)
+    zone.reverse()
+    _assert_indexed(zone)
+
+    zone[1:3] = [get_card("Estate")]
+    del zone[:1]
+    _assert_indexed(zone)
+
+    zone.clear()
+    _assert_indexed(zone)
+    assert zone.count_name("Estate") == 0
+
+
+def test_remove_drops_the_identical_card():
+    first, second = get_card("Village"), get_card("Village")
+    zone = IndexedZone([first, get_card("Copper"), second])
+
+    zone.remove(second)
+
+    assert zone.actions() == [first]
+    assert zone.actions()[0] is first
+
+
+def test_same_card_held_twice_keeps_bucket_order():
+    first, second = get_card("Village"), get_card("Village")
+    zone = IndexedZone([first, second, first])
+    zone.actions()
+
+    zone.remove(first)
+
+    _assert_indexed(zone)
+    assert zone.actions() == [second, first]
+
+
+def test_reindex_follows_cards_renamed_in_place():
+    zone = _zone("Estate", "Copper")
+    estate = zone[0]
+    village = get_card("Village")
+
+    estate.name, estate.types = village.name, village.types
+    with pytest.raises(AssertionError):
+        zone.check()
+    zone.reindex()
+
+    _assert_indexed(zone)
+    assert zone.count_name("Village") == 1
+    assert zone.actions() == [estate]
+
+
+def test_copies_and_pickles_are_indexed():
+    zone = _zone("Village", "Copper", "Village")
+
+    for clone in (copy.copy(zone), copy.deepcopy(zone), pickle.loads(pickle.dumps(zone))):
+        assert type(clone) is IndexedZone
+        _assert_indexed(clone)
+        assert clone.count_name("Village") == 2
+
+
+def test_player_zones_wrap_assigned_lists():
+    player = PlayerState(DummyAI())
+    player.hand = [get_card("Village"), get_card("Copper")]
+    player.in_play = []
+
+    assert type(player.hand) is IndexedZone
+    assert type(player.in_play) is IndexedZone
+    assert player.hand.count_name("Village") == 1
+    assert type(copy.deepcopy(player).hand) is IndexedZone
+
+
+@pytest.mark.parametrize("board_seed", [3, 11, 29])
+def test_games_pass_zone_checks(monkeypatch, board_seed):
+    monkeypatch.setenv("PY_OVERLORD_CHECK_ZONES", "1")
+
+    state = play_game(board_seed, 0)
+
+    assert state.turn_number > 1
+    for player in state.players:
+        player.hand.check()
+        player.in_play.check()
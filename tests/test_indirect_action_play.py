@@ -3,7 +3,7 @@ action-phase loop (Throne Room, King's Court, Procession, Crown, Royal
 Carriage, Mastermind, Vassal, Golem, Conclave, Necromancer, etc.) must
 apply the same per-play bookkeeping the main loop does:
 
-- bump ``player.actions_this_turn`` so Conspirator-style "if you've played
+- bump ``player.turn.actions_this_turn`` so Conspirator-style "if you've played
   N or more Actions this turn" cards see the correct count
 - fire Prophecy / Ally / Tavern "action_played" hooks consistently
 
@@ -48,14 +48,14 @@ def test_conspirator_via_throne_room_triggers_threshold():
     state.phase = "action"
     state.handle_action_phase()
     # Throne Room (1) + Conspirator x2 (2 + 3) = 3 actions played this turn.
-    assert p1.actions_this_turn == 3
+    assert p1.turn.actions_this_turn == 3
     # Conspirator's bonus action triggered exactly once (on the 2nd replay
     # when the count reached 3). Conspirator base provides 0 actions; only
     # the threshold gives +1. The first replay didn't trigger; the second
     # did. Hard to assert "exactly once" without internals, but verifying
     # the threshold was reached + at least one Card was drawn over base
     # is a strong proxy (Throne Room itself draws 0 cards).
-    assert p1.actions_this_turn >= 3
+    assert p1.turn.actions_this_turn >= 3
 
 
 def test_conspirator_via_kings_court_triggers_threshold():
@@ -71,7 +71,7 @@ def test_conspirator_via_kings_court_triggers_threshold():
     state.phase = "action"
     state.handle_action_phase()
     # KC (1) + Conspirator x3 (2,3,4) = 4 actions played.
-    assert p1.actions_this_turn == 4
+    assert p1.turn.actions_this_turn == 4
 
 
 # --------- Tavern triggers via replay helpers ---------
@@ -129,7 +129,7 @@ def test_throne_room_bumps_actions_this_turn_for_each_replay():
     state.phase = "action"
     state.handle_action_phase()
     # Throne Room (1) + Smithy x2 (2, 3) = 3 actions played.
-    assert p1.actions_this_turn == 3
+    assert p1.turn.actions_this_turn == 3
 
 
 def test_procession_bumps_actions_this_turn_for_both_plays():
@@ -142,7 +142,7 @@ def test_procession_bumps_actions_this_turn_for_both_plays():
     state.phase = "action"
     state.handle_action_phase()
     # Procession (1) + Smithy x2 (2, 3) = 3.
-    assert p1.actions_this_turn == 3
+    assert p1.turn.actions_this_turn == 3
 
 
 def test_procession_trashes_and_gains_when_warlord_blocks_first_play():
@@ -177,7 +177,7 @@ def test_sailor_does_not_bump_action_counter_for_treasure_duration():
     cotr = get_card("Coin of the Realm")
     p1.tavern_mat = [cotr]
     p1.coins = 0
-    p1.actions_this_turn = 0
+    p1.turn.actions_this_turn = 0
     p1.actions_played = 0
 
     sailor = get_card("Sailor")
@@ -191,7 +191,7 @@ def test_sailor_does_not_bump_action_counter_for_treasure_duration():
 
     # Astrolabe is a Treasure-Duration: Sailor's play should NOT count as
     # an Action play (no action-counter bump, no Tavern trigger fire).
-    assert p1.actions_this_turn == 0
+    assert p1.turn.actions_this_turn == 0
     assert p1.actions_played == 0
     assert cotr in p1.tavern_mat   # CotR did NOT fire
     # Astrolabe's "$1 +1 Buy" should still apply on play.
@@ -206,7 +206,7 @@ def test_vassal_bumps_actions_this_turn_for_revealed_action():
     state.phase = "action"
     state.handle_action_phase()
     # Vassal (1) + revealed Smithy (2) = 2.
-    assert p1.actions_this_turn == 2
+    assert p1.turn.actions_this_turn == 2
 
 
 def test_indirect_action_play_gets_training_bonus():
@@ -224,11 +224,11 @@ def test_indirect_action_play_gets_training_bonus():
 def test_indirect_action_play_triggers_kiln_gain():
     state, p1, _ = _two_player_state()
     state.supply["Village"] = 10
-    p1.kiln_pending = 1
+    p1.turn.kiln_pending = 1
     village = get_card("Village")
     p1.in_play.append(village)
 
     state.play_action_indirectly(p1, village)
 
-    assert p1.kiln_pending == 0
+    assert p1.turn.kiln_pending == 0
     assert any(card.name == "Village" for card in p1.discard)
@@ -22,13 +22,13 @@ def test_inventor_gains_reduced_cost_card_and_adds_discount():
     inventor = get_card("Inventor")
     player.hand = [inventor]
     player.actions = 1
-    player.cost_reduction = 1
+    player.turn.cost_reduction = 1
 
     play_action(state, player, inventor)
 
     assert any(card.name == "Laboratory" for card in player.discard)
     assert state.supply["Laboratory"] == 9
-    assert player.cost_reduction == 2
+    assert player.turn.cost_reduction == 2
 
 
 def test_inventor_handles_no_affordable_cards_but_still_reduces_cost():
@@ -48,4 +48,4 @@ def test_inventor_handles_no_affordable_cards_but_still_reduces_cost():
 
     assert not player.discard
     assert state.supply["Laboratory"] == 10
-    assert player.cost_reduction == 1
+    assert player.turn.cost_reduction == 1
@@ -48,7 +48,7 @@ def test_innovation_plays_first_gained_action():
     state.gain_card(player, bridge)
     assert bridge in player.in_play
     assert bridge not in player.discard
-    assert player.innovation_used
+    assert player.turn.innovation_used
 
 
 def test_tragic_hero_trashes_and_gains_treasure():
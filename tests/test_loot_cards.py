@@ -53,7 +53,7 @@ def test_staff_respects_warlord_block_when_playing_action_from_hand():
     assert blocked_village in player.hand
     assert blocked_village not in player.in_play
     assert len(player.deck) == 1
-    assert player.actions_this_turn == 0
+    assert player.turn.actions_this_turn == 0
 
 
 def test_puzzle_box_sets_aside_non_action_and_returns_next_turn():
@@ -1,6 +1,7 @@
 """Tests for Menagerie kingdom cards."""
 
 from dominion.cards.registry import get_card
+from dominion.game.board_hooks import BoardHooks
 from dominion.game.game_state import GameState
 from dominion.game.player_state import PlayerState
 from tests.utils import DummyAI, ChooseFirstActionAI
@@ -13,6 +14,8 @@ def _two_player_state(extra_kingdom=None):
     state = GameState(players=[])
     kingdom = [get_card("Village")] + extra_kingdom
     state.initialize_game([ai1, ai2], kingdom)
+    # Tests put cards straight into zones, so keep every optional hook on.
+    state.hooks = BoardHooks()
     state.supply.setdefault("Horse", 30)
     state.supply.setdefault("Curse", 10)
     state.supply.setdefault("Silver", 40)
@@ -613,4 +616,4 @@ def test_kiln_consumes_trigger_when_pile_empty():
     state.handle_action_phase()
     # Pending must have been consumed by the first play even though no copy
     # could be gained.
-    assert getattr(p1, "kiln_pending", 0) == 0
+    assert p1.turn.kiln_pending == 0
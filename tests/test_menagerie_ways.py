@@ -650,10 +650,10 @@ def test_way_of_the_seal_does_not_persist_past_turn():
     p1.hand = [get_card("Village")]
     state.phase = "action"
     state.handle_action_phase()
-    assert p1.way_of_seal_active is True
+    assert p1.turn.way_of_seal_active is True
     # Advance past this player's turn so the flag is cleared.
     state.handle_cleanup_phase()
-    assert p1.way_of_seal_active is False
+    assert p1.turn.way_of_seal_active is False
 
 
 def test_way_of_the_seal_respects_ai_decline():
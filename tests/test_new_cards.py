@@ -2,6 +2,7 @@
 Treasury, Cargo Ship, Pickaxe, Graverobber, Joust, Road Network, Way of the Mouse."""
 
 from dominion.cards.registry import get_card
+from dominion.game.board_hooks import BoardHooks
 from dominion.game.game_state import GameState
 from dominion.projects.road_network import RoadNetwork
 from dominion.ways.mouse import WayOfTheMouse
@@ -69,6 +70,8 @@ def _setup(ai, kingdom_cards=None):
         kingdom_cards = [get_card("Village")]
     state = GameState(players=[])
     state.initialize_game([ai], kingdom_cards)
+    # Tests put cards straight into zones, so keep every optional hook on.
+    state.hooks = BoardHooks()
     player = state.players[0]
     player.hand = []
     player.deck = []
@@ -77,7 +80,7 @@ def _setup(ai, kingdom_cards=None):
     player.actions = 1
     player.buys = 1
     player.coins = 0
-    player.actions_this_turn = 0
+    player.turn.actions_this_turn = 0
     player.actions_played = 0
     return state, player
 
@@ -184,7 +187,7 @@ def test_treasury_topdecks_when_no_victory_gained():
     state, player = _setup(ai)
     treasury = get_card("Treasury")
     player.in_play = [treasury]
-    player.gained_victory_this_turn = False
+    player.turn.gained_victory_this_turn = False
 
     treasury.on_buy_phase_end(state)
 
@@ -197,7 +200,7 @@ def test_treasury_stays_when_victory_gained():
     state, player = _setup(ai)
     treasury = get_card("Treasury")
     player.in_play = [treasury]
-    player.gained_victory_this_turn = True
+    player.turn.gained_victory_this_turn = True
 
     treasury.on_buy_phase_end(state)
 
@@ -210,7 +213,7 @@ def test_treasury_stays_when_ai_declines():
     state, player = _setup(ai)
     treasury = get_card("Treasury")
     player.in_play = [treasury]
-    player.gained_victory_this_turn = False
+    player.turn.gained_victory_this_turn = False
 
     treasury.on_buy_phase_end(state)
 
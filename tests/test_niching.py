@@ -0,0 +1,70 @@
+"""Fitness-sharing niches: encoded niche counts match the pairwise similarity check."""
+
+import random
+
+import pytest
+
+from dominion.simulation import niching
+from dominion.simulation.niching import niche_counts, top_card_overlap, top_gain_cards
+from dominion.simulation.structured_genome import kingdom_features, kingdom_similarity
+from dominion.strategy.enhanced_strategy import EnhancedStrategy, PriorityRule
+
+CARDS = ["Province", "Duchy", "Gold", "Silver", "Copper", "Village", "Smithy", "Witch", "Market", "Chapel"]
+THRESHOLDS = [0.0, 0.2, 1 / 3, 0.4, 0.5, 0.6, 2 / 3, 0.75, 0.8, 1.0]
+
+
+@pytest.fixture(params=["numpy", "bitmask"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        assert niching.np is not None
+    else:
+        monkeypatch.setattr(niching, "np", None)
+    return request.param
+
+
+def _population(rng, size):
+    population = []
+    for _ in range(size):
+        strategy = EnhancedStrategy()
+        strategy.gain_priority = [PriorityRule(rng.choice(CARDS)) for _ in range(rng.randint(0, 8))]
+        population.append(strategy)
+    # GA populations are full of clones.
+    return population + population[: size // 3]
+
+
+def _pairwise(population, threshold, similarity):
+    return [sum(1 for other in population if similarity(strategy, other) >= threshold) for strategy in population]
+
+
+def test_niches_match_pairwise_similarity(backend):
+    rng = random.Random(5)
+
+    def raw_similarity(a, b):
+        return top_card_overlap(top_gain_cards(a), top_gain_cards(b))
+
+    for _ in range(60):
+        population = _population(rng, rng.randint(0, 25))
+        for threshold in THRESHOLDS:
+            raw_sets = [top_gain_cards(strategy) for strategy in population]
+            kingdom_sets = [kingdom_features(strategy) for strategy in population]
+            assert niche_counts(raw_sets, threshold) == _pairwise(population, threshold, raw_similarity)
+            assert niche_counts(kingdom_sets, threshold) == _pairwise(population, threshold, kingdom_similarity)
+
+
+def test_edge_cases(backend):
+    assert niche_counts([], 0.8) == []
+    # An empty top set is not even similar to itself.
+    assert niche_counts([set(), set()], 0.8) == [0, 0]
+    assert niche_counts([{"A", "B", "C"}, {"A", "B", "C"}, {"A", "B"}], 0.6) == [3, 3, 3]
+    assert niche_counts([{"A", "B", "C"}, {"A", "B", "C"}, {"A", "B"}], 0.8) == [2, 2, 1]
+
+
+def test_strategies_without_kingdom_picks_share_one_niche():
+    bare = EnhancedStrategy()
+    bare.gain_priority = [PriorityRule("Province"), PriorityRule("Gold")]
+    witch = EnhancedStrategy()
+    witch.gain_priority = [PriorityRule("Witch")]
+    assert kingdom_similarity(bare, bare) == 1.0
+    assert kingdom_similarity(bare, witch) == 0.0
+    assert niche_counts([kingdom_features(s) for s in (bare, bare, witch)], 0.8) == [2, 2, 1]
@@ -183,7 +183,7 @@ def test_den_of_sin_drawn_into_hand_on_gain():
 def test_devils_workshop_zero_gains_picks_card_up_to_four():
     state, player = _setup()
     dw = get_card("Devil's Workshop")
-    player.cards_gained_this_turn_count = 0
+    player.turn.cards_gained_this_turn_count = 0
     silver_before = state.supply.get("Silver", 0)
     dw.play_effect(state)
     # Should gain up to $4 — most expensive available
@@ -194,7 +194,7 @@ def test_devils_workshop_zero_gains_picks_card_up_to_four():
 def test_devils_workshop_one_gain_yields_gold():
     state, player = _setup()
     dw = get_card("Devil's Workshop")
-    player.cards_gained_this_turn_count = 1
+    player.turn.cards_gained_this_turn_count = 1
     gold_before = state.supply["Gold"]
     dw.play_effect(state)
     assert state.supply["Gold"] == gold_before - 1
@@ -203,7 +203,7 @@ def test_devils_workshop_one_gain_yields_gold():
 def test_devils_workshop_two_or_more_yields_imp():
     state, player = _setup()
     dw = get_card("Devil's Workshop")
-    player.cards_gained_this_turn_count = 2
+    player.turn.cards_gained_this_turn_count = 2
     imp_before = state.supply["Imp"]
     dw.play_effect(state)
     assert state.supply["Imp"] == imp_before - 1
@@ -308,7 +308,7 @@ def test_leprechaun_gains_gold_and_hex():
 def test_monastery_trashes_per_card_gained():
     state, player = _setup()
     mon = get_card("Monastery")
-    player.cards_gained_this_turn_count = 2
+    player.turn.cards_gained_this_turn_count = 2
     player.hand = [get_card("Copper"), get_card("Estate"), get_card("Silver")]
     mon.play_effect(state)
     # Two cards trashed, Silver kept
@@ -688,11 +688,11 @@ def test_changeling_uses_effective_cost_at_gain_peddler_reduced_below_three():
     state.supply["Changeling"] = 10
     state.supply["Peddler"] = 10
 
-    # Stack three Bridges in play -> player.cost_reduction = 3, so
+    # Stack three Bridges in play -> player.turn.cost_reduction = 3, so
     # every card gets -$3. Combined with 2 actions in play
     # (Peddler -$4 from cost_modifier), Peddler effective cost is
     # max(0, 8 - 4 - 3) = 1, which is below $3.
-    player.cost_reduction = 3
+    player.turn.cost_reduction = 3
     # Two Action cards in play to trigger Peddler's cost_modifier.
     player.in_play = [get_card("Village"), get_card("Smithy")]
     # Peddler's discount only applies during the Buy phase.
@@ -56,7 +56,7 @@ def _setup():
 def test_night_phase_plays_night_cards():
     state, player = _setup()
     monastery = get_card("Monastery")
-    player.cards_gained_this_turn_count = 1
+    player.turn.cards_gained_this_turn_count = 1
     player.hand = [monastery, get_card("Estate")]
     state.phase = "night"
     state.handle_night_phase()
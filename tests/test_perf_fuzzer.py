@@ -0,0 +1,77 @@
+"""Engine performance fuzzer: allocation counting, ranked card hooks and slow turns."""
+
+import copy
+import json
+
+from dominion.cards.base_card import Card
+from dominion.cards.registry import get_card
+from dominion.game.game_state import GameState, PhaseStepLimitExceeded
+from dominion.simulation import perf_fuzzer
+from dominion.simulation.perf_fuzzer import (
+    AllocationProfiler,
+    counting_card_instances,
+    format_report,
+    fuzz_board,
+    play_game,
+    run_fuzz,
+)
+
+
+def test_card_instances_are_counted_while_active():
+    with counting_card_instances():
+        start = perf_fuzzer._created[0]
+        village = get_card("Village")
+        copy.deepcopy(village)
+        assert perf_fuzzer._created[0] - start == 2
+    assert "__new__" not in Card.__dict__
+    assert get_card("Village").name == "Village"
+
+
+def test_memory_peaks_include_nested_sections():
+    profiler = AllocationProfiler(memory=True)
+
+    def inner():
+        return len([0] * 200_000)
+
+    def outer():
+        return profiler.call("test", "inner", inner)
+
+    with perf_fuzzer._tracing():
+        profiler.call("test", "outer", outer)
+    inner_peak = profiler.extra[("test", "inner")][3]
+    assert inner_peak > 1_000_000
+    assert profiler.extra[("test", "outer")][3] >= inner_peak
+
+
+def test_games_replay_and_profiling_does_not_change_them():
+    plain = play_game(4, 1)
+    profiled = play_game(4, 1, profiler=AllocationProfiler())
+    assert plain.turn_number == profiled.turn_number
+    assert [p.get_victory_points() for p in plain.players] == [p.get_victory_points() for p in profiled.players]
+
+
+def test_fuzz_ranks_hooks_and_keeps_the_slowest_turns():
+    report = run_fuzz(2, 1, seed=3, top_turns=5)
+    assert set(report["cards"]) == {"on_play", "on_gain", "on_buy"}
+    plays = report["cards"]["on_play"]
+    assert plays and all(a["self_us"] >= b["self_us"] for a, b in zip(plays, plays[1:]))
+    assert {"card", "calls", "mean_us", "max_us", "cards_created"} <= set(plays[0])
+    seconds = [turn["seconds"] for turn in report["turns"]]
+    assert len(seconds) == 5 and seconds == sorted(seconds, reverse=True)
+    assert report["failures"] == []
+    json.dumps(report)
+    assert "[on_play]" in format_report(report)
+
+
+def test_failures_are_recorded_with_their_turn(monkeypatch):
+    play_turn = GameState.play_turn
+
+    def runaway(self):
+        if self.turn_number == 3:
+            raise PhaseStepLimitExceeded("runaway")
+        return play_turn(self)
+
+    monkeypatch.setattr(GameState, "play_turn", runaway)
+    result = fuzz_board(6, 2)
+    assert [(game, turn) for _, game, turn, _ in result.failures] == [(0, 3), (1, 3)]
+    assert result.failures[0][3] == "PhaseStepLimitExceeded: runaway"
@@ -12,6 +12,7 @@ action — preferring cantrips over terminals — instead of the previous
 import types
 
 from dominion.cards.registry import get_card
+from dominion.game.turn_state import TurnState
 from dominion.strategy.enhanced_strategy import EnhancedStrategy, PriorityRule
 
 
@@ -27,11 +28,12 @@ def _make_state():
 
 def _make_player(hand=None, actions=1):
     player = types.SimpleNamespace()
+    player.turn = TurnState()
     player.hand = list(hand or [])
     player.in_play = []
     player.actions = actions
-    player.actions_gained_this_turn = 0
-    player.cards_gained_this_turn = 0
+    player.turn.actions_gained_this_turn = 0
+    player.turn.cards_gained_this_turn = 0
     return player
 
 
@@ -317,7 +317,7 @@ def test_launch_lockout_clears_at_turn_start():
     player.deck = [get_card("Copper")]
     launch = get_event("Launch")
     launch.on_buy(state, player)
-    assert player.launch_used is True
+    assert player.turn.launch_used is True
     assert not launch.may_be_bought(state, player)
     # Cycle: end turn (player 0) → next player → back to player 0.
     state.current_player_index = 1
@@ -325,7 +325,7 @@ def test_launch_lockout_clears_at_turn_start():
     state.current_player_index = 0
     state.handle_start_phase()
     # After our next turn-start, Launch should be buyable again.
-    assert player.launch_used is False
+    assert player.turn.launch_used is False
     assert launch.may_be_bought(state, player)
 
 
@@ -452,7 +452,7 @@ def test_journey_schedules_extra_turn_and_locks_out_for_turn():
     journey = get_event("Journey")
     assert journey.may_be_bought(state, player)
     journey.on_buy(state, player)
-    assert player.journey_used_this_turn is True
+    assert player.turn.journey_used_this_turn is True
     assert player.journey_extra_turn_pending is True
     assert state.extra_turn is True
     # Once-per-turn lockout takes effect immediately.
@@ -494,7 +494,7 @@ def test_journey_extra_turn_blocks_a_third_in_a_row():
     # On that extra turn, journey_used_this_turn resets but
     # took_extra_turn_last_turn keeps Journey unbuyable (no 3rd in a row).
     state.handle_start_phase()
-    assert player.journey_used_this_turn is False
+    assert player.turn.journey_used_this_turn is False
     assert not journey.may_be_bought(state, player)
 
 
@@ -527,7 +527,7 @@ def test_journey_lockout_clears_at_turn_start():
     state.current_player_index = 0
     journey = get_event("Journey")
     journey.on_buy(state, player)
-    assert player.journey_used_this_turn is True
+    assert player.turn.journey_used_this_turn is True
     # Cycle: end turn (player 0) → next player → back to player 0.
     state.handle_cleanup_phase()  # Player 0's cleanup, schedules extra turn.
     # Before player 0's extra turn starts, the extra-turn flag is still set;
@@ -540,7 +540,7 @@ def test_journey_lockout_clears_at_turn_start():
     state.handle_cleanup_phase()
     state.current_player_index = 0
     state.handle_start_phase()
-    assert player.journey_used_this_turn is False
+    assert player.turn.journey_used_this_turn is False
     assert journey.may_be_bought(state, player)
 
 
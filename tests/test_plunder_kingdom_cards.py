@@ -405,7 +405,7 @@ def test_crucible_gives_one_per_trashed():
     state.current_player_index = 0
     state.trash_card(player, get_card("Curse"))
     state.trash_card(player, get_card("Curse"))
-    assert player.cards_trashed_this_turn == 2
+    assert player.turn.cards_trashed_this_turn == 2
     cr = get_card("Crucible")
     player.in_play.append(cr)
     pre = player.coins
@@ -542,7 +542,7 @@ def test_crucible_counts_duration_phase_trashes():
     state.handle_start_phase()
     # Shrine trashed up to 2 Curses during the duration phase, AFTER the
     # per-turn counter reset; so the count should reflect them.
-    assert player.cards_trashed_this_turn >= 1
+    assert player.turn.cards_trashed_this_turn >= 1
 
 
 def test_quartermaster_routes_gain_through_gain_card_hooks():
@@ -566,7 +566,7 @@ def test_quartermaster_routes_gain_through_gain_card_hooks():
     gained_name = mat[0].name
     # gain_card-side bookkeeping must have run.
     assert gained_name in player.gained_cards_this_turn
-    assert player.cards_gained_this_turn >= 1
+    assert player.turn.cards_gained_this_turn >= 1
 
 
 def test_quartermaster_respects_watchtower_topdeck():
@@ -8,6 +8,7 @@ through the strategy serializer.
 
 import types
 
+from dominion.game.turn_state import TurnState
 from dominion.strategy.enhanced_strategy import PriorityRule
 
 
@@ -22,8 +23,9 @@ def _make_mock_state():
 
 def _make_mock_player(actions_gained_this_turn=0, cards_gained_this_turn=0):
     player = types.SimpleNamespace()
-    player.actions_gained_this_turn = actions_gained_this_turn
-    player.cards_gained_this_turn = cards_gained_this_turn
+    player.turn = TurnState()
+    player.turn.actions_gained_this_turn = actions_gained_this_turn
+    player.turn.cards_gained_this_turn = cards_gained_this_turn
     player.in_play = []
     player.hand = []
     return player
@@ -0,0 +1,85 @@
+"""Opt-in GameProfiler: sections recorded, nesting and isolation from clones."""
+
+import copy
+import random
+
+from dominion.ai.genetic_ai import GeneticAI
+from dominion.cards.registry import get_card
+from dominion.game.game_state import GameState
+from dominion.game.profiler import GameProfiler
+from dominion.strategy.strategies.big_money import create_big_money
+from dominion.strategy.strategies.village_smithy_lab import VillageSmithyLabStrategy
+
+KINGDOM = ["Smithy", "Village", "Market", "Festival", "Laboratory", "Mine", "Witch", "Moat", "Workshop", "Chapel"]
+
+
+def _profiled_game(profiler):
+    random.seed(3)
+    ais = [GeneticAI(create_big_money()), GeneticAI(VillageSmithyLabStrategy())]
+    for ai in ais:
+        profiler.instrument_ai(ai)
+    state = GameState(players=[], supply={})
+    state.log_callback = lambda *_: None
+    state.set_profiler(profiler)
+    state.initialize_game(ais, [get_card(name) for name in KINGDOM])
+    while not state.is_game_over():
+        state.play_turn()
+    return state
+
+
+def test_profiler_records_every_category():
+    profiler = GameProfiler()
+    _profiled_game(profiler)
+    report = profiler.report()
+
+    assert {"phase", "card", "gain", "on_gain", "on_buy", "priority", "condition", "ai"} <= set(report)
+    phases = {row["key"] for row in report["phase"]}
+    assert {"action", "treasure", "buy", "cleanup"} <= phases
+    assert any(row["key"] == "Copper" for row in report["card"])
+    assert any(row["key"].endswith(": choose_buy") for row in report["ai"])
+
+
+def test_self_time_excludes_nested_sections():
+    profiler = GameProfiler()
+
+    def inner():
+        return 1
+
+    def outer():
+        return profiler.call("test", "inner", inner) + 1
+
+    assert profiler.call("test", "outer", outer) == 2
+    calls, total, own = profiler.stats[("test", "outer")]
+    assert calls == 1
+    assert own <= total
+    assert profiler.stats[("test", "inner")][0] == 1
+
+
+def test_profiling_does_not_change_the_game():
+    plain = GameProfiler()
+    profiled_state = _profiled_game(plain)
+
+    random.seed(3)
+    ais = [GeneticAI(create_big_money()), GeneticAI(VillageSmithyLabStrategy())]
+    state = GameState(players=[], supply={})
+    state.log_callback = lambda *_: None
+    state.initialize_game(ais, [get_card(name) for name in KINGDOM])
+    while not state.is_game_over():
+        state.play_turn()
+
+    assert [p.get_victory_points() for p in state.players] == [
+        p.get_victory_points() for p in profiled_state.players
+    ]
+    assert state.turn_number == profiled_state.turn_number
+
+
+def test_clones_are_not_profiled_and_reports_merge():
+    profiler = GameProfiler()
+    state = _profiled_game(profiler)
+    assert copy.deepcopy(state).profiler is None
+
+    total = GameProfiler()
+    total.merge(profiler)
+    total.merge(profiler)
+    key = ("phase", "buy")
+    assert total.stats[key][0] == 2 * profiler.stats[key][0]
@@ -2,6 +2,7 @@
 
 from dominion.cards.registry import get_card
 from dominion.events.registry import get_event
+from dominion.game.board_hooks import BoardHooks
 from dominion.game.game_state import GameState
 from tests.utils import ChooseFirstActionAI
 
@@ -18,6 +19,8 @@ def _new_state(kingdom_card_names=None):
     kingdom_cards = [get_card(n) for n in kingdom_card_names]
     allies = [_NoOpAlly()] if any(card.is_liaison for card in kingdom_cards) else None
     state.initialize_game([ai], kingdom_cards, allies=allies)
+    # Tests put cards straight into zones, so keep every optional hook on.
+    state.hooks = BoardHooks()
     return state
 
 
@@ -182,7 +185,7 @@ def test_summon_routes_gain_through_pipeline_so_on_gain_fires():
     """
     state = _new_state(["Village"])
     player = state.players[0]
-    player.collection_played = 1
+    player.turn.collection_played = 1
     starting_vp = player.vp_tokens
 
     summon = get_event("Summon")
@@ -198,7 +201,7 @@ def test_summon_uses_effective_cost_so_cost_reduction_widens_choices():
     # Festival is $5 printed.
     state = _new_state(["Festival"])
     player = state.players[0]
-    player.cost_reduction = 1
+    player.turn.cost_reduction = 1
 
     summon = get_event("Summon")
     summon.on_buy(state, player)
@@ -214,12 +217,12 @@ def test_summon_play_increments_actions_this_turn():
     player = state.players[0]
     summon = get_event("Summon")
     summon.on_buy(state, player)
-    starting_actions_count = player.actions_this_turn
+    starting_actions_count = player.turn.actions_this_turn
 
     state.phase = "start"
     state.handle_start_phase()
 
-    assert player.actions_this_turn == starting_actions_count + 1
+    assert player.turn.actions_this_turn == starting_actions_count + 1
 
 
 def test_summon_topdeck_via_royal_seal_stays_on_deck():
@@ -251,7 +254,7 @@ def test_summon_resolves_knights_pile_correctly():
     """
     state = _new_state(["Knights"])
     player = state.players[0]
-    player.cost_reduction = 1
+    player.turn.cost_reduction = 1
 
     starting_supply = state.supply["Knights"]
     starting_order_len = len(state.pile_order["Knights"])
@@ -276,7 +279,7 @@ def test_summon_exile_reclaim_on_knight_keeps_pile_intact():
     """
     state = _new_state(["Knights"])
     player = state.players[0]
-    player.cost_reduction = 1
+    player.turn.cost_reduction = 1
     top_knight_name = state.pile_order["Knights"][-1]
     # Pre-place the same-named knight on Exile.
     player.exile.append(get_card(top_knight_name))
@@ -305,7 +308,7 @@ def test_summon_changeling_exchange_on_knight_no_double_restore():
     """
     state = _new_state(["Knights", "Changeling"])
     player = state.players[0]
-    player.cost_reduction = 1
+    player.turn.cost_reduction = 1
     player.ai.should_exchange_changeling = lambda s, p, c: True
 
     starting_knights_supply = state.supply["Knights"]
@@ -448,7 +451,7 @@ def test_summon_trader_replacement_on_knight_restores_pile_state():
     """
     state = _new_state(["Knights"])
     player = state.players[0]
-    player.cost_reduction = 1  # makes Knights effectively $4
+    player.turn.cost_reduction = 1  # makes Knights effectively $4
     player.hand = [get_card("Trader")]
     player.ai.should_reveal_trader = lambda s, p, original, to_deck=False: True
 
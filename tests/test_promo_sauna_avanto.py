@@ -25,7 +25,7 @@ def test_avanto_partner_sauna_respects_warlord_block():
     assert blocked_sauna in player.hand
     assert blocked_sauna not in player.in_play
     assert len(player.deck) == 1
-    assert player.actions_this_turn == 0
+    assert player.turn.actions_this_turn == 0
 
 
 def test_sauna_partner_avanto_respects_warlord_block():
@@ -42,4 +42,4 @@ def test_sauna_partner_avanto_respects_warlord_block():
     assert blocked_avanto in player.hand
     assert blocked_avanto not in player.in_play
     assert len(player.deck) == 3
-    assert player.actions_this_turn == 0
+    assert player.turn.actions_this_turn == 0
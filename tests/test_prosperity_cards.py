@@ -105,7 +105,7 @@ def test_bishop_vp_uses_effective_coin_cost():
     state = GameState([player])
     state.setup_supply([get_card("Bishop")])
 
-    player.cost_reduction = 1
+    player.turn.cost_reduction = 1
     player.hand = [get_card("Bishop"), get_card("Gold")]
 
     play_action(state, player, "Bishop")
@@ -821,7 +821,7 @@ def test_tiara_replays_treasure_once_per_turn():
     # Tiara: +1 Buy, no coin. Silver: $2 (replayed once via Tiara) ⇒ $4. Copper: $1.
     # So total = 4 + 1 = 5
     assert player.coins == 5
-    assert player.tiara_replay_used
+    assert player.turn.tiara_replay_used
 
 
 def test_tiara_can_replay_itself():
@@ -845,7 +845,7 @@ def test_tiara_can_replay_itself():
     # No further replay because Tiara's once-per-turn limit is now used.
     assert player.coins == 1
     assert player.buys == initial_buys + 2
-    assert player.tiara_replay_used
+    assert player.turn.tiara_replay_used
 
 
 def test_tiara_topdecks_gain_when_in_play():
@@ -914,7 +914,7 @@ def test_war_chest_gains_unnamed_card():
 
     # Silver was named ⇒ should NOT be gained. Gold is the most expensive
     # remaining $0-$5 card.
-    assert "Silver" in owner.war_chest_named_this_turn
+    assert "Silver" in owner.turn.war_chest_named_this_turn
     assert any(c.name != "Silver" for c in owner.discard + owner.deck + owner.hand)
 
 
@@ -933,7 +933,7 @@ def test_war_chest_excludes_previously_named_card():
     # First WC named Silver. Now the same opponent will try to name Silver
     # again, but the gain must avoid any previously-named card.
     wc2.on_play(state)
-    assert "Silver" in owner.war_chest_named_this_turn
+    assert "Silver" in owner.turn.war_chest_named_this_turn
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,76 @@
+"""Seeded random boards: legality, determinism and round trips through the board loader."""
+
+from dominion.allies.registry import get_ally
+from dominion.boards.loader import load_board
+from dominion.boards.random_board import format_board, kingdom_pile_names, random_board
+from dominion.cards.metadata import get_card_metadata
+from dominion.cards.registry import get_card
+from dominion.events.registry import get_event
+from dominion.game.game_state import GameState
+from dominion.landmarks.registry import get_landmark
+from dominion.projects.registry import get_project
+from dominion.rl.random_ai import RandomAI
+from dominion.ways.registry import get_way
+
+
+def test_same_seed_same_board():
+    assert random_board(7) == random_board(7)
+    assert random_board(7).config.kingdom_cards != random_board(8).config.kingdom_cards
+
+
+def test_kingdom_pool_only_holds_supply_piles():
+    piles = kingdom_pile_names()
+    assert {"Village", "Castles", "Knights", "Encampment"} <= set(piles)
+    for name in ("Copper", "Province", "Plunder", "Dame Anna", "Spoils", "Horse", "Bag of Gold", "Will-o'-Wisp"):
+        assert name not in piles
+    assert len(piles) == len(set(piles))
+
+
+def test_boards_are_legal():
+    for seed in range(150):
+        board = random_board(seed)
+        config = board.config
+        kingdom = config.kingdom_cards
+        for name in kingdom:
+            get_card(name)
+        if "Young Witch" in kingdom:
+            bane = kingdom[10]
+            meta = get_card_metadata(bane)
+            assert meta.cost.coins in (2, 3) and not meta.cost.potions and not meta.cost.debt
+        for landmark in config.landmarks:
+            if landmark.startswith("Obelisk ("):
+                assert landmark[len("Obelisk (") : -1] in kingdom
+        for pile in config.traits:
+            assert pile in kingdom
+        if any(get_card_metadata(name).is_liaison for name in kingdom):
+            assert len(config.allies) == 1
+
+
+def test_format_board_round_trips(tmp_path):
+    for seed in range(40):
+        config = random_board(seed).config
+        path = tmp_path / f"random_{seed}.txt"
+        path.write_text(format_board(config))
+        loaded = load_board(path)
+        assert loaded.kingdom_cards == config.kingdom_cards
+        assert (loaded.events, loaded.projects, loaded.ways) == (config.events, config.projects, config.ways)
+        assert (loaded.landmarks, loaded.allies, loaded.traits) == (config.landmarks, config.allies, config.traits)
+
+
+def test_boards_set_up():
+    for seed in range(30):
+        board = random_board(seed)
+        config = board.config
+        state = GameState(players=[], supply={})
+        state.initialize_game(
+            [RandomAI(), RandomAI()],
+            [get_card(name) for name in config.kingdom_cards],
+            use_shelters=board.use_shelters,
+            events=[get_event(name) for name in config.events],
+            projects=[get_project(name) for name in config.projects],
+            ways=[get_way(name) for name in config.ways],
+            landmarks=[get_landmark(name) for name in config.landmarks],
+            allies=[get_ally(name) for name in config.allies],
+            traits=config.traits,
+        )
+        assert state.supply
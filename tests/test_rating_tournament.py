@@ -0,0 +1,119 @@
+"""Adaptive Bradley-Terry rating tournaments."""
+
+import math
+import random
+
+import pytest
+
+from dominion.simulation.rating_tournament import Rating, RatingTournament, ratings_to_leaderboard
+
+
+def _simulated(strengths, seed=0):
+    """play_pair callback drawing wins from a true Bradley-Terry model."""
+    rng = random.Random(seed)
+    calls = []
+
+    def play(a, b, games, offset):
+        calls.append((a, b, games, offset))
+        p = 1 / (1 + math.exp(strengths[b] - strengths[a]))
+        return sum(rng.random() < p for _ in range(games))
+
+    return play, calls
+
+
+def test_recovers_true_order_with_fewer_games_than_round_robin():
+    strengths = {f"s{i}": 0.4 * i for i in range(10)}
+    play, _ = _simulated(strengths)
+    round_robin_cost = 45 * 200
+    tournament = RatingTournament(list(strengths), play, batch_games=20, max_games=round_robin_cost, seed=1)
+
+    ranked = tournament.run()
+
+    assert [r.name for r in ranked] == [f"s{i}" for i in reversed(range(10))]
+    assert tournament.is_resolved()
+    assert tournament.games_played < round_robin_cost / 2
+
+
+def test_budget_caps_games_when_strategies_are_identical():
+    play, _ = _simulated({"a": 0.0, "b": 0.0, "c": 0.0})
+    tournament = RatingTournament(["a", "b", "c"], play, batch_games=10, max_games=100, seed=0)
+
+    tournament.run()
+
+    assert tournament.games_played == 100
+    assert not tournament.is_resolved()
+
+
+def test_offsets_count_prior_games_between_the_pair():
+    play, calls = _simulated({"a": 0.0, "b": 0.0})
+    tournament = RatingTournament(["a", "b"], play, batch_games=4, max_games=12, seed=0)
+
+    tournament.run()
+
+    offsets = sorted(offset for *_, offset in calls)
+    assert offsets == [0, 4, 8]
+
+
+def test_batch_games_are_rounded_up_to_balance_seats():
+    play, _ = _simulated({"a": 0.0, "b": 0.0})
+    assert RatingTournament(["a", "b"], play, batch_games=5).batch_games == 6
+
+
+def test_unplayable_pairs_are_not_offered_again():
+    strengths = {"a": 0.0, "b": 0.5, "c": 1.0}
+    simulated, calls = _simulated(strengths)
+
+    def play(a, b, games, offset):
+        if {a, b} == {"a", "c"}:
+            return None
+        return simulated(a, b, games, offset)
+
+    tournament = RatingTournament(list(strengths), play, batch_games=10, max_games=400, seed=0)
+    tournament.run()
+
+    assert tournament.games_between("a", "c") == 0
+    assert sum(1 for a, b, *_ in calls if {a, b} == {"a", "c"}) == 0
+
+
+def test_wide_interval_below_a_separated_neighbour_is_still_paired():
+    tournament = RatingTournament(["a", "b", "c"], lambda *args: 0, seed=0)
+    # b sits below a with a narrow interval; c is lower still but so
+    # uncertain that it overlaps a.
+    tournament.ratings = lambda: [
+        Rating("a", 1700.0, 10.0, 0, 0),
+        Rating("b", 1600.0, 10.0, 0, 0),
+        Rating("c", 1500.0, 200.0, 0, 0),
+    ]
+
+    pairs = {tournament.next_pair() for _ in range(30)}
+
+    assert ("a", "c") in pairs
+    assert ("a", "b") not in pairs
+
+
+def test_undefeated_strategy_keeps_a_finite_rating():
+    tournament = RatingTournament(["a", "b"], lambda a, b, games, offset: games if a == "a" else 0)
+    tournament.record("a", "b", 20, 20)
+    tournament.fit()
+
+    top, bottom = tournament.ratings()
+    assert top.name == "a"
+    assert math.isfinite(top.rating) and top.sigma > 0
+    assert top.rating > bottom.rating
+
+
+def test_leaderboard_rows_include_rating_interval():
+    tournament = RatingTournament(["a", "b"], lambda *args: 0)
+    tournament.record("a", "b", 10, 7)
+    tournament.fit()
+
+    rows = ratings_to_leaderboard(tournament.ratings())
+
+    assert rows["a"]["wins"] == 7 and rows["a"]["losses"] == 3
+    assert rows["a"]["win_rate"] == pytest.approx(70.0)
+    assert rows["a"]["rating_low"] < rows["a"]["rating"] < rows["a"]["rating_high"]
+
+
+def test_requires_unique_names():
+    with pytest.raises(ValueError):
+        RatingTournament(["a", "a"], lambda *args: 0)
@@ -302,7 +302,7 @@ def test_canal_reduces_cost_during_turn():
     p.hand = []
     state.phase = "start"
     state.handle_start_phase()
-    assert p.cost_reduction == 1
+    assert p.turn.cost_reduction == 1
     # A Province costs $8 normally; with Canal in effect it costs $7.
     province = get_card("Province")
     assert state.get_card_cost(p, province) == 7
@@ -354,7 +354,7 @@ def test_citadel_replays_first_action():
     # Village played twice: +1 Card +2 Actions per play.
     # Started with 1 action, used 1 to play Village, +2 from each of 2 plays = 4.
     assert p.actions == 4
-    assert p.citadel_used
+    assert p.turn.citadel_used
 
 
 def test_citadel_only_fires_once_per_turn():
@@ -414,7 +414,7 @@ def test_citadel_does_not_trigger_on_treasure_under_enlightenment():
     # Silver played as the only "action" under Enlightenment: +1 Card,
     # +1 Action, no replay. citadel_used must remain False so a future
     # Action this turn would still trigger Citadel.
-    assert p.citadel_used is False
+    assert p.turn.citadel_used is False
     # Started with 1 action, -1 to play Silver, +1 from Enlightenment text.
     assert p.actions == 1
 
@@ -449,7 +449,7 @@ def test_citadel_replays_first_action_played_via_way():
     # Village played via Way of the Otter (+2 Cards from Otter, no actions).
     # Citadel replays Village using normal text (+1 Card, +2 Actions).
     # Actions: 1 - 1 (play) + 2 (replay) = 2.
-    assert p.citadel_used
+    assert p.turn.citadel_used
     assert p.actions == 2
 
 
@@ -469,7 +469,7 @@ def test_citadel_replays_hasty_played_action():
     state._handle_hasty_start_of_turn(p)
     # Village played twice (Hasty + Citadel replay): +2 cards drawn,
     # +4 actions. Started with 1 → 5.
-    assert p.citadel_used
+    assert p.turn.citadel_used
     assert p.actions == 5
 
 
@@ -489,14 +489,14 @@ def test_citadel_replays_captain_supply_play_on_duration():
     state.current_player_index = 0
     captain = get_card("Captain")
     p.duration.append(captain)
-    p.citadel_used = False
+    p.turn.citadel_used = False
     p.deck = [get_card("Copper") for _ in range(10)]
     p.hand = []
     actions_before = p.actions
     captain.on_duration(state)
     # Captain plays a Village from Supply (+2 actions); Citadel replays
     # that Village (+2 actions). Net: +4 actions.
-    assert p.citadel_used
+    assert p.turn.citadel_used
     assert p.actions == actions_before + 4
 
 
@@ -532,7 +532,7 @@ def test_citadel_replays_capitalism_treasure_phase_action():
     state.handle_treasure_phase()
     # Bazaar plays as Treasure (Capitalism), Citadel replays it once.
     # Each play gives +$1 → coins increase by 2.
-    assert p.citadel_used
+    assert p.turn.citadel_used
     assert p.coins == coins_before + 2
 
 
@@ -560,7 +560,7 @@ def test_citadel_does_not_trigger_on_plain_treasure_in_buy_phase():
     p.deck = [get_card("Copper") for _ in range(5)]
     state.phase = "treasure"
     state.handle_treasure_phase()
-    assert p.citadel_used is False
+    assert p.turn.citadel_used is False
 
 
 def test_citadel_replays_inherited_estate():
@@ -584,7 +584,7 @@ def test_citadel_replays_inherited_estate():
     state.handle_action_phase()
     # Estate played as Village twice (once + Citadel replay): +2 Actions
     # per play. Started 1, -1 to play, +2 +2 from replays = 4.
-    assert p.citadel_used
+    assert p.turn.citadel_used
     assert p.actions == 4
 
 
@@ -628,7 +628,7 @@ def test_citadel_inheritance_replay_preserves_inherited_identity():
     # Citadel replay as inherited Village (+$1 from the training token
     # because the helper now overlays the Estate's identity to "Village"
     # during the post-play hooks).
-    assert p.citadel_used
+    assert p.turn.citadel_used
     assert p.coins == coins_before + 1
 
 
@@ -664,7 +664,7 @@ def test_citadel_replays_inherited_estate_played_via_way():
     # Estate played via Way of the Otter (+2 Cards). Citadel replays it
     # as the inherited Village (+1 Card, +2 Actions). Started 1 action,
     # -1 to play, +2 from inherited Village = 2.
-    assert p.citadel_used
+    assert p.turn.citadel_used
     assert p.actions == 2
 
 
@@ -685,7 +685,7 @@ def test_citadel_replays_ghost_pending_action():
     state.phase = "start"
     state.handle_start_phase()
     # Ghost plays Village (+2 actions); Citadel replays it (+2 actions).
-    assert p.citadel_used
+    assert p.turn.citadel_used
     assert p.actions == actions_before + 4
 
 
@@ -705,7 +705,7 @@ def test_citadel_replays_turtle_set_aside_action():
     state.phase = "start"
     state.handle_start_phase()
     # Turtle plays Village (+2 actions); Citadel replays it (+2 actions).
-    assert p.citadel_used
+    assert p.turn.citadel_used
     assert p.actions == actions_before + 4
 
 
@@ -747,7 +747,7 @@ def test_citadel_helper_fires_tavern_triggers():
     # Village (+2 actions); Royal Carriage reacts to the replay's
     # action_played trigger and replays Village again (+2 actions).
     # Started 1 action, -1 to play, +2 +2 = 4.
-    assert p.citadel_used
+    assert p.turn.citadel_used
     assert p.actions == 4
     # Royal Carriage moved from tavern_mat to discard after firing.
     assert rc not in p.tavern_mat
@@ -792,7 +792,7 @@ def test_citadel_helper_fires_prophecy_hooks():
     # Way play: no actions. Citadel replay: +2 (Village). Great Leader
     # fires once on the helper replay → +1 more. Started 1, -1 to play,
     # +2 (replay) +1 (Great Leader) = 3.
-    assert p.citadel_used
+    assert p.turn.citadel_used
     assert p.actions == 3
 
 
@@ -815,7 +815,7 @@ def test_citadel_replays_prince_set_aside_action():
     prince.on_duration(state)
     # Village plays once via Prince (+2 actions); Citadel replays it
     # via the helper (+2 actions).
-    assert p.citadel_used
+    assert p.turn.citadel_used
     assert p.actions == actions_before + 4
 
 
@@ -838,7 +838,7 @@ def test_citadel_replays_riverboat_target_action():
     riverboat.on_duration(state)
     # Village plays once via Riverboat (+2 actions); Citadel replays
     # via the helper (+2 actions).
-    assert p.citadel_used
+    assert p.turn.citadel_used
     assert p.actions == actions_before + 4
 
 
@@ -859,7 +859,7 @@ def test_citadel_replays_summon_set_aside_action():
     state.phase = "start"
     state.handle_start_phase()
     # Summon plays Village (+2 actions); Citadel replays (+2 actions).
-    assert p.citadel_used
+    assert p.turn.citadel_used
     assert p.actions == actions_before + 4
 
 
@@ -867,13 +867,13 @@ def test_citadel_resets_at_turn_start():
     state = make_state(Citadel())
     p = state.players[0]
     p.projects.append(state.projects[0])
-    p.citadel_used = True
+    p.turn.citadel_used = True
     state.current_player_index = 0
     p.deck = [get_card("Copper")]
     p.hand = []
     state.phase = "start"
     state.handle_start_phase()
-    assert p.citadel_used is False
+    assert p.turn.citadel_used is False
 
 
 def test_crop_rotation_discards_victory_for_cards():
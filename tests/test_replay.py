@@ -0,0 +1,110 @@
+"""Binary replay records, decision encoding and deterministic re-recording."""
+
+import random
+
+import pytest
+
+from dominion.ai.genetic_ai import GeneticAI
+from dominion.cards.registry import get_card
+from dominion.game.game_state import GameState
+from dominion.simulation.replay import (
+    DecisionRecorder,
+    ReplayRecord,
+    ReplayWriter,
+    decode_codes,
+    encode_decision,
+    load_replay,
+    read_replays,
+    replay_game,
+)
+from dominion.simulation.strategy_battle import StrategyBattle
+from dominion.strategy.strategies.big_money import create_big_money
+from dominion.strategy.strategies.big_money_smithy import create_big_money_smithy
+
+KINGDOM = ["Smithy", "Village", "Market", "Festival", "Laboratory", "Mine", "Witch", "Moat", "Workshop", "Chapel"]
+
+
+def _record(seed=7, decisions=b"\x01\x05\x09"):
+    return ReplayRecord(
+        seed=seed,
+        kingdom=KINGDOM,
+        strategies=["Big Money", "BigMoneySmithy"],
+        fingerprints=["aaaa", "bbbb"],
+        scores=[30, 24],
+        turns=19,
+        decisions=decisions,
+        landscapes={"events": ["Alms"]},
+    )
+
+
+def _play_recorded(seed):
+    random.seed(seed)
+    recorder = DecisionRecorder()
+    ais = [GeneticAI(create_big_money()), GeneticAI(create_big_money_smithy())]
+    for ai in ais:
+        recorder.attach(ai)
+    state = GameState(players=[], supply={})
+    state.log_callback = lambda *_: None
+    state.initialize_game(ais, [get_card(name) for name in KINGDOM])
+    while not state.is_game_over():
+        state.play_turn()
+    return recorder
+
+
+def test_record_round_trips_through_bytes():
+    record = _record()
+    assert ReplayRecord.from_bytes(record.to_bytes()) == record
+
+
+def test_writer_appends_and_reader_returns_records_in_order(tmp_path):
+    path = tmp_path / "games.replay"
+    with ReplayWriter(path) as writer:
+        writer.write(_record(seed=1))
+    with ReplayWriter(path) as writer:
+        writer.write(_record(seed=2))
+
+    assert [record.seed for record in read_replays(path)] == [1, 2]
+    assert load_replay(path, 1).seed == 2
+    with pytest.raises(IndexError):
+        load_replay(path, 2)
+
+
+def test_reader_rejects_other_files(tmp_path):
+    path = tmp_path / "not.replay"
+    path.write_bytes(b"hello")
+    with pytest.raises(ValueError):
+        list(read_replays(path))
+
+
+def test_decisions_encode_as_indices_into_the_offered_choices():
+    smithy, village = get_card("Smithy"), get_card("Village")
+    choices = [smithy, village, None]
+
+    assert encode_decision(village, (None, choices)) == [(1 << 2) | 1]
+    assert encode_decision(None, (None, choices)) == [0]
+    assert encode_decision(True) != encode_decision(False)
+    assert encode_decision([village, smithy], (None, choices)) == [(2 << 2) | 3, (1 << 2) | 1, 1]
+
+
+def test_same_seed_records_the_same_decisions():
+    first = _play_recorded(11)
+    again = _play_recorded(11)
+
+    assert first.decisions > 0
+    assert decode_codes(first.to_bytes()) == first.codes == again.codes
+
+
+def test_three_seat_tournament_games_replay_exactly(tmp_path):
+    battle = StrategyBattle(log_folder=str(tmp_path / "logs"), log_frequency=0)
+    path = tmp_path / "games.replay"
+    with ReplayWriter(path) as writer:
+        battle.run_tournament(["Big Money", "Big Money Smithy", "Chapel Witch"], 3, seed=5, replays=writer)
+
+    records = list(read_replays(path))
+    assert [len(record.strategies) for record in records] == [3, 3, 3]
+    assert records[0].strategies != records[1].strategies  # seats rotate
+    for record in records:
+        result = replay_game(record, log_folder=str(tmp_path / "replayed"))
+        assert result.matches
+        assert result.scores == record.scores
+        assert result.turns == record.turns
@@ -0,0 +1,144 @@
+"""Persistent matchup result store: fingerprints, reuse and canonical order."""
+
+from dominion.cards.registry import get_card
+from dominion.game.game_state import GameState
+from dominion.simulation.result_store import (
+    ResultStore,
+    board_fingerprint,
+    engine_source_hash,
+    play_stored_matchup,
+    strategy_fingerprint,
+)
+from dominion.strategy.enhanced_strategy import PriorityRule
+from dominion.strategy.strategies.big_money import create_big_money
+from dominion.strategy.strategies.big_money_smithy import create_big_money_smithy
+
+KINGDOM = ["Smithy", "Village", "Market", "Festival", "Laboratory", "Mine", "Witch", "Moat", "Workshop", "Chapel"]
+
+
+class _Battle:
+    """Minimal stand-in for StrategyBattle.run_game that counts games."""
+
+    def __init__(self):
+        self.games = 0
+
+    def run_game(self, ai1, ai2, kingdom_card_names):
+        self.games += 1
+        state = GameState(players=[], supply={})
+        state.log_callback = lambda *_: None
+        state.initialize_game([ai1, ai2], [get_card(name) for name in kingdom_card_names])
+        while not state.is_game_over():
+            state.play_turn()
+        scores = {p.ai.name: p.get_victory_points() for p in state.players}
+        winner = max(state.players, key=lambda p: (p.get_victory_points(), -p.turns_taken)).ai
+        return winner, scores, None, state.turn_number
+
+
+def test_strategy_fingerprint_tracks_rule_conditions():
+    base = create_big_money()
+    same = create_big_money()
+    changed = create_big_money()
+    changed.gain_priority[0] = PriorityRule(
+        changed.gain_priority[0].card_name, PriorityRule.turn_number(">=", 3)
+    )
+
+    assert strategy_fingerprint(base) == strategy_fingerprint(same)
+    assert strategy_fingerprint(base) != strategy_fingerprint(changed)
+
+
+def test_board_fingerprint_ignores_kingdom_order():
+    assert board_fingerprint(kingdom_cards=["Smithy", "Village"]) == board_fingerprint(
+        kingdom_cards=["Village", "Smithy"]
+    )
+    assert board_fingerprint(kingdom_cards=["Smithy"]) != board_fingerprint(
+        kingdom_cards=["Smithy"], events=["Alms"]
+    )
+
+
+def test_stored_games_are_reused_and_only_missing_games_play(tmp_path):
+    battle = _Battle()
+    board = board_fingerprint(kingdom_cards=KINGDOM)
+    with ResultStore(tmp_path / "results.sqlite") as store:
+        first = play_stored_matchup(store, battle, create_big_money(), create_big_money_smithy(), 4, board, KINGDOM)
+        assert first.played == 4 and battle.games == 4
+
+        again = play_stored_matchup(store, battle, create_big_money(), create_big_money_smithy(), 6, board, KINGDOM)
+
+    assert again.played == 2
+    assert battle.games == 6
+    assert again.games == 6
+
+
+def test_reversed_pairing_reads_the_same_games(tmp_path):
+    battle = _Battle()
+    board = board_fingerprint(kingdom_cards=KINGDOM)
+    with ResultStore(tmp_path / "results.sqlite") as store:
+        forward = play_stored_matchup(store, battle, create_big_money(), create_big_money_smithy(), 4, board, KINGDOM)
+        reverse = play_stored_matchup(store, battle, create_big_money_smithy(), create_big_money(), 4, board, KINGDOM)
+
+    assert reverse.played == 0
+    assert (reverse.a_wins, reverse.b_wins) == (forward.b_wins, forward.a_wins)
+    assert reverse.a_total_score == forward.b_total_score
+
+
+def test_engine_version_bump_makes_stored_games_stale(tmp_path):
+    battle = _Battle()
+    board = board_fingerprint(kingdom_cards=KINGDOM)
+    path = tmp_path / "results.sqlite"
+    with ResultStore(path, engine_version="old") as store:
+        play_stored_matchup(store, battle, create_big_money(), create_big_money_smithy(), 2, board, KINGDOM)
+
+    with ResultStore(path, engine_version="new") as store:
+        replay = play_stored_matchup(store, battle, create_big_money(), create_big_money_smithy(), 2, board, KINGDOM)
+        assert replay.played == 2
+        assert store.prune_stale() == 2
+
+
+def test_stored_result_matches_a_fresh_run(tmp_path):
+    board = board_fingerprint(kingdom_cards=KINGDOM)
+    with ResultStore(tmp_path / "a.sqlite") as store:
+        stored = play_stored_matchup(store, _Battle(), create_big_money(), create_big_money_smithy(), 4, board, KINGDOM)
+        cached = play_stored_matchup(store, _Battle(), create_big_money(), create_big_money_smithy(), 4, board, KINGDOM)
+    with ResultStore(tmp_path / "b.sqlite") as store:
+        fresh = play_stored_matchup(store, _Battle(), create_big_money(), create_big_money_smithy(), 4, board, KINGDOM)
+
+    summary = lambda r: (r.a_wins, r.a_total_score, r.b_total_score, r.total_turns)
+    assert summary(stored) == summary(cached) == summary(fresh)
+
+
+def _engine_tree(root):
+    for name in ("game/rules.py", "cards/smithy.py", "strategy/strategies/big_money.py", "reporting/html.py"):
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# {name}\n")
+    return root
+
+
+def test_engine_source_hash_changes_with_engine_code_only(tmp_path):
+    root = _engine_tree(tmp_path)
+    before = engine_source_hash.__wrapped__(root)
+
+    (root / "reporting/html.py").write_text("# restyled\n")
+    (root / "strategy/strategies/big_money.py").write_text("# tuned\n")
+    assert engine_source_hash.__wrapped__(root) == before
+
+    (root / "game/rules.py").write_text("# rules change\n")
+    assert engine_source_hash.__wrapped__(root) != before
+
+
+def test_default_engine_version_hashes_the_installed_engine(tmp_path):
+    with ResultStore(tmp_path / "results.sqlite") as store:
+        assert store.engine_version == engine_source_hash()
+
+
+def test_recorded_games_are_committed_together(tmp_path):
+    battle = _Battle()
+    board = board_fingerprint(kingdom_cards=KINGDOM)
+    path = tmp_path / "results.sqlite"
+    with ResultStore(path, engine_version="v") as store:
+        play_stored_matchup(store, battle, create_big_money(), create_big_money_smithy(), 3, board, KINGDOM)
+        with ResultStore(path, engine_version="v") as reader:
+            key_a, key_b = strategy_fingerprint(create_big_money()), strategy_fingerprint(create_big_money_smithy())
+            assert reader.lookup(key_a, key_b, board, range(3)) == {}
+            store.commit()
+            assert len(reader.lookup(key_a, key_b, board, range(3))) == 3
@@ -5,6 +5,7 @@ from typing import Optional
 from dominion.cards.base_card import Card, CardType
 from dominion.cards.registry import get_card
 from dominion.events.registry import get_event
+from dominion.game.board_hooks import BoardHooks
 from dominion.game.game_state import GameState
 from dominion.game.player_state import PlayerState
 from dominion.prophecies import get_prophecy
@@ -37,6 +38,8 @@ def _setup(ai=None):
         ai = _GainFirstAI()
     state = GameState(players=[])
     state.initialize_game([ai], [get_card("Village")])
+    # Tests put cards straight into zones, so keep every optional hook on.
+    state.hooks = BoardHooks()
     return state, state.players[0]
 
 
@@ -130,14 +133,14 @@ def test_daimyo_replays_next_action():
     player.hand.remove(daimyo)
     player.in_play.append(daimyo)
     daimyo.on_play(state)
-    assert player.daimyo_pending == 1
+    assert player.turn.daimyo_pending == 1
 
     # The action phase loop normally handles the replay; simulate it.
     player.hand.remove(village)
     player.in_play.append(village)
     actions_before = player.actions
-    daimyo_replays = player.daimyo_pending
-    player.daimyo_pending = 0
+    daimyo_replays = player.turn.daimyo_pending
+    player.turn.daimyo_pending = 0
     plays = 1 + daimyo_replays
     for _ in range(plays):
         village.on_play(state)
@@ -463,7 +466,7 @@ def test_continue_is_once_per_turn():
     state.supply["Village"] = 10
     Continue = get_event("Continue").__class__
     Continue().on_buy(state, player)
-    assert player.continue_used_this_turn is True
+    assert player.turn.continue_used_this_turn is True
     assert Continue().may_be_bought(state, player) is False
 
 
@@ -687,12 +690,12 @@ def test_daimyo_pending_resets_at_turn_start():
     player.in_play = [daimyo]
     player.deck = [get_card("Copper") for _ in range(5)]
     daimyo.on_play(state)
-    assert player.daimyo_pending == 1, "Daimyo registers a pending replay"
+    assert player.turn.daimyo_pending == 1, "Daimyo registers a pending replay"
 
     # Simulate turn boundary by calling handle_start_phase
     state.phase = "start"
     state.handle_start_phase()
-    assert player.daimyo_pending == 0, "pending replay must clear at turn start"
+    assert player.turn.daimyo_pending == 0, "pending replay must clear at turn start"
 
 
 def test_divine_wind_preserves_non_kingdom_support_piles():
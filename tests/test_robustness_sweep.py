@@ -0,0 +1,73 @@
+"""Robustness sweep over random boards: crash capture, long games and timing outliers."""
+
+import json
+
+from dominion.boards.loader import load_board
+from dominion.boards.random_board import random_board
+from dominion.game.game_state import GameState, PhaseStepLimitExceeded
+from dominion.game.profiler import GameProfiler
+from dominion.simulation.robustness_sweep import (
+    format_report,
+    run_sweep,
+    save_board,
+    sweep_board,
+    timing_outliers,
+)
+
+
+def test_sweep_plays_every_game():
+    report = run_sweep(2, 2, seed=5, long_game_turns=1)
+    assert (report["boards"], report["games"], report["completed"]) == (2, 4, 4)
+    assert report["crashes"] == 0
+    assert len(report["long_games"]) == 4
+    assert {"card", "gain"} == set(report["timing_outliers"])
+    json.dumps(report)
+    assert "4 completed" in format_report(report)
+
+
+def test_board_results_are_reproducible():
+    first = sweep_board(3, 2)
+    second = sweep_board(3, 2)
+    assert first.turns == second.turns
+
+
+def test_crashes_and_step_limits_are_captured(monkeypatch):
+    play_turn = GameState.play_turn
+    failed = []
+
+    def flaky(self):
+        # The first game crashes, the second runs away, the rest finish.
+        if self.turn_number == 3 and len(failed) < 2:
+            failed.append(self)
+            raise KeyError("boom") if len(failed) == 1 else PhaseStepLimitExceeded("runaway")
+        return play_turn(self)
+
+    monkeypatch.setattr(GameState, "play_turn", flaky)
+    report = run_sweep(3, 1)
+    assert report["completed"] == 1
+    assert report["crashes"] == 1
+    assert report["step_limit"] == 1 and report["step_limit_boards"] == [1]
+    (group,) = report["crash_groups"]
+    assert group["error"] == "KeyError: 'boom'"
+    # The innermost dominion frame is the engine loop that called play_turn.
+    assert group["location"].startswith("dominion/simulation/strategy_battle.py:")
+    assert group["location"].endswith(" in run_multiplayer_game")
+    assert group["boards"] == [0]
+
+
+def test_timing_outliers_compare_to_the_median_card():
+    profiler = GameProfiler()
+    for key, seconds in (("A", 1e-6), ("B", 2e-6), ("C", 2e-6), ("Slow", 1e-4), ("Rare", 1.0)):
+        calls = 1 if key == "Rare" else 10
+        profiler.stats[("card", key)] = [calls, seconds * calls, seconds * calls]
+    outliers = timing_outliers(profiler, factor=10, min_calls=5)
+    assert [row["key"] for row in outliers["card"]] == ["Slow"]
+    assert outliers["card"][0]["ratio"] == 50
+    assert outliers["gain"] == []
+
+
+def test_saved_boards_load(tmp_path):
+    board = random_board(12)
+    path = save_board(board, tmp_path)
+    assert path.name == "random_12.txt"
+    assert load_board(path).kingdom_cards == board.config.kingdom_cards
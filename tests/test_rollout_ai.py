@@ -0,0 +1,135 @@
+"""Monte Carlo RolloutAI: buy evaluation, budgets and rollout reuse."""
+
+import random
+
+from dominion.ai.rollout_ai import PlayoutAI, RolloutAI
+from dominion.cards.registry import get_card
+from dominion.game.game_state import GameState
+
+KINGDOM = [
+    "Village",
+    "Smithy",
+    "Market",
+    "Festival",
+    "Laboratory",
+    "Mine",
+    "Witch",
+    "Moat",
+    "Workshop",
+    "Chapel",
+]
+
+
+def _buy_phase_state(ai):
+    random.seed(0)
+    state = GameState(players=[], supply={})
+    state.log_callback = lambda *_: None
+    state.initialize_game([ai, PlayoutAI()], [get_card(name) for name in KINGDOM])
+    while state.phase != "buy":
+        state.play_turn()
+    return state
+
+
+def _choose_in_buy_phase(ai, state, choices):
+    state._choosing_buy_phase = True
+    try:
+        return ai.choose_buy(state, choices)
+    finally:
+        state._choosing_buy_phase = False
+
+
+def test_playout_ai_finishes_a_game():
+    random.seed(1)
+    state = GameState(players=[], supply={})
+    state.log_callback = lambda *_: None
+    state.initialize_game([PlayoutAI(), PlayoutAI()], [get_card(name) for name in KINGDOM])
+    while not state.is_game_over():
+        state.play_turn()
+    assert state.supply["Province"] == 0 or state.empty_piles >= 3
+
+
+def test_rollouts_take_the_winning_last_province():
+    ai = RolloutAI(rollouts=4, seed=0)
+    state = _buy_phase_state(ai)
+    state.current_player.coins = 8
+    state.supply["Province"] = 1
+    # Trailing by 5: only ending the game now with the Province is a sure win.
+    state.players[1].vp_tokens = 5
+
+    choices = [get_card("Silver"), get_card("Province"), None]
+    choice = _choose_in_buy_phase(ai, state, choices)
+
+    assert choice.name == "Province"
+    assert ai.last_evaluation["Province"].mean_score == 1.0
+
+
+def test_rollouts_leave_real_state_and_rng_untouched():
+    ai = RolloutAI(rollouts=2, max_turns=2, seed=0)
+    state = _buy_phase_state(ai)
+    player = state.current_player
+    supply_before = dict(state.supply)
+    hand_before = [card.name for card in player.hand]
+    rng_before = random.getstate()
+
+    _choose_in_buy_phase(ai, state, [get_card("Silver"), get_card("Copper"), None])
+
+    assert random.getstate() == rng_before
+    assert state.supply == supply_before
+    assert [card.name for card in player.hand] == hand_before
+    assert state.phase == "buy"
+
+
+def test_sibling_candidates_reuse_rollouts_when_asked_again():
+    ai = RolloutAI(rollouts=2, max_turns=2, seed=0)
+    state = _buy_phase_state(ai)
+    silver, copper = get_card("Silver"), get_card("Copper")
+
+    _choose_in_buy_phase(ai, state, [silver, copper, None])
+    silver_stats = ai.last_evaluation["Silver"]
+    assert silver_stats.rollouts == 2
+
+    _choose_in_buy_phase(ai, state, [silver, None])
+    assert ai.last_evaluation["Silver"] is silver_stats
+    assert silver_stats.rollouts == 2
+
+
+def test_time_budget_gives_each_candidate_one_rollout():
+    ai = RolloutAI(rollouts=50, time_budget=0.0, max_turns=1, seed=0)
+    state = _buy_phase_state(ai)
+
+    _choose_in_buy_phase(ai, state, [get_card("Silver"), get_card("Copper"), None])
+
+    assert {name: stats.rollouts for name, stats in ai.last_evaluation.items()} == {
+        "Silver": 1,
+        "Copper": 1,
+        None: 1,
+    }
+
+
+def test_gains_outside_buy_phase_use_default_policy():
+    ai = RolloutAI(rollouts=2, seed=0)
+    state = _buy_phase_state(ai)
+
+    choice = ai.choose_buy(state, [get_card("Silver"), get_card("Copper"), None])
+
+    assert choice.name == "Silver"
+    assert ai.last_evaluation == {}
+
+
+def test_process_pool_matches_serial_results():
+    serial = RolloutAI(rollouts=2, max_turns=1, seed=0)
+    pooled = RolloutAI(rollouts=2, max_turns=1, seed=0, processes=2)
+    try:
+        choices = [get_card("Silver"), get_card("Copper"), None]
+        _choose_in_buy_phase(serial, _buy_phase_state(serial), choices)
+        _choose_in_buy_phase(pooled, _buy_phase_state(pooled), choices)
+    finally:
+        pooled.close()
+
+    assert {
+        name: (stats.rollouts, stats.total_score, stats.total_margin)
+        for name, stats in pooled.last_evaluation.items()
+    } == {
+        name: (stats.rollouts, stats.total_score, stats.total_margin)
+        for name, stats in serial.last_evaluation.items()
+    }
@@ -10,6 +10,7 @@ isn't spent on dead code.
 import types
 
 from dominion.cards.registry import get_card
+from dominion.game.turn_state import TurnState
 from dominion.strategy.enhanced_strategy import EnhancedStrategy, PriorityRule
 from dominion.strategy.rule_pruning import (
     prune_unfired_rules,
@@ -30,11 +31,12 @@ def _make_state():
 
 def _make_player(hand=None, actions=1):
     player = types.SimpleNamespace()
+    player.turn = TurnState()
     player.hand = list(hand or [])
     player.in_play = []
     player.actions = actions
-    player.actions_gained_this_turn = 0
-    player.cards_gained_this_turn = 0
+    player.turn.actions_gained_this_turn = 0
+    player.turn.cards_gained_this_turn = 0
     return player
 
 
@@ -1161,7 +1161,7 @@ def test_treasury_topdecks_to_top_of_deck():
     other = get_card("Copper")
     player.in_play = [treasury]
     player.deck = [other]  # bottom card
-    player.gained_victory_this_turn = False
+    player.turn.gained_victory_this_turn = False
 
     treasury.on_buy_phase_end(state)
 
@@ -1180,8 +1180,8 @@ def test_treasury_does_not_topdeck_when_action_phase_victory_gained():
     treasury = get_card("Treasury")
     player.in_play = [treasury]
     # Simulate a Victory card gain during the Action phase.
-    player.gained_victory_this_turn = True
-    player.gained_victory_this_buy_phase = False
+    player.turn.gained_victory_this_turn = True
+    player.turn.gained_victory_this_buy_phase = False
 
     treasury.on_buy_phase_end(state)
 
@@ -0,0 +1,31 @@
+"""Seat rotation for games with more than two players."""
+
+import pytest
+
+from dominion.simulation.seating import placement_score, seat_schedule, seating
+
+
+def test_two_player_schedule_is_the_usual_alternation():
+    assert seat_schedule(2) == [(0, 1), (1, 0)]
+    assert [seating("ab", n) for n in range(3)] == [["a", "b"], ["b", "a"], ["a", "b"]]
+
+
+@pytest.mark.parametrize("players", [3, 4, 5, 6])
+def test_every_player_sits_in_every_seat_once(players):
+    schedule = seat_schedule(players)
+    assert len(schedule) == players
+    for seat in range(players):
+        assert sorted(order[seat] for order in schedule) == list(range(players))
+    assert [seating(range(players), n) for n in range(players)] == [list(order) for order in schedule]
+
+
+def test_player_counts_outside_the_engine_range_are_rejected():
+    with pytest.raises(ValueError):
+        seat_schedule(1)
+    with pytest.raises(ValueError):
+        seat_schedule(7)
+
+
+def test_placement_score_spans_first_to_last():
+    assert [placement_score(place, 2) for place in range(2)] == [100.0, 0.0]
+    assert [placement_score(place, 3) for place in range(3)] == [100.0, 50.0, 0.0]
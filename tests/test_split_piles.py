@@ -40,3 +40,20 @@ def test_split_pile_counts_as_single_empty_pile():
     state.supply["Emporium"] = 0
     assert state.empty_piles == 3
     assert state.is_game_over()
+
+
+def test_empty_piles_builds_each_pile_card_once(monkeypatch):
+    import dominion.game.game_state as game_state_module
+
+    players = [PlayerState(DummyAI()) for _ in range(2)]
+    state = GameState(players)
+    state.setup_supply([get_card("Patrician"), get_card("Village")])
+    built = []
+    monkeypatch.setattr(game_state_module, "get_card", lambda name: built.append(name) or get_card(name))
+
+    state.supply["Emporium"] = 0
+    assert state.empty_piles == 0
+    state.supply["Patrician"] = 0
+    assert state.empty_piles == 1
+
+    assert len(built) == len(set(built))
@@ -1,6 +1,7 @@
 from types import SimpleNamespace
 
 from dominion.ai.genetic_ai import GeneticAI
+from dominion.game.turn_state import TurnState
 from dominion.reporting.html_report import _decision_firings_section
 from dominion.simulation.strategy_battle import StrategyBattle
 from dominion.strategy.enhanced_strategy import EnhancedStrategy, PriorityRule
@@ -16,7 +17,7 @@ def test_choose_gain_matching_top_priority_is_not_counted_as_override():
     ai = GeneticAI(strategy)
     battle = StrategyBattle()
     stats = battle._empty_decision_firings("Priority Strategy")
-    state = SimpleNamespace(current_player=SimpleNamespace())
+    state = SimpleNamespace(current_player=SimpleNamespace(turn=TurnState()))
 
     battle._instrument_ai_decisions(ai, stats)
 
@@ -41,7 +42,7 @@ def test_choose_gain_bypassing_priority_and_choose_way_are_counted():
     ai = GeneticAI(strategy)
     battle = StrategyBattle()
     stats = battle._empty_decision_firings("Override Strategy")
-    state = SimpleNamespace(current_player=SimpleNamespace())
+    state = SimpleNamespace(current_player=SimpleNamespace(turn=TurnState()))
 
     battle._instrument_ai_decisions(ai, stats)
 
@@ -65,7 +66,7 @@ def test_custom_choose_gain_without_priority_baseline_is_not_counted_as_override
     ai = GeneticAI(strategy)
     battle = StrategyBattle()
     stats = battle._empty_decision_firings("Dynamic Strategy")
-    state = SimpleNamespace(current_player=SimpleNamespace())
+    state = SimpleNamespace(current_player=SimpleNamespace(turn=TurnState()))
 
     battle._instrument_ai_decisions(ai, stats)
 
@@ -84,7 +85,7 @@ def test_priority_rule_firings_are_counted_by_decision_list():
     ai = GeneticAI(strategy)
     battle = StrategyBattle()
     stats = battle._empty_decision_firings("Trace Strategy")
-    state = SimpleNamespace(current_player=SimpleNamespace())
+    state = SimpleNamespace(current_player=SimpleNamespace(turn=TurnState()))
 
     battle._instrument_ai_decisions(ai, stats)
 
@@ -3,6 +3,7 @@ from types import SimpleNamespace
 from dominion.boards.loader import BoardConfig
 from dominion.cards.registry import get_card
 from dominion.events.looting import Looting
+from dominion.game.turn_state import TurnState
 from dominion.projects.sewers import Sewers
 from dominion.strategy.card_roles import cards_with_role, infer_card_roles
 from dominion.strategy.enhanced_strategy import EnhancedStrategy, PriorityRule
@@ -21,7 +22,7 @@ def _state(turn_number=5, provinces_left=8, empty_piles=0):
 def _player(cards=None):
     cards = cards or []
     return SimpleNamespace(
-        collection_played=0,
+        turn=TurnState(),
         all_cards=lambda: list(cards),
         count_in_deck=lambda name: sum(1 for card in cards if card.name == name),
     )
@@ -434,7 +435,7 @@ def test_collection_gain_bias_ignores_landscape_buy_choices():
     strategy = EnhancedStrategy()
     strategy.gain_priority = [PriorityRule("Silver")]
     player = _player()
-    player.collection_played = 1
+    player.turn.collection_played = 1
     state = SimpleNamespace(supply={"Smithy": 10, "Silver": 40})
 
     choice = strategy.choose_gain(
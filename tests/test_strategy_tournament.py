@@ -0,0 +1,30 @@
+"""StrategyBattle games and tournaments with more than two seats."""
+
+from dominion.ai.genetic_ai import GeneticAI
+from dominion.simulation.strategy_battle import DEFAULT_KINGDOM_CARDS, StrategyBattle
+
+
+def test_multiplayer_game_reports_full_finishing_order(tmp_path):
+    battle = StrategyBattle(DEFAULT_KINGDOM_CARDS, log_folder=str(tmp_path), log_frequency=0)
+    strategy = battle.strategy_loader.get_strategy("Big Money")
+    ais = [GeneticAI(strategy) for _ in range(4)]
+
+    winner, scores, _log, _turns = battle.run_multiplayer_game(ais, DEFAULT_KINGDOM_CARDS)
+
+    assert sorted(battle.last_placements) == sorted(ai.name for ai in ais)
+    assert battle.last_placements[0] == winner.name
+    assert [scores[name] for name in battle.last_placements] == sorted(scores.values(), reverse=True)
+
+
+def test_tournament_rotates_seats(tmp_path):
+    battle = StrategyBattle(DEFAULT_KINGDOM_CARDS, log_folder=str(tmp_path), log_frequency=0)
+    names = ["Big Money", "Big Money Smithy", "Big Money"]
+
+    results = battle.run_tournament(names, num_games=6, seed=7)
+
+    seatings = [game["seating"] for game in results["detailed_results"]]
+    assert seatings[:3] == [names, names[1:] + names[:1], names[2:] + names[:2]]
+    assert seatings[3:] == seatings[:3]
+    assert sum(results["wins"]) == sum(results["seat_wins"]) == 6
+    assert sum(results["avg_placement_score"]) == 150.0
+    assert battle.run_tournament(names, num_games=6, seed=7)["wins"] == results["wins"]
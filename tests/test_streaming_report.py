@@ -0,0 +1,80 @@
+"""Streaming battle reports: online statistics and bounded-memory rewrites."""
+
+import pytest
+
+from dominion.reporting.streaming_report import (
+    Histogram,
+    RunningStats,
+    StreamingBattleReport,
+    wilson_interval,
+)
+
+
+def _game(n, winner, turns=15, margin=5, log_path=None):
+    return {
+        "game_number": n,
+        "winner": winner,
+        "strategy1_score": 30,
+        "strategy2_score": 30 - margin,
+        "margin": margin,
+        "turns": turns,
+        "log_path": log_path,
+    }
+
+
+def test_wilson_interval_brackets_the_rate():
+    low, high = wilson_interval(60, 100)
+    assert low < 0.6 < high
+    assert low == pytest.approx(0.502, abs=1e-3)
+    assert high == pytest.approx(0.691, abs=1e-3)
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+
+
+def test_running_stats_match_batch_statistics():
+    values = [3, 7, 7, 19, 24]
+    stats = RunningStats()
+    for v in values:
+        stats.add(v)
+
+    mean = sum(values) / len(values)
+    variance = sum((v - mean) ** 2 for v in values) / (len(values) - 1)
+    assert stats.mean == pytest.approx(mean)
+    assert stats.variance == pytest.approx(variance)
+    assert (stats.minimum, stats.maximum) == (3, 24)
+
+
+def test_histogram_counts_out_of_range_values_separately():
+    hist = Histogram(0, 5)
+    for value in (-1, 0, 5, 6, 6):
+        hist.add(value)
+
+    assert hist.counts == [1, 0, 0, 0, 0, 1]
+    assert (hist.underflow, hist.overflow, hist.total) == (1, 2, 5)
+
+
+def test_report_rewrites_page_while_running_and_on_finish(tmp_path):
+    out = tmp_path / "report.html"
+    report = StreamingBattleReport("A", "B", out, write_every=2)
+
+    report.add_game(_game(1, "A"))
+    assert not out.exists()
+    report.add_game(_game(2, "B", turns=20))
+    running = out.read_text()
+    assert "Games played: 2" in running
+    assert 'http-equiv="refresh"' in running
+
+    report.add_game(_game(3, "A"))
+    report.finish()
+    final = out.read_text()
+    assert "Games played: 3" in final
+    assert "refresh" not in final
+    assert "<svg" in final
+
+
+def test_report_keeps_only_recent_log_links(tmp_path):
+    report = StreamingBattleReport("A", "B", tmp_path / "r.html", write_every=0, max_log_links=3)
+    for n in range(1, 11):
+        report.add_game(_game(n, "A", log_path=str(tmp_path / f"game_{n}.log")))
+
+    assert [n for n, _ in report.recent_logs] == [8, 9, 10]
+    assert report.wins == {"A": 10, "B": 0}
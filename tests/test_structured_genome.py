@@ -11,6 +11,7 @@ from __future__ import annotations
 import random
 import types
 
+from dominion.game.turn_state import TurnState
 from dominion.simulation.genetic_trainer import GeneticTrainer
 from dominion.simulation.structured_genome import (
     KingdomInfo,
@@ -45,6 +46,7 @@ def _mock_state(turn_number=5, provinces_left=8):
 
 def _mock_player():
     player = types.SimpleNamespace()
+    player.turn = TurnState()
     player.coins = 3
     player.actions = 1
     player.buys = 1
@@ -53,8 +55,8 @@ def _mock_player():
     player.count_in_deck = lambda _c: 0
     player.all_cards = lambda: []
     player.get_victory_points = lambda _g=None: 3
-    player.actions_gained_this_turn = 0
-    player.cards_gained_this_turn = 0
+    player.turn.actions_gained_this_turn = 0
+    player.turn.cards_gained_this_turn = 0
     return player
 
 
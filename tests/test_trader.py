@@ -45,7 +45,7 @@ def test_trader_trashes_and_gains_silvers():
     player.hand = [trader_card, duchy]
     player.deck = [get_card("Copper")]
     player.actions = 0
-    player.cost_reduction = 1
+    player.turn.cost_reduction = 1
 
     player.hand.remove(trader_card)
     player.in_play.append(trader_card)
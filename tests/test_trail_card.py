@@ -22,7 +22,7 @@ def _setup_game(ai):
     player.discard = []
     player.in_play = []
     player.actions = 0
-    player.actions_this_turn = 0
+    player.turn.actions_this_turn = 0
     player.actions_played = 0
     return state, player
 
@@ -41,7 +41,7 @@ def test_trail_reacts_to_discard():
     assert trail in player.in_play
     assert trail not in player.discard
     assert player.actions == 1
-    assert player.actions_this_turn == 1
+    assert player.turn.actions_this_turn == 1
     assert player.actions_played == 1
     assert len(player.hand) == 1  # Drew one card
 
@@ -71,7 +71,7 @@ def test_trail_can_play_when_gained():
 
     assert gained in player.in_play
     assert player.actions == 1
-    assert player.actions_this_turn == 1
+    assert player.turn.actions_this_turn == 1
     assert player.actions_played == 1
     assert len(player.hand) == 1
 
@@ -102,6 +102,6 @@ def test_trail_trash_reaction_returns_to_trash():
     assert trail in state.trash
     assert trail not in player.in_play
     assert player.actions == 1
-    assert player.actions_this_turn == 1
+    assert player.turn.actions_this_turn == 1
     assert player.actions_played == 1
     assert len(player.hand) == 1
@@ -70,10 +70,10 @@ def test_lurker_trash_gain_increments_cards_gained_this_turn():
     village = get_card("Village")
     state.trash.append(village)
 
-    before = player.cards_gained_this_turn
+    before = player.turn.cards_gained_this_turn
     Lurker().play_effect(state)
 
-    assert player.cards_gained_this_turn == before + 1, (
+    assert player.turn.cards_gained_this_turn == before + 1, (
         "Lurker's trash gain should bump cards_gained_this_turn so it "
         "participates in the same bookkeeping as buy-phase gains"
     )
@@ -87,10 +87,10 @@ def test_lurker_trash_gain_increments_actions_gained_this_turn():
     village = get_card("Village")
     state.trash.append(village)
 
-    before = player.actions_gained_this_turn
+    before = player.turn.actions_gained_this_turn
     Lurker().play_effect(state)
 
-    assert player.actions_gained_this_turn == before + 1, (
+    assert player.turn.actions_gained_this_turn == before + 1, (
         "Lurker's trash gain should advance actions_gained_this_turn so "
         "Cauldron's third-Action-gain trigger fires consistently"
     )
@@ -105,11 +105,11 @@ def test_lich_trash_gain_increments_cards_gained_this_turn():
     # Lich draws +6 / +2A then asks the AI to discard 2 — give the player a hand.
     player.hand = [get_card("Copper") for _ in range(3)]
 
-    before_cards = player.cards_gained_this_turn
-    before_actions = player.actions_gained_this_turn
+    before_cards = player.turn.cards_gained_this_turn
+    before_actions = player.turn.actions_gained_this_turn
     Lich().play_effect(state)
 
-    assert player.cards_gained_this_turn == before_cards + 1
-    assert player.actions_gained_this_turn == before_actions + 1
+    assert player.turn.cards_gained_this_turn == before_cards + 1
+    assert player.turn.actions_gained_this_turn == before_actions + 1
     assert village in player.discard
     assert village not in state.trash
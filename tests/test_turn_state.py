@@ -0,0 +1,47 @@
+"""TurnState: per-turn fields live on ``player.turn`` and reset together."""
+
+import copy
+import dataclasses
+
+from dominion.ai.genetic_ai import GeneticAI
+from dominion.game.player_state import PlayerState
+from dominion.game.turn_state import TurnState
+from dominion.strategy.strategies.big_money import create_big_money
+
+from tests.utils import BASE_KINGDOM, make_state
+
+
+def test_turn_fields_are_not_player_attributes():
+    player = PlayerState(GeneticAI(create_big_money()))
+    for name in TurnState.__slots__:
+        assert not hasattr(player, name), name
+
+
+def test_start_phase_resets_every_turn_field():
+    state = make_state(BASE_KINGDOM, seed=5)
+    player = state.current_player
+    player.turn.kiln_pending = 2
+    player.turn.merchant_silver_bonus_used = True
+    player.turn.launch_used = True
+    player.turn.gained_five_this_turn = True
+
+    state.handle_start_phase()
+
+    assert player.turn == TurnState()
+    assert player.gained_five_last_turn
+
+
+def test_games_do_not_add_undeclared_player_attributes():
+    state = make_state(BASE_KINGDOM, seed=5)
+    while not state.is_game_over():
+        state.play_turn()
+    declared = {f.name for f in dataclasses.fields(PlayerState)}
+    for player in state.players:
+        assert set(vars(player)) <= declared
+
+
+def test_copies_do_not_share_turn_state():
+    player = PlayerState(GeneticAI(create_big_money()))
+    clone = copy.deepcopy(player)
+    clone.turn.actions_this_turn = 3
+    assert player.turn.actions_this_turn == 0
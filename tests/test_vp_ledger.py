@@ -0,0 +1,77 @@
+"""Incremental VP ledger agrees with a full recount."""
+
+from dominion.cards.registry import get_card
+from dominion.game.vp_ledger import VPLedger
+
+from tests.utils import ChooseFirstActionAI, make_state
+
+KINGDOM = ["Gardens", "Duke", "Silk Road", "Vineyard", "Feodum", "Fairgrounds", "Workshop", "Village", "Smithy", "Market"]
+
+
+def _full_recount(player):
+    return sum(card.get_victory_points(player) for card in player.all_cards())
+
+
+def test_gains_and_trashes_update_the_ledger_incrementally(monkeypatch):
+    state = make_state(KINGDOM, seed=4)
+    player = state.players[0]
+    assert player.get_victory_points(state) == 3
+
+    rebuilds = []
+    original = VPLedger.rebuild
+    monkeypatch.setattr(VPLedger, "rebuild", lambda self, *args: rebuilds.append(1) or original(self, *args))
+    for name in ["Gardens", "Duke", "Duchy", "Duchy", "Silk Road", "Vineyard", "Village", "Silver", "Silver", "Silver", "Feodum"]:
+        state.gain_card(player, get_card(name))
+        player.get_victory_points(state)
+    estate = next(card for card in player.deck if card.name == "Estate")
+    player.deck.remove(estate)
+    state.trash_card(player, estate)
+
+    assert player.get_victory_points(state) == _full_recount(player)
+    assert rebuilds == []
+
+
+def test_untracked_zone_changes_trigger_a_rebuild():
+    state = make_state(KINGDOM, seed=4)
+    player = state.players[0]
+    state.gain_card(player, get_card("Duke"))
+    state.gain_card(player, get_card("Duchy"))
+    before = player.get_victory_points(state)
+
+    duchy = next(card for card in player.discard if card.name == "Duchy")
+    player.discard.remove(duchy)  # e.g. returned to the supply
+    assert player.get_victory_points(state) == before - 4
+
+    player.hand.append(get_card("Province"))  # e.g. received from Masquerade
+    assert player.get_victory_points(state) == before + 2
+
+
+def test_ledger_matches_recount_throughout_games():
+    for seed in range(3):
+        state = make_state(KINGDOM, seed)
+        while not state.is_game_over():
+            state.play_turn()
+            for player in state.players:
+                player.get_victory_points(state)
+
+
+def test_estate_trashed_while_inheriting_leaves_the_ledger_consistent(monkeypatch):
+    state = make_state(["Mining Village", *KINGDOM[1:]], seed=4)
+    player = state.players[0]
+    player.ai = ChooseFirstActionAI()
+    monkeypatch.setattr(ChooseFirstActionAI, "should_trash_mining_village", lambda *_: True, raising=False)
+    player.inherited_action_name = "Mining Village"
+    estate = next(card for card in player.all_cards() if card.name == "Estate")
+    for zone in (player.hand, player.deck, player.discard):
+        if estate in zone:
+            zone.remove(estate)
+    player.hand = [estate]
+    player.actions = 1
+    assert player.get_victory_points(state) == 3  # the ledger now counts the Estate
+    state.current_player_index = 0
+    state.phase = "action"
+    state.handle_action_phase()
+
+    assert estate in state.trash and estate.name == "Estate"
+    assert player.get_victory_points(state) == _full_recount(player) == 2
+    assert "Mining Village" not in player.vp_ledger.summary.counts
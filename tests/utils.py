@@ -1,7 +1,24 @@
+import random
+
 from dominion.ai.base_ai import AI
+from dominion.ai.genetic_ai import GeneticAI
 from typing import Optional
 from dominion.cards.base_card import Card
+from dominion.cards.registry import get_card
 from dominion.game.game_state import GameState
+from dominion.strategy.strategies.big_money import create_big_money
+
+# Base-set kingdom with no expansion hooks.
+BASE_KINGDOM = ["Smithy", "Village", "Market", "Festival", "Laboratory", "Mine", "Witch", "Moat", "Workshop", "Chapel"]
+
+
+def make_state(kingdom: list[str], seed: int) -> GameState:
+    """A seeded, silent two-player Big Money game on ``kingdom``."""
+    random.seed(seed)
+    state = GameState(players=[], supply={})
+    state.log_callback = lambda *_: None
+    state.initialize_game([GeneticAI(create_big_money()), GeneticAI(create_big_money())], [get_card(n) for n in kingdom])
+    return state
 
 class DummyAI(AI):
     def __init__(self):
@@ -31,7 +48,7 @@ class BuyEventAI(DummyAI):
         for choice in choices:
             if (
                 getattr(choice, "is_event", False) or getattr(choice, "is_project", False)
-            ) and choice.name not in state.current_player.bought_this_turn:
+            ) and choice.name not in state.current_player.turn.bought_this_turn:
                 return choice
         return None
 